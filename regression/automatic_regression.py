@@ -37,6 +37,12 @@ modules = [
     # ----------------------- Regression List --------------------------
     'scripts/weights/eVTOL_Weights_Buildup_Regression.py',
     'scripts/aerodynamics/aerodynamics.py',
+    'scripts/aerodynamics/vortex_lattice.py',
+    'scripts/aerodynamics/surrogate_cache.py',
+    'scripts/aerodynamics/parasite_drag_segments.py',
+    'scripts/aerodynamics/drag_geometry.py',
+    'scripts/aerodynamics/evaluate_batch.py',
+    'scripts/aerodynamics/aerodas_tables.py',
     #'scripts/aerodynamics_super/aerodynamics_super.py',
     #'scripts/regression/test_mission_AS2.py',
     'scripts/atmosphere/atmosphere.py',
@@ -48,6 +54,7 @@ modules = [
     'scripts/cnbeta/cnbeta.py',    
     'scripts/concorde/concorde.py',
     'scripts/DC_10_noise/DC_10_noise.py',
+    'scripts/data/data_access.py',
     'scripts/ducted_fan/ducted_fan_network.py',
     'scripts/ducted_fan/battery_ducted_fan_network.py',
     'scripts/ducted_fan/serial_hybrid_ducted_fan_network.py',
@@ -55,6 +62,8 @@ modules = [
     'scripts/Embraer_E190_constThr/mission_Embraer_E190_constThr.py',
     'scripts/fuel_cell/fuel_cell.py',     
     'scripts/gasturbine_network/gasturbine_network.py',
+    'scripts/gasturbine_network/turbofan_deck.py',
+    'scripts/gasturbine_network/turbofan_cycle.py',
     'scripts/geometry/NACA_airfoil_compute.py',
     'scripts/geometry/NACA_volume_compute.py',
     'scripts/geometry/wing_fuel_volume_compute.py',
@@ -62,21 +71,34 @@ modules = [
     'scripts/industrial_costs/industrial_costs.py',
     'scripts/landing_field_length/landing_field_length.py',
     'scripts/lifting_line/lifting_line.py',
+    'scripts/lifting_line/factorization_cache.py',
+    'scripts/mission_solvers/sparse_jacobian.py',
+    'scripts/mission_solvers/flat_state.py',
+    'scripts/mission_solvers/parallel_segments.py',
+    'scripts/mission_solvers/root_finders.py',
+    'scripts/mission_solvers/warm_start.py',
+    'scripts/mission_solvers/shared_operators.py',
     'scripts/multifidelity/optimize_mf.py',
     'scripts/noise_optimization/Noise_Test.py',
     'scripts/payload_range/payload_range.py',
     'scripts/propeller/propeller.py',
+    'scripts/propeller/propeller_convergence.py',
+    'scripts/propeller/propeller_map.py',
     'scripts/propulsion_surrogate/propulsion_surrogate.py',
+    'scripts/propulsion_surrogate/surrogate_evaluation.py',
     'scripts/ramjet_network/ramjet_network.py',
+    'scripts/ramjet_network/mach_solvers.py',
     'scripts/Regional_Jet_Optimization/Optimize2.py',
     'scripts/scramjet_network/scramjet_network.py',
     'scripts/rocket_network/Rocketdyne_F1.py',
     'scripts/rocket_network/Rocketdyne_J2.py',   
     'scripts/sizing_loop/sizing_loop.py',
+    'scripts/sizing_loop/complex_step_sizing.py',
     'scripts/solar_network/solar_network.py',
     'scripts/solar_network/solar_low_fidelity_network.py',
     'scripts/solar_radiation/solar_radiation.py',
     'scripts/SU2_surrogate/BWB-450.py',   
+    'scripts/SU2_surrogate/parallel_training.py',
     'scripts/sweeps/test_sweeps.py',
     'scripts/take_off_field_length/take_off_field_length.py',
     'scripts/test_input_output/test_xml_read_write.py',
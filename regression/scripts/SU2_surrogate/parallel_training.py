@@ -0,0 +1,196 @@
+# parallel_training.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the SU2 training table gives the same results when its cases are run
+    at once, that failed and hung cases are run again, and that an interrupted
+    training continues where it stopped. A stand-in for SU2_CFD writes the history
+    file, so SU2 does not need to be installed. Also checks that AVL cases run at once
+    never share their run folder.
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, redirect
+
+import numpy as np
+import os
+import sys
+import stat
+import time
+import shutil
+import tempfile
+
+# ----------------------------------------------------------------------
+#   Stand-in for SU2_CFD
+# ----------------------------------------------------------------------
+
+stand_in = '''#!{executable}
+import os, sys, time, numpy as np
+
+settings = dict()
+for line in open(sys.argv[1]):
+    if '=' in line:
+        name, value = line.split('=',1)
+        settings[name.strip()] = value.strip()
+
+mach  = float(settings['MACH_NUMBER'])
+alpha = float(settings['AOA'])
+if mach >= 1.:
+    sys.exit(1)
+
+# every call is counted, the first call of a case can fail or hang
+log   = os.environ['STAND_IN_LOG']
+calls = [line.strip() for line in open(log)] if os.path.exists(log) else []
+case  = '%g %g' % (alpha,mach)
+with open(log,'a') as f:
+    f.write(case + '\\n')
+if not case in calls:
+    if case == os.environ.get('STAND_IN_FAIL'):
+        sys.exit(1)
+    if case == os.environ.get('STAND_IN_HANG'):
+        time.sleep(600.)
+
+time.sleep(0.2)
+
+CL = 2.*np.pi*alpha*np.pi/180./np.sqrt(1.-mach**2)
+CD = 0.01 + CL**2/(np.pi*8.)
+
+with open(settings['CONV_FILENAME'] + '.dat','w') as f:
+    f.write('"Iteration","CLift","CDrag"\\n')
+    f.write('0, 0., 0.\\n')
+    f.write('10, %.12f, %.12f\\n' % (CL,CD))
+'''
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    directory = tempfile.mkdtemp()
+    path      = os.environ['PATH']
+    try:
+        # put the stand-in on the path
+        executable = os.path.join(directory,'SU2_CFD')
+        with open(executable,'w') as f:
+            f.write(stand_in.format(executable=sys.executable))
+        os.chmod(executable,os.stat(executable).st_mode | stat.S_IEXEC)
+        os.environ['PATH']         = directory + os.pathsep + path
+        os.environ['STAND_IN_LOG'] = os.path.join(directory,'calls.txt')
+
+        with redirect.output(os.devnull):
+            with redirect.folder(os.path.join(directory,'run'),force=False):
+                check_training(directory)
+                check_avl_run_folders(directory)
+    finally:
+        os.environ['PATH'] = path
+        for name in ['STAND_IN_LOG','STAND_IN_FAIL','STAND_IN_HANG']:
+            os.environ.pop(name,None)
+        shutil.rmtree(directory)
+
+    return
+
+def check_training(directory):
+
+    geometry = Data()
+    geometry.tag            = 'stand_in'
+    geometry.reference_area = 10.
+
+    # a mesh to link into every case folder
+    with open(geometry.tag + '.su2','w') as f:
+        f.write('NDIME= 3\n')
+
+    # one case at a time
+    serial = SUAVE.Analyses.Aerodynamics.SU2_inviscid()
+    serial.geometry = geometry
+    t0 = time.time()
+    serial.sample_training()
+    t_serial = time.time() - t0
+    os.remove(os.environ['STAND_IN_LOG'])
+
+    # every case at once, one case fails and another one hangs the first time
+    os.environ['STAND_IN_FAIL'] = '%g %g' % (-2.,0.3)
+    os.environ['STAND_IN_HANG'] = '%g %g' % (8.,0.85)
+    parallel = SUAVE.Analyses.Aerodynamics.SU2_inviscid()
+    parallel.geometry = geometry
+    parallel.training_jobs.processes = 4
+    parallel.training_jobs.timeout   = 2.
+    parallel.training_jobs.retries   = 1
+    t0 = time.time()
+    parallel.sample_training()
+    t_parallel = time.time() - t0
+
+    sys.__stdout__.write('serial: %.2f s, parallel: %.2f s\n' % (t_serial,t_parallel))
+
+    assert np.all(parallel.training.grid_points == serial.training.grid_points)
+    assert np.max(np.abs(parallel.training.coefficients - serial.training.coefficients)) < 1e-12
+
+    calls = open(os.environ['STAND_IN_LOG']).read().split('\n')
+    assert len(calls) - 1 == 9 + 2
+
+    # the finished cases are not run again
+    os.remove(os.path.join('su2_training','job_0004','result.pkl'))
+    parallel.sample_training()
+    calls = open(os.environ['STAND_IN_LOG']).read().split('\n')
+    assert len(calls) - 1 == 9 + 2 + 1
+    assert np.max(np.abs(parallel.training.coefficients - serial.training.coefficients)) < 1e-12
+
+    # cases that keep failing stop the training
+    parallel.training_jobs.retries = 0
+    parallel.training.Mach = np.array([0.3,0.7,0.85,1.5])
+    try:
+        parallel.sample_training()
+        failed = False
+    except RuntimeError:
+        failed = True
+    assert failed
+
+    return
+
+def check_avl_run_folders(directory):
+
+    # a stand-in for the AVL run, it fails if another case writes to its folder
+    class Stand_In_AVL(SUAVE.Analyses.Aerodynamics.AVL_Inviscid):
+        def evaluate_conditions(self,run_conditions):
+            run_folder = self.settings.filenames.run_folder
+            if not os.path.isdir(run_folder):
+                os.makedirs(run_folder)
+            open(os.path.join(run_folder,'case.run'),'w').close()
+            time.sleep(0.2)
+            assert os.listdir(run_folder) == ['case.run']
+            shutil.rmtree(run_folder)
+
+            alpha = run_conditions.aerodynamics.angle_of_attack
+            results = Data()
+            results.aerodynamics = Data()
+            results.aerodynamics.lift_coefficient = np.atleast_2d(2.*np.pi*alpha)
+            results.aerodynamics.drag_breakdown = Data()
+            results.aerodynamics.drag_breakdown.induced = Data()
+            results.aerodynamics.drag_breakdown.induced.total = np.atleast_2d(alpha**2)
+            results.aerodynamics.drag_breakdown.induced.efficiency_factor = np.array([[1.]])
+            return results
+
+    avl = Stand_In_AVL()
+    avl.geometry = Data(tag='stand_in')
+    avl.settings.filenames.run_folder = os.path.join(directory,'avl_files')
+    avl.training_jobs.processes = 4
+
+    points = np.array([[alpha,0.3] for alpha in np.linspace(-0.1,0.1,8)])
+    coefficients = avl.evaluate_training_cases(points)
+
+    assert np.max(np.abs(coefficients[:,0] - 2.*np.pi*points[:,0])) < 1e-12
+    assert avl.settings.filenames.run_folder == os.path.join(directory,'avl_files')
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# aerodas_tables.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the AERODAS model tabulated at initialization matches the model
+    evaluated directly
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+import time
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # pre and post stall, over the Reynolds numbers of a mission
+    machs  = np.linspace(0.05,0.8,40)[:,None]
+    alphas = np.linspace(-60.,110.,500)[None,:] * Units.deg
+
+    direct = SUAVE.Analyses.Aerodynamics.AERODAS()
+    direct.geometry = vehicle_setup()
+    direct.initialize()
+
+    t0    = time.time()
+    truth = direct.evaluate_batch(machs,3000.,alphas)
+    t_direct = time.time() - t0
+
+    tabulated = SUAVE.Analyses.Aerodynamics.AERODAS()
+    tabulated.geometry = vehicle_setup()
+    tabulated.settings.use_tabulated_wings = True
+    tabulated.initialize()
+
+    t0      = time.time()
+    results = tabulated.evaluate_batch(machs,3000.,alphas)
+    t_table = time.time() - t0
+
+    tables = tabulated.geometry._aerodas_tables
+    tol    = tabulated.settings.tabulation.tolerance
+    print('errors of the tables: ' + str([tables.errors.lift_coefficient,tables.errors.drag_coefficient]))
+    print('discontinuities [deg]: ' + str(tables.discontinuities/Units.deg))
+    print('direct: %.2e s, tabulated: %.2e s' % (t_direct,t_table))
+
+    assert tables.errors.lift_coefficient <= tol
+    assert tables.errors.drag_coefficient <= tol
+
+    # the stall of the horizontal tail is a jump of the model
+    assert len(tables.discontinuities) == 2
+
+    # away from the jumps the tables are as good as at the middle of their cells
+    jump_width = np.max(np.diff(tables.angle_of_attack))
+    near_jump  = np.zeros(alphas.shape,dtype=bool)
+    for alpha in tables.discontinuities:
+        near_jump = np.logical_or(near_jump,np.abs(alphas-alpha) < jump_width)
+    far = np.broadcast_to(np.logical_not(near_jump),truth.lift_coefficient.shape)
+
+    assert np.max(np.abs(results.lift_coefficient - truth.lift_coefficient)[far]) < 2.*tol
+    assert np.max(np.abs(results.drag_coefficient - truth.drag_coefficient)[far]) < 2.*tol
+
+    # the model is evaluated again when the tables are turned off
+    tabulated.settings.use_tabulated_wings = False
+    tabulated.initialize()
+    results = tabulated.evaluate_batch(machs,3000.,alphas)
+    assert np.all(results.lift_coefficient == truth.lift_coefficient)
+    assert np.all(results.drag_coefficient == truth.drag_coefficient)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
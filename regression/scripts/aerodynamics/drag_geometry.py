@@ -0,0 +1,97 @@
+# drag_geometry.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the drag buildup gives the same results with the geometry found once,
+    when the analysis is initialized, as with the geometry found on every evaluation
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    analysis = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    analysis.geometry = vehicle
+    analysis.initialize()
+
+    # every component has its geometry
+    assert '_drag_geometry' in vehicle
+    for component in list(vehicle.wings.values()) + list(vehicle.fuselages.values()) + list(vehicle.propulsors.values()):
+        assert '_drag_geometry' in component
+
+    state   = flight_state()
+    results = drag_buildup(analysis,state)
+
+    # the geometry found on every evaluation
+    del vehicle['_drag_geometry']
+    for component in list(vehicle.wings.values()) + list(vehicle.fuselages.values()) + list(vehicle.propulsors.values()):
+        del component['_drag_geometry']
+    truth = drag_buildup(analysis,flight_state())
+
+    print('total drag: ' + str(results.total[:,0]))
+
+    for key in ['total','parasite','compressible','miscellaneous']:
+        assert np.all(results[key] == truth[key])
+
+    # a changed geometry is found again when the analysis is initialized again
+    vehicle.fuselages.fuselage.lengths.total *= 1.1
+    analysis.initialize()
+    changed = drag_buildup(analysis,flight_state())
+    assert np.all(changed.parasite != results.parasite)
+
+    return
+
+def flight_state():
+
+    n     = 8
+    state = Data()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.conditions.expand_rows(n)
+
+    freestream = state.conditions.freestream
+    freestream.mach_number      = np.linspace(0.2,0.85,n)[:,None]
+    freestream.temperature      = np.linspace(288.,220.,n)[:,None]
+    freestream.reynolds_number  = np.linspace(8e6,5e6,n)[:,None]
+    freestream.density          = np.linspace(1.2,0.4,n)[:,None]
+    freestream.velocity         = np.linspace(70.,250.,n)[:,None]
+    freestream.dynamic_pressure = 0.5 * freestream.density * freestream.velocity**2
+    state.conditions.aerodynamics.angle_of_attack = np.linspace(-2.,8.,n)[:,None] * Units.deg
+
+    return state
+
+def drag_buildup(analysis,state):
+
+    analysis.evaluate(state)
+    drag_breakdown = state.conditions.aerodynamics.drag_breakdown
+
+    results = Data()
+    results.total         = drag_breakdown.total
+    results.parasite      = drag_breakdown.parasite.total
+    results.compressible  = drag_breakdown.compressible.total
+    results.miscellaneous = drag_breakdown.miscellaneous.total
+
+    return results
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+# evaluate_batch.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that evaluating a sweep of flight conditions at once gives the same
+    coefficients as evaluating the conditions of a mission segment
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+
+import numpy as np
+import time
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+sys.path.append('../concorde')
+from concorde import vehicle_setup as supersonic_vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    analysis = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    analysis.geometry = vehicle_setup()
+    analysis.initialize()
+    check_batch(analysis,np.linspace(0.2,0.85,12))
+
+    analysis = SUAVE.Analyses.Aerodynamics.Supersonic_Zero()
+    analysis.geometry = supersonic_vehicle_setup()
+    analysis.initialize()
+    check_batch(analysis,np.linspace(0.3,2.0,12))
+
+    return
+
+def check_batch(analysis,machs):
+
+    alphas    = np.linspace(-2.,10.,9) * Units.deg
+    altitude  = 9000. * Units.m
+
+    # a polar, one row per Mach number
+    t0      = time.time()
+    results = analysis.evaluate_batch(machs[:,None],altitude,alphas[None,:])
+    t_batch = time.time() - t0
+    assert results.lift_coefficient.shape == (len(machs),len(alphas))
+    assert results.drag_coefficient.shape == (len(machs),len(alphas))
+
+    # in smaller batches
+    batches = analysis.evaluate_batch(machs[:,None],altitude,alphas[None,:],batch_size=7)
+    assert np.all(batches.lift_coefficient == results.lift_coefficient)
+    assert np.all(batches.drag_coefficient == results.drag_coefficient)
+
+    # the conditions of a segment, one Mach number at a time
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    t0 = time.time()
+    for i,mach in enumerate(machs):
+        state = segment_state(mach,altitude,alphas,atmosphere)
+        truth = analysis.evaluate(state)
+        assert np.max(np.abs(results.lift_coefficient[i] - truth.lift.total[:,0])) < 1e-12
+        assert np.max(np.abs(results.drag_coefficient[i] - truth.drag.total[:,0])) < 1e-12
+    t_loop = time.time() - t0
+
+    print(analysis.tag + ' batch: %.2e s, segments: %.2e s' % (t_batch,t_loop))
+
+    return
+
+def segment_state(mach,altitude,alphas,atmosphere):
+
+    n     = len(alphas)
+    state = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.expand_rows(n)
+
+    atmo_data  = atmosphere.compute_values(altitude * np.ones((n,1)))
+    freestream = state.conditions.freestream
+    freestream.altitude          = altitude * np.ones((n,1))
+    freestream.pressure          = atmo_data.pressure
+    freestream.temperature       = atmo_data.temperature
+    freestream.density           = atmo_data.density
+    freestream.speed_of_sound    = atmo_data.speed_of_sound
+    freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+
+    velocity = mach * atmo_data.speed_of_sound
+    freestream.velocity          = velocity
+    freestream.mach_number       = mach * np.ones((n,1))
+    freestream.reynolds_number   = atmo_data.density * velocity / atmo_data.dynamic_viscosity
+    freestream.dynamic_pressure  = 0.5 * atmo_data.density * velocity**2
+
+    state.conditions.aerodynamics.angle_of_attack = alphas[:,None]
+
+    return state
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
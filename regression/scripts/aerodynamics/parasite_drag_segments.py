@@ -0,0 +1,83 @@
+# parasite_drag_segments.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the parasite drag of a segmented wing, with all segments evaluated
+    together, matches the sum of the segments evaluated one at a time
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Drag.parasite_drag_wing import parasite_drag_wing, compute_parasite_drag
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_BWB_450 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    analysis = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    analysis.geometry = vehicle
+    analysis.initialize()
+
+    settings = analysis.settings
+    wing     = vehicle.wings.main_wing
+    assert len(wing.Segments) > 2
+
+    # subsonic and supersonic points
+    n     = 12
+    state = Data()
+    state.conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.conditions.freestream.mach_number     = np.linspace(0.1,1.3,n)[:,None]
+    state.conditions.freestream.temperature     = np.linspace(216.,288.,n)[:,None]
+    state.conditions.freestream.reynolds_number = np.linspace(4e6,9e6,n)[:,None]
+    state.conditions.aerodynamics.drag_breakdown.parasite = Data()
+
+    wing_parasite_drag = parasite_drag_wing(state,settings,wing)
+    result             = state.conditions.aerodynamics.drag_breakdown.parasite[wing.tag]
+    assert np.shape(wing_parasite_drag) == (n,1)
+
+    # one segment at a time
+    freestream = state.conditions.freestream
+    truth      = np.zeros((n,1))
+    Swet       = 0.
+    for segment in list(wing.Segments.values())[:-1]:
+        segment_drag = compute_parasite_drag(freestream.reynolds_number,segment.chords.mean_aerodynamic,
+                                             freestream.mach_number,freestream.temperature,
+                                             wing.transition_x_upper,wing.transition_x_lower,
+                                             segment.sweeps.quarter_chord,wing.thickness_to_chord,
+                                             segment.areas.reference,segment.areas.wetted,
+                                             settings.wing_parasite_drag_form_factor)[0]
+        truth += segment_drag * segment.areas.reference / wing.areas.reference
+        Swet  += segment.areas.wetted
+
+    print('wing parasite drag: ' + str(wing_parasite_drag[:,0]))
+
+    assert np.max(np.abs(wing_parasite_drag - truth)/truth) < 1e-12
+    assert np.abs(result.wetted_area - Swet)/Swet < 1e-12
+    assert np.abs(wing.areas.wetted - Swet)/Swet < 1e-12
+
+    # segments that were not gathered at initialization are gathered here
+    del wing['_segment_arrays']
+    assert np.all(parasite_drag_wing(state,settings,wing) == wing_parasite_drag)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+# surrogate_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that a surrogate cache reuses the training of an unchanged vehicle,
+    retrains a changed one, and evicts old entries
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Surrogate.surrogate_cache import Surrogate_Cache, hash_objects
+
+import numpy as np
+import os
+import time
+import pickle
+import shutil
+import tempfile
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    directory = tempfile.mkdtemp()
+    try:
+        check_analysis(directory)
+        check_eviction(os.path.join(directory,'eviction'))
+    finally:
+        shutil.rmtree(directory)
+
+    return
+
+def check_analysis(directory):
+
+    cache   = Surrogate_Cache(directory)
+    vehicle = vehicle_setup()
+
+    # the key only depends on the contents
+    assert cache.key(vehicle) == cache.key(vehicle_setup())
+    assert cache.key(vehicle) == cache.key(pickle.loads(pickle.dumps(vehicle)))
+
+    # the first analysis trains
+    first  = vortex_lattice(vehicle,cache)
+    t0     = time.time()
+    first.initialize()
+    t_train = time.time() - t0
+    assert len(os.listdir(directory)) == 1
+
+    # the second one reuses the training
+    second = vortex_lattice(vehicle,cache)
+    second.sample_training = None
+    t0     = time.time()
+    second.initialize()
+    t_load = time.time() - t0
+
+    print('train: %.2e s, load: %.2e s' % (t_train,t_load))
+
+    assert np.all(second.training.lift_coefficient == first.training.lift_coefficient)
+    for mach in [0.3,0.8]:
+        lift_first  = evaluate_lift(first,mach)
+        lift_second = evaluate_lift(second,mach)
+        for tag in lift_first.keys():
+            assert np.all(lift_second[tag] == lift_first[tag])
+
+    # a changed vehicle is trained again
+    vehicle.wings.main_wing.spans.projected *= 1.1
+    third = vortex_lattice(vehicle,cache)
+    third.initialize()
+    assert len(os.listdir(directory)) == 2
+    assert np.all(third.training.lift_coefficient != first.training.lift_coefficient)
+
+    return
+
+def vortex_lattice(vehicle,cache):
+
+    analysis = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    analysis.geometry = vehicle
+    analysis.settings.number_panels_spanwise   = 10
+    analysis.settings.mach_dependent_surrogate = True
+    analysis.settings.surrogate_cache          = cache
+
+    return analysis
+
+def evaluate_lift(analysis,mach):
+
+    state = Data()
+    state.conditions = Data()
+    state.conditions.aerodynamics = Data()
+    state.conditions.aerodynamics.lift_breakdown = Data()
+    state.conditions.freestream = Data()
+    state.conditions.aerodynamics.angle_of_attack = np.array([[-2.],[0.],[4.]]) * Units.deg
+    state.conditions.freestream.mach_number       = mach * np.ones([3,1])
+
+    return analysis.evaluate(state,analysis.settings,analysis.geometry)
+
+def check_eviction(directory):
+
+    content = np.zeros(100)
+    size    = len(pickle.dumps(content,protocol=pickle.HIGHEST_PROTOCOL))
+    cache   = Surrogate_Cache(directory,maximum_size=3.5*size)
+
+    keys = [hash_objects(i) for i in range(4)]
+    for i,key in enumerate(keys):
+        cache.save(key,content)
+        # entries are ordered by when they were last used
+        past = time.time() - 100. + i
+        os.utime(cache.path(key),(past,past))
+
+    # the least recently used entries are evicted once the cache is full
+    assert cache.load(keys[0]) is None
+    for key in keys[1:]:
+        assert cache.load(key) is not None
+
+    # and entries that have not been used for too long
+    old = time.time() - 3600.
+    os.utime(cache.path(keys[1]),(old,old))
+    cache.maximum_age = 600.
+    cache.evict()
+    assert cache.load(keys[1]) is None
+    assert cache.load(keys[2]) is not None
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
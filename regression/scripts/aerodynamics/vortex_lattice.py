@@ -0,0 +1,142 @@
+# vortex_lattice.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the vortex lattice solves a table of angles of attack at once
+    with the same results as one angle at a time, and that the Mach dependent
+    surrogate matches the Prandtl-Glauert vortex lattice
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import weissinger_vortex_lattice
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.weissinger_vortex_lattice import vortex_lattice_geometry
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+from Boeing_BWB_450 import vehicle_setup as bwb_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    settings = Data()
+    settings.number_panels_spanwise = 10
+
+    AoA = np.linspace(-10.,10.,9) * Units.deg
+
+    # a straight wing and a wing with segments
+    for wing in [vehicle_setup().wings.main_wing,bwb_setup().wings.main_wing]:
+
+        conditions = Data()
+        conditions.aerodynamics = Data()
+
+        # all angles together
+        conditions.aerodynamics.angle_of_attack = AoA
+        CL, CD = weissinger_vortex_lattice(conditions,settings,wing)
+        assert CL.shape == AoA.shape
+
+        # one angle at a time
+        for i,alpha in enumerate(AoA):
+            conditions.aerodynamics.angle_of_attack = alpha
+            cl, cd = weissinger_vortex_lattice(conditions,settings,wing)
+            assert np.ndim(cl) == 0
+            assert np.abs(cl - CL[i]) < 1e-12
+            assert np.abs(cd - CD[i]) < 1e-12
+
+        # the influence matrix is only built once for a wing
+        assert vortex_lattice_geometry(settings,wing) is vortex_lattice_geometry(settings,wing)
+
+    # the analysis trains on the whole table
+    vehicle = vehicle_setup()
+    vortex_lattice = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    vortex_lattice.geometry = vehicle
+    vortex_lattice.settings.number_panels_spanwise = 10
+    vortex_lattice.initialize()
+
+    training = vortex_lattice.training
+    assert np.all(training.wing_lift_coefficients.vertical_stabilizer == 0.)
+
+    CL_truth = 0.
+    for wing in vehicle.wings.values():
+        conditions.aerodynamics.angle_of_attack = training.angle_of_attack
+        cl, cd = weissinger_vortex_lattice(conditions,vortex_lattice.settings,wing)
+        CL_truth += cl * wing.areas.reference / vehicle.reference_area
+    print('CL:',training.lift_coefficient)
+    assert np.max(np.abs(training.lift_coefficient - CL_truth)) < 1e-12
+    
+    # the Mach dependent surrogate
+    check_mach_surrogate(vehicle)
+
+    return
+
+def check_mach_surrogate(vehicle):
+    
+    vortex_lattice = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    vortex_lattice.geometry = vehicle
+    vortex_lattice.settings.number_panels_spanwise      = 10
+    vortex_lattice.settings.mach_dependent_surrogate    = True
+    vortex_lattice.settings.surrogate_polynomial_degree = 4
+    vortex_lattice.initialize()
+    
+    state = Data()
+    state.conditions = Data()
+    state.conditions.aerodynamics = Data()
+    state.conditions.aerodynamics.lift_breakdown = Data()
+    state.conditions.freestream = Data()
+    
+    AoA = np.array([[-10.],[-5.],[0.],[5.],[10.]]) * Units.deg
+    state.conditions.aerodynamics.angle_of_attack = AoA
+    
+    conditions = Data()
+    conditions.aerodynamics = Data()
+    conditions.aerodynamics.angle_of_attack = AoA
+    conditions.freestream = Data()
+    
+    # on the training points the surrogate goes through the vortex lattice results
+    for M in [0.,0.5,0.8,0.9,0.95]:
+        state.conditions.freestream.mach_number = M * np.ones_like(AoA)
+        lifts = vortex_lattice.evaluate(state,vortex_lattice.settings,vehicle)
+        
+        # beyond the table the lift is held at the last Mach number
+        conditions.freestream.mach_number = min(M,0.9)
+        for wing in vehicle.wings.values():
+            cl, cd = weissinger_vortex_lattice(conditions,vortex_lattice.settings,wing)
+            assert lifts[wing.tag].shape == AoA.shape
+            assert np.max(np.abs(lifts[wing.tag] - cl)) < 1e-10
+            
+    # between the training points the lift slope grows with Mach number
+    Mach = np.linspace(0.,0.9,19)[:,None]
+    state.conditions.freestream.mach_number = Mach
+    state.conditions.aerodynamics.angle_of_attack = 5. * Units.deg * np.ones_like(Mach)
+    lifts = vortex_lattice.evaluate(state,vortex_lattice.settings,vehicle)
+    print('CL(M):',lifts.total.T)
+    assert np.all(np.diff(lifts.total[:,0]) > 0.)
+    
+    # the incompressible lift is the Mach 0 lift
+    assert np.abs(lifts.total[0,0] - CL_incompressible(vehicle,5. * Units.deg)) < 1e-10
+    
+    return
+
+def CL_incompressible(vehicle,alpha):
+    
+    vortex_lattice = SUAVE.Analyses.Aerodynamics.Vortex_Lattice()
+    vortex_lattice.geometry = vehicle
+    vortex_lattice.settings.number_panels_spanwise      = 10
+    vortex_lattice.settings.surrogate_polynomial_degree = 4
+    vortex_lattice.initialize()
+    
+    return vortex_lattice.surrogates.lift_coefficient(alpha)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+# data_access.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the attribute access rules of Data and times them against the
+    previous try/except implementation, and checks packing through a Data_Layout
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Data_Layout
+
+import numpy as np
+import timeit
+import pickle
+from copy import deepcopy
+
+dictgetitem  = dict.__getitem__
+objgetattrib = object.__getattribute__
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    check_semantics()
+    check_layout()
+
+    # time the new access against the old one
+    print('%-20s %10s %10s %8s' % ('operation','old [ns]','new [ns]','speedup'))
+    for name, statement in [('key get'     , 'd.freestream.mach_number'),
+                            ('method get'  , 'd.pack_array'),
+                            ('key set'     , 'd.mach_number = 0.8'),
+                            ('new Data'    , 'Data()'),]:
+        old = benchmark(statement,Legacy_Data)
+        new = benchmark(statement,Data)
+        print('%-20s %10.1f %10.1f %8.2f' % (name,old,new,old/new))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Check Semantics
+# ----------------------------------------------------------------------
+
+def check_semantics():
+
+    d = Data()
+
+    # keys
+    d.mach_number = 0.8
+    assert d['mach_number'] == 0.8
+    assert d.mach_number == 0.8
+    assert 'mach_number' not in vars(d)
+
+    # keys come before methods of the same name
+    d['values'] = 1.
+    assert d.values == 1.
+    del d['values']
+    assert d.values() == [0.8]
+
+    # setting a method name sets an instance attribute, not a key
+    d.pack_array = 'not a method'
+    assert d.pack_array == 'not a method'
+    assert 'pack_array' not in d
+    del d.pack_array
+    assert 'pack_array' not in vars(d)
+    assert d.pack_array().shape == (1,)
+
+    # and so does setting an existing instance attribute
+    object.__setattr__(d,'attribute',1.)
+    d.attribute = 2.
+    assert vars(d)['attribute'] == 2.
+    assert 'attribute' not in d
+
+    # deleting keys
+    del d.mach_number
+    assert 'mach_number' not in d
+    try:
+        d.mach_number
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('missing key did not raise an AttributeError')
+
+    # subclasses
+    c = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    assert c.get_bases()[-1] is Data
+    assert 'freestream' in c
+    c = pickle.loads(pickle.dumps(c))
+    assert isinstance(c.freestream,Data)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Check Layout
+# ----------------------------------------------------------------------
+
+def check_layout():
+
+    d = Data()
+    d.throttle   = np.linspace(0.,1.,4)[:,None]
+    d.body_angle = np.arange(8.).reshape([4,2])
+    d.network    = Data()
+    d.network.voltage = np.ones(3)
+    d.network.tag     = 'not packed'
+    d.network.rank_3  = np.ones([2,2,2])
+    d.time       = 2.
+
+    layout = Data_Layout()
+    assert np.all(layout.pack(d) == d.pack_array())
+
+    # unpacking writes the same values as unpack_array
+    M = np.arange(16.) + 1.
+    e = deepcopy(d)
+    layout.unpack(d,M)
+    e.unpack_array(M)
+    assert np.all(d.pack_array() == M)
+    assert np.all(layout.pack(d) == e.pack_array())
+
+    # the layout follows changes of keys, shapes, types and sub data
+    d.network.current = np.ones([4,1])
+    assert np.all(layout.pack(d) == d.pack_array())
+    d.throttle = np.ones([5,1])
+    assert np.all(layout.pack(d) == d.pack_array())
+    d.body_angle = d.body_angle + 1j
+    assert np.all(layout.pack(d) == d.pack_array())
+    d.network = Data()
+    assert np.all(layout.pack(d) == d.pack_array())
+
+    # packs are not shared
+    assert layout.pack(d) is not layout.pack(d)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Benchmark
+# ----------------------------------------------------------------------
+
+def benchmark(statement,klass):
+
+    d = klass()
+    d.freestream = klass()
+    d.freestream.mach_number = np.ones([16,1])
+
+    timer  = timeit.Timer(statement,globals={'d':d,'Data':klass})
+    number = 20000
+    times  = timer.repeat(repeat=5,number=number)
+
+    return min(times) / number * 1e9
+
+# ----------------------------------------------------------------------
+#   Legacy Data
+# ----------------------------------------------------------------------
+
+class Legacy_Data(Data):
+    """ The try/except attribute access of Data before Oct 2026 """
+
+    def __getattribute__(self, k):
+        try:
+            return dictgetitem(self,k)
+        except:
+            return objgetattrib(self,k)
+
+    def __setattr__(self, k, v):
+        try:
+            objgetattrib(self, k)
+        except:
+            self[k] = v
+        else:
+            object.__setattr__(self, k, v)
+
+    def get_bases(self):
+        klass = self.__class__
+        klasses = []
+        while klass:
+            if issubclass(klass,Data):
+                klasses.append(klass)
+                klass = klass.__base__
+            else:
+                klass = None
+        return klasses
+
+    def __new__(cls,*args,**kwarg):
+        self = dict.__new__(cls)
+        dict.__init__(self)
+        for klass in self.get_bases()[::-1]:
+            klass.__defaults__(self)
+        return self
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# turbofan_cycle.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the fused cycle of the turbofan network gives the same results as
+    the cycle through the components
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+
+import numpy as np
+import copy
+import time
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+from Embraer_190 import vehicle_setup as E190_vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    B737_turbofan = vehicle_setup().propulsors.turbofan
+    E190_turbofan = E190_vehicle_setup().propulsors.turbofan
+
+    # with power taken off the shaft
+    shaft_turbofan = copy.deepcopy(B737_turbofan)
+    shaft_power    = SUAVE.Components.Energy.Converters.Shaft_Power_Off_Take()
+    shaft_power.power_draw            = 150. * Units.kW
+    shaft_power.reference_temperature = shaft_turbofan.thrust.reference_temperature
+    shaft_power.reference_pressure    = shaft_turbofan.thrust.reference_pressure
+    shaft_turbofan.Shaft_Power_Off_Take = shaft_power
+
+    for turbofan in [B737_turbofan,E190_turbofan,shaft_turbofan]:
+        for n in [1,16,200]:
+            check(turbofan,n)
+
+    return
+
+def check(turbofan,n):
+
+    turbofan.use_fused_cycle = False
+    state   = flight_state(n)
+    t0      = time.time()
+    truth   = turbofan.evaluate_thrust(state)
+    t_components = time.time() - t0
+    truth_conditions = copy.deepcopy(state.conditions)
+
+    turbofan.use_fused_cycle = True
+    state   = flight_state(n)
+    t0      = time.time()
+    results = turbofan.evaluate_thrust(state)
+    t_fused = time.time() - t0
+    turbofan.use_fused_cycle = False
+
+    print(turbofan.tag + ' %d points, components: %.2e s, fused: %.2e s' % (n,t_components,t_fused))
+
+    assert np.array_equal(results.thrust_force_vector,truth.thrust_force_vector)
+    assert np.array_equal(results.vehicle_mass_rate,truth.vehicle_mass_rate)
+
+    for nozzle in ['core','fan']:
+        truth_outputs = truth_conditions.propulsion.acoustic_outputs[nozzle]
+        outputs       = state.conditions.propulsion.acoustic_outputs[nozzle]
+        for key in truth_outputs.keys():
+            assert np.array_equal(outputs[key],truth_outputs[key])
+
+    for key in truth_conditions.freestream.keys():
+        assert np.array_equal(state.conditions.freestream[key],truth_conditions.freestream[key])
+
+    return
+
+def flight_state(n):
+
+    altitude    = np.linspace(0.,12000.,n)[:,None]
+    mach_number = np.linspace(0.05,0.95,n)[::-1,None]
+    throttle    = np.linspace(0.,1.,n)[:,None]
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(altitude)
+    planet     = SUAVE.Attributes.Planets.Earth()
+
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(n)
+
+    freestream = conditions.freestream
+    freestream.altitude          = altitude
+    freestream.mach_number       = mach_number
+    freestream.pressure          = atmo_data.pressure
+    freestream.temperature       = atmo_data.temperature
+    freestream.density           = atmo_data.density
+    freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    freestream.speed_of_sound    = atmo_data.speed_of_sound
+    freestream.velocity          = mach_number * atmo_data.speed_of_sound
+    freestream.gravity           = planet.compute_gravity(altitude)
+    conditions.propulsion.throttle = throttle
+
+    state = Data()
+    state.conditions = conditions
+
+    return state
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
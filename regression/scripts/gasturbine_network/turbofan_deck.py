@@ -0,0 +1,116 @@
+# turbofan_deck.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" builds a deck of a turbofan network and checks it against the cycle
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+
+import numpy as np
+import time
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    turbofan = vehicle_setup().propulsors.turbofan
+
+    altitudes    = np.linspace(0.,13000.,53)
+    mach_numbers = np.linspace(0.05,0.9,35)
+    deck = turbofan.build_deck(altitudes,mach_numbers)
+
+    print('errors of the deck: ')
+    print(deck.errors)
+    for key in deck.deck_keys:
+        assert deck.errors[key] < 5e-3
+
+    assert deck.tag == turbofan.tag
+    assert deck.number_of_engines == turbofan.number_of_engines
+
+    # on the grid the deck is the cycle, at any throttle
+    state = flight_state(altitudes[[0,10,44,52]],mach_numbers[[3,0,20,34]],np.array([1.,0.7,0.4,0.]))
+    check(turbofan,deck,state,1e-12)
+
+    # between the grid points
+    n     = 200
+    state = flight_state(np.linspace(100.,12500.,n),np.linspace(0.85,0.1,n),np.linspace(0.3,1.,n))
+    check(turbofan,deck,state,5e-3)
+
+    t0 = time.time()
+    turbofan.evaluate_thrust(state)
+    t_cycle = time.time() - t0
+    t0 = time.time()
+    deck.evaluate_thrust(state)
+    t_deck = time.time() - t0
+    print('cycle: %.2e s, deck: %.2e s' % (t_cycle,t_deck))
+
+    return
+
+def check(turbofan,deck,state,tol):
+
+    truth    = turbofan.evaluate_thrust(state)
+    acoustic = state.conditions.propulsion.acoustic_outputs
+    truth_core = Data(acoustic.core)
+    truth_fan  = Data(acoustic.fan)
+
+    results  = deck.evaluate_thrust(state)
+
+    F_max = np.max(np.abs(truth.thrust_force_vector))
+    m_max = np.max(np.abs(truth.vehicle_mass_rate))
+    assert np.max(np.abs(results.thrust_force_vector - truth.thrust_force_vector)) <= tol*F_max
+    assert np.max(np.abs(results.vehicle_mass_rate - truth.vehicle_mass_rate)) <= tol*m_max
+
+    for truth_nozzle,nozzle in [[truth_core,acoustic.core],[truth_fan,acoustic.fan]]:
+        for key in truth_nozzle.keys():
+            scale = np.max(np.abs(truth_nozzle[key]))
+            assert np.max(np.abs(nozzle[key] - truth_nozzle[key])) <= tol*scale
+
+    return
+
+def flight_state(altitude,mach_number,throttle):
+
+    n          = len(altitude)
+    altitude   = np.reshape(altitude,(n,1))
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(altitude)
+    planet     = SUAVE.Attributes.Planets.Earth()
+
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(n)
+
+    freestream = conditions.freestream
+    freestream.altitude          = altitude
+    freestream.mach_number       = np.reshape(mach_number,(n,1))
+    freestream.pressure          = atmo_data.pressure
+    freestream.temperature       = atmo_data.temperature
+    freestream.density           = atmo_data.density
+    freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    freestream.speed_of_sound    = atmo_data.speed_of_sound
+    freestream.velocity          = freestream.mach_number * atmo_data.speed_of_sound
+    freestream.gravity           = planet.compute_gravity(altitude)
+    conditions.propulsion.throttle = np.reshape(throttle,(n,1))
+
+    state = Data()
+    state.conditions = conditions
+
+    return state
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# factorization_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the lifting line and the vortex lattice reuse the factored system of
+    an unchanged wing, and factor it again when the wing changes
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Aerodynamics.Lifting_Line.Lifting_Line import lifting_line, _factorization_cache
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.weissinger_vortex_lattice import weissinger_vortex_lattice, \
+     _geometry_cache
+from SUAVE.Methods.Utilities.bounded_cache import Bounded_Cache
+
+import numpy as np
+import copy
+
+import sys
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    wing = vehicle_setup().wings.main_wing
+
+    conditions = Data()
+    conditions.aerodynamics = Data()
+    conditions.aerodynamics.angle_of_attack = np.linspace(-5.,5.,5) * Units.deg
+
+    settings = Data()
+    settings.number_of_stations     = 20
+    settings.number_panels_spanwise = 10
+
+    # each method with its own cache
+    for function, cache in [(lifting_line,_factorization_cache),(weissinger_vortex_lattice,_geometry_cache)]:
+        cache.clear()
+
+        # the first call factors, the second call with the same wing reuses it
+        CL_1, CD_1 = function(conditions,settings,wing)
+        CL_2, CD_2 = function(conditions,settings,copy.deepcopy(wing))
+        assert cache.misses == 1 and cache.hits == 1
+        assert np.all(CL_1 == CL_2) and np.all(CD_1 == CD_2)
+
+        # a changed chord is factored again
+        other = copy.deepcopy(wing)
+        other.chords.root = 1.1 * wing.chords.root
+        CL_3, CD_3 = function(conditions,settings,other)
+        assert cache.misses == 2 and cache.hits == 1
+        assert np.all(CL_3 != CL_1)
+
+        # the shared arrays can not be written to
+        entry = list(cache.entries.values())[0]
+        while isinstance(entry,tuple):
+            entry = entry[-1]
+        try:
+            entry[0] = 0.
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('a cached array was written to')
+
+    # only the most recently used entries are kept
+    cache = Bounded_Cache(maximum_size=2)
+    for key in ['a','b','a','c']:
+        cache.fetch(key,np.ones,3)
+    assert list(cache.entries.keys()) == ['a','c']
+    assert cache.hits == 1 and cache.misses == 3
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# B737_mission.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" setup file for the Boeing 737 mission solved by the mission solver checks,
+    and the comparison of its results with a reference solution
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+import sys
+sys.path.append('../Vehicles')
+sys.path.append('../B737')
+
+import mission_B737
+
+# ----------------------------------------------------------------------
+#   Define the Mission
+# ----------------------------------------------------------------------
+
+def mission_setup():
+
+    configs, analyses = mission_B737.full_setup()
+    mission_B737.simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+
+    return analyses.missions.base
+
+# ----------------------------------------------------------------------
+#   Check Results
+# ----------------------------------------------------------------------
+
+def check_results(results,new_results,check,
+                  keys=('conditions.weights.total_mass','conditions.propulsion.throttle','conditions.aerodynamics.angle_of_attack')):
+
+    for tag in results.segments.keys():
+        segment     = results.segments[tag]
+        new_segment = new_results.segments[tag]
+
+        assert new_segment.state.numerics.converged
+
+        for k in keys:
+            old_val = segment.deep_get(k)
+            new_val = new_segment.deep_get(k)
+            err     = np.max(np.abs(new_val-old_val)) / np.max(np.abs(old_val))
+            print(tag, k, 'Error:', err)
+            assert err < 1e-6, '%s Check Failed : %s %s' % (check,tag,k)
+
+    return
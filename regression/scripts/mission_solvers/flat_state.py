@@ -0,0 +1,70 @@
+# flat_state.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that an all at once mission that merges its segments into flat
+    state buffers matches one that merges them by copying
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+
+import numpy as np
+
+from B737_mission import mission_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    results      = setup(flat_state=False).evaluate()
+    flat_results = setup(flat_state=True).evaluate()
+
+    assert results.state.numerics.converged
+    assert flat_results.state.numerics.converged
+
+    # the merged states match
+    for k in ['conditions.weights.total_mass','conditions.frames.inertial.position_vector',
+              'conditions.frames.body.transform_to_inertial','unknowns.throttle']:
+        old_val = results.state.deep_get(k)
+        new_val = flat_results.state.deep_get(k)
+        err     = np.max(np.abs(new_val-old_val)) / np.max(np.abs(old_val))
+        print(k, 'Error:', err)
+        assert err < 1e-12, 'Flat State Check Failed : %s' % k
+
+    # and live in one buffer with the sub segment states
+    buffer = flat_results.state.numerics._state_buffers.conditions
+    mass   = flat_results.state.conditions.weights.total_mass
+    c0,c1  = buffer.columns['weights.total_mass']
+    assert np.all(buffer.buffer[:,c0:c1] == mass)
+    for segment in flat_results.segments.values():
+        assert np.shares_memory(buffer.buffer,segment.state.conditions.weights.total_mass)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup(flat_state):
+
+    base    = mission_setup()
+    mission = SUAVE.Analyses.Mission.All_At_Once()
+    mission.tag = 'all_at_once'
+    mission.settings.flat_state = flat_state
+
+    for tag in ['climb_1','climb_2','climb_3','cruise']:
+        segment = base.segments[tag]
+        segment.state.numerics.number_control_points = 8
+        mission.append_segment(segment)
+
+    return mission
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+# parallel_segments.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that a sequential mission solved with the segments in parallel
+    matches the mission solved one segment at a time
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from B737_mission import mission_setup, check_results
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the time and position are where the segments start from their initials
+    keys = ['conditions.weights.total_mass','conditions.frames.inertial.time','conditions.frames.inertial.position_vector','conditions.propulsion.throttle']
+
+    serial_mission   = mission_setup()
+    parallel_mission = mission_setup()
+    parallel_mission.settings.parallel_segments  = True
+    parallel_mission.settings.parallel_processes = 3
+
+    # the first evaluation has no converged initials to start from
+    results          = serial_mission.evaluate()
+    parallel_results = parallel_mission.evaluate()
+    check_results(results,parallel_results,'Parallel Segments',keys)
+
+    # change a segment, so that the initials of the following ones move
+    for mission in [serial_mission,parallel_mission]:
+        mission.segments.descent_3.air_speed = mission.segments.descent_3.air_speed * 1.01
+
+    results          = serial_mission.evaluate()
+    parallel_results = parallel_mission.evaluate()
+    check_results(results,parallel_results,'Parallel Segments',keys)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# root_finders.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that a mission solved with each of the alternative root finders
+    matches the default solution and records the solver statistics
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Missions.Segments import root_finders
+from SUAVE.Methods.Missions.Segments.converge_root import converge_root
+from SUAVE.Analyses.Mission.Segments.Conditions import State
+
+import numpy as np
+
+from B737_mission import mission_setup, check_results
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the root finders on a small system, every call is counted, finite differences included
+    calls = [0]
+    def func(x,a):
+        calls[0] += 1
+        return np.array([x[0]**2 + x[1]**2 - a, x[0] - x[1]])
+
+    for root_finder in [root_finders.newton_line_search,root_finders.newton_krylov,root_finders.trust_region_least_squares]:
+        calls[0] = 0
+        x,infodict,ier,msg = root_finder(func,np.array([1.,0.5]),args=2.,xtol=1e-10)
+        assert ier == 1, msg
+        assert infodict['nfev'] == calls[0]
+        assert np.max(np.abs(x - 1.)) < 1e-8
+        assert np.allclose(infodict['fvec'],func(x,2.))
+
+    # a root finder that reports no statistics at all
+    check_bare_root_finder()
+
+    # the default solution
+    mission  = mission_setup()
+    results  = mission.evaluate()
+
+    # the alternative root finders
+    for root_finder, solver_jacobian in [(root_finders.newton_line_search,'none'),
+                                         (root_finders.newton_line_search,'sparse'),
+                                         (root_finders.newton_krylov,'none'),
+                                         (root_finders.trust_region_least_squares,'sparse')]:
+        mission  = mission_setup()
+        for segment in mission.segments.values():
+            segment.settings.root_finder           = root_finder
+            segment.state.numerics.solver_jacobian = solver_jacobian
+        new_results = mission.evaluate()
+
+        check_statistics(new_results)
+        check_results(results,new_results,'Root Finder')
+
+    return
+
+# ----------------------------------------------------------------------
+#   Check Bare Root Finder
+# ----------------------------------------------------------------------
+
+def check_bare_root_finder():
+
+    def bare_root_finder(func,x0,args=(),xtol=1e-8,full_output=1):
+        x = x0 - func(x0,args)
+        return x, {}, 1, 'done'
+
+    def iterate(segment):
+        segment.state.residuals.a = segment.state.unknowns.x - 2.
+
+    segment = Data()
+    segment.tag      = 'bare'
+    segment.state    = State()
+    segment.process  = Data()
+    segment.settings = Data()
+    segment.process.iterate      = iterate
+    segment.settings.root_finder = bare_root_finder
+    segment.state.unknowns.x     = np.zeros([4,1])
+    segment.state.residuals.a    = np.zeros([4,1])
+
+    converge_root(segment)
+
+    statistics = segment.state.numerics.solver_statistics
+    assert segment.state.numerics.converged
+    # the call made by the root finder and the one made for the residuals are counted
+    assert statistics.function_evaluations == 2
+    assert statistics.jacobian_evaluations == 0
+    assert statistics.residual_norm_history[-1] < 1e-12
+
+    return
+
+# ----------------------------------------------------------------------
+#   Check Statistics
+# ----------------------------------------------------------------------
+
+def check_statistics(results):
+
+    for tag, segment in results.segments.items():
+        statistics = segment.state.numerics.solver_statistics
+
+        assert statistics.function_evaluations > 0
+        assert statistics.residual_norm_history[-1] < statistics.residual_norm_history[0]
+        print(tag, 'Function Evaluations:', statistics.function_evaluations, 'Jacobian Evaluations:', statistics.jacobian_evaluations)
+
+    return
+
+if __name__ == '__main__':
+    main()
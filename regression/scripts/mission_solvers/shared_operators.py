@@ -0,0 +1,95 @@
+# shared_operators.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that segments with the same discretization share read only
+    dimensionless operators, and that other discretizations get their own
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Methods.Missions.Segments.Common.Numerics import initialize_differentials_dimensionless, \
+     update_differentials_time
+from SUAVE.Methods.Utilities.Chebyshev import chebyshev_data, linear_data
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    Segments = SUAVE.Analyses.Mission.Segments
+
+    # two segments of different types with the same discretization
+    climb  = Segments.Climb.Constant_Speed_Constant_Rate()
+    cruise = Segments.Cruise.Constant_Speed_Constant_Altitude()
+    initialize_differentials_dimensionless(climb)
+    initialize_differentials_dimensionless(cruise)
+
+    for key in ['control_points','differentiate','integrate']:
+        A = climb.state.numerics.dimensionless[key]
+        assert A is cruise.state.numerics.dimensionless[key]
+
+        # the shared arrays can not be written to
+        try:
+            A[0,0] = 1.
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('the shared %s operator was written to' % key)
+
+    # scaling to time does not touch the shared operators
+    D = np.array(cruise.state.numerics.dimensionless.differentiate)
+    cruise.state.conditions.frames.inertial.time = np.linspace(0.,100.,16)[:,None]
+    update_differentials_time(cruise)
+    assert np.all(cruise.state.numerics.dimensionless.differentiate == D)
+    assert np.allclose(cruise.state.numerics.time.differentiate*100.,D)
+
+    # another number of control points, method or integration option is another set of operators
+    others = []
+    for N, method, integration in [(8,chebyshev_data,True),(16,linear_data,True),(16,chebyshev_data,False)]:
+        segment = Segments.Cruise.Constant_Speed_Constant_Altitude()
+        segment.state.numerics.number_control_points = N
+        segment.state.numerics.discretization_method = method
+        segment.state.numerics.integration           = integration
+        initialize_differentials_dimensionless(segment)
+        others.append(segment.state.numerics.dimensionless)
+
+        x, D, I = method(N,integration=integration)
+        assert np.all(segment.state.numerics.dimensionless.differentiate == D)
+        assert segment.state.numerics.dimensionless.differentiate is not cruise.state.numerics.dimensionless.differentiate
+
+    assert others[2].integrate is None
+    assert others[2].control_points is not cruise.state.numerics.dimensionless.control_points
+
+    # any other option in the numerics is passed on to the discretization method and keys the operators
+    def stretched_data(N,integration=True,stretch=1.,**options):
+        x, D, I = chebyshev_data(N,integration=integration)
+        return x**stretch, D, I
+
+    stretched = []
+    for stretch in [1.,2.,2.]:
+        segment = Segments.Cruise.Constant_Speed_Constant_Altitude()
+        segment.state.numerics.discretization_method = stretched_data
+        segment.state.numerics.stretch               = stretch
+        initialize_differentials_dimensionless(segment)
+        stretched.append(segment.state.numerics.dimensionless.control_points)
+
+    x, D, I = chebyshev_data(16)
+    assert np.all(stretched[0][:,0] == x) and np.all(stretched[1][:,0] == x**2.)
+    assert stretched[2] is stretched[1]
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+# sparse_jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that a mission solved with a colored, sparse finite difference
+    or complex step jacobian matches the default solution
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Missions.Segments.Common.Jacobian import color_columns, block_sparsity
+from SUAVE.Methods.Missions.Segments.converge_root import converge_root, iterate, pack_layouts
+from SUAVE.Analyses.Mission.Segments.Conditions import State
+
+import numpy as np
+
+from B737_mission import mission_setup, check_results
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # check the coloring on a block diagonal pattern
+    sparsity = np.kron(np.eye(4),np.ones((2,2))) > 0.
+    sparsity = np.hstack([sparsity,sparsity])
+    colors   = color_columns(sparsity)
+    assert np.max(colors) + 1 == 4
+    for c in range(np.max(colors)+1):
+        assert np.all(np.sum(sparsity[:,colors==c],axis=1) <= 1)
+
+    # a detected pattern keeps the entries that are zero at the initial guess only
+    check_detect()
+
+    # the default solution, with a dense finite difference jacobian
+    mission  = mission_setup()
+    results  = mission.evaluate()
+    dense    = count_evaluations(results)
+
+    # the blocks pattern holds the couplings through the integrated mass
+    check_blocks(mission_setup().segments.climb_1)
+
+    # the sparse finite difference and complex step solutions
+    for solver_jacobian, jacobian_sparsity in [('sparse','blocks'),('sparse','pointwise'),('sparse','segment'),('complex_step','blocks')]:
+        mission  = mission_setup()
+        for segment in mission.segments.values():
+            segment.state.numerics.solver_jacobian   = solver_jacobian
+            segment.state.numerics.jacobian_sparsity = jacobian_sparsity
+        sparse_results = mission.evaluate()
+
+        check_results(results,sparse_results,'Sparse Jacobian')
+
+        # every iterate call is counted, including the ones for the jacobian
+        evaluations = count_evaluations(sparse_results)
+        print(solver_jacobian, jacobian_sparsity, 'function evaluations:', evaluations, 'dense:', dense)
+        if jacobian_sparsity == 'blocks':
+            assert evaluations < 0.8*dense
+
+    return
+
+def count_evaluations(results):
+
+    return np.sum([segment.state.numerics.solver_statistics.function_evaluations for segment in results.segments.values()])
+
+# ----------------------------------------------------------------------
+#   Check Blocks
+# ----------------------------------------------------------------------
+
+def check_blocks(segment):
+
+    # the throttle sets the fuel burn, which is integrated into the mass at the later control points
+    segment.process.initialize(segment)
+    unknowns  = pack_layouts(segment)[0].pack(segment.state.unknowns)
+    residuals = iterate(unknowns,segment)
+    sparsity  = block_sparsity(iterate,unknowns,residuals,segment,segment)
+
+    J = np.zeros(sparsity.shape)
+    for j in range(len(unknowns)):
+        step     = np.array(unknowns)
+        h        = 1e-6 * max(1.,np.abs(unknowns[j]))
+        step[j] += h
+        J[:,j]   = (iterate(step,segment) - residuals) / h
+
+    assert np.all(sparsity[J != 0.])
+    assert np.sum(J != 0.) > 2*len(unknowns)
+    assert np.max(color_columns(sparsity)) + 1 < len(unknowns)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Check Detect
+# ----------------------------------------------------------------------
+
+def check_detect():
+
+    # x = c and y - x*y = 1 at every control point, d(y - x*y)/dx = -y is zero at the guess
+    n_points = 4
+    c        = np.linspace(2.,5.,n_points)[:,None]
+
+    def iterate(segment):
+        x = segment.state.unknowns.x
+        y = segment.state.unknowns.y
+        segment.state.residuals.a = x - c
+        segment.state.residuals.b = y - x*y - 1.
+
+    segment = Data()
+    segment.tag     = 'detect'
+    segment.state   = State()
+    segment.process = Data()
+    segment.process.iterate = iterate
+    segment.state.unknowns.x  = np.zeros([n_points,1])
+    segment.state.unknowns.y  = np.zeros([n_points,1])
+    segment.state.residuals.a = np.zeros([n_points,1])
+    segment.state.residuals.b = np.zeros([n_points,1])
+    segment.state.numerics.number_control_points = n_points
+    segment.state.numerics.solver_jacobian       = 'sparse'
+    segment.state.numerics.jacobian_sparsity     = 'detect'
+
+    converge_root(segment)
+
+    assert segment.state.numerics.converged
+    assert np.max(np.abs(segment.state.unknowns.x - c)) < 1e-8
+    assert np.max(np.abs(segment.state.unknowns.y - 1./(1.-c))) < 1e-8
+
+    key, sparsity, colors = segment.state.numerics._jacobian_coloring
+    assert np.all(np.diag(sparsity[n_points:,:n_points]))
+
+    # the coloring is found again when the settings change
+    segment.state.numerics.jacobian_sparsity = 'pointwise'
+    converge_root(segment)
+    assert segment.state.numerics._jacobian_coloring[0] != key
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# warm_start.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that a mission started from the unknowns of an earlier evaluation
+    matches the cold started solution with fewer residual evaluations
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from B737_mission import mission_setup, check_results
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # the cold start
+    mission = mission_setup()
+    results = mission.evaluate()
+    cache   = mission.warm_start_cache
+
+    assert list(cache.keys()) == list(mission.segments.keys())
+
+    # a new mission started from the saved unknowns
+    mission = mission_setup()
+    mission.settings.warm_start = True
+    mission.warm_start_cache    = cache
+    warm_results = mission.evaluate()
+
+    check_evaluations(results,warm_results)
+    check_results(results,warm_results,'Warm Start')
+
+    # the saved unknowns are interpolated if the number of control points changes
+    for segment in mission.segments.values():
+        segment.state.numerics.number_control_points = 20
+    warm_results = mission.evaluate()
+
+    mission = mission_setup()
+    for segment in mission.segments.values():
+        segment.state.numerics.number_control_points = 20
+    results = mission.evaluate()
+
+    check_evaluations(results,warm_results)
+    check_results(results,warm_results,'Warm Start')
+
+    return
+
+# ----------------------------------------------------------------------
+#   Check Evaluations
+# ----------------------------------------------------------------------
+
+def check_evaluations(results,warm_results):
+
+    for tag in results.segments.keys():
+        cold_evaluations = results.segments[tag].state.numerics.solver_statistics.function_evaluations
+        warm_evaluations = warm_results.segments[tag].state.numerics.solver_statistics.function_evaluations
+        print(tag, 'Cold Evaluations:', cold_evaluations, 'Warm Evaluations:', warm_evaluations)
+        assert warm_evaluations < cold_evaluations
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+# propeller_convergence.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the points of a propeller spun together converge on their own, the same as when
+    they are spun one at a time
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+import time
+
+from SUAVE.Methods.Propulsion import propeller_design
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # Design the Propeller, as in propeller.py
+    prop_attributes = Data()
+    prop_attributes.number_blades       = 2.0
+    prop_attributes.freestream_velocity = 50.0
+    prop_attributes.angular_velocity    = 2000.*(2.*np.pi/60.0)
+    prop_attributes.tip_radius          = 1.5
+    prop_attributes.hub_radius          = 0.05
+    prop_attributes.design_Cl           = 0.7
+    prop_attributes.design_altitude     = 0.0 * Units.km
+    prop_attributes.design_thrust       = 0.0
+    prop_attributes.design_power        = 7000.
+    prop_attributes                     = propeller_design(prop_attributes)
+
+    prop                 = SUAVE.Components.Energy.Converters.Propeller()
+    prop.prop_attributes = prop_attributes
+
+    # a spread of speeds and rotation rates, which take different numbers of iterations
+    n_points = 200
+    V        = np.linspace(20.,70.,n_points)[:,None]
+    omega    = np.linspace(1500.,2500.,n_points)[::-1,None]*Units.rpm
+
+    conditions = setup_conditions(V)
+    prop.inputs.omega = omega
+
+    t0 = time.time()
+    F, Q, P, Cp = prop.spin(conditions)
+    print('%i points together: %.2e s' % (n_points,time.time()-t0))
+
+    iterations = prop.outputs.iterations
+    converged  = prop.outputs.converged
+    print('iterations: %i to %i' % (np.min(iterations),np.max(iterations)))
+
+    assert np.all(converged)
+    assert np.min(iterations) < np.max(iterations)
+
+    # every point is the same as when it is spun alone
+    t0 = time.time()
+    for i in range(n_points):
+        prop.inputs.omega = omega[i:i+1]
+        F_i, Q_i, P_i, Cp_i = prop.spin(setup_conditions(V[i:i+1]))
+
+        assert F_i[0,0]  == F[i,0]
+        assert Q_i[0,0]  == Q[i,0]
+        assert P_i[0,0]  == P[i,0]
+        assert Cp_i[0,0] == Cp[i,0]
+        assert prop.outputs.iterations[0,0] == iterations[i,0]
+    print('%i points one at a time: %.2e s' % (n_points,time.time()-t0))
+
+    # the blade stations are made once, and again when the blade changes
+    blade = prop.blade_geometry()
+    assert prop.blade_geometry() is blade
+
+    chord = prop.prop_attributes.chord_distribution
+    prop.prop_attributes.chord_distribution = chord*1.1
+    assert prop.blade_geometry() is not blade
+
+    # a windmilling point where the Newton iterations oscillate without diverging, it is stopped
+    # at max_iterations and the point spun with it is not changed
+    prop.prop_attributes.chord_distribution = chord
+    V     = np.array([[119.69491525423729],[50.]])
+    omega = np.array([[2003.389830508475],[2000.]])*Units.rpm
+    prop.inputs.omega = omega
+    F, Q, P, Cp = prop.spin(setup_conditions(V))
+
+    assert prop.outputs.iterations[0,0] == prop.max_iterations
+    assert not prop.outputs.converged[0,0]
+    assert prop.outputs.converged[1,0]
+
+    prop.inputs.omega = omega[1:]
+    F_1, Q_1, P_1, Cp_1 = prop.spin(setup_conditions(V[1:]))
+    assert F_1[0,0] == F[1,0]
+
+    return
+
+def setup_conditions(V):
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere_conditions = atmosphere.compute_values(0.0 * Units.km)
+    ones = np.ones_like(V)
+
+    conditions = Data()
+    conditions.freestream = Data()
+    conditions.propulsion = Data()
+    conditions.frames     = Data()
+    conditions.frames.body     = Data()
+    conditions.frames.inertial = Data()
+    for key in atmosphere_conditions.keys():
+        conditions.freestream[key] = atmosphere_conditions[key]*ones
+    conditions.frames.inertial.velocity_vector   = np.hstack([V,0.*V,0.*V])
+    conditions.propulsion.throttle               = ones*1.0
+    conditions.frames.body.transform_to_inertial = np.tile(np.eye(3),(len(V),1,1))
+
+    return conditions
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
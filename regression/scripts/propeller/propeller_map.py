@@ -0,0 +1,137 @@
+# propeller_map.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks a propeller answered from its performance map against the blade element theory,
+    and that the map is kept on disk for the same blades
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Surrogate.surrogate_cache import Surrogate_Cache
+
+import numpy as np
+import copy
+import time
+import shutil
+import tempfile
+
+from SUAVE.Methods.Propulsion import propeller_design
+from propeller_convergence import setup_conditions
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # Design the Propeller, as in propeller.py
+    prop_attributes = Data()
+    prop_attributes.number_blades       = 2.0
+    prop_attributes.freestream_velocity = 50.0
+    prop_attributes.angular_velocity    = 2000.*(2.*np.pi/60.0)
+    prop_attributes.tip_radius          = 1.5
+    prop_attributes.hub_radius          = 0.05
+    prop_attributes.design_Cl           = 0.7
+    prop_attributes.design_altitude     = 0.0 * Units.km
+    prop_attributes.design_thrust       = 0.0
+    prop_attributes.design_power        = 7000.
+    prop_attributes                     = propeller_design(prop_attributes)
+
+    directory = tempfile.mkdtemp()
+    try:
+        cache = Surrogate_Cache(directory)
+
+        prop                 = SUAVE.Components.Energy.Converters.Propeller()
+        prop.prop_attributes = prop_attributes
+        prop.performance_map_settings.cache = cache
+
+        t0       = time.time()
+        prop_map = prop.build_performance_map()
+        t_build  = time.time() - t0
+        print('map errors: ' + str([prop_map.errors.thrust_coefficient,prop_map.errors.power_coefficient]))
+
+        assert prop_map.errors.thrust_coefficient < 0.02
+        assert prop_map.errors.power_coefficient  < 0.02
+
+        # points where the propeller gives thrust
+        n_points = 200
+        V        = np.linspace(30.,60.,n_points)[:,None]
+        omega    = np.linspace(1600.,2000.,n_points)[::-1,None]*Units.rpm
+        check_against_blade_elements(prop,V,omega)
+
+        # the tips are supersonic past the map, these points use the blade element theory
+        V     = np.array([[30.],[40.]])
+        omega = np.array([[1700.],[2600.]])*Units.rpm
+        F_map, F = check_against_blade_elements(prop,V,omega)
+        assert F_map[1,0] == F[1,0]
+        assert prop.outputs.iterations[0,0] == 0
+        assert prop.outputs.iterations[1,0] > 0
+
+        # another propeller with the same blades reads the map from the disk
+        other                 = SUAVE.Components.Energy.Converters.Propeller()
+        other.prop_attributes = copy.deepcopy(prop_attributes)
+        other.performance_map_settings.cache = cache
+
+        t0     = time.time()
+        loaded = other.build_performance_map()
+        t_load = time.time() - t0
+        print('build: %.2e s, load: %.2e s' % (t_build,t_load))
+
+        assert loaded.key == prop_map.key
+        assert np.all(loaded.thrust_coefficient == prop_map.thrust_coefficient)
+        assert np.all(loaded.power_coefficient  == prop_map.power_coefficient)
+
+        # spinning does not hash the blades again while they are unchanged
+        other.use_performance_map = True
+        other.inputs.omega = np.array([[1800.]])*Units.rpm
+        conditions = setup_conditions(np.array([[45.]]))
+        F_1 = other.spin(conditions)[0]
+        other.performance_map_key = None
+        assert np.all(other.spin(conditions)[0] == F_1)
+        assert other.performance_map is loaded
+        del other.performance_map_key
+        
+        # changed blades, even in place, make another map on the next spin
+        other.prop_attributes.chord_distribution *= 1.1
+        F_2 = other.spin(conditions)[0]
+        assert other.performance_map is not loaded
+        assert other.performance_map.key != prop_map.key
+        assert other.performance_map.key == other.performance_map_key()
+        assert np.all(F_2 != F_1)
+        
+    finally:
+        shutil.rmtree(directory,ignore_errors=True)
+
+    return
+
+def check_against_blade_elements(prop,V,omega):
+
+    conditions        = setup_conditions(V)
+    prop.inputs.omega = omega
+
+    prop.use_performance_map = False
+    F, Q, P, Cp = prop.spin(conditions)
+
+    prop.use_performance_map = True
+    t0 = time.time()
+    F_map, Q_map, P_map, Cp_map = prop.spin(conditions)
+    print('%i points from the map: %.2e s' % (len(V),time.time()-t0))
+
+    assert np.max(np.abs(F_map-F))/np.max(np.abs(F)) < 0.01
+    assert np.max(np.abs(P_map-P))/np.max(np.abs(P)) < 0.01
+    assert np.max(np.abs(Q_map-Q))/np.max(np.abs(Q)) < 0.01
+
+    return F_map, F
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
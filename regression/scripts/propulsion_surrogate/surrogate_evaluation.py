@@ -0,0 +1,97 @@
+# surrogate_evaluation.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks that the engine deck surrogates are evaluated for all points at once,
+    and that the compiled surrogates give the same results as scikit-learn
+"""
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Components.Energy.Networks.Propulsor_Surrogate import Propulsor_Surrogate
+from SUAVE.Surrogate.surrogate_evaluation import Compiled_Surrogate
+from SUAVE.Core import Data
+
+import numpy as np
+import time
+
+#----------------------------------------------------------------------
+#   The regression script
+# ---------------------------------------------------------------------
+
+def main():
+
+    # a segment worth of points
+    N = 32
+    state = Data()
+    state.conditions = Data()
+    state.conditions.freestream = Data()
+    state.conditions.propulsion = Data()
+    state.conditions.freestream.mach_number = np.linspace(0.2,0.6,N)[:,None]
+    state.conditions.freestream.altitude    = np.linspace(0.,5000.,N)[:,None]
+    state.conditions.propulsion.throttle    = np.linspace(0.5,1.,N)[:,None]
+
+    cond = np.hstack([state.conditions.freestream.altitude,
+                      state.conditions.freestream.mach_number,
+                      state.conditions.propulsion.throttle])
+
+    for surrogate_type in ['gaussian','knn','svr']:
+
+        propulsion = Propulsor_Surrogate()
+        propulsion.input_file        = 'deck.csv'
+        propulsion.number_of_engines = 2.
+        propulsion.surrogate_type    = surrogate_type
+        propulsion.build_surrogate()
+
+        # one point at a time, as scikit-learn sees it
+        thr_surrogate = propulsion.thrust_surrogate
+        sfc_surrogate = propulsion.sfc_surrogate
+        t0 = time.time()
+        thr_truth = np.array([thr_surrogate.predict([row]) for row in cond]).reshape([N,1])
+        sfc_truth = np.array([sfc_surrogate.predict([row]) for row in cond]).reshape([N,1])
+        t_loop = time.time() - t0
+
+        mdot_truth = thr_truth*sfc_truth*propulsion.number_of_engines
+
+        # all points at once
+        t0 = time.time()
+        results = propulsion.evaluate_thrust(state)
+        t_batch = time.time() - t0
+
+        assert results.thrust_force_vector.shape == (N,3)
+        assert results.vehicle_mass_rate.shape   == (N,1)
+        assert np.max(np.abs(results.thrust_force_vector[:,0:1] - 2.*thr_truth)) <= 1e-10*np.max(np.abs(thr_truth))
+        assert np.max(np.abs(results.vehicle_mass_rate - mdot_truth)) <= 1e-10*np.max(np.abs(mdot_truth))
+
+        # the compiled surrogates
+        propulsion.use_compiled_surrogates = True
+        propulsion.build_surrogate()
+        assert isinstance(propulsion.thrust_surrogate,Compiled_Surrogate)
+        assert isinstance(propulsion.sfc_surrogate,Compiled_Surrogate)
+
+        t0 = time.time()
+        compiled = propulsion.evaluate_thrust(state)
+        t_compiled = time.time() - t0
+
+        print(surrogate_type,'one at a time: %.2e s, batch: %.2e s, compiled: %.2e s' % (t_loop,t_batch,t_compiled))
+
+        error = Data()
+        error.Thrust    = np.max(np.abs(compiled.thrust_force_vector - results.thrust_force_vector))/np.max(np.abs(results.thrust_force_vector))
+        error.Mass_Rate = np.max(np.abs(compiled.vehicle_mass_rate - results.vehicle_mass_rate))/np.max(np.abs(results.vehicle_mass_rate))
+        print(error)
+
+        for k,v in list(error.items()):
+            assert(np.abs(v)<1e-10)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+# mach_solvers.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the area-Mach and Rayleigh solvers against the closed form relations
+    they invert, over many points at once
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+
+import numpy as np
+import time
+import warnings
+
+from SUAVE.Methods.Propulsion.fm_solver import fm_solver
+from SUAVE.Methods.Propulsion.fm_id import fm_id
+from SUAVE.Methods.Propulsion.rayleigh import rayleigh
+from SUAVE.Methods.Propulsion.nozzle_calculations import mach_area, exit_Mach_shock
+from SUAVE.Methods.Utilities.scalar_root import safeguarded_newton
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    n_points = 1000
+    gamma    = np.linspace(1.2,1.4,n_points)
+
+    # known answers on both sides of Mach 1
+    M0 = np.where(np.arange(n_points) % 2 == 0, np.linspace(0.1,0.9,n_points), np.linspace(1.2,4.,n_points))
+    M1 = np.where(M0 < 1., np.linspace(0.05,0.6,n_points), np.linspace(1.5,5.,n_points))
+
+    # area ratio between the stations, from the area ratios to the throat
+    area_ratio = fm_id(M0,gamma)/fm_id(M1,gamma)
+
+    t0    = time.time()
+    M1_fm = fm_solver(area_ratio,M0,gamma)
+    print('fm_solver, %i points: %.2e s' % (n_points,time.time()-t0))
+
+    assert np.max(np.abs(M1_fm-M1)/M1) < 1e-10
+
+    # stagnation temperature ratios of Rayleigh flow
+    def Tt_ratio(M):
+        return 2.*(gamma+1.)*M*M*(1.+(gamma-1.)/2.*M*M)/(1.+gamma*M*M)**2.
+    TtR = Tt_ratio(M1)/Tt_ratio(M0)
+
+    t0 = time.time()
+    M1_ray, Ptr = rayleigh(gamma,M0,TtR)
+    print('rayleigh, %i points: %.2e s' % (n_points,time.time()-t0))
+
+    assert np.max(np.abs(M1_ray-M1)/M1) < 1e-10
+
+    Ptr_truth = (1.+gamma*M0*M0)/(1.+gamma*M1*M1)*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**(gamma/(gamma-1.))
+    assert np.max(np.abs(Ptr-Ptr_truth)/Ptr_truth) < 1e-10
+
+    # the nozzle relations, with the throat as the reference station
+    gamma_column = gamma[:,None]
+    area_throat  = 1./fm_id(M1,gamma)[:,None]
+    subsonic     = mach_area(area_throat[M1<1.],gamma_column[M1<1.],True)
+    supersonic   = mach_area(area_throat[M1>1.],gamma_column[M1>1.],False)
+    assert np.max(np.abs(subsonic[:,0]-M1[M1<1.])/M1[M1<1.]) < 1e-10
+    assert np.max(np.abs(supersonic[:,0]-M1[M1>1.])/M1[M1>1.]) < 1e-10
+
+    # the exit Mach number behind a shock, from the mass flow through the exit
+    Pt_out = 3e5
+    P0     = 1e5
+    ar     = (Pt_out/P0)/(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.)))*M0*np.sqrt(1.+(gamma-1.)/2.*M0*M0))
+    Me     = exit_Mach_shock(ar,gamma,Pt_out,P0)
+    assert np.max(np.abs(Me-M0)/M0) < 1e-10
+
+    # the brackets keep the branch, however far the guess is
+    x, converged = safeguarded_newton(lambda x, a: (x*x-a, 2.*x), -10., 0., guess=5., args=(np.array([4.,9.]),))
+    assert np.all(converged)
+    assert np.max(np.abs(x-np.array([-2.,-3.]))) < 1e-12
+
+    # points without a solution on their branch are flagged and warned about, the others are kept
+    check_no_solution()
+
+    return
+
+def check_no_solution():
+
+    gamma = 1.4
+
+    # no root in the range, the iterate is held at the end of the range
+    x, converged = safeguarded_newton(lambda x, a: (x*x+a, 2.*x), 0., 10., guess=5., args=(np.array([1.,-4.]),))
+    assert np.all(converged == [False,True])
+    assert np.abs(x[1]-2.) < 1e-12
+
+    # below the throat area of the subsonic M0 = 0.5, and past the choking heat addition
+    M0         = np.array([0.5,0.5])
+    area_ratio = np.array([0.5,1.5])
+    TtR        = np.array([2.,1.2])
+
+    for function, args in [(fm_solver,(area_ratio,M0,gamma)),
+                           (rayleigh,(gamma,M0,TtR)),
+                           (mach_area,(np.array([0.5,1.5]),gamma,True))]:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            result = function(*args)
+        assert any(issubclass(w.category,RuntimeWarning) for w in caught), function.__name__
+        print(function.__name__ + ' warned: ' + str(caught[0].message))
+
+    # the point with a solution is still solved
+    M1 = fm_solver(area_ratio,M0,gamma)
+    assert np.abs(fm_id(M0[1],gamma)/fm_id(M1[1],gamma) - area_ratio[1]) < 1e-10
+
+    return
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# complex_step_sizing.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+""" checks the complex step Jacobian of the sizing loop against finite differences,
+    on a sizing evaluation that carries complex numbers
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+from SUAVE.Sizing.Sizing_Loop import Sizing_Loop, Complex_Step_Gradient, Finite_Difference_Gradient
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    scaling = np.array([10000.,20.])
+    y       = np.array([1.,1.])
+
+    # the Jacobians at the default guess
+    nexus  = setup_nexus()
+    err, y_out = sizing_evaluation(y,nexus,scaling)
+    J_fd, i_fd = Finite_Difference_Gradient(y,err,sizing_evaluation,nexus,scaling,0,1E-6)
+    J_cs, i_cs = Complex_Step_Gradient(y,sizing_evaluation,nexus,scaling,0)
+
+    print('Jacobian difference: ' + str(np.max(np.abs(J_cs-J_fd))))
+    assert i_fd == i_cs == len(y)
+    assert np.max(np.abs(J_cs-J_fd)) < 1E-5
+    assert not np.iscomplexobj(J_cs)
+
+    # the sizing loop closes to the same aircraft with either Jacobian
+    sized = Data()
+    for jacobian_method in ['finite_difference','complex_step']:
+        nexus = setup_nexus()
+        nexus.sizing_loop.iteration_options.jacobian_method = jacobian_method
+        nexus = nexus.sizing_loop(nexus)
+
+        assert nexus.sizing_loop.norm_error < 1E-8
+        sized[jacobian_method] = nexus.sizing_variables*scaling
+
+    assert nexus.complex_evaluations > 0
+    error = np.max(np.abs(sized.complex_step-sized.finite_difference)/sized.finite_difference)
+    print('sized mass and wing area: ' + str(sized.complex_step) + ', error: ' + str(error))
+    assert error < 1E-6
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup
+# ----------------------------------------------------------------------
+
+def setup_nexus():
+
+    sizing_loop = Sizing_Loop()
+    sizing_loop.tolerance          = 1E-10
+    sizing_loop.initial_step       = 'Default'
+    sizing_loop.update_method      = 'newton-raphson'
+    sizing_loop.default_y          = np.array([1.,1.])
+    sizing_loop.default_scaling    = np.array([10000.,20.])
+    sizing_loop.min_y              = [.1,.1]
+    sizing_loop.max_y              = [10.,10.]
+    sizing_loop.sizing_evaluation  = sizing_evaluation
+    sizing_loop.maximum_iterations = 50
+    sizing_loop.iteration_options.newton_raphson_tolerance     = 1.
+    sizing_loop.iteration_options.max_newton_raphson_tolerance = 0.
+
+    nexus = Data()
+    nexus.optimization_problem       = None
+    nexus.sizing_loop                = sizing_loop
+    nexus.total_number_of_iterations = 0
+    nexus.complex_evaluations        = 0
+    nexus.results                    = Data()
+
+    return nexus
+
+# ----------------------------------------------------------------------
+#   Sizing Evaluation
+# ----------------------------------------------------------------------
+
+def sizing_evaluation(y,nexus,scaling):
+
+    # only smooth, complex safe operations
+    if np.iscomplexobj(y):
+        nexus.complex_evaluations += 1
+
+    mass      = y[0]*scaling[0]
+    wing_area = y[1]*scaling[1]
+
+    wing_loading = 450.*9.81
+    payload      = 2000.
+    empty_mass   = 1500. + 0.25*mass + 15.*wing_area**1.2
+    fuel_mass    = 0.15*mass*(1. + 1E-3*wing_area) + 50.*np.sqrt(mass/1000.)
+
+    mass_out      = empty_mass + fuel_mass + payload
+    wing_area_out = mass*9.81/wing_loading
+
+    y_out = np.array([mass_out,wing_area_out])/scaling
+    f     = (y_out - y)/y
+
+    return f, y_out
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
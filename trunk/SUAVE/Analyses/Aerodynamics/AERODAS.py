@@ -3,6 +3,7 @@
 # 
 # Created:  Feb 2016, E. Botero
 # Modified: Apr 2019, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -53,6 +54,15 @@ class AERODAS(Markup):
         settings = self.settings
         settings.section_zero_lift_angle_of_attack = 0.0 * Units.deg
         settings.section_lift_curve_slope          = 2.0 * np.pi
+        settings.drag_coefficient_increment        = 0.0000
+        
+        # the wings can be tabulated when the analysis is initialized, instead of evaluated
+        settings.use_tabulated_wings               = False
+        settings.tabulation                        = Data()
+        settings.tabulation.angle_of_attack        = np.linspace(-180.,180.,1441) * Units.deg
+        settings.tabulation.reynolds_number        = np.logspace(3.,9.,49) # per unit length
+        settings.tabulation.tolerance              = 1.e-3
+        settings.tabulation.refinements            = 10
 
         # build the evaluation process
         compute = self.process.compute
@@ -60,12 +70,7 @@ class AERODAS(Markup):
         compute.setup_data = Methods.AERODAS_setup.setup_data
     
         # Get all of the coefficients for AERODAS wings
-        compute.wings_coefficients = Process()
-        compute.wings_coefficients = Process_Geometry('wings')
-        compute.wings_coefficients.section_properties  = Methods.section_properties.section_properties
-        compute.wings_coefficients.finite_aspect_ratio = Methods.finite_aspect_ratio.finite_aspect_ratio
-        compute.wings_coefficients.pre_stall           = Methods.pre_stall_coefficients.pre_stall_coefficients
-        compute.wings_coefficients.post_stall          = Methods.post_stall_coefficients.post_stall_coefficients
+        compute.wings_coefficients = wings_coefficients()
         
         # Fuselage drag?
         # do a plate build up with angles
@@ -80,9 +85,61 @@ class AERODAS(Markup):
         compute.drag = Process()
         compute.drag.total                             = Methods.AERODAS_setup.drag_total
         
-        def initialize(self):
-            super(AERODAS, self).initialize()
-            self.process.compute.lift.inviscid_wings.geometry = self.geometry
-            self.process.compute.lift.inviscid_wings.initialize()
+    def initialize(self):
+        """Initializes the analysis. If settings.use_tabulated_wings is set, the wings are tabulated
+        once here and the tables are interpolated in place of the model of each wing.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        None
+
+        Properties Used:
+        self.settings.use_tabulated_wings  [boolean] see SUAVE.Methods.Aerodynamics.AERODAS.tabulated_coefficients
+        """               
+        super(AERODAS, self).initialize()
+        
+        compute = self.process.compute
+        
+        if self.settings.use_tabulated_wings:
+            Methods.tabulated_coefficients.tabulate_wings(self.settings,self.geometry)
+            # the wings are found from the tables together with the totals
+            compute.wings_coefficients = Process()
+            compute.lift_drag_total    = Methods.tabulated_coefficients.tabulated_lift_drag_total
+        else:
+            compute.wings_coefficients = wings_coefficients()
+            compute.lift_drag_total    = Methods.AERODAS_setup.lift_drag_total
             
-        finalize = initialize   
\ No newline at end of file
+## @ingroup Analyses-Aerodynamics
+def wings_coefficients():
+    """Builds the process that evaluates the AERODAS model of each wing.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    None
+
+    Outputs:
+    process                                [SUAVE.Analyses.Aerodynamics.Process_Geometry]
+
+    Properties Used:
+    N/A
+    """      
+    process = Process_Geometry('wings')
+    process.section_properties  = Methods.section_properties.section_properties
+    process.finite_aspect_ratio = Methods.finite_aspect_ratio.finite_aspect_ratio
+    process.pre_stall           = Methods.pre_stall_coefficients.pre_stall_coefficients
+    process.post_stall          = Methods.post_stall_coefficients.post_stall_coefficients
+    
+    return process
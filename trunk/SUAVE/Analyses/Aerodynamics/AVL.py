@@ -3,6 +3,7 @@
 #
 # Created:  Apr 2017, M. Clarke 
 # Modified: Apr 2019, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -70,6 +71,7 @@ class AVL(Markup):
         settings.chordwise_vortices                 = None        
         
         settings.maximum_lift_coefficient           = np.inf 
+        settings.surrogate_cache                    = None
         
                 
         # Build the evaluation process
@@ -119,6 +121,7 @@ class AVL(Markup):
 
         Properties Used:
         self.geometry
+        self.settings.surrogate_cache  <Surrogate_Cache> (optional)
         """  
         super(AVL, self).initialize()
         # unpack
@@ -126,6 +129,7 @@ class AVL(Markup):
         cv = self.settings.chordwise_vortices 
         
         self.process.compute.lift.inviscid.geometry = self.geometry
+        self.process.compute.lift.inviscid.settings.surrogate_cache = self.settings.surrogate_cache
         
         # Generate the surrogate
         self.process.compute.lift.inviscid.initialize(sv,cv)
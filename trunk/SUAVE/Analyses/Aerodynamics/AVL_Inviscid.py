@@ -4,6 +4,7 @@
 # Created:  Apr 2017, M. Clarke 
 # Modified: Jan 2018, W. Maier
 #           Oct 2018, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -25,6 +26,9 @@ from SUAVE.Methods.Aerodynamics.AVL.translate_data   import translate_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files      import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings    import Settings
 from SUAVE.Methods.Aerodynamics.AVL.Data.Cases       import Run_Case
+from SUAVE.Surrogate.surrogate_evaluation import predict, compile_surrogate
+from SUAVE.Surrogate.surrogate_cache import load_surrogates, save_surrogates, file_contents
+from SUAVE.Methods.Utilities.job_scheduler import run_jobs
 
 # Package imports
 import time
@@ -83,6 +87,8 @@ class AVL_Inviscid(Aerodynamics):
         self.settings.filenames.err_filename = sys.stderr        
         self.settings.spanwise_vortices      = None 
         self.settings.chordwise_vortices     = None         
+        self.settings.use_compiled_surrogates = False
+        self.settings.surrogate_cache        = None
         
         # Conditions table, used for surrogate model training
         self.training                        = Data()   
@@ -96,6 +102,13 @@ class AVL_Inviscid(Aerodynamics):
         self.training.span_efficiency_factor = None
         self.training_file                   = None
         
+        # Training runs, more than one process runs several cases at once in their own folders
+        self.training_jobs                   = Data()
+        self.training_jobs.processes         = 1
+        self.training_jobs.timeout           = None
+        self.training_jobs.retries           = 0
+        self.training_jobs.folder            = 'avl_training'
+        
         # Surrogate model
         self.surrogates                      = Data()
         
@@ -119,6 +132,8 @@ class AVL_Inviscid(Aerodynamics):
 
         Properties Used:
         self.geometry.tag
+        self.settings.surrogate_cache  <Surrogate_Cache> (optional - reuses the surrogates of an
+                                       unchanged geometry, settings and training table)
         """  
         geometry     = self.geometry
         self.tag     = 'avl_analysis_of_{}'.format(geometry.tag)
@@ -136,11 +151,21 @@ class AVL_Inviscid(Aerodynamics):
         else:
             self.settings.discretization.defaults.wing.chordwise_vortices = chordwise_vortices     
             
+        cache = self.settings.get('surrogate_cache',None)
+        key   = None
+        if cache is not None:
+            key = cache.key(type(self),geometry,self.settings,self.training.angle_of_attack,self.training.Mach,
+                            file_contents(self.training_file),self.regression_flag)
+            if load_surrogates(cache,key,self):
+                return
+            
         # Sample training data
         self.sample_training()
     
         # Build surrogate
         self.build_surrogate()
+        
+        save_surrogates(cache,key,self)
 
         return
 
@@ -180,16 +205,11 @@ class AVL_Inviscid(Aerodynamics):
         drag_model    = surrogates.drag_coefficient
         e_model       = surrogates.span_efficiency_factor
         
-        # Inviscid lift
-        data_len        = len(AoA)
-        inviscid_lift   = np.zeros([data_len,1])
-        inviscid_drag   = np.zeros([data_len,1])    
-        span_efficiency = np.zeros([data_len,1]) 
-        
-        for ii,_ in enumerate(AoA):
-            inviscid_lift[ii]   = lift_model.predict([np.array([AoA[ii][0],mach[ii][0]])])  
-            inviscid_drag[ii]   = drag_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            span_efficiency[ii] = e_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
+        # Inviscid lift, all points at once
+        xy              = np.hstack([AoA,mach])
+        inviscid_lift   = predict(lift_model,xy)
+        inviscid_drag   = predict(drag_model,xy)
+        span_efficiency = predict(e_model,xy)
         
         # Store inviscid lift results     
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = Data()    
@@ -231,6 +251,8 @@ class AVL_Inviscid(Aerodynamics):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.training_jobs.
+          processes        [-] more than one runs the cases at once, see evaluate_training_cases
         """          
         # Unpack 
         geometry = self.geometry
@@ -252,24 +274,33 @@ class AVL_Inviscid(Aerodynamics):
         for i,_ in enumerate(mach):
             for j,_ in enumerate(AoA):
                 xy[i*len(mach)+j,:] = np.array([AoA[j],mach[i]])
-        for j,_ in enumerate(mach):
-            # Set training conditions
-            run_conditions = Aerodynamics()
-            run_conditions.weights.total_mass           = 0     # Currently set to zero. Used for dynamic analysis which is under development
-            run_conditions.freestream.density           = 0     # Density not used in inviscid computation therefore set to zero. Used for dynamic analysis which is under development
-            run_conditions.freestream.gravity           = 9.81        
-            run_conditions.aerodynamics.angle_of_attack = AoA 
-            run_conditions.freestream.mach_number       = mach[j]
-            
-            #Run Analysis at AoA[i] and mach[j]
-            results =  self.evaluate_conditions(run_conditions)
-            
-            # Obtain CD , CL and e  
-            CL[count*len(mach):(count+1)*len(mach),0]   = results.aerodynamics.lift_coefficient[:,0]
-            CD[count*len(mach):(count+1)*len(mach),0]   = results.aerodynamics.drag_breakdown.induced.total[:,0]      
-            e[count*len(mach):(count+1)*len(mach),0]    = results.aerodynamics.drag_breakdown.induced.efficiency_factor[:,0]  
+                
+        if self.training_jobs.processes != 1 and not self.regression_flag:
+            # Run every case at once
+            coefficients = self.evaluate_training_cases(xy)
+            CL           = coefficients[:,0:1]
+            CD           = coefficients[:,1:2]
+            e            = coefficients[:,2:3]
             
-            count += 1
+        else:
+            for j,_ in enumerate(mach):
+                # Set training conditions
+                run_conditions = Aerodynamics()
+                run_conditions.weights.total_mass           = 0     # Currently set to zero. Used for dynamic analysis which is under development
+                run_conditions.freestream.density           = 0     # Density not used in inviscid computation therefore set to zero. Used for dynamic analysis which is under development
+                run_conditions.freestream.gravity           = 9.81        
+                run_conditions.aerodynamics.angle_of_attack = AoA 
+                run_conditions.freestream.mach_number       = mach[j]
+                
+                #Run Analysis at AoA[i] and mach[j]
+                results =  self.evaluate_conditions(run_conditions)
+                
+                # Obtain CD , CL and e  
+                CL[count*len(mach):(count+1)*len(mach),0]   = results.aerodynamics.lift_coefficient[:,0]
+                CD[count*len(mach):(count+1)*len(mach),0]   = results.aerodynamics.drag_breakdown.induced.total[:,0]      
+                e[count*len(mach):(count+1)*len(mach),0]    = results.aerodynamics.drag_breakdown.induced.efficiency_factor[:,0]  
+                
+                count += 1
         
         time1 = time.time()
         
@@ -314,7 +345,7 @@ class AVL_Inviscid(Aerodynamics):
           span_efficiency_factor <Guassian process surrogate>
 
         Properties Used:
-        No others
+        self.settings.use_compiled_surrogates  [boolean] see SUAVE.Surrogate.surrogate_evaluation.compile_surrogate
         """   
         # Unpack data
         training                         = self.training
@@ -334,6 +365,11 @@ class AVL_Inviscid(Aerodynamics):
         cd_surrogate                     = regr_cd.fit(xy, CD_data)
         e_surrogate                      = regr_e.fit(xy, e_data)
         
+        if self.settings.use_compiled_surrogates:
+            cl_surrogate                 = compile_surrogate(cl_surrogate)
+            cd_surrogate                 = compile_surrogate(cd_surrogate)
+            e_surrogate                  = compile_surrogate(e_surrogate)
+        
         self.surrogates.lift_coefficient = cl_surrogate
         self.surrogates.drag_coefficient = cd_surrogate
         self.surrogates.span_efficiency_factor = e_surrogate  
@@ -346,6 +382,80 @@ class AVL_Inviscid(Aerodynamics):
 #  Helper Functions
 # ----------------------------------------------------------------------
         
+    def evaluate_training_cases(self,points):
+        """Runs AVL at every training point, several at once, each in its own folder.
+
+        Assumptions:
+        Every case runs AVL in its own folder under the run folder, see 
+        SUAVE.Methods.Utilities.job_scheduler.run_jobs for how the cases are run
+
+        Source:
+        N/A
+
+        Inputs:
+        points             [radians,-] angles of attack and mach numbers, one point per row
+
+        Outputs:
+        coefficients       [-] CL, CD and e, one point per row
+
+        Properties Used:
+        self.training_jobs.
+          processes        [-] (None for the number of processors)
+          timeout          [s]
+          retries          [-]
+          folder           <string> results are kept here, so an interrupted training continues where it stopped
+        """  
+        
+        jobs = self.training_jobs
+        key  = (type(self),self.geometry,self.settings)
+        
+        coefficients = run_jobs(self.evaluate_training_case,list(points),jobs.folder,jobs.processes,
+                                jobs.timeout,jobs.retries,key=key)
+        
+        return np.array(coefficients)
+    
+    def evaluate_training_case(self,point):
+        """Runs AVL at one training point.
+
+        Assumptions:
+        Called from the job folder, the AVL files are written to a folder of the same name under
+        the run folder, so that cases run at once never share their files
+
+        Source:
+        N/A
+
+        Inputs:
+        point              [radians,-] angle of attack and mach number
+
+        Outputs:
+        coefficients       [-] CL, CD and e
+
+        Properties Used:
+        N/A
+        """  
+        
+        run_conditions = Aerodynamics()
+        run_conditions.weights.total_mass           = 0
+        run_conditions.freestream.density           = 0
+        run_conditions.freestream.gravity           = 9.81        
+        run_conditions.aerodynamics.angle_of_attack = np.array([point[0]])
+        run_conditions.freestream.mach_number       = point[1]
+        
+        # a run folder of its own, as the run folder may be shared by every job
+        filenames            = self.settings.filenames
+        run_folder           = filenames.run_folder
+        filenames.run_folder = os.path.join(os.path.abspath(run_folder),os.path.basename(os.getcwd()))
+        try:
+            results = self.evaluate_conditions(run_conditions)
+        finally:
+            filenames.run_folder = run_folder
+        
+        coefficients = [results.aerodynamics.lift_coefficient[0,0],
+                        results.aerodynamics.drag_breakdown.induced.total[0,0],
+                        results.aerodynamics.drag_breakdown.induced.efficiency_factor[0,0]]
+        
+        return coefficients
+
     def evaluate_conditions(self,run_conditions):
         """Process vehicle to setup geometry, condititon, and configuration.
 
@@ -2,7 +2,7 @@
 # Lifting_Line.py
 # 
 # Created:  Aug 2017, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -193,16 +193,13 @@ class Lifting_Line(Aerodynamics):
         konditions              = Data()
         konditions.aerodynamics = Data()
 
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
-            
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
-            
-            # these functions are inherited from Aerodynamics() or overridden
-            CL[i], wing_lifts = calculate_lift_lifting_line(konditions, settings, geometry)
-            for wing in geometry.wings.values():
-                wing_CLs[wing.tag][i] = wing_lifts[wing.tag]
+        # calculate aerodynamics for the whole table at once
+        konditions.aerodynamics.angle_of_attack = AoA
+        
+        # these functions are inherited from Aerodynamics() or overridden
+        CL[:], wing_lifts = calculate_lift_lifting_line(konditions, settings, geometry)
+        for wing in geometry.wings.values():
+            wing_CLs[wing.tag][:] = wing_lifts[wing.tag]
 
         # store training data
         training.lift_coefficient = CL
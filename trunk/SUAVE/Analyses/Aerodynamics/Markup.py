@@ -5,6 +5,7 @@
 # Modified: Feb 2016, Andrew Wendorff
 #           Oct 2017, T. MacDonald
 #           Apr 2019, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -13,7 +14,12 @@
 from SUAVE.Core import Data
 from .Aerodynamics import Aerodynamics
 from SUAVE.Analyses import Process
+from SUAVE.Analyses.Atmospheric import US_Standard_1976
+from SUAVE.Analyses.Mission.Segments.Conditions import State, Conditions
 from SUAVE.Methods.Geometry.Two_Dimensional.Planform.segment_properties import segment_properties
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.drag_geometry import drag_geometry
+
+import numpy as np
 
 
 # ----------------------------------------------------------------------
@@ -83,9 +89,145 @@ class Markup(Aerodynamics):
         results = self.process.compute(state,settings,geometry)
         
         return results
+    
+    def evaluate_batch(self,mach,altitude,angle_of_attack,temperature_deviation=0.,atmosphere=None,batch_size=None):
+        """Evaluates the analysis at many flight conditions at once, such as for drag polars or trim 
+        tables, without setting up a mission segment.
+
+        Assumptions:
+        The inputs are broadcast against each other, any number of conditions of any shape can be given.
+        The freestream is found from the atmosphere as in a mission segment. 
+        The coefficients are not limited to the maximum lift coefficient.
+
+        Source:
+        N/A
+
+        Inputs:
+        mach                        [Unitless]
+        altitude                    [m]
+        angle_of_attack             [radians]
+        temperature_deviation       [K] (optional)
+        atmosphere                  <SUAVE atmosphere analysis> (optional - defaults to US_Standard_1976)
+        batch_size                  [-] number of conditions evaluated together (optional - defaults to all),
+                                        this bounds the memory used for large sweeps
+
+        Outputs:
+        results.
+          lift_coefficient          [Unitless] in the broadcast shape of the inputs
+          drag_coefficient          [Unitless] in the broadcast shape of the inputs
+
+        Properties Used:
+        N/A
+        """   
+        
+        if atmosphere is None:
+            atmosphere = US_Standard_1976()
+        
+        # one column per input
+        inputs = np.broadcast_arrays(*[np.asarray(value,dtype=float) for value in [mach,altitude,angle_of_attack,temperature_deviation]])
+        shape  = inputs[0].shape
+        mach, altitude, angle_of_attack, temperature_deviation = [np.reshape(value,(-1,1)) for value in inputs]
+        
+        count      = mach.shape[0]
+        batch_size = int(batch_size or max(count,1))
+        CL         = np.zeros((count,1))
+        CD         = np.zeros((count,1))
+        
+        for start in range(0,count,batch_size):
+            rows    = slice(start,start+batch_size)
+            state   = self.batch_state(mach[rows],altitude[rows],angle_of_attack[rows],temperature_deviation[rows],atmosphere)
+            results = self.evaluate(state)
+            CL[rows] = results.lift.total
+            CD[rows] = results.drag.total
+            
+        results = Data()
+        results.lift_coefficient = np.reshape(CL,shape)
+        results.drag_coefficient = np.reshape(CD,shape)
+        
+        return results
+    
+    def batch_state(self,mach,altitude,angle_of_attack,temperature_deviation,atmosphere):
+        """Builds the state of one batch of evaluate_batch, with only the conditions used by the 
+        aerodynamic analyses.
+
+        Assumptions:
+        Wind axes, the velocity is found from the Mach number
+        The conditions are made at their full size, instead of expanding the conditions of a segment
+
+        Source:
+        N/A
+
+        Inputs:
+        mach                        [Unitless] column
+        altitude                    [m] column
+        angle_of_attack             [radians] column
+        temperature_deviation       [K] column
+        atmosphere                  <SUAVE atmosphere analysis>
+
+        Outputs:
+        state.conditions.
+          freestream.
+            altitude                [m]
+            pressure                [Pa]
+            temperature             [K]
+            density                 [kg/m^3]
+            speed_of_sound          [m/s]
+            dynamic_viscosity       [Pa-s]
+            velocity                [m/s]
+            mach_number             [Unitless]
+            reynolds_number         [1/m]
+            dynamic_pressure        [Pa]
+          aerodynamics.
+            angle_of_attack         [radians]
+            side_slip_angle         [radians]
+            roll_angle              [radians]
+            lift_breakdown          <Conditions> empty
+            drag_breakdown          <Conditions> empty
+
+        Properties Used:
+        N/A
+        """   
+        
+        rows  = mach.shape[0]
+        state = State()
+        state.expand_rows(rows)
+        
+        conditions = Conditions()
+        conditions.freestream   = Conditions()
+        conditions.aerodynamics = Conditions()
+        conditions.aerodynamics.lift_breakdown              = Conditions()
+        conditions.aerodynamics.drag_breakdown              = Conditions()
+        conditions.aerodynamics.drag_breakdown.parasite     = Conditions()
+        conditions.aerodynamics.drag_breakdown.compressible = Conditions()
+        state.conditions = conditions
+        
+        # the atmosphere
+        atmo_data  = atmosphere.compute_values(altitude,temperature_deviation)
+        freestream = conditions.freestream
+        freestream.altitude          = altitude
+        freestream.pressure          = atmo_data.pressure
+        freestream.temperature       = atmo_data.temperature
+        freestream.density           = atmo_data.density
+        freestream.speed_of_sound    = atmo_data.speed_of_sound
+        freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+        
+        # the freestream
+        rho  = freestream.density
+        Vmag = mach * freestream.speed_of_sound
+        freestream.velocity          = Vmag
+        freestream.mach_number       = mach
+        freestream.reynolds_number   = rho * Vmag / freestream.dynamic_viscosity
+        freestream.dynamic_pressure  = 0.5 * rho * Vmag**2
+        
+        conditions.aerodynamics.angle_of_attack = angle_of_attack
+        conditions.aerodynamics.side_slip_angle = np.zeros_like(angle_of_attack)
+        conditions.aerodynamics.roll_angle      = np.zeros_like(angle_of_attack)
+        
+        return state
         
     def initialize(self):
-        """The default finalize function. Calls the initialize process.
+        """The default finalize function. Calls the initialize process, and finds the geometric
+        quantities of the drag buildup.
 
         Assumptions:
         None
@@ -106,6 +248,7 @@ class Markup(Aerodynamics):
         for wing in self.geometry.wings:
             if len(wing.Segments) > 0:
                 segment_properties(self.settings,wing)          
+        drag_geometry(self.geometry)
     
         
         
\ No newline at end of file
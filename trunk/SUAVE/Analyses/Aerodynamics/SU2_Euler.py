@@ -4,6 +4,7 @@
 # Created:  Sep 2016, E. Botero
 # Modified: Jan 2017, T. MacDonald
 #           Apr 2019, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -75,6 +76,7 @@ class SU2_Euler(Markup):
         settings.processors                         = 1
         settings.vsp_mesh_growth_ratio              = 1.3
         settings.vsp_mesh_growth_limiting_flag      = False
+        settings.surrogate_cache                    = None
         
         # Build the evaluation process
         compute = self.process.compute
@@ -130,18 +132,25 @@ class SU2_Euler(Markup):
           half_mesh_flag                <boolean> Determines if a symmetry plane is used
           vsp_mesh_growth_ratio         [-] Determines how the mesh grows
           vsp_mesh_growth_limiting_flag <boolean> Determines if 3D growth limiting is used
+          surrogate_cache               <Surrogate_Cache> (optional - a cached surrogate needs no mesh)
         """         
         super(SU2_Euler, self).initialize()
-        self.process.compute.lift.inviscid.geometry = self.geometry
+        inviscid = self.process.compute.lift.inviscid
+        inviscid.geometry = self.geometry
+        inviscid.settings.surrogate_cache = self.settings.surrogate_cache
+        
+        # The mesh settings are part of the cache key
+        if inviscid.load_cached_surrogates(self.settings):
+            return
         
         tag = self.geometry.tag
         # Mesh the geometry in prepartion for CFD if no training file exists
-        if self.process.compute.lift.inviscid.training_file is None:
+        if inviscid.training_file is None:
             write_vsp_mesh(self.geometry,tag,self.settings.half_mesh_flag,self.settings.vsp_mesh_growth_ratio,self.settings.vsp_mesh_growth_limiting_flag)
             write_geo_file(tag)
             mesh_geo_file(tag)
         
         # Generate the surrogate
-        self.process.compute.lift.inviscid.initialize()
+        inviscid.initialize(self.settings)
         
     finalize = initialize
\ No newline at end of file
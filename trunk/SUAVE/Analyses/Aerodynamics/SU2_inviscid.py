@@ -3,6 +3,7 @@
 #
 # Created:  Sep 2016, E. Botero
 # Modified: Jan 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,6 +17,9 @@ from SUAVE.Core import Data, Units
 from .Aerodynamics import Aerodynamics
 from SUAVE.Input_Output.SU2.call_SU2_CFD import call_SU2_CFD
 from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
+from SUAVE.Surrogate.surrogate_evaluation import predict, compile_surrogate
+from SUAVE.Surrogate.surrogate_cache import load_surrogates, save_surrogates, file_contents
+from SUAVE.Methods.Utilities.job_scheduler import run_jobs
 from sklearn.gaussian_process.kernels import ExpSineSquared
 
 # Package imports
@@ -66,6 +70,8 @@ class SU2_inviscid(Aerodynamics):
         self.settings.parallel           = False
         self.settings.processors         = 1
         self.settings.maximum_iterations = 1500
+        self.settings.use_compiled_surrogates = False
+        self.settings.surrogate_cache    = None
 
         # Conditions table, used for surrogate model training
         self.training = Data()        
@@ -75,11 +81,18 @@ class SU2_inviscid(Aerodynamics):
         self.training.drag_coefficient = None
         self.training_file             = None
         
+        # Training runs, more than one process runs several cases at once in their own folders
+        self.training_jobs             = Data()
+        self.training_jobs.processes   = 1
+        self.training_jobs.timeout     = None
+        self.training_jobs.retries     = 0
+        self.training_jobs.folder      = 'su2_training'
+        
         # Surrogate model
         self.surrogates = Data()
  
         
-    def initialize(self):
+    def initialize(self,*dependencies):
         """Drives functions to get training samples and build a surrogate.
 
         Assumptions:
@@ -89,19 +102,78 @@ class SU2_inviscid(Aerodynamics):
         N/A
 
         Inputs:
-        None
+        dependencies                   anything else the training data depends on, such as mesh settings
 
         Outputs:
         None
 
         Properties Used:
-        None
+        self.settings.surrogate_cache  <Surrogate_Cache> (optional - reuses the surrogates of an
+                                       unchanged geometry, settings and training table)
         """                     
+        if self.load_cached_surrogates(*dependencies):
+            return
+        
         # Sample training data
         self.sample_training()
                     
         # Build surrogate
         self.build_surrogate()
+        
+        cache = self.settings.get('surrogate_cache',None)
+        if cache is not None:
+            save_surrogates(cache,self.cache_key(*dependencies),self)
+        
+    def cache_key(self,*dependencies):
+        """Hashes everything the training data and surrogates depend on.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        dependencies                   anything else the training data depends on
+
+        Outputs:
+        key                            <string>
+
+        Properties Used:
+        self.geometry
+        self.settings
+        self.training.
+          angle_of_attack              [radians]
+          Mach                         [-]
+        self.training_file
+        """   
+        cache = self.settings.surrogate_cache
+        return cache.key(type(self),self.geometry,self.settings,self.training.angle_of_attack,
+                         self.training.Mach,file_contents(self.training_file),*dependencies)
+        
+    def load_cached_surrogates(self,*dependencies):
+        """Restores the training data and surrogates from the surrogate cache, if there is one.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        dependencies                   anything else the training data depends on
+
+        Outputs:
+        found                          <boolean>
+
+        Properties Used:
+        self.settings.surrogate_cache  <Surrogate_Cache> (optional)
+        """   
+        cache = self.settings.get('surrogate_cache',None)
+        if cache is None:
+            return False
+        
+        return load_surrogates(cache,self.cache_key(*dependencies),self)
 
 
     def evaluate(self,state,settings,geometry):
@@ -136,11 +208,9 @@ class SU2_inviscid(Aerodynamics):
         lift_model = surrogates.lift_coefficient
         drag_model = surrogates.drag_coefficient
         
-        # Inviscid lift
+        # Inviscid lift, all points at once
         data_len = len(AoA)
-        inviscid_lift = np.zeros([data_len,1])
-        for ii,_ in enumerate(AoA):
-            inviscid_lift[ii] = lift_model.predict([np.array([AoA[ii][0],mach[ii][0]])]) #sklearn fix
+        inviscid_lift = predict(lift_model,np.hstack([AoA,mach]))
             
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = Data()
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift.total = inviscid_lift
@@ -177,6 +247,8 @@ class SU2_inviscid(Aerodynamics):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.training_jobs.
+          processes        [-] more than one runs the cases at once, see evaluate_training_cases
         """               
         # Unpack
         geometry = self.geometry
@@ -198,16 +270,23 @@ class SU2_inviscid(Aerodynamics):
             xy = np.zeros([table_size,2])
             count = 0
             time0 = time.time()
-            for i,_ in enumerate(AoA):
-                for j,_ in enumerate(mach):
-                    
-                    xy[count,:] = np.array([AoA[i],mach[j]])
-                    # Set training conditions
-                    konditions.aerodynamics.angle_of_attack = AoA[i]
-                    konditions.aerodynamics.mach            = mach[j]
-                    
-                    CL[count],CD[count] = call_SU2(konditions, settings, geometry)
-                    count += 1
+            if self.training_jobs.processes != 1:
+                # Run every case at once
+                xy = np.array([[AoA[i],mach[j]] for i in range(len(AoA)) for j in range(len(mach))])
+                coefficients = self.evaluate_training_cases(xy)
+                CL = coefficients[:,0:1]
+                CD = coefficients[:,1:2]
+            else:
+                for i,_ in enumerate(AoA):
+                    for j,_ in enumerate(mach):
+                        
+                        xy[count,:] = np.array([AoA[i],mach[j]])
+                        # Set training conditions
+                        konditions.aerodynamics.angle_of_attack = AoA[i]
+                        konditions.aerodynamics.mach            = mach[j]
+                        
+                        CL[count],CD[count] = call_SU2(konditions, settings, geometry)
+                        count += 1
             
             time1 = time.time()
             
@@ -248,7 +327,7 @@ class SU2_inviscid(Aerodynamics):
           drag_coefficient <Guassian process surrogate>
 
         Properties Used:
-        No others
+        self.settings.use_compiled_surrogates  [boolean] see SUAVE.Surrogate.surrogate_evaluation.compile_surrogate
         """  
         # Unpack data
         training  = self.training
@@ -266,6 +345,10 @@ class SU2_inviscid(Aerodynamics):
         cl_surrogate = regr_cl.fit(xy, CL_data)
         cd_surrogate = regr_cd.fit(xy, CD_data)  
         
+        if self.settings.use_compiled_surrogates:
+            cl_surrogate = compile_surrogate(cl_surrogate)
+            cd_surrogate = compile_surrogate(cd_surrogate)
+        
         # KNN
         #regr_cl = neighbors.KNeighborsRegressor(n_neighbors=1,weights='distance')
         #regr_cd = neighbors.KNeighborsRegressor(n_neighbors=1,weights='distance')
@@ -288,13 +371,10 @@ class SU2_inviscid(Aerodynamics):
         
         AoA_mesh,mach_mesh = np.meshgrid(AoA_points,mach_points)
         
-        CL_sur = np.zeros(np.shape(AoA_mesh))
-        CD_sur = np.zeros(np.shape(AoA_mesh))        
+        xy_mesh = np.vstack([AoA_mesh.flatten(),mach_mesh.flatten()]).T
         
-        for jj in range(len(AoA_points)):
-            for ii in range(len(mach_points)):
-                CL_sur[ii,jj] = cl_surrogate.predict([np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]])])
-                CD_sur[ii,jj] = cd_surrogate.predict([np.array([AoA_mesh[ii,jj],mach_mesh[ii,jj]])])  #sklearn fix        
+        CL_sur = np.reshape(predict(cl_surrogate,xy_mesh),np.shape(AoA_mesh))
+        CD_sur = np.reshape(predict(cd_surrogate,xy_mesh),np.shape(AoA_mesh))
 
         fig = plt.figure('Coefficient of Lift Surrogate Plot')    
         plt_handle = plt.contourf(AoA_mesh/Units.deg,mach_mesh,CL_sur,levels=None)
@@ -318,6 +398,69 @@ class SU2_inviscid(Aerodynamics):
 
 
 
+    def evaluate_training_cases(self,points):
+        """Runs SU2 at every training point, several at once, each in its own folder.
+
+        Assumptions:
+        The mesh, <tag>.su2, is in the working directory. See 
+        SUAVE.Methods.Utilities.job_scheduler.run_jobs for how the cases are run
+
+        Source:
+        N/A
+
+        Inputs:
+        points             [radians,-] angles of attack and mach numbers, one point per row
+
+        Outputs:
+        coefficients       [-] CL and CD, one point per row
+
+        Properties Used:
+        self.geometry.tag  <string>
+        self.training_jobs.
+          processes        [-] (None for the number of processors)
+          timeout          [s]
+          retries          [-]
+          folder           <string> results are kept here, so an interrupted training continues where it stopped
+        """  
+        
+        jobs = self.training_jobs
+        mesh = self.geometry.tag + '.su2'
+        key  = (type(self),self.geometry,self.settings,file_contents(mesh))
+        
+        coefficients = run_jobs(self.evaluate_training_case,list(points),jobs.folder,jobs.processes,
+                                jobs.timeout,jobs.retries,links=[mesh],key=key)
+        
+        return np.array(coefficients)
+    
+    def evaluate_training_case(self,point):
+        """Runs SU2 at one training point.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        point              [radians,-] angle of attack and mach number
+
+        Outputs:
+        coefficients       [-] CL and CD
+
+        Properties Used:
+        N/A
+        """  
+        
+        konditions              = Data()
+        konditions.aerodynamics = Data()
+        konditions.aerodynamics.angle_of_attack = point[0]
+        konditions.aerodynamics.mach            = point[1]
+        
+        CL, CD = call_SU2(konditions, self.settings, self.geometry)
+        
+        return [CL,CD]
+
+
 # ----------------------------------------------------------------------
 #  Helper Functions
 # ----------------------------------------------------------------------
@@ -4,6 +4,7 @@
 # Created:            T. MacDonald
 # Modified: Apr 2017, T. MacDonald
 #           Apr 2019, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -69,6 +70,8 @@ class Supersonic_OpenVSP_Wave_Drag(Markup):
         settings.maximum_lift_coefficient           = np.inf
         settings.number_slices                      = 20
         settings.number_rotations                   = 10
+        settings.volume_drag_data_file              = None
+        settings.surrogate_cache                    = None
         
         # vortex lattice configurations
         settings.number_panels_spanwise = 5
@@ -121,17 +124,26 @@ class Supersonic_OpenVSP_Wave_Drag(Markup):
 
         Properties Used:
         self.geometry.tag (geometry in full is also attached to a process)
+        self.settings.surrogate_cache  <Surrogate_Cache> (optional - keeps the volume drag data and the
+                                       lift surrogate of an unchanged geometry)
         """    
         super(Supersonic_OpenVSP_Wave_Drag, self).initialize()
         import os
         
-        # Remove old volume drag data so that new data can be appended without issues
-        try:
-            os.remove('volume_drag_data_' + self.geometry.tag + '.npy')  
-        except:
-            pass
+        cache = self.settings.surrogate_cache
+        if cache is not None:
+            # The volume drag data only depends on the geometry and the OpenVSP settings
+            key = cache.key(type(self),self.geometry,self.settings.number_slices,self.settings.number_rotations)
+            self.settings.volume_drag_data_file = cache.path(key,'.npy')
+        else:
+            # Remove old volume drag data so that new data can be appended without issues
+            try:
+                os.remove('volume_drag_data_' + self.geometry.tag + '.npy')  
+            except:
+                pass
         
         self.process.compute.lift.inviscid_wings.geometry = self.geometry
+        self.process.compute.lift.inviscid_wings.settings.surrogate_cache = cache
         self.process.compute.lift.inviscid_wings.initialize()
         
     finalize = initialize        
\ No newline at end of file
@@ -6,6 +6,7 @@
 #           Feb 2016, A. Wendorff
 #           Apr 2017, T. MacDonald
 #           Nov 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -19,6 +20,7 @@ from SUAVE.Core import Data
 from SUAVE.Core import Units
 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift import weissinger_vortex_lattice
+from SUAVE.Surrogate.surrogate_cache import load_surrogates, save_surrogates
 
 # local imports
 from .Aerodynamics import Aerodynamics
@@ -35,7 +37,9 @@ class Vortex_Lattice(Aerodynamics):
     """This builds a surrogate and computes lift using a basic vortex lattice.
 
     Assumptions:
-    None
+    The surrogate is a polynomial in angle of attack. If settings.mach_dependent_surrogate is True
+    it is trained on a table of Mach numbers with the Prandtl-Glauert vortex lattice, and the
+    polynomial coefficients are interpolated in Mach number.
 
     Source:
     None
@@ -74,15 +78,22 @@ class Vortex_Lattice(Aerodynamics):
 
         # vortex lattice configurations
         self.settings.number_panels_spanwise = 5
+        
+        # surrogate configurations
+        self.settings.mach_dependent_surrogate    = False
+        self.settings.surrogate_polynomial_degree = 1
+        self.settings.surrogate_cache             = None
 
         # conditions table, used for surrogate model training
         self.training = Data()        
         self.training.angle_of_attack  = np.array([-10.,-5.,0.,5.,10.]) * Units.deg
+        self.training.Mach             = np.array([0.0,0.3,0.5,0.6,0.7,0.75,0.8,0.85,0.9])
         self.training.lift_coefficient = None
         
         # surrogoate models
         self.surrogates = Data()
         self.surrogates.lift_coefficient = None
+        self.surrogates.coefficients     = None
  
         
     def initialize(self):
@@ -101,13 +112,23 @@ class Vortex_Lattice(Aerodynamics):
         None
 
         Properties Used:
-        None
+        self.settings.surrogate_cache  <Surrogate_Cache> (optional - reuses the surrogate of an
+                                       unchanged geometry, settings and training table)
         """                      
+        cache = self.settings.get('surrogate_cache',None)
+        key   = None
+        if cache is not None:
+            key = cache.key(type(self),self.geometry,self.settings,self.training.angle_of_attack,self.training.Mach)
+            if load_surrogates(cache,key,self):
+                return
+        
         # sample training data
         self.sample_training()
                     
         # build surrogate
         self.build_surrogate()
+        
+        save_surrogates(cache,key,self)
 
 
     def evaluate(self,state,settings,geometry):
@@ -122,6 +143,7 @@ class Vortex_Lattice(Aerodynamics):
         Inputs:
         state.conditions.
           freestream.dynamics_pressure       [-]
+          freestream.mach_number             [-] (only with a Mach dependent surrogate)
           angle_of_attack                    [radians]
 
         Outputs:
@@ -134,8 +156,9 @@ class Vortex_Lattice(Aerodynamics):
 
         Properties Used:
         self.surrogates.
-          lift_coefficient                   [-] CL
-          wing_lift_coefficient[wings.*.tag] [-] CL (wing specific)
+          coefficients                       [-] see build_surrogate
+          outputs                            [-] tags of the surrogate outputs
+          Mach                               [-] Mach numbers of the coefficients
         """          
         """ process vehicle to setup geometry, condititon and settings
             Inputs:
@@ -144,9 +167,9 @@ class Vortex_Lattice(Aerodynamics):
                 CL - array of lift coefficients, same size as alpha
                 CD - array of drag coefficients, same size as alpha
             Assumptions:
-                linear intperolation surrogate model on Mach, Angle of Attack
-                    and Reynolds number
-                locations outside the surrogate's table are held to nearest data
+                polynomial surrogate model on Angle of Attack, interpolated in Mach
+                    number, see evaluate_lift_surrogate
+                locations outside the surrogate's Mach table are held to nearest data
                 no changes to initial geometry or settings
         """
 
@@ -156,26 +179,28 @@ class Vortex_Lattice(Aerodynamics):
         conditions = state.conditions
         
         # unpack        
-        q    = conditions.freestream.dynamic_pressure
         AoA  = conditions.aerodynamics.angle_of_attack
-        Sref = geometry.reference_area
         
-        wings_lift_model = surrogates.lift_coefficient
+        # lift of the vehicle and of every wing together, one column each
+        if surrogates.Mach is None:
+            lifts = evaluate_lift_surrogate(surrogates.coefficients,AoA)
+        else:
+            Mach  = conditions.freestream.mach_number
+            lifts = evaluate_lift_surrogate(surrogates.coefficients,AoA,surrogates.Mach,Mach)
         
         # inviscid lift of wings only
         inviscid_wings_lift                                              = Data()
-        inviscid_wings_lift.total                                        = wings_lift_model(AoA)
+        inviscid_wings_lift.total                                        = lifts[0]
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift       = Data()
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift.total = inviscid_wings_lift.total
         state.conditions.aerodynamics.lift_coefficient                   = inviscid_wings_lift.total
         
-        # store model for lift coefficients of each wing
+        # store lift coefficients of each wing
         state.conditions.aerodynamics.lift_coefficient_wing             = Data()        
-        for wing in geometry.wings.keys():
-            wings_lift_model = surrogates.wing_lift_coefficients[wing]
-            inviscid_wings_lift[wing] = wings_lift_model(AoA)
-            conditions.aerodynamics.lift_breakdown.inviscid_wings_lift[wing] = inviscid_wings_lift[wing]
-            state.conditions.aerodynamics.lift_coefficient_wing[wing]        = inviscid_wings_lift[wing]
+        for wing,lift in zip(surrogates.outputs[1:],lifts[1:]):
+            inviscid_wings_lift[wing] = lift
+            conditions.aerodynamics.lift_breakdown.inviscid_wings_lift[wing] = lift
+            state.conditions.aerodynamics.lift_coefficient_wing[wing]        = lift
 
         return inviscid_wings_lift
 
@@ -196,11 +221,14 @@ class Vortex_Lattice(Aerodynamics):
         self.training.
           lift_coefficient            [-] 
           wing_lift_coefficients      [-] (wing specific)
+          
+          one row per Mach number if settings.mach_dependent_surrogate is True
 
         Properties Used:
         self.geometry.wings.*.tag
         self.settings                 (passed to calculate vortex lattice)
         self.training.angle_of_attack [radians]
+        self.training.Mach            [-]
         """        
         # unpack
         geometry = self.geometry
@@ -208,26 +236,38 @@ class Vortex_Lattice(Aerodynamics):
         training = self.training
         
         AoA = training.angle_of_attack
-        CL  = np.zeros_like(AoA)
+        if settings.mach_dependent_surrogate:
+            Mach = training.Mach
+        else:
+            Mach = [None]
+        
+        CL  = np.zeros([len(Mach),len(AoA)])
         
         wing_CLs = Data() 
         for wing in geometry.wings.values():
-            wing_CLs[wing.tag] = np.zeros_like(AoA)
+            wing_CLs[wing.tag] = np.zeros_like(CL)
 
         # condition input, local, do not keep
         konditions              = Data()
         konditions.aerodynamics = Data()
 
-        # calculate aerodynamics for table
-        for i,_ in enumerate(AoA):
-            
-            # overriding conditions, thus the name mangling
-            konditions.aerodynamics.angle_of_attack = AoA[i]
+        # calculate aerodynamics for the whole table of angles at once
+        konditions.aerodynamics.angle_of_attack = AoA
+        
+        for i,M in enumerate(Mach):
+            if M is not None:
+                konditions.freestream = Data()
+                konditions.freestream.mach_number = M
             
             # these functions are inherited from Aerodynamics() or overridden
             CL[i], wing_lifts = calculate_lift_vortex_lattice(konditions, settings, geometry)
             for wing in geometry.wings.values():
                 wing_CLs[wing.tag][i] = wing_lifts[wing.tag]
+                
+        if not settings.mach_dependent_surrogate:
+            CL = CL[0]
+            for wing in geometry.wings.values():
+                wing_CLs[wing.tag] = wing_CLs[wing.tag][0]
 
         # store training data
         training.lift_coefficient = CL
@@ -249,37 +289,59 @@ class Vortex_Lattice(Aerodynamics):
 
         Outputs:
         self.surrogates.
-          lift_coefficient       <np.poly1d>
-          wing_lift_coefficients <np.poly1d> (multiple surrogates)
+          coefficients           [-] polynomial coefficients in angle of attack, highest power
+                                     first, shape (number of Mach numbers, degree + 1, outputs)
+          outputs                [-] 'total' and the wing tags, in the order of the coefficients
+          Mach                   [-] Mach numbers of the coefficients, None if not Mach dependent
+          lift_coefficient       <np.poly1d> (not Mach dependent only)
+          wing_lift_coefficients <np.poly1d> (multiple surrogates, not Mach dependent only)
 
         Properties Used:
         self.
+          settings.
+            mach_dependent_surrogate    [boolean]
+            surrogate_polynomial_degree [-]
           training.
             angle_of_attack        [radians]
+            Mach                   [-]
             lift_coefficient       [-]
             wing_lift_coefficients [-] (wing specific)
         """        
         # unpack data
+        settings = self.settings
         training = self.training
         AoA_data = training.angle_of_attack
         CL_data  = training.lift_coefficient
         wing_CL_data = training.wing_lift_coefficients
+        degree   = settings.surrogate_polynomial_degree
 
         # pack for surrogate model
         X_data = np.array([AoA_data]).T
         X_data = np.reshape(X_data,-1)
         
-        # learn the model
-        cl_surrogate = np.poly1d(np.polyfit(X_data, CL_data ,1))
+        # one column per output, one row of outputs per Mach number
+        outputs = ['total'] + list(wing_CL_data.keys())
+        Y_data  = np.array([CL_data] + [wing_CL_data[wing] for wing in outputs[1:]])
+        Y_data  = np.reshape(Y_data,[len(outputs),-1,len(X_data)])
         
-        wing_cl_surrogates = Data()
+        # learn the model, all outputs at once
+        coefficients = np.array([np.polyfit(X_data, Y.T, degree) for Y in np.transpose(Y_data,[1,0,2])])
         
-        for wing in wing_CL_data.keys():
-            wing_cl_surrogates[wing] = np.poly1d(np.polyfit(X_data, wing_CL_data[wing] ,1))
-
-
-        self.surrogates.lift_coefficient = cl_surrogate
-        self.surrogates.wing_lift_coefficients = wing_cl_surrogates
+        self.surrogates.coefficients = coefficients
+        self.surrogates.outputs      = outputs
+        
+        if settings.mach_dependent_surrogate:
+            self.surrogates.Mach                   = np.array(training.Mach,dtype=float)
+            self.surrogates.lift_coefficient       = None
+            self.surrogates.wing_lift_coefficients = None
+        else:
+            wing_cl_surrogates = Data()
+            for i,wing in enumerate(outputs[1:]):
+                wing_cl_surrogates[wing] = np.poly1d(coefficients[0,:,i+1])
+                
+            self.surrogates.Mach                   = None
+            self.surrogates.lift_coefficient       = np.poly1d(coefficients[0,:,0])
+            self.surrogates.wing_lift_coefficients = wing_cl_surrogates
 
         return
 
@@ -289,6 +351,50 @@ class Vortex_Lattice(Aerodynamics):
 #  Helper Functions
 # ----------------------------------------------------------------------
 
+def evaluate_lift_surrogate(coefficients,AoA,Mach_table=None,Mach=None):
+    """Evaluates the polynomial lift surrogates of the vehicle and of every wing together
+
+    Assumptions:
+    The coefficients are scaled by the Prandtl-Glauert factor sqrt(1-M^2) and linearly interpolated
+    in M^2, so the interpolated lift follows the 1/sqrt(1-M^2) trend between the trained Mach
+    numbers. Mach numbers outside the table are held to the nearest one.
+
+    Source:
+    N/A
+
+    Inputs:
+    coefficients                    [-] shape (number of Mach numbers, degree + 1, outputs)
+    AoA                             [radians]
+    Mach_table                      [-] (None if not Mach dependent)
+    Mach                            [-] same shape as AoA
+
+    Outputs:
+    lifts                           [-] shape (outputs,) + shape of AoA
+
+    Properties Used:
+    N/A
+    """  
+    
+    x = np.reshape(AoA,-1)
+    
+    if Mach_table is None or len(Mach_table) == 1:
+        C = coefficients[0]
+    else:
+        M     = np.clip(np.reshape(Mach,-1),Mach_table[0],Mach_table[-1])
+        betas = np.sqrt(1. - Mach_table**2)
+        beta  = np.sqrt(1. - M**2)
+        scaled_coefficients = coefficients * betas[:,None,None]
+        
+        i = np.clip(np.searchsorted(Mach_table,M,side='right') - 1,0,len(Mach_table)-2)
+        w = ((M**2 - Mach_table[i]**2)/(Mach_table[i+1]**2 - Mach_table[i]**2))[:,None,None]
+        C = ((1.-w)*scaled_coefficients[i] + w*scaled_coefficients[i+1])/beta[:,None,None]
+    
+    # Horner's rule, one column per output
+    lifts = C[...,0,:] + 0.*x[:,None]
+    for d in range(1,C.shape[-2]):
+        lifts = lifts*x[:,None] + C[...,d,:]
+        
+    return np.reshape(lifts.T,(C.shape[-1],) + np.shape(AoA))
 
 def calculate_lift_vortex_lattice(conditions,settings,geometry):
     """Calculate the total vehicle lift coefficient and specific wing coefficients (with specific wing reference areas)
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -48,6 +49,9 @@ class All_At_Once(Mission):
         
         self.tag = 'mission'
         
+        # merge the sub segment states into contiguous buffers, see State_Buffer
+        self.settings.flat_state = False
+        
         # --------------------------------------------------------------
         #   The Solving Process
         # --------------------------------------------------------------
@@ -57,6 +61,7 @@ class All_At_Once(Mission):
         # --------------------------------------------------------------
         self.process.initialize.expand_state             = Methods.Segments.expand_state
         self.process.initialize.expand_sub_segments      = Methods.Segments.Common.Sub_Segments.expand_sub_segments
+        self.process.initialize.warm_start               = Methods.Segments.Common.Warm_Start.initialize_unknowns
         self.process.initialize.merge_sub_segment_states = Methods.Segments.Common.Sub_Segments.merge_sub_segment_states
 
         # --------------------------------------------------------------
@@ -74,4 +79,5 @@ class All_At_Once(Mission):
         # --------------------------------------------------------------
         #   Finalize
         # --------------------------------------------------------------        
-        self.process.finalize.sub_segments          = Methods.Segments.Common.Sub_Segments.finalize_sub_segments
\ No newline at end of file
+        self.process.finalize.sub_segments          = Methods.Segments.Common.Sub_Segments.finalize_sub_segments
+        self.process.finalize.warm_start            = Methods.Segments.Common.Warm_Start.store_unknowns
\ No newline at end of file
@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 """ Mission.py: Top-level mission class """
 
@@ -12,6 +13,7 @@
 
 import SUAVE
 from SUAVE.Core import Container as ContainerBase
+from SUAVE.Core import Data
 from . import Segments
 
 # ----------------------------------------------------------------------
@@ -49,6 +51,10 @@ class Mission(Segments.Simple.Container):
         """         
         self.tag = 'mission'
         
+        # reuse the converged unknowns of the last evaluation as the initial guess
+        self.settings.warm_start = False
+        self.warm_start_cache    = Data()
+        
         # see Segments.Simple.Container
         
     def finalize(self):
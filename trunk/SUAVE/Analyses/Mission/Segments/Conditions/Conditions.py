@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Feb 2016, A. Wendorff
 #           Jun 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -32,13 +33,14 @@ class Conditions(Data):
         None   
     """ 
 
-    _size = 1
+    _size  = 1
+    _dtype = float
     
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns 
         
             Assumptions:
-            None
+            The type follows the conditions, complex while complex stepping
     
             Source:
             N/A
@@ -52,7 +54,7 @@ class Conditions(Data):
             Properties Used:
             None
         """     
-        return np.ones([self._size,cols])
+        return np.ones([self._size,cols],dtype=self._dtype)
     
     def ones_row_m1(self,cols):
         """ returns an N-1 row vector of ones with given number of columns
@@ -72,7 +74,7 @@ class Conditions(Data):
             Properties Used:
             None
         """ 
-        return np.ones([self._size-1,cols])    
+        return np.ones([self._size-1,cols],dtype=self._dtype)    
     
     def ones_row_m2(self,cols):
         """ returns an N-2 row vector of ones with given number of columns
@@ -92,7 +94,7 @@ class Conditions(Data):
             Properties Used:
             None
         """ 
-        return np.ones([self._size-2,cols])
+        return np.ones([self._size-2,cols],dtype=self._dtype)
     
     
     def expand_rows(self,rows):
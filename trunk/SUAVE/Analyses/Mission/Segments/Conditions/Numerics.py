@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -53,10 +54,16 @@ class Numerics(Conditions):
         self.discretization_method = chebyshev_data
         
         self.solver_jacobian                  = "none"
+        self.jacobian_sparsity                = 'blocks'
         self.tolerance_solution               = 1e-8
         self.tolerance_boundary_conditions    = 1e-8  
         self.converged                        = None
         
+        self.solver_statistics = Conditions()
+        self.solver_statistics.function_evaluations  = 0
+        self.solver_statistics.jacobian_evaluations  = 0
+        self.solver_statistics.residual_norm_history = np.empty([0])
+        
         self.dimensionless = Conditions()
         self.dimensionless.control_points = np.empty([0,0])
         self.dimensionless.differentiate  = np.empty([0,0])
@@ -4,6 +4,7 @@
 # Created:  
 # Modified: Feb 2016, A. Wendorff
 #           Oct 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -49,6 +50,11 @@ class Sequential_Segments(Mission):
         
         self.tag = 'mission'
         
+        # solve the segments in parallel from the initials of the last evaluation
+        self.settings.parallel_segments  = False
+        self.settings.parallel_processes = None
+        self.settings.parallel_tolerance = 1e-6
+        
         
         # --------------------------------------------------------------
         #   The Solving Process
@@ -57,7 +63,8 @@ class Sequential_Segments(Mission):
         # --------------------------------------------------------------
         #   Initialize
         # --------------------------------------------------------------
-        self.process.initialize = Methods.Segments.Common.Sub_Segments.expand_sub_segments
+        self.process.initialize.expand_sub_segments = Methods.Segments.Common.Sub_Segments.expand_sub_segments
+        self.process.initialize.warm_start          = Methods.Segments.Common.Warm_Start.initialize_unknowns
 
         # --------------------------------------------------------------
         #   Converge
@@ -73,5 +80,6 @@ class Sequential_Segments(Mission):
         #   Finalize
         # --------------------------------------------------------------        
         self.process.finalize.sub_segments = Methods.Segments.Common.Sub_Segments.finalize_sub_segments
+        self.process.finalize.warm_start   = Methods.Segments.Common.Warm_Start.store_unknowns
         
         return
\ No newline at end of file
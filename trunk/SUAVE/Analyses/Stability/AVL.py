@@ -2,6 +2,7 @@
 # AVL.py
 #
 # Created: Apr 2017, M. Clarke 
+# Modified: Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -24,6 +25,9 @@ from SUAVE.Methods.Aerodynamics.AVL.translate_data   import translate_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files      import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings    import Settings
 from SUAVE.Methods.Aerodynamics.AVL.Data.Cases       import Run_Case
+from SUAVE.Surrogate.surrogate_evaluation import predict, compile_surrogate
+from SUAVE.Surrogate.surrogate_cache import load_surrogates, save_surrogates, file_contents
+from SUAVE.Methods.Utilities.job_scheduler import run_jobs
 
 # local imports 
 from .Stability import Stability
@@ -86,6 +90,8 @@ class AVL(Stability):
         self.settings.filenames.err_filename                = sys.stderr
         self.settings.spanwise_vortices                     = None
         self.settings.chordwise_vortices                    = None
+        self.settings.use_compiled_surrogates               = False
+        self.settings.surrogate_cache                       = None
             
         # Conditions table, used for surrogate model training
         self.training                                       = Data()        
@@ -98,6 +104,13 @@ class AVL(Stability):
         self.training.Cn_beta_moment_coefficient            = None
         self.training.neutral_point                         = None
         self.training_file                                  = None
+        
+        # Training runs, more than one process runs several cases at once in their own folders
+        self.training_jobs                                  = Data()
+        self.training_jobs.processes                        = 1
+        self.training_jobs.timeout                          = None
+        self.training_jobs.retries                          = 0
+        self.training_jobs.folder                           = 'avl_training'
 
         # Surrogate model
         self.surrogates                                     = Data()
@@ -143,6 +156,8 @@ class AVL(Stability):
 
         Properties Used:
         self.geometry.tag
+        self.settings.surrogate_cache  <Surrogate_Cache> (optional - reuses the surrogates of an
+                                       unchanged geometry, configuration, settings and training table)
         """          
         geometry                       = self.geometry
         self.tag                       = 'avl_analysis_of_{}'.format(geometry.tag)
@@ -169,12 +184,22 @@ class AVL(Stability):
             self.settings.discretization.defaults.wing.chordwise_vortices = self.settings.chordwise_vortices
                 
         run_folder = self.settings.filenames.run_folder 
+        
+        cache = self.settings.get('surrogate_cache',None)
+        key   = None
+        if cache is not None:
+            key = cache.key(type(self),geometry,configuration,self.settings,self.training.angle_of_attack,
+                            self.training.Mach,file_contents(self.training_file),self.regression_flag)
+            if load_surrogates(cache,key,self):
+                return
    
         # Sample training data
         self.sample_training()
 
         # Build surrogate
         self.build_surrogate()
+        
+        save_surrogates(cache,key,self)
 
         return
 
@@ -235,18 +260,12 @@ class AVL(Stability):
         static_stability    = Data()
         dynamic_stability   = Data()        
 
-        #Run Analysis
-        data_len            = len(AoA)
-        CM                  = np.zeros([data_len,1])
-        Cm_alpha            = np.zeros([data_len,1])
-        Cn_beta             = np.zeros([data_len,1])
-        NP                  = np.zeros([data_len,1]) 
-
-        for ii,_ in enumerate(AoA):           
-            CM[ii]          = moment_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            Cm_alpha[ii]    = Cm_alpha_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            Cn_beta[ii]     = Cn_beta_model.predict([np.array([AoA[ii][0],mach[ii][0]])])
-            NP[ii]          = neutral_point_model.predict([np.array([AoA[ii][0],mach[ii][0]])])    #sklearn fix        
+        #Run Analysis, all points at once
+        xy                  = np.hstack([AoA,mach])
+        CM                  = predict(moment_model,xy)
+        Cm_alpha            = predict(Cm_alpha_model,xy)
+        Cn_beta             = predict(Cn_beta_model,xy)
+        NP                  = predict(neutral_point_model,xy)
 
         static_stability.CM       = CM
         static_stability.Cm_alpha = Cm_alpha 
@@ -324,6 +343,8 @@ class AVL(Stability):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.training_jobs.
+          processes        [-] more than one runs the cases at once, see evaluate_training_cases
         """ 
         # Unpack
         geometry = self.geometry
@@ -346,25 +367,35 @@ class AVL(Stability):
         for i,_ in enumerate(mach):
             for j,_ in enumerate(AoA):
                 xy[i*len(mach)+j,:] = np.array([AoA[j],mach[i]])
-        for j,_ in enumerate(mach):
-            # Set training conditions
-            run_conditions = Aerodynamics()
-            run_conditions.weights.total_mass               = 0    # Currently set to zero. Used for dynamic analysis which is under development
-            run_conditions.freestream.density               = 0    # Density not used in inviscid computation therefore set to zero. Used for dynamic analysis which is under development
-            run_conditions.freestream.gravity               = 9.81          
-            run_conditions.aerodynamics.angle_of_attack     = AoA
-            run_conditions.freestream.mach_number           = mach[j]
+                
+        if self.training_jobs.processes != 1 and not self.regression_flag:
+            # Run every case at once
+            coefficients = self.evaluate_training_cases(xy)
+            CM           = coefficients[:,0:1]
+            Cm_alpha     = coefficients[:,1:2]
+            Cn_beta      = coefficients[:,2:3]
+            NP           = coefficients[:,3:4]
             
-            #Run Analysis at AoA[i] and mach[j]
-            results =  self.evaluate_conditions(run_conditions)
-
-            # Obtain CM Cm_alpha, Cn_beta and the Neutral Point # Store other variables here as well 
-            CM[count*len(mach):(count+1)*len(mach),0]       = results.aerodynamics.pitch_moment_coefficient[:,0]
-            Cm_alpha[count*len(mach):(count+1)*len(mach),0] = results.aerodynamics.cm_alpha[:,0]
-            Cn_beta[count*len(mach):(count+1)*len(mach),0]  = results.aerodynamics.cn_beta[:,0]
-            NP[count*len(mach):(count+1)*len(mach),0]       = results.aerodynamics.neutral_point[:,0]
-
-            count += 1
+        else:
+            for j,_ in enumerate(mach):
+                # Set training conditions
+                run_conditions = Aerodynamics()
+                run_conditions.weights.total_mass               = 0    # Currently set to zero. Used for dynamic analysis which is under development
+                run_conditions.freestream.density               = 0    # Density not used in inviscid computation therefore set to zero. Used for dynamic analysis which is under development
+                run_conditions.freestream.gravity               = 9.81          
+                run_conditions.aerodynamics.angle_of_attack     = AoA
+                run_conditions.freestream.mach_number           = mach[j]
+                
+                #Run Analysis at AoA[i] and mach[j]
+                results =  self.evaluate_conditions(run_conditions)
+    
+                # Obtain CM Cm_alpha, Cn_beta and the Neutral Point # Store other variables here as well 
+                CM[count*len(mach):(count+1)*len(mach),0]       = results.aerodynamics.pitch_moment_coefficient[:,0]
+                Cm_alpha[count*len(mach):(count+1)*len(mach),0] = results.aerodynamics.cm_alpha[:,0]
+                Cn_beta[count*len(mach):(count+1)*len(mach),0]  = results.aerodynamics.cn_beta[:,0]
+                NP[count*len(mach):(count+1)*len(mach),0]       = results.aerodynamics.neutral_point[:,0]
+    
+                count += 1
 
         time1 = time.time()
 
@@ -411,7 +442,7 @@ class AVL(Stability):
           neutral_point                  <Guassian process surrogate>       
 
         Properties Used:
-        No others
+        self.settings.use_compiled_surrogates  [boolean] see SUAVE.Surrogate.surrogate_evaluation.compile_surrogate
         """  
         # Unpack data
         training                                    = self.training
@@ -433,6 +464,12 @@ class AVL(Stability):
         cm_alpha_surrogate                          = regr_cm_alpha.fit(xy, Cm_alpha_data) 
         cn_beta_surrogate                           = regr_cn_beta.fit(xy, Cn_beta_data)
         neutral_point_surrogate                     = regr_np.fit(xy, NP_data)
+        
+        if self.settings.use_compiled_surrogates:
+            cm_surrogate                            = compile_surrogate(cm_surrogate)
+            cm_alpha_surrogate                      = compile_surrogate(cm_alpha_surrogate)
+            cn_beta_surrogate                       = compile_surrogate(cn_beta_surrogate)
+            neutral_point_surrogate                 = compile_surrogate(neutral_point_surrogate)
 
         self.surrogates.moment_coefficient          = cm_surrogate
         self.surrogates.Cm_alpha_moment_coefficient = cm_alpha_surrogate
@@ -446,6 +483,81 @@ class AVL(Stability):
 #  Helper Functions
 # ----------------------------------------------------------------------
 
+    def evaluate_training_cases(self,points):
+        """Runs AVL at every training point, several at once, each in its own folder.
+
+        Assumptions:
+        Every case runs AVL in its own folder under the run folder, see 
+        SUAVE.Methods.Utilities.job_scheduler.run_jobs for how the cases are run
+
+        Source:
+        N/A
+
+        Inputs:
+        points             [radians,-] angles of attack and mach numbers, one point per row
+
+        Outputs:
+        coefficients       [-] CM, Cm_alpha, Cn_beta and NP, one point per row
+
+        Properties Used:
+        self.training_jobs.
+          processes        [-] (None for the number of processors)
+          timeout          [s]
+          retries          [-]
+          folder           <string> results are kept here, so an interrupted training continues where it stopped
+        """  
+        
+        jobs = self.training_jobs
+        key  = (type(self),self.geometry,self.configuration,self.settings)
+        
+        coefficients = run_jobs(self.evaluate_training_case,list(points),jobs.folder,jobs.processes,
+                                jobs.timeout,jobs.retries,key=key)
+        
+        return np.array(coefficients)
+    
+    def evaluate_training_case(self,point):
+        """Runs AVL at one training point.
+
+        Assumptions:
+        Called from the job folder, the AVL files are written to a folder of the same name under
+        the run folder, so that cases run at once never share their files
+
+        Source:
+        N/A
+
+        Inputs:
+        point              [radians,-] angle of attack and mach number
+
+        Outputs:
+        coefficients       [-] CM, Cm_alpha, Cn_beta and NP
+
+        Properties Used:
+        N/A
+        """  
+        
+        run_conditions = Aerodynamics()
+        run_conditions.weights.total_mass           = 0
+        run_conditions.freestream.density           = 0
+        run_conditions.freestream.gravity           = 9.81          
+        run_conditions.aerodynamics.angle_of_attack = np.array([point[0]])
+        run_conditions.freestream.mach_number       = point[1]
+        
+        # a run folder of its own, as the run folder may be shared by every job
+        filenames            = self.settings.filenames
+        run_folder           = filenames.run_folder
+        filenames.run_folder = os.path.join(os.path.abspath(run_folder),os.path.basename(os.getcwd()))
+        try:
+            results = self.evaluate_conditions(run_conditions)
+        finally:
+            filenames.run_folder = run_folder
+        
+        coefficients = [results.aerodynamics.pitch_moment_coefficient[0,0],
+                        results.aerodynamics.cm_alpha[0,0],
+                        results.aerodynamics.cn_beta[0,0],
+                        results.aerodynamics.neutral_point[0,0]]
+        
+        return coefficients
+
     def evaluate_conditions(self,run_conditions):
         """Process vehicle to setup geometry, condititon, and configuration.
 
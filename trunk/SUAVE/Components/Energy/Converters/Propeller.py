@@ -4,6 +4,7 @@
 # Created:  Jun 2014, E. Botero
 # Modified: Jan 2016, T. MacDonald
 #           Feb 2019, M. Vegh            
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -14,6 +15,9 @@ import numpy as np
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Core import Data
 import scipy.optimize as opt
+from scipy.interpolate import RegularGridInterpolator
+
+from SUAVE.Surrogate.surrogate_cache import hash_objects, fingerprint_objects
 
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
@@ -64,12 +68,49 @@ class Propeller(Energy_Component):
         self.prop_attributes.drag_reference_reynolds_number = 50000.     #drag scaling is  (Re_ref/Re) **Re_exp
         self.prop_attributes.reynolds_scaling_exponent      = .2
         self.thrust_angle                                   = 0.0
+        self.max_iterations                                 = 200 # points still iterating after these are not converged
         self.origin                                         = [[0.0,0.0,0.0]] # [X,Y,Z]
         self.rotation                                       = [[0.0,0.0,0.0]] # [X,Y,Z] rotation of axis relative to
+        
+        # optionally answer spin from a map of the coefficients of the blades, see build_performance_map,
+        # the map is made on the first spin and again when the blades or the settings change
+        self.use_performance_map                            = False
+        self.performance_map                                = None
+        self.performance_map_settings                       = Data()
+        self.performance_map_settings.advance_ratio         = np.linspace(0.,2.,41)
+        self.performance_map_settings.tip_mach_number       = np.linspace(0.05,0.95,19)
+        self.performance_map_settings.reynolds_number       = np.logspace(4.,8.,17) # tip speed times tip radius over kinematic viscosity
+        self.performance_map_settings.temperature           = 288.15 # [K] of the skin friction correction
+        self.performance_map_settings.cache                 = None   # <Surrogate_Cache> (optional - keeps maps on disk)
       
 
                  # vehicle (used in OpenVSP for thrust_angle)
     def spin(self,conditions):
+        """Analyzes a propeller given geometry and operating conditions, by the blade element
+        theory or, with use_performance_map, from the map of the blades.
+
+        Assumptions:
+        See spin_blade_elements and spin_performance_map
+
+        Source:
+        N/A
+
+        Inputs:
+        See spin_blade_elements
+
+        Outputs:
+        See spin_blade_elements
+
+        Properties Used:
+        self.use_performance_map     [Boolean]
+        """
+        
+        if self.use_performance_map:
+            return self.spin_performance_map(conditions)
+        
+        return self.spin_blade_elements(conditions)
+    
+    def spin_blade_elements(self,conditions):
         """Analyzes a propeller given geometry and operating conditions.
 
         Assumptions:
@@ -106,6 +147,9 @@ class Propeller(Energy_Component):
           power                      [W]
           mid_chord_aligment         [m] (distance from the mid chord to the line axis out of the center of the blade)
         conditions.propulsion.etap   [-]
+        self.outputs.
+          iterations                 [-] (Newton iterations of each point)
+          converged                  [Boolean] (False where a point was stopped as diverging or at max_iterations)
         thrust                       [N]
         torque                       [Nm]
         power                        [W]
@@ -124,45 +168,36 @@ class Propeller(Energy_Component):
          drag_reference_reynolds_number [-]
          reynolds_scaling_exponent      [-]
         self.thrust_angle               [radians]
+        self.max_iterations             [-]
         """         
            
         #Unpack    
         B        = self.prop_attributes.number_blades
         R        = self.prop_attributes.tip_radius
         Rh       = self.prop_attributes.hub_radius
-        beta     = self.prop_attributes.twist_distribution
-        c        = self.prop_attributes.chord_distribution
         cl_a     = self.prop_attributes.lift_curve_slope
         cd_coeff = self.prop_attributes.cd_coefficients   
         re_ref   = self.prop_attributes.drag_reference_reynolds_number
         x_re     = self.prop_attributes.reynolds_scaling_exponent  
-           
-        
         
+        # Things that don't change with the operating conditions
+        blade    = self.blade_geometry()
+        beta     = blade.twist_distribution
+        c        = blade.chord_distribution
+        N        = blade.number_stations
+        r        = blade.radius_distribution
         
         omega1 = self.inputs.omega
         rho    = conditions.freestream.density[:,0,None]
         mu     = conditions.freestream.dynamic_viscosity[:,0,None]
-        Vv     = conditions.frames.inertial.velocity_vector
         a      = conditions.freestream.speed_of_sound[:,0,None]
         T      = conditions.freestream.temperature[:,0,None]
-        theta  = self.thrust_angle
         
         BB     = B*B
         BBB    = BB*B
             
-        # Velocity in the Body frame
-        T_body2inertial = conditions.frames.body.transform_to_inertial
-        T_inertial2body = orientation_transpose(T_body2inertial)
-        V_body = orientation_product(T_inertial2body,Vv)
-        
-        # Velocity transformed to the propulsor frame
-        body2thrust   = np.array([[np.cos(theta), 0., np.sin(theta)],[0., 1., 0.], [-np.sin(theta), 0., np.cos(theta)]])
-        T_body2thrust = orientation_transpose(np.ones_like(T_body2inertial[:])*body2thrust)
-        V_thrust      = orientation_product(T_body2thrust,V_body)
-        
-        # Now just use the aligned velocity
-        V = V_thrust[:,0,None]
+        # Velocity along the thrust axis
+        V = self.thrust_axis_velocity(conditions)
         
         nu    = mu/rho
         tol   = 1e-5 # Convergence tolerance
@@ -174,19 +209,9 @@ class Propeller(Energy_Component):
         # Enter airfoil data in a better way, there is currently Re and Ma scaling from DAE51 data
         ######
 
-        #Things that don't change with iteration
-        N       = len(c) # Number of stations
-        chi0    = Rh/R   # Where the propeller blade actually starts
-        chi     = np.linspace(chi0,1,N+1)  # Vector of nondimensional radii
-        chi     = chi[0:N]
-        lamda   = V/(omega*R)              # Speed ratio
-        r       = chi*R                    # Radial coordinate
         pi      = np.pi
         pi2     = pi*pi
-        x       = r*np.multiply(omega,1/V) # Nondimensional distance
         n       = omega/(2.*pi)            # Cycles per second
-        J       = V/(2.*R*n)    
-        sigma   = np.multiply(B*c,1./(2.*pi*r))   
     
         #I make the assumption that externally-induced velocity at the disk is zero
         #This can be easily changed if needed in the future:
@@ -199,29 +224,51 @@ class Propeller(Energy_Component):
         U  = np.sqrt(Ua*Ua + Ut*Ut)
         
         #Things that will change with iteration
-        size = (len(a),N)
+        n_points = len(a)
+        size     = (n_points,N)
     
         #Setup a Newton iteration
         psi    = np.ones(size)
         psiold = np.zeros(size)
-        diff   = 1.
+        
+        # The last iterate of each point
+        Wa         = np.zeros(size)
+        Wt         = np.zeros(size)
+        W          = np.zeros(size)
+        Ma         = np.zeros(size)
+        alpha      = np.zeros(size)
+        Gamma      = np.zeros(size)
+        Cl         = np.zeros(size)
+        iterations = np.zeros(n_points,dtype=int)
+        converged  = np.zeros(n_points,dtype=bool)
+        
+        # Only the points that have not converged are iterated, their rows are taken out of the
+        # working arrays as they finish
+        active = np.arange(n_points)
+        Ua_a   = Ua
+        Ut_a   = Ut
+        U_a    = U
+        a_a    = a
+        psi_a  = psi
         
         ii = 0
-        while (diff>tol):
-            sin_psi = np.sin(psi)
-            cos_psi = np.cos(psi)
-            Wa      = 0.5*Ua + 0.5*U*sin_psi
-            Wt      = 0.5*Ut + 0.5*U*cos_psi   
-            #va     = Wa - Ua
-            vt      = Ut - Wt
-            alpha   = beta - np.arctan2(Wa,Wt)
-            W       = (Wa*Wa + Wt*Wt)**0.5
-            Ma      = (W)/a #a is the speed of sound
+        while active.size > 0:
+            ii += 1
+            
+            sin_psi  = np.sin(psi_a)
+            cos_psi  = np.cos(psi_a)
+            Wa_a     = 0.5*Ua_a + 0.5*U_a*sin_psi
+            Wt_a     = 0.5*Ut_a + 0.5*U_a*cos_psi   
+            #va      = Wa - Ua
+            vt       = Ut_a - Wt_a
+            alpha_a  = beta - np.arctan2(Wa_a,Wt_a)
+            W_a      = (Wa_a*Wa_a + Wt_a*Wt_a)**0.5
+            Ma_a     = (W_a)/a_a #a is the speed of sound
             
             #if np.any(Ma> 1.0):
                 #warn('Propeller blade tips are supersonic.', Warning)
             
-            lamdaw = r*Wa/(R*Wt)
+            lamdaw = r*Wa_a/(R*Wt_a)
             
             # Limiter to keep from Nan-ing
             lamdaw[lamdaw<0.] = 0.
@@ -230,55 +277,86 @@ class Propeller(Energy_Component):
             piece        = np.exp(-f)
             arccos_piece = np.arccos(piece)
             F            = 2.*arccos_piece/pi
-            Gamma        = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
+            Gamma_a      = vt*(4.*pi*r/B)*F*(1.+(4.*lamdaw*R/(pi*B*r))*(4.*lamdaw*R/(pi*B*r)))**0.5
             
             # Ok, from the airfoil data, given Re, Ma, alpha we need to find Cl
-            Cl = cl_a*alpha
+            Cl_a = cl_a*alpha_a
             
             # By 90 deg, it's totally stalled.
-            Cl[alpha>=pi/2] = 0.
+            Cl_a[alpha_a>=pi/2] = 0.
             
             # Scale for Mach, this is Karmen_Tsien
-            Cl[Ma[:,:]<1.] = Cl[Ma[:,:]<1.]/((1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5+((Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])/(1+(1-Ma[Ma[:,:]<1.]*Ma[Ma[:,:]<1.])**0.5))*Cl[Ma<1.]/2)
+            subsonic       = Ma_a<1.
+            Ma_2           = Ma_a[subsonic]*Ma_a[subsonic]
+            Cl_a[subsonic] = Cl_a[subsonic]/((1-Ma_2)**0.5+(Ma_2/(1+(1-Ma_2)**0.5))*Cl_a[subsonic]/2)
             
             # If the blade segments are supersonic, don't scale
-            Cl[Ma[:,:]>=1.] = Cl[Ma[:,:]>=1.] 
             
-            Rsquiggly = Gamma - 0.5*W*c*Cl
+            Rsquiggly = Gamma_a - 0.5*W_a*c*Cl_a
             
             #An analytical derivative for dR_dpsi, this is derived by taking a derivative of the above equations
             #This was solved symbolically in Matlab and exported        
-            f_wt_2 = 4*Wt*Wt
-            f_wa_2 = 4*Wa*Wa
-            Ucospsi  = U*cos_psi
-            Usinpsi  = U*sin_psi
-            Utcospsi = Ut*cos_psi
-            Uasinpsi = Ua*sin_psi
+            f_wt_2 = 4*Wt_a*Wt_a
+            f_wa_2 = 4*Wa_a*Wa_a
+            Ucospsi  = U_a*cos_psi
+            Usinpsi  = U_a*sin_psi
+            Utcospsi = Ut_a*cos_psi
+            Uasinpsi = Ua_a*sin_psi
             
-            UapUsinpsi = (Ua + Usinpsi)
-            utpUcospsi = (Ut + Ucospsi)
+            UapUsinpsi = (Ua_a + Usinpsi)
+            utpUcospsi = (Ut_a + Ucospsi)
             
             utpUcospsi2 = utpUcospsi*utpUcospsi
             UapUsinpsi2 = UapUsinpsi*UapUsinpsi
             
-            dR_dpsi = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
-                       (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                       + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                       - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. - 
-                      (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R - 
-                       r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U + 
+            dR_dpsi = ((4.*U_a*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B - 
+                       (pi*U_a*(Ua_a*cos_psi - Ut_a*sin_psi)*(beta - np.arctan((Wa_a+Wa_a)/(Wt_a+Wt_a))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
+                       + (pi*U_a*(f_wt_2 +f_wa_2)**(0.5)*(U_a + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
+                       - (4.*U_a*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut_a/2. - 
+                      (Ucospsi)/2.)*(U_a + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt_a+Wt_a)*(R - 
+                       r))/(r*(Wa_a+Wa_a))))**(0.5)) + (128.*U_a*r*arccos_piece*(Wa_a+Wa_a)*(Ut_a/2. - (Ucospsi)/2.)*(U_a + 
                        Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5))) 
             
             dR_dpsi[np.isnan(dR_dpsi)] = 0.1
                       
             dpsi   = -Rsquiggly/dR_dpsi
-            psi    = psi + dpsi
-            diff   = np.max(abs(psiold-psi))
-            psiold = psi
+            psi_a  = psi_a + dpsi
+            diff   = np.max(abs(psiold-psi_a),axis=1)
+            psiold = psi_a
+            
+            # Points are done when their own update is small
+            done = np.logical_not(diff>tol)
             
             # If its really not going to converge
-            if np.any(psi>(pi*85.0/180.)) and np.any(dpsi>0.0):
-                break
+            diverging = np.logical_and(np.any(psi_a>(pi*85.0/180.),axis=1),np.any(dpsi>0.0,axis=1))
+            
+            finished = np.logical_or(done,diverging)
+            if ii >= self.max_iterations:
+                finished[:] = True
+            if not np.any(finished):
+                continue
+            
+            # Keep the last iterate of the points that are finished
+            rows             = active[finished]
+            psi[rows]        = psi_a[finished]
+            Wa[rows]         = Wa_a[finished]
+            Wt[rows]         = Wt_a[finished]
+            W[rows]          = W_a[finished]
+            Ma[rows]         = Ma_a[finished]
+            alpha[rows]      = alpha_a[finished]
+            Gamma[rows]      = Gamma_a[finished]
+            Cl[rows]         = Cl_a[finished]
+            iterations[rows] = ii
+            converged[rows]  = diff[finished] <= tol
+            
+            remaining = np.logical_not(finished)
+            active    = active[remaining]
+            Ua_a      = Ua_a[remaining]
+            Ut_a      = Ut_a[remaining]
+            U_a       = U_a[remaining]
+            a_a       = a_a[remaining]
+            psi_a     = psi_a[remaining]
+            psiold    = psi_a
 
         Re      = (W*c)/nu
         
@@ -296,7 +374,7 @@ class Propeller(Energy_Component):
         
         epsilon  = Cd/Cl
         epsilon[epsilon==np.inf] = 10. 
-        deltar   = (r[1]-r[0])
+        deltar   = blade.radial_spacing
         thrust   = rho*B*(np.sum(Gamma*(Wt-epsilon*Wa)*deltar,axis=1)[:,None])
         torque   = rho*B*np.sum(Gamma*(Wa+epsilon*Wt)*r*deltar,axis=1)[:,None]
         power    = torque*omega       
@@ -313,6 +391,10 @@ class Propeller(Energy_Component):
         
         conditions.propulsion.etap = etap
         
+        # convergence of the blade element solution at each point
+        self.outputs.iterations = iterations[:,None]
+        self.outputs.converged  = converged[:,None]
+        
         # store data
         results_conditions = Data      
         conditions.propulsion.acoustic_outputs = results_conditions(
@@ -332,4 +414,504 @@ class Propeller(Energy_Component):
         
         
         return thrust, torque, power, Cp
-    
\ No newline at end of file
+    
+    def blade_geometry(self):
+        """The arrays of the blade stations that spin uses. These only change with the blade,
+        so they are kept with the propeller and made again when prop_attributes change.
+
+        Assumptions:
+        The stations are evenly spaced from the hub to the tip
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        blade.
+          number_stations            [-]
+          radius_distribution        [m]
+          radial_spacing             [m]
+          chord_distribution         [m]
+          twist_distribution         [radians]
+
+        Properties Used:
+        self.prop_attributes.
+          number_blades              [-]
+          tip_radius                 [m]
+          hub_radius                 [m]
+          twist_distribution         [radians]
+          chord_distribution         [m]
+        """
+        
+        B    = self.prop_attributes.number_blades
+        R    = self.prop_attributes.tip_radius
+        Rh   = self.prop_attributes.hub_radius
+        beta = np.asarray(self.prop_attributes.twist_distribution,dtype=float)
+        c    = np.asarray(self.prop_attributes.chord_distribution,dtype=float)
+        
+        key   = (float(B),float(R),float(Rh),beta.tobytes(),c.tobytes())
+        blade = self.get('_blade_geometry',None)
+        if blade is not None and blade.key == key:
+            return blade
+        
+        N       = len(c)                   # Number of stations
+        chi0    = Rh/R                     # Where the propeller blade actually starts
+        chi     = np.linspace(chi0,1,N+1)  # Vector of nondimensional radii
+        chi     = chi[0:N]
+        r       = chi*R                    # Radial coordinate
+        
+        blade = Data()
+        blade.key                 = key
+        blade.number_stations     = N
+        blade.radius_distribution = r
+        blade.radial_spacing      = (r[1]-r[0])
+        blade.chord_distribution  = c
+        blade.twist_distribution  = beta
+        
+        self._blade_geometry = blade
+        
+        return blade
+    
+    def thrust_axis_velocity(self,conditions):
+        """The velocity of the freestream along the axis of the propeller.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        conditions.frames.
+          body.transform_to_inertial (rotation matrix)
+          inertial.velocity_vector   [m/s]
+
+        Outputs:
+        V                            [m/s]
+
+        Properties Used:
+        self.thrust_angle            [radians]
+        """
+        
+        Vv     = conditions.frames.inertial.velocity_vector
+        theta  = self.thrust_angle
+        
+        # Velocity in the Body frame
+        T_body2inertial = conditions.frames.body.transform_to_inertial
+        T_inertial2body = orientation_transpose(T_body2inertial)
+        V_body = orientation_product(T_inertial2body,Vv)
+        
+        # Velocity transformed to the propulsor frame
+        body2thrust   = np.array([[np.cos(theta), 0., np.sin(theta)],[0., 1., 0.], [-np.sin(theta), 0., np.cos(theta)]])
+        T_body2thrust = orientation_transpose(np.ones_like(T_body2inertial[:])*body2thrust)
+        V_thrust      = orientation_product(T_body2thrust,V_body)
+        
+        # Now just use the aligned velocity
+        V = V_thrust[:,0,None]
+        
+        return V
+    
+    def spin_performance_map(self,conditions):
+        """Analyzes a propeller from the map of its thrust and power coefficients. Points that
+        are outside of the map, or next to points where the blade element theory did not
+        converge, are analyzed by spin_blade_elements.
+
+        Assumptions:
+        The coefficients depend on the advance ratio, the tip Mach number and the tip Reynolds
+        number, the temperature of the skin friction correction is the one of the map
+        The lift and drag coefficients of the blades are only found for the points that are not
+        in the map
+        The map is made again when the blades or the map settings change, see interpolate_performance_map
+
+        Source:
+        N/A
+
+        Inputs:
+        self.inputs.omega            [radian/s]
+        conditions.freestream.
+          density                    [kg/m^3]
+          dynamic_viscosity          [kg/(m-s)]
+          speed_of_sound             [m/s]
+        conditions.frames.
+          body.transform_to_inertial (rotation matrix)
+          inertial.velocity_vector   [m/s]
+        conditions.propulsion.
+          throttle                   [-]
+
+        Outputs:
+        conditions.propulsion.acoustic_outputs (without the coefficients of the blades)
+        conditions.propulsion.etap   [-]
+        self.outputs.
+          iterations                 [-] (zero for the points in the map)
+          converged                  [Boolean]
+        thrust                       [N]
+        torque                       [Nm]
+        power                        [W]
+        Cp                           [-] (coefficient of power)
+
+        Properties Used:
+        self.prop_attributes.
+          number_blades              [-]
+          tip_radius                 [m]
+          chord_distribution         [m]
+        self.performance_map_settings
+        """
+        
+        R      = self.prop_attributes.tip_radius
+        B      = self.prop_attributes.number_blades
+        c      = self.prop_attributes.chord_distribution
+        D      = 2*R
+        
+        omega1 = self.inputs.omega
+        rho    = conditions.freestream.density[:,0,None]
+        mu     = conditions.freestream.dynamic_viscosity[:,0,None]
+        a      = conditions.freestream.speed_of_sound[:,0,None]
+        V      = self.thrust_axis_velocity(conditions)
+        
+        omega  = np.abs(omega1*1.0)
+        n      = omega/(2.*np.pi)
+        
+        with np.errstate(divide='ignore',invalid='ignore'):
+            J  = V/(n*D)
+            Mt = omega*R/a
+            Re = omega*R*R*rho/mu
+        
+        values, inside = self.interpolate_performance_map(J,Mt,Re)
+        
+        Cp     = values.power_coefficient
+        thrust = values.thrust_coefficient*rho*(n*n)*(D*D*D*D)
+        power  = Cp*rho*(n*n*n)*(D*D*D*D*D)
+        with np.errstate(divide='ignore',invalid='ignore'):
+            torque = power/omega
+        
+        thrust[conditions.propulsion.throttle[:,0] <=0.0] = 0.0
+        power[conditions.propulsion.throttle[:,0]  <=0.0] = 0.0
+        
+        thrust[omega1<0.0] = - thrust[omega1<0.0]
+        
+        iterations = np.zeros_like(thrust,dtype=int)
+        converged  = np.ones_like(thrust,dtype=bool)
+        
+        # the rest of the points by the blade element theory
+        rows = np.where(np.logical_not(inside[:,0]))[0]
+        if rows.size > 0:
+            blade_conditions = Data()
+            blade_conditions.freestream = Data()
+            for key in ['density','dynamic_viscosity','speed_of_sound','temperature']:
+                blade_conditions.freestream[key] = conditions.freestream[key][rows]
+            blade_conditions.frames = Data()
+            blade_conditions.frames.inertial = Data()
+            blade_conditions.frames.inertial.velocity_vector = conditions.frames.inertial.velocity_vector[rows]
+            blade_conditions.frames.body = Data()
+            blade_conditions.frames.body.transform_to_inertial = conditions.frames.body.transform_to_inertial[rows]
+            blade_conditions.propulsion = Data()
+            blade_conditions.propulsion.throttle = conditions.propulsion.throttle[rows]
+            
+            self.inputs.omega = omega1[rows]
+            try:
+                thrust[rows], torque[rows], power[rows], Cp[rows] = self.spin_blade_elements(blade_conditions)
+            finally:
+                self.inputs.omega = omega1
+            iterations[rows] = self.outputs.iterations
+            converged[rows]  = self.outputs.converged
+        
+        etap     = V*thrust/power
+        
+        conditions.propulsion.etap = etap
+        
+        self.outputs.iterations = iterations
+        self.outputs.converged  = converged
+        
+        # store data
+        results_conditions = Data      
+        conditions.propulsion.acoustic_outputs = results_conditions(
+            number_sections    = len(c),
+            airfoil_chord      = c,
+            blades_number      = B,
+            propeller_diameter = D,
+            omega              = omega,
+            velocity           = V,
+            thrust             = thrust,
+            power              = power,
+            mid_chord_aligment = self.prop_attributes.mid_chord_aligment
+        )
+        
+        return thrust, torque, power, Cp
+    
+    def interpolate_performance_map(self,J,Mt,Re):
+        """Interpolates the map of the propeller, which is made first if it is missing or was made
+        for other blades or map settings. The blades and settings are compared with a fingerprint
+        on every call, the slower hash of performance_map_key is only found when they change.
+
+        Assumptions:
+        Linear interpolation in the advance ratio, the tip Mach number and the logarithm of the
+        tip Reynolds number
+
+        Source:
+        N/A
+
+        Inputs:
+        J                            [-] advance ratio
+        Mt                           [-] tip Mach number
+        Re                           [-] tip Reynolds number
+
+        Outputs:
+        values.
+          thrust_coefficient         [-]
+          power_coefficient          [-]
+        inside                       [Boolean] False where the map can not be used
+
+        Properties Used:
+        self.performance_map
+        See performance_map_key
+        """
+        
+        # the fingerprint is exact and cheap, the key is only hashed again when it changes
+        prop_map    = self.performance_map
+        fingerprint = self.performance_map_fingerprint()
+        if prop_map is None or prop_map.get('_fingerprint',None) != fingerprint:
+            if prop_map is None or prop_map.key != self.performance_map_key():
+                prop_map = self.build_performance_map()
+            prop_map._fingerprint = fingerprint
+        
+        interpolator = prop_map.get('_interpolator',None)
+        if interpolator is None:
+            interpolator = RegularGridInterpolator((prop_map.advance_ratio,prop_map.tip_mach_number,np.log10(prop_map.reynolds_number)),
+                                                   np.stack([prop_map.thrust_coefficient,prop_map.power_coefficient,
+                                                             prop_map.converged.astype(float)],axis=-1))
+            prop_map._interpolator = interpolator
+        
+        J, Mt, Re = np.broadcast_arrays(J,Mt,Re)
+        with np.errstate(divide='ignore',invalid='ignore'):
+            log_Re = np.log10(Re)
+        
+        inside = np.logical_and.reduce([J  >= prop_map.advance_ratio[0],   J  <= prop_map.advance_ratio[-1],
+                                        Mt >= prop_map.tip_mach_number[0], Mt <= prop_map.tip_mach_number[-1],
+                                        Re >= prop_map.reynolds_number[0], Re <= prop_map.reynolds_number[-1]])
+        
+        points = np.zeros(J.shape + (3,))
+        points[inside,0] = J[inside]
+        points[inside,1] = Mt[inside]
+        points[inside,2] = log_Re[inside]
+        points[~inside]  = [prop_map.advance_ratio[0],prop_map.tip_mach_number[0],np.log10(prop_map.reynolds_number[0])]
+        
+        stacked = interpolator(points)
+        
+        # every corner of the cell has to have converged
+        inside = np.logical_and(inside,stacked[...,2] >= 1.-1e-9)
+        
+        values = Data()
+        values.thrust_coefficient = np.where(inside,stacked[...,0],0.)
+        values.power_coefficient  = np.where(inside,stacked[...,1],0.)
+        
+        return values, inside
+    
+    def performance_map_key(self):
+        """A hash of everything the map of the propeller depends on.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        key                          <string>
+
+        Properties Used:
+        self.
+          prop_attributes
+          performance_map_settings
+          max_iterations
+        """
+        
+        return hash_objects(type(self),self.prop_attributes,self.performance_map_settings,self.max_iterations)
+    
+    def performance_map_fingerprint(self):
+        """A copy of everything the map of the propeller depends on, that is cheaper to compare
+        than to hash, see fingerprint_objects.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        fingerprint                  <tuple>
+
+        Properties Used:
+        See performance_map_key
+        """
+        
+        return fingerprint_objects(type(self),self.prop_attributes,self.performance_map_settings,self.max_iterations)
+    
+    def build_performance_map(self):
+        """Makes the map of the thrust and power coefficients of the propeller by the blade
+        element theory, all points at once. The map is checked at the middle of its cells. With
+        performance_map_settings.cache, maps are kept on disk keyed on the blades and settings.
+
+        Assumptions:
+        See spin_performance_map
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Outputs:
+        prop_map.
+          key                        <string> see performance_map_key
+          advance_ratio              [-]
+          tip_mach_number            [-]
+          reynolds_number            [-]
+          temperature                [K]
+          thrust_coefficient         [-] one axis per grid above
+          power_coefficient          [-]
+          efficiency                 [-]
+          converged                  [Boolean]
+          errors.
+            thrust_coefficient       [-] largest difference at the middle of the cells that give
+            power_coefficient        [-] thrust, relative to the largest magnitude where there is thrust
+
+        Properties Used:
+        self.performance_map_settings
+        """
+        
+        settings = self.performance_map_settings
+        key      = self.performance_map_key()
+        cache    = settings.get('cache',None)
+        
+        prop_map = None
+        if cache is not None:
+            prop_map = cache.load(key)
+            
+        if prop_map is None:
+            J  = np.asarray(settings.advance_ratio,dtype=float)
+            Mt = np.asarray(settings.tip_mach_number,dtype=float)
+            Re = np.asarray(settings.reynolds_number,dtype=float)
+            
+            prop_map = Data()
+            prop_map.key             = key
+            prop_map.advance_ratio   = J
+            prop_map.tip_mach_number = Mt
+            prop_map.reynolds_number = Re
+            prop_map.temperature     = settings.temperature
+            
+            Ct, Cp, converged = self.evaluate_coefficients(J[:,None,None],Mt[None,:,None],Re[None,None,:],settings.temperature)
+            
+            # the points that did not converge are never interpolated
+            prop_map.converged          = converged
+            prop_map.thrust_coefficient = np.where(converged,Ct,0.)
+            prop_map.power_coefficient  = np.where(converged,Cp,0.)
+            with np.errstate(divide='ignore',invalid='ignore'):
+                efficiency = J[:,None,None]*prop_map.thrust_coefficient/prop_map.power_coefficient
+            prop_map.efficiency         = np.where(np.isfinite(efficiency),efficiency,0.)
+            
+            # the blade element theory at the middle of the cells, against the interpolation
+            self.performance_map = prop_map
+            mid_J  = (J[1:]+J[:-1])/2.
+            mid_Mt = (Mt[1:]+Mt[:-1])/2.
+            mid_Re = np.sqrt(Re[1:]*Re[:-1])
+            Ct, Cp, converged = self.evaluate_coefficients(mid_J[:,None,None],mid_Mt[None,:,None],mid_Re[None,None,:],settings.temperature)
+            values, inside    = self.interpolate_performance_map(mid_J[:,None,None],mid_Mt[None,:,None],mid_Re[None,None,:])
+            del prop_map._interpolator
+            del prop_map._fingerprint
+            
+            # where the propeller gives thrust, the blade element theory has spikes past windmilling
+            checked    = np.logical_and.reduce([inside,converged,Ct > 0.])
+            propulsive = np.logical_and(prop_map.converged,prop_map.thrust_coefficient > 0.)
+            prop_map.errors = Data()
+            for name, truth in [['thrust_coefficient',Ct],['power_coefficient',Cp]]:
+                scale = np.max(np.abs(prop_map[name][propulsive])) if np.any(propulsive) else 0.
+                if not np.any(checked) or scale == 0.:
+                    prop_map.errors[name] = 0.
+                else:
+                    prop_map.errors[name] = np.max(np.abs(values[name]-truth)[checked])/scale
+            
+            if cache is not None:
+                cache.save(key,prop_map)
+        
+        prop_map._fingerprint = self.performance_map_fingerprint()
+        self.performance_map  = prop_map
+        
+        return prop_map
+    
+    def evaluate_coefficients(self,J,Mt,Re,temperature):
+        """The thrust and power coefficients of the propeller by the blade element theory, for
+        a grid of advance ratios, tip Mach numbers and tip Reynolds numbers.
+
+        Assumptions:
+        Any speed of sound and density can be used, the coefficients only depend on the inputs
+
+        Source:
+        N/A
+
+        Inputs:
+        J                            [-] advance ratio
+        Mt                           [-] tip Mach number
+        Re                           [-] tip Reynolds number
+        temperature                  [K]
+
+        Outputs:
+        Ct                           [-] coefficient of thrust, with the broadcast shape of the inputs
+        Cp                           [-] coefficient of power
+        converged                    [Boolean]
+
+        Properties Used:
+        self.prop_attributes.tip_radius [m]
+        """
+        
+        J, Mt, Re = np.broadcast_arrays(J,Mt,Re)
+        shape     = J.shape
+        J, Mt, Re = [np.reshape(x,(-1,1)).astype(float) for x in [J,Mt,Re]]
+        ones      = np.ones_like(J)
+        
+        R     = self.prop_attributes.tip_radius
+        D     = 2*R
+        a     = 340.294*ones
+        rho   = 1.225*ones
+        omega = Mt*a/R
+        n     = omega/(2.*np.pi)
+        V     = J*n*D
+        
+        conditions = Data()
+        conditions.freestream = Data()
+        conditions.freestream.density           = rho
+        conditions.freestream.dynamic_viscosity = omega*R*R*rho/Re
+        conditions.freestream.speed_of_sound    = a
+        conditions.freestream.temperature       = temperature*ones
+        conditions.frames = Data()
+        conditions.frames.inertial = Data()
+        conditions.frames.inertial.velocity_vector = np.hstack([V,0.*V,0.*V])
+        conditions.frames.body = Data()
+        conditions.frames.body.transform_to_inertial = np.tile(np.eye(3),(len(J),1,1))
+        conditions.propulsion = Data()
+        conditions.propulsion.throttle = ones
+        
+        # along the axis of the propeller
+        thrust_angle      = self.thrust_angle
+        omega_in          = self.inputs.get('omega',None)
+        self.thrust_angle = 0.0
+        self.inputs.omega = omega
+        try:
+            with np.errstate(all='ignore'):
+                thrust, torque, power, Cp = self.spin_blade_elements(conditions)
+        finally:
+            self.thrust_angle = thrust_angle
+            self.inputs.omega = omega_in
+        
+        Ct        = thrust/(rho*(n*n)*(D*D*D*D))
+        converged = np.logical_and(self.outputs.converged,np.isfinite(Ct+Cp))
+        
+        return Ct.reshape(shape), Cp.reshape(shape), converged.reshape(shape)
+
@@ -2,7 +2,7 @@
 # Propulsor_Surrogate.py
 #
 # Created:  Mar 2017, E. Botero
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,6 +16,7 @@ import numpy as np
 from SUAVE.Components.Propulsors.Propulsor import Propulsor
 
 from SUAVE.Core import Data
+from SUAVE.Surrogate.surrogate_evaluation import predict, compile_surrogate
 import sklearn
 from sklearn import gaussian_process
 from sklearn.gaussian_process.kernels import RationalQuadratic 
@@ -67,6 +68,7 @@ class Propulsor_Surrogate(Propulsor):
         self.thrust_angle      = 0.0
         self.areas             = Data()
         self.surrogate_type    = 'gaussian'
+        self.use_compiled_surrogates = False
     
     # manage process with a driver function
     def evaluate_thrust(self,state):
@@ -101,14 +103,9 @@ class Propulsor_Surrogate(Propulsor):
         
         cond = np.hstack([altitude,mach,throttle])
         
-        # Run the surrogate for a range of altitudes
-        data_len = len(altitude)
-        sfc = np.zeros([data_len,1])  
-        thr = np.zeros([data_len,1]) 
-        for ii,_ in enumerate(altitude):            
-            sfc[ii] = sfc_surrogate.predict([np.array([altitude[ii][0],mach[ii][0],throttle[ii][0]])])    
-            thr[ii] = thr_surrogate.predict([np.array([altitude[ii][0],mach[ii][0],throttle[ii][0]])])   #This is the fix when sklearn is update.
-
+        # Run the surrogate for all of the points at once
+        sfc = predict(sfc_surrogate,cond)
+        thr = predict(thr_surrogate,cond)
         
         F    = thr
         mdot = thr*sfc*self.number_of_engines
@@ -141,6 +138,8 @@ class Propulsor_Surrogate(Propulsor):
     
             Properties Used:
             Defaulted values
+            self.use_compiled_surrogates  evaluates the surrogates with numpy only, see
+                                          SUAVE.Surrogate.surrogate_evaluation.compile_surrogate
         """          
         
         # file name to look for
@@ -184,6 +183,9 @@ class Propulsor_Surrogate(Propulsor):
             sfc_surrogate  = regr_sfc.fit(xy, sfc)
             thr_surrogate  = regr_thr.fit(xy, thr)           
         
+        if self.use_compiled_surrogates:
+            sfc_surrogate = compile_surrogate(sfc_surrogate)
+            thr_surrogate = compile_surrogate(thr_surrogate)
         
         # Save the output
         self.sfc_surrogate    = sfc_surrogate
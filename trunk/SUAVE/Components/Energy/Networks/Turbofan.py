@@ -7,6 +7,7 @@
 #           Aug 2017, E. Botero
 #           Oct 2017, E. Botero
 #           Nov 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -17,9 +18,11 @@ import SUAVE
 
 # package imports
 import numpy as np
+import copy
 
 from SUAVE.Core import Data
 from SUAVE.Components.Propulsors.Propulsor import Propulsor
+from SUAVE.Methods.Propulsion.turbofan_cycle import turbofan_cycle, turbofan_cycle_parameters, stations
 
 # ----------------------------------------------------------------------
 #  Turbofan Network
@@ -65,6 +68,9 @@ class Turbofan(Propulsor):
         self.SFC_adjustment       = 0.0 # Less than 1 is a reduction
         self.OpenVSP_flow_through = False
         
+        # evaluate the cycle in one pass over arrays, see SUAVE.Methods.Propulsion.turbofan_cycle
+        self.use_fused_cycle      = False
+        
         #areas needed for drag; not in there yet
         self.areas             = Data()
         self.areas.wetted      = 0.0
@@ -105,8 +111,13 @@ class Turbofan(Propulsor):
     
             Properties Used:
             Defaulted values
+            self.use_fused_cycle  [boolean]
         """           
 
+        # the fused cycle does not model the compressibility effects of the inlet
+        if self.use_fused_cycle and not self.inlet_nozzle.compressibility_effects:
+            return self.evaluate_fused_cycle(state)
+
         #Unpack
         conditions = state.conditions
         
@@ -291,6 +302,197 @@ class Turbofan(Propulsor):
         
         return results
     
+    def evaluate_fused_cycle(self,state):
+        """ Calculate thrust given the current state of the vehicle, with the whole cycle evaluated
+            in one pass over arrays instead of through the components. The results are the same as
+            the ones of evaluate_thrust, but the inputs and outputs of the components are not set.
+    
+            Assumptions:
+            The inlet nozzle does not model compressibility effects
+    
+            Source:
+            N/A
+    
+            Inputs:
+            state [state()]
+    
+            Outputs:
+            results.thrust_force_vector [newtons]
+            results.vehicle_mass_rate   [kg/s]
+            conditions.propulsion.acoustic_outputs, see evaluate_thrust
+    
+            Properties Used:
+            Defaulted values
+        """           
+        
+        conditions = state.conditions
+        
+        parameters = turbofan_cycle_parameters(self)
+        cycle      = turbofan_cycle(conditions,parameters)
+        
+        F_vec      = conditions.ones_row(3) * 0.0
+        F_vec[:,0] = cycle.thrust[:,0]
+
+        results = Data()
+        results.thrust_force_vector = F_vec
+        results.vehicle_mass_rate   = cycle.fuel_flow_rate
+        
+        # store data
+        core = cycle.core_nozzle
+        conditions.propulsion.acoustic_outputs.core = Data(
+        exit_static_temperature             = core.static_temperature,
+        exit_static_pressure                = core.static_pressure,
+        exit_stagnation_temperature         = cycle.stagnation_temperature[stations.index('core_nozzle')],
+        exit_stagnation_pressure            = core.static_pressure,
+        exit_velocity                       = core.velocity
+        )
+        
+        fan = cycle.fan_nozzle
+        conditions.propulsion.acoustic_outputs.fan = Data(
+        exit_static_temperature             = fan.static_temperature,
+        exit_static_pressure                = fan.static_pressure,
+        exit_stagnation_temperature         = cycle.stagnation_temperature[stations.index('fan_nozzle')],
+        exit_stagnation_pressure            = fan.static_pressure,
+        exit_velocity                       = fan.velocity
+        )
+        
+        return results
+    
+    def build_deck(self,altitudes,mach_numbers,atmosphere=None,temperature_deviation=0.,interpolation='linear'):
+        """ Evaluates the cycle once over a grid of altitudes and Mach numbers, all points at once,
+            and makes a network that interpolates the results in place of the cycle. The cycle is
+            checked at the middle of the cells of the grid.
+    
+            Assumptions:
+            Thrust and fuel flow are proportional to the throttle, so the cycle is evaluated at full throttle
+            The engine has been sized
+    
+            Source:
+            N/A
+    
+            Inputs:
+            altitudes              [m] increasing
+            mach_numbers           [-] increasing, above zero
+            atmosphere             [SUAVE.Analyses.Atmospheric] US_Standard_1976 if None
+            temperature_deviation  [K]
+            interpolation          <string> see Turbofan_Deck, the errors are found with it
+    
+            Outputs:
+            deck                   [SUAVE.Components.Energy.Networks.Turbofan_Deck]
+    
+            Properties Used:
+            Defaulted values
+        """          
+        
+        altitudes    = np.asarray(altitudes,dtype=float)
+        mach_numbers = np.asarray(mach_numbers,dtype=float)
+        
+        if atmosphere is None:
+            atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+        
+        deck = SUAVE.Components.Energy.Networks.Turbofan_Deck()
+        deck.tag               = self.tag
+        deck.number_of_engines = self.number_of_engines
+        deck.nacelle_diameter  = self.nacelle_diameter
+        deck.engine_length     = self.engine_length
+        deck.bypass_ratio      = self.bypass_ratio
+        deck.areas             = copy.deepcopy(self.areas)
+        deck.origin            = copy.deepcopy(self.origin)
+        deck.mass_properties   = copy.deepcopy(self.mass_properties)
+        for key in ['sealevel_static_thrust','design_thrust']:
+            if key in self:
+                deck[key] = self[key]
+        
+        deck.altitude      = altitudes
+        deck.mach_number   = mach_numbers
+        deck.interpolation = interpolation
+        deck.tables        = self.evaluate_grid(altitudes,mach_numbers,atmosphere,temperature_deviation)
+        deck.build_interpolator()
+        
+        # the cycle at the middle of the cells, against the interpolation
+        mid_altitudes    = (altitudes[1:]+altitudes[:-1])/2.
+        mid_mach_numbers = (mach_numbers[1:]+mach_numbers[:-1])/2.
+        truth  = self.evaluate_grid(mid_altitudes,mid_mach_numbers,atmosphere,temperature_deviation)
+        values = deck.interpolate(mid_altitudes[:,None],mid_mach_numbers[None,:])
+        
+        deck.errors = Data()
+        for key in deck.deck_keys:
+            scale = np.max(np.abs(deck.tables[key]))
+            if scale == 0.:
+                scale = 1.
+            deck.errors[key] = np.max(np.abs(values[key]-truth[key]))/scale
+        
+        return deck
+    
+    def evaluate_grid(self,altitudes,mach_numbers,atmosphere,temperature_deviation=0.):
+        """ Evaluates the cycle at full throttle at every pair of an altitude and a Mach number.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            altitudes              [m]
+            mach_numbers           [-]
+            atmosphere             [SUAVE.Analyses.Atmospheric]
+            temperature_deviation  [K]
+    
+            Outputs:
+            tables.<Turbofan_Deck.deck_keys>  one row per altitude, one column per Mach number
+    
+            Properties Used:
+            Defaulted values
+        """            
+        
+        grid_altitude, grid_mach = np.meshgrid(altitudes,mach_numbers,indexing='ij')
+        shape = grid_altitude.shape
+        
+        altitude    = np.reshape(grid_altitude,(-1,1))
+        mach_number = np.reshape(grid_mach,(-1,1))
+        
+        planet     = SUAVE.Attributes.Planets.Earth()
+        atmo_data  = atmosphere.compute_values(altitude,temperature_deviation)
+        
+        conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+        conditions.expand_rows(len(altitude))
+        
+        freestream = conditions.freestream
+        freestream.altitude          = altitude
+        freestream.mach_number       = mach_number
+        freestream.pressure          = atmo_data.pressure
+        freestream.temperature       = atmo_data.temperature
+        freestream.density           = atmo_data.density
+        freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+        freestream.speed_of_sound    = atmo_data.speed_of_sound
+        freestream.velocity          = mach_number*atmo_data.speed_of_sound
+        freestream.gravity           = planet.compute_gravity(altitude)
+        conditions.propulsion.throttle = np.ones_like(altitude)
+        
+        state = Data()
+        state.conditions = conditions
+        
+        results  = self.evaluate_thrust(state)
+        acoustic = conditions.propulsion.acoustic_outputs
+        
+        tables = Data()
+        tables.thrust                           = results.thrust_force_vector[:,0]
+        tables.fuel_flow_rate                   = results.vehicle_mass_rate[:,0]
+        tables.core_exit_static_temperature     = acoustic.core.exit_static_temperature[:,0]
+        tables.core_exit_static_pressure        = acoustic.core.exit_static_pressure[:,0]
+        tables.core_exit_stagnation_temperature = acoustic.core.exit_stagnation_temperature[:,0]
+        tables.core_exit_velocity               = acoustic.core.exit_velocity[:,0]
+        tables.fan_exit_static_temperature      = acoustic.fan.exit_static_temperature[:,0]
+        tables.fan_exit_static_pressure         = acoustic.fan.exit_static_pressure[:,0]
+        tables.fan_exit_stagnation_temperature  = acoustic.fan.exit_stagnation_temperature[:,0]
+        tables.fan_exit_velocity                = acoustic.fan.exit_velocity[:,0]
+        
+        for key in tables.keys():
+            tables[key] = np.reshape(tables[key],shape)
+        
+        return tables
+    
     def size(self,state):  
         """ Size the turbofan
     
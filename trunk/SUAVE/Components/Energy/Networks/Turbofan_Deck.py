@@ -0,0 +1,238 @@
+## @ingroup Components-Energy-Networks
+# Turbofan_Deck.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# package imports
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator
+
+from SUAVE.Core import Data
+from SUAVE.Components.Propulsors.Propulsor import Propulsor
+
+# ----------------------------------------------------------------------
+#  Network
+# ----------------------------------------------------------------------
+
+## @ingroup Components-Energy-Networks
+class Turbofan_Deck(Propulsor):
+    """ This is a turbofan that is answered from tables of its cycle instead of evaluating the
+        cycle. The tables are made by SUAVE.Components.Energy.Networks.Turbofan.build_deck.
+
+        Assumptions:
+        Thrust and fuel flow are proportional to the throttle, as in the Turbofan network, so the
+        tables are at full throttle
+        The atmosphere is the one the deck was built with
+        Points outside of the tables take the values at their edges
+
+        Source:
+        None
+    """
+
+    # the quantities in the tables, per unit throttle for thrust and fuel flow
+    deck_keys = ['thrust',
+                 'fuel_flow_rate',
+                 'core_exit_static_temperature',
+                 'core_exit_static_pressure',
+                 'core_exit_stagnation_temperature',
+                 'core_exit_velocity',
+                 'fan_exit_static_temperature',
+                 'fan_exit_static_pressure',
+                 'fan_exit_stagnation_temperature',
+                 'fan_exit_velocity']
+
+    def __defaults__(self):
+        """ This sets the default values for the network to function.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            N/A
+        """
+
+        self.tag               = 'Turbofan_Deck'
+        self.number_of_engines = 1.0
+        self.nacelle_diameter  = 1.0
+        self.engine_length     = 1.0
+        self.bypass_ratio      = 1.0
+        self.areas             = Data()
+        self.areas.wetted      = 0.0
+        self.areas.maximum     = 0.0
+        self.areas.exit        = 0.0
+        self.areas.inflow      = 0.0
+
+        # the grid of the tables
+        self.altitude          = None
+        self.mach_number       = None
+
+        # one table per key in deck_keys, one row per altitude
+        self.tables            = Data()
+
+        # 'linear' or a spline of scipy.interpolate.RegularGridInterpolator, such as 'cubic'
+        self.interpolation     = 'linear'
+
+        # largest differences to the cycle at the middle of the cells of the grid, relative to
+        # the largest magnitude in each table
+        self.errors            = Data()
+
+    def evaluate_thrust(self,state):
+        """ Calculate thrust given the current state of the vehicle
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            state.conditions.
+              freestream.altitude         [m]
+              freestream.mach_number      [-]
+              propulsion.throttle         [-]
+
+            Outputs:
+            results.thrust_force_vector [newtons]
+            results.vehicle_mass_rate   [kg/s]
+            conditions.propulsion.acoustic_outputs:
+                core:
+                    exit_static_temperature
+                    exit_static_pressure
+                    exit_stagnation_temperature
+                    exit_stagnation_pressure
+                    exit_velocity
+                fan:
+                    exit_static_temperature
+                    exit_static_pressure
+                    exit_stagnation_temperature
+                    exit_stagnation_pressure
+                    exit_velocity
+
+            Properties Used:
+            Defaulted values
+        """
+
+        # Unpack the conditions
+        conditions = state.conditions
+        throttle   = conditions.propulsion.throttle
+
+        values = self.interpolate(conditions.freestream.altitude,conditions.freestream.mach_number)
+
+        F    = values.thrust*throttle
+        mdot = np.fmax(values.fuel_flow_rate*throttle,0.)
+
+        F_vec      = conditions.ones_row(3) * 0.0
+        F_vec[:,0] = F[:,0]
+
+        results = Data()
+        results.thrust_force_vector = F_vec
+        results.vehicle_mass_rate   = mdot
+
+        # store data, the stagnation pressures are the static ones as in the Turbofan network
+        conditions.propulsion.acoustic_outputs.core = Data(
+        exit_static_temperature             = values.core_exit_static_temperature,
+        exit_static_pressure                = values.core_exit_static_pressure,
+        exit_stagnation_temperature         = values.core_exit_stagnation_temperature,
+        exit_stagnation_pressure            = values.core_exit_static_pressure,
+        exit_velocity                       = values.core_exit_velocity
+        )
+
+        conditions.propulsion.acoustic_outputs.fan = Data(
+        exit_static_temperature             = values.fan_exit_static_temperature,
+        exit_static_pressure                = values.fan_exit_static_pressure,
+        exit_stagnation_temperature         = values.fan_exit_stagnation_temperature,
+        exit_stagnation_pressure            = values.fan_exit_static_pressure,
+        exit_velocity                       = values.fan_exit_velocity
+        )
+
+        return results
+
+    def interpolate(self,altitude,mach_number):
+        """ Interpolates all of the tables at once.
+
+            Assumptions:
+            Points outside of the tables take the values at their edges
+
+            Source:
+            N/A
+
+            Inputs:
+            altitude                    [m]
+            mach_number                 [-]
+
+            Outputs:
+            values.<deck_keys>          same shape as the broadcast inputs
+
+            Properties Used:
+            self.
+              altitude                  [m]
+              mach_number               [-]
+              tables                    see deck_keys
+              interpolation             <string>
+        """
+
+        altitude, mach_number = np.broadcast_arrays(altitude,mach_number)
+
+        interpolator = self.get('_interpolator',None)
+        if interpolator is None or interpolator.method != self.interpolation:
+            interpolator = self.build_interpolator()
+
+        points = np.empty(altitude.shape + (2,))
+        points[...,0] = np.clip(altitude,self.altitude[0],self.altitude[-1])
+        points[...,1] = np.clip(mach_number,self.mach_number[0],self.mach_number[-1])
+
+        stacked = interpolator(points)
+
+        values = Data()
+        for i, key in enumerate(self.deck_keys):
+            values[key] = stacked[...,i]
+
+        return values
+
+    def build_interpolator(self):
+        """ Stacks the tables into one interpolator, which is kept with the network. This is run
+            again when the tables are changed.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            interpolator                [scipy.interpolate.RegularGridInterpolator]
+
+            Properties Used:
+            self.
+              altitude                  [m]
+              mach_number               [-]
+              tables                    see deck_keys
+              interpolation             <string>
+        """
+
+        stacked = np.stack([self.tables[key] for key in self.deck_keys],axis=-1)
+
+        interpolator = RegularGridInterpolator((self.altitude,self.mach_number),stacked,method=self.interpolation)
+
+        self._interpolator = interpolator
+
+        return interpolator
+
+    __call__ = evaluate_thrust
@@ -9,6 +9,7 @@ from .Ducted_Fan import Ducted_Fan
 from .Battery_Ducted_Fan import Battery_Ducted_Fan 
 from .Serial_Hybrid_Ducted_Fan import Serial_Hybrid_Ducted_Fan 
 from .Turbofan import Turbofan
+from .Turbofan_Deck import Turbofan_Deck
 from .Turbojet_Super import Turbojet_Super
 from .Solar_Low_Fidelity import Solar_Low_Fidelity
 from .Propulsor_Surrogate import Propulsor_Surrogate
@@ -2,7 +2,7 @@
 # Data.py
 #
 # Created:  Jun 2016, E. Botero
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #   Imports
@@ -16,7 +16,17 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
                             '_'*len(chars) + string.ascii_lowercase )
 
 dictgetitem = dict.__getitem__
+dictget      = dict.get
 objgetattrib = object.__getattribute__
+objsetattrib = object.__setattr__
+objdelattrib = object.__delattr__
+
+# marks a key that is not in the dictionary
+_missing = object()
+
+# class level caches, filled on first use of each class
+_class_attributes = {}
+_class_bases      = {}
 
 # ----------------------------------------------------------------------
 #   Data
@@ -39,7 +49,8 @@ class Data(dict):
         """ Retrieves an attribute set by a key k
     
             Assumptions:
-            Does a try if it is a dict, but if that fails treats it as an object
+            Looks for k in the dict first, if it is not there treats it as an object.
+            No exception is raised when k is a method or an attribute.
     
             Source:
             N/A
@@ -53,16 +64,17 @@ class Data(dict):
             Properties Used:
             N/A
             """         
-        try:
-            return dictgetitem(self,k)
-        except:
+        v = dictget(self,k,_missing)
+        if v is _missing:
             return objgetattrib(self,k)
+        return v
 
     def __setattr__(self, k, v):
         """ An override of the standard __setattr_ in Python.
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            This one treats k as an object if it is an attribute of the class or the instance,
+            otherwise it treats it as a key.
     
             Source:
             N/A
@@ -77,18 +89,17 @@ class Data(dict):
             Properties Used:
             N/A    
         """
-        try:
-            objgetattrib(self, k)
-        except:
+        if k in class_attributes(type(self)) or k in objgetattrib(self,'__dict__'):
+            objsetattrib(self, k, v)
+        else:
             self[k] = v
-        else:          
-            object.__setattr__(self, k, v) 
             
     def __delattr__(self, k):
         """ An override of the standard __delattr_ in Python. This deletes whatever is called by k
             
             Assumptions:
-            This one tries to treat k as an object, if that fails it treats it as a key.
+            This one treats k as an object if it is an attribute of the class or the instance,
+            otherwise it treats it as a key.
     
             Source:
             N/A
@@ -102,12 +113,10 @@ class Data(dict):
             Properties Used:
             N/A    
         """        
-        try:
-            objgetattrib(self, k)
-        except:
-            del self[k]
+        if k in class_attributes(type(self)) or k in objgetattrib(self,'__dict__'):
+            objdelattrib(self, k)
         else:
-            object.__delattr__(self, k)
+            del self[k]
     
     def __defaults__(self):
         """ A stub for all classes that come later
@@ -154,7 +163,7 @@ class Data(dict):
         super(Data,self).__init__() 
         
         # get base class list
-        klasses = self.get_bases()
+        klasses = class_bases(cls)
                 
         # fill in defaults trunk to leaf
         for klass in klasses[::-1]:
@@ -451,17 +460,7 @@ class Data(dict):
             Properties Used:
             N/A    
         """          
-        klass = self.__class__
-        klasses = []
-        while klass:
-            if issubclass(klass,Data): 
-                klasses.append(klass)
-                klass = klass.__base__
-            else:
-                klass = None
-        if not klasses: # empty list
-            raise TypeError('class %s is not of type Data()' % self.__class__)
-        return klasses    
+        return list(class_bases(type(self)))
     
     def append(self,value,key=None):
         """ Adds new values to the classes. Can also change an already appended key
@@ -796,6 +795,70 @@ class Data(dict):
     
         return result
 
+# ----------------------------------------------------------------------
+#   Class Caches
+# ----------------------------------------------------------------------        
+
+## @ingroup Core
+def class_attributes(klass):
+    """ Finds the names of all attributes and methods defined on a class and its bases
+    
+        Assumptions:
+        Classes are not given new attributes after their first instance is used
+    
+        Source:
+        N/A
+    
+        Inputs:
+        klass       [class]
+    
+        Outputs:
+        names       [frozenset]
+    
+        Properties Used:
+        N/A    
+    """
+    names = _class_attributes.get(klass)
+    if names is None:
+        names = frozenset().union(*[vars(k) for k in klass.__mro__])
+        _class_attributes[klass] = names
+    return names
+
+## @ingroup Core
+def class_bases(klass):
+    """ Finds the chain of Data classes a class is built on, from the class to Data
+    
+        Assumptions:
+        N/A
+    
+        Source:
+        N/A
+    
+        Inputs:
+        klass       [class]
+    
+        Outputs:
+        klasses     [tuple]
+    
+        Properties Used:
+        N/A    
+    """
+    klasses = _class_bases.get(klass)
+    if klasses is None:
+        bases = []
+        base  = klass
+        while base:
+            if issubclass(base,Data): 
+                bases.append(base)
+                base = base.__base__
+            else:
+                base = None
+        if not bases: # empty list
+            raise TypeError('class %s is not of type Data()' % klass)
+        klasses = tuple(bases)
+        _class_bases[klass] = klasses
+    return klasses
+
 # ----------------------------------------------------------------------
 #   Module Tests
 # ----------------------------------------------------------------------        
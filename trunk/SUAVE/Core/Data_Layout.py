@@ -0,0 +1,259 @@
+## @ingroup Core
+# Data_Layout.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from .Data   import Data
+from .Arrays import array_type, matrix_type
+
+dictget  = dict.get
+dictkeys = dict.keys
+
+# marks a key that is not in the dictionary
+_missing = object()
+
+# ----------------------------------------------------------------------
+#   Data Layout
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Data_Layout(object):
+    """ A flat map of the values that Data.pack_array() packs, so that packing and unpacking a Data
+        with the same structure many times does not need to walk the tree.
+
+        The layout is built on first use and is checked on every pack and unpack. It is rebuilt
+        whenever a key is added, removed or reordered, a sub Data is replaced, or a value changes
+        its type, shape or dtype.
+
+        Assumptions:
+        Only vector packing. If the Data holds containers that are not Data, or matrices, every
+        call falls back to Data.pack_array() and Data.unpack_array().
+
+        Source:
+        N/A
+    """
+
+    def __init__(self):
+        """ Makes an empty layout
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.clear()
+
+    def clear(self):
+        """ Forgets the layout, it is rebuilt on the next pack or unpack
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.root       = None
+        self.supported  = False
+        self.containers = []
+        self.entries    = []
+        self.size       = 0
+        self.dtype      = None
+
+    def build(self,data):
+        """ Walks the Data in the packing order of Data.pack_array() and records where each value goes
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data       [Data]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        self.clear()
+        self.root      = data
+        self.supported = True
+
+        containers = self.containers
+        entries    = self.entries
+        dtypes     = []
+        index      = [0]
+
+        def do_build(P,key,D):
+            containers.append((P,key,D,list(dictkeys(D))))
+            for k in dictkeys(D):
+                v = dictget(D,k)
+                if isinstance(v,dict):
+                    if not isinstance(v,Data):
+                        self.supported = False
+                    do_build(D,k,v)
+                elif isinstance(v,matrix_type):
+                    self.supported = False
+                elif isinstance(v,array_type):
+                    rank = v.ndim
+                    if rank > 2:
+                        entries.append((D,k,array_type,v.shape,v.dtype,rank,None,None))
+                        continue
+                    start = index[0]
+                    index[0] += v.size
+                    dtypes.append(v.dtype)
+                    entries.append((D,k,array_type,v.shape,v.dtype,rank,start,index[0]))
+                elif isinstance(v,(int,float)):
+                    start = index[0]
+                    index[0] += 1
+                    dtypes.append(np.asarray(v).dtype)
+                    entries.append((D,k,type(v),None,None,0,start,index[0]))
+                else:
+                    entries.append((D,k,type(v),None,None,None,None,None))
+
+        do_build(None,None,data)
+
+        self.size  = index[0]
+        self.dtype = np.result_type(*dtypes) if dtypes else np.dtype(float)
+
+    def valid(self,data):
+        """ Checks that the Data still has the structure of the layout
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data       [Data]
+
+            Outputs:
+            valid      [boolean]
+
+            Properties Used:
+            N/A
+        """
+
+        if data is not self.root:
+            return False
+
+        # sub Data must be the same objects, with the same keys in the same order
+        for P,key,D,keys in self.containers:
+            if P is not None and dictget(P,key) is not D:
+                return False
+            if list(dictkeys(D)) != keys:
+                return False
+
+        for D,k,kind,shape,dtype,rank,start,stop in self.entries:
+            v = dictget(D,k,_missing)
+            if kind is array_type:
+                if type(v) is not array_type or v.shape != shape or v.dtype is not dtype:
+                    return False
+            elif type(v) is not kind:
+                return False
+
+        return True
+
+    def pack(self,data):
+        """ Packs the Data into a new 1D vector, the same as data.pack_array()
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data       [Data]
+
+            Outputs:
+            M          [array]
+
+            Properties Used:
+            N/A
+        """
+
+        if not self.valid(data):
+            self.build(data)
+        if not self.supported:
+            return data.pack_array()
+
+        M = np.empty(self.size,dtype=self.dtype)
+
+        for D,k,kind,shape,dtype,rank,start,stop in self.entries:
+            if start is None:
+                continue
+            v = dictget(D,k)
+            if rank == 2:
+                M[start:stop] = v.ravel(order='F')
+            else:
+                M[start:stop] = v
+
+        return M
+
+    def unpack(self,data,M):
+        """ Unpacks a 1D vector into the Data, the same as data.unpack_array(M)
+
+            Assumptions:
+            Arrays are written in place, scalars are replaced
+
+            Source:
+            N/A
+
+            Inputs:
+            data       [Data]
+            M          [array]
+
+            Outputs:
+            data       [Data]
+
+            Properties Used:
+            N/A
+        """
+
+        if not self.valid(data):
+            self.build(data)
+        if not self.supported or np.ndim(M) != 1 or len(M) != self.size:
+            return data.unpack_array(M)
+
+        for D,k,kind,shape,dtype,rank,start,stop in self.entries:
+            if start is None:
+                continue
+            if rank == 0:
+                D[k] = M[start]
+            elif rank == 1:
+                dictget(D,k)[:] = M[start:stop]
+            else:
+                dictget(D,k)[:,:] = np.reshape(M[start:stop],shape,order='F')
+
+        return data
@@ -6,6 +6,7 @@ from .Arrays import *
 from .Data             import Data
 from .DataOrdered      import DataOrdered
 from .Diffed_Data      import Diffed_Data
+from .Data_Layout      import Data_Layout
 from .Container        import Container
 from .ContainerOrdered import ContainerOrdered
 
@@ -3,6 +3,7 @@
 # 
 # Created:  Feb 2016, E. Botero
 # Modified: Jun 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -99,14 +100,7 @@ def lift_drag_total(state,settings,geometry):
         CL2  = wing_aero.post_stall_coefficients[wing.tag].lift_coefficient
         CD2  = wing_aero.post_stall_coefficients[wing.tag].drag_coefficient
         
-        # Equation 3a
-        CL = np.fmax(CL1,CL2)
-        
-        # Equation 3b
-        CL[alpha<=A0] = np.fmin(CL1[alpha<=A0],CL2[alpha<=A0])
-        
-        # Equation 3c
-        CD            = np.fmax(CD1,CD2)
+        CL, CD = wing_lift_drag(alpha,A0,CL1,CD1,CL2,CD2)
         
         # Add to the total
         CD_total      = CD_total + CD*area/ref
@@ -126,6 +120,47 @@ def lift_drag_total(state,settings,geometry):
     return CL_total, CD_total
 
 
+# ----------------------------------------------------------------------
+#  Wing Lift and Drag
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-AERODAS
+def wing_lift_drag(alpha,A0,CL1,CD1,CL2,CD2):
+    """ This combines the pre and post stall coefficients of a wing.
+
+    Assumptions:
+    None
+
+    Source:
+    NASA TR: "Models of Lift and Drag Coefficients of Stalled and Unstalled Airfoils in
+      Wind Turbines and Wind Tunnels" by D. A. Spera
+
+    Inputs:
+    alpha                                                                 [radians]
+    A0                                                                    [radians]
+    CL1, CD1 (pre stall coefficients)                                     [Unitless]
+    CL2, CD2 (post stall coefficients)                                    [Unitless]
+
+    Outputs:
+    CL (coefficient of lift)                                              [Unitless]
+    CD (coefficient of drag)                                              [Unitless]
+
+    Properties Used:
+    N/A
+    """      
+    
+    # Equation 3a
+    CL = np.fmax(CL1,CL2)
+    
+    # Equation 3b
+    CL[alpha<=A0] = np.fmin(CL1[alpha<=A0],CL2[alpha<=A0])
+    
+    # Equation 3c
+    CD            = np.fmax(CD1,CD2)
+    
+    return CL, CD
+
+
 # ----------------------------------------------------------------------
 #  Drag Total
 # ----------------------------------------------------------------------
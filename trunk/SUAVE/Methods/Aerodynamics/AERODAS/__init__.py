@@ -6,4 +6,5 @@ from . import AERODAS_setup
 from . import finite_aspect_ratio
 from . import post_stall_coefficients
 from . import pre_stall_coefficients
-from . import section_properties
\ No newline at end of file
+from . import section_properties
+from . import tabulated_coefficients
\ No newline at end of file
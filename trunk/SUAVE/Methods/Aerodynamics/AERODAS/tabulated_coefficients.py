@@ -0,0 +1,399 @@
+## @ingroup Methods-Aerodynamics-AERODAS
+# tabulated_coefficients.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from warnings import warn
+from SUAVE.Core import Data
+
+from .section_properties      import section_properties
+from .finite_aspect_ratio     import finite_aspect_ratio
+from .pre_stall_coefficients  import pre_stall_coefficients
+from .post_stall_coefficients import post_stall_coefficients
+from .AERODAS_setup           import wing_lift_drag
+
+# ----------------------------------------------------------------------
+#  Tabulate Wings
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-AERODAS
+def tabulate_wings(settings,geometry):
+    """Samples the AERODAS model of each wing once over a grid of angles of attack and Reynolds
+    numbers, and sums the wings into tables of the aircraft coefficients. The tables are checked
+    against the model at the middle of every cell of the grid, and the cells that are off by more
+    than the tolerance are split in angle of attack. The results are stored with the aircraft as
+    _aerodas_tables.
+
+    Assumptions:
+    The model does not depend on the Mach number, so it is not tabulated
+    Cells that are still off after all of the refinements hold a jump of the model, they are
+    listed as discontinuities and left out of the errors
+    The geometry is not changed afterwards, otherwise this is run again
+
+    Source:
+    NASA TR: "Models of Lift and Drag Coefficients of Stalled and Unstalled Airfoils in
+      Wind Turbines and Wind Tunnels" by D. A. Spera
+
+    Inputs:
+    settings.tabulation.
+      angle_of_attack                             [radians] increasing
+      reynolds_number                             [1/m] increasing
+      tolerance                                   [Unitless]
+      refinements                                 [int] number of times a cell can be split
+    settings.section_zero_lift_angle_of_attack    [radians]
+    geometry.
+      reference_area                              [m^2]
+      wings.*.
+        areas.reference                           [m^2]
+        vertical                                  <boolean>
+        (and the properties used by the AERODAS steps)
+
+    Outputs:
+    geometry._aerodas_tables.
+      angle_of_attack                             [radians] the refined grid
+      log_reynolds_number                         [Unitless] natural logarithm of the grid
+      lift_coefficient                            [Unitless] one row per angle of attack
+      drag_coefficient                            [Unitless] one row per angle of attack
+      wings[wing.tag].lift_coefficient            [Unitless] of each wing on its own area
+      wings[wing.tag].drag_coefficient            [Unitless] of each wing on its own area
+      errors.lift_coefficient                     [Unitless] largest error at the middle of the cells
+      errors.drag_coefficient                     [Unitless] largest error at the middle of the cells
+      discontinuities                             [radians]
+
+    Properties Used:
+    N/A
+    """
+
+    # Unpack
+    alphas = np.asarray(settings.tabulation.angle_of_attack,dtype=float)
+    log_re = np.log(np.asarray(settings.tabulation.reynolds_number,dtype=float))
+    tol    = settings.tabulation.tolerance
+    levels = settings.tabulation.refinements
+
+    wings, CL, CD = sample_wings(settings,geometry,alphas,log_re)
+    errors        = cell_errors(settings,geometry,alphas,log_re,CL,CD,np.ones(len(alphas)-1,dtype=bool))
+
+    for level in range(levels):
+
+        split = np.any(errors>tol,axis=1)
+        if not np.any(split):
+            break
+
+        # sample the middle of the cells that are split, and merge them into the grid
+        new_alphas = (alphas[:-1][split]+alphas[1:][split])/2.
+        new_wings, new_CL, new_CD = sample_wings(settings,geometry,new_alphas,log_re)
+
+        order  = np.argsort(np.concatenate([alphas,new_alphas]),kind='stable')
+        is_new = np.concatenate([np.zeros(len(alphas),dtype=bool),np.ones(len(new_alphas),dtype=bool)])[order]
+        alphas = np.concatenate([alphas,new_alphas])[order]
+        CL     = np.concatenate([CL,new_CL])[order]
+        CD     = np.concatenate([CD,new_CD])[order]
+        for tag in wings.keys():
+            for key in ['lift_coefficient','drag_coefficient']:
+                wings[tag][key] = np.concatenate([wings[tag][key],new_wings[tag][key]])[order]
+
+        # only the new cells are checked, the others keep their errors in order
+        new_cells = np.logical_or(is_new[:-1],is_new[1:])
+        old_errors = errors[np.logical_not(split)]
+        errors     = np.zeros((len(alphas)-1,2))
+        errors[np.logical_not(new_cells)] = old_errors
+        errors[new_cells] = cell_errors(settings,geometry,alphas,log_re,CL,CD,new_cells)
+
+    # the cells that are still off hold the jumps of the model
+    jumps = np.any(errors>tol,axis=1) if levels > 0 else np.zeros(len(alphas)-1,dtype=bool)
+    kept  = errors[np.logical_not(jumps)]
+
+    tables = Data()
+    tables.angle_of_attack     = alphas
+    tables.log_reynolds_number = log_re
+    tables.lift_coefficient    = CL
+    tables.drag_coefficient    = CD
+    tables.wings               = wings
+    tables.errors              = Data()
+    tables.errors.lift_coefficient = np.max(kept[:,0]) if len(kept) else 0.
+    tables.errors.drag_coefficient = np.max(kept[:,1]) if len(kept) else 0.
+    tables.discontinuities     = (alphas[:-1][jumps]+alphas[1:][jumps])/2.
+
+    if max(tables.errors.lift_coefficient,tables.errors.drag_coefficient) > tol:
+        warn('AERODAS tables differ from the model by up to %.2e in lift and %.2e in drag, refine settings.tabulation' \
+             % (tables.errors.lift_coefficient,tables.errors.drag_coefficient))
+
+    geometry._aerodas_tables = tables
+
+    return tables
+
+## @ingroup Methods-Aerodynamics-AERODAS
+def sample_wings(settings,geometry,alphas,log_re):
+    """Evaluates the AERODAS model of each wing on a grid, and sums the wings as in lift_drag_total.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    alphas                                        [radians]
+    log_re                                        [Unitless] natural logarithm of the Reynolds numbers
+    geometry.
+      reference_area                              [m^2]
+      wings                                       see wing_coefficients
+
+    Outputs:
+    wings[wing.tag].
+      lift_coefficient                            [Unitless] one row per angle of attack
+      drag_coefficient                            [Unitless] one row per angle of attack
+    CL (coefficient of lift of the aircraft)      [Unitless] one row per angle of attack
+    CD (coefficient of drag of the aircraft)      [Unitless] one row per angle of attack
+
+    Properties Used:
+    N/A
+    """
+
+    ref   = geometry.reference_area
+    shape = (len(alphas),len(log_re))
+    grid_alpha, grid_re = np.meshgrid(alphas,np.exp(log_re),indexing='ij')
+
+    wings    = Data()
+    CL_total = np.zeros(shape)
+    CD_total = np.zeros(shape)
+
+    for wing in geometry.wings:
+
+        CL, CD = wing_coefficients(settings,wing,grid_alpha.ravel(),grid_re.ravel())
+
+        wings[wing.tag] = Data()
+        wings[wing.tag].lift_coefficient = np.reshape(CL,shape)
+        wings[wing.tag].drag_coefficient = np.reshape(CD,shape)
+
+        area     = wing.areas.reference
+        CD_total = CD_total + wings[wing.tag].drag_coefficient*area/ref
+        if wing.vertical == False:
+            CL_total = CL_total + wings[wing.tag].lift_coefficient*area/ref
+
+    return wings, CL_total, CD_total
+
+## @ingroup Methods-Aerodynamics-AERODAS
+def cell_errors(settings,geometry,alphas,log_re,CL,CD,cells):
+    """Compares the tables of the aircraft to the model at the middle of cells of the grid, where
+    the interpolation is the mean of the corners of the cell.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    alphas                                        [radians]
+    log_re                                        [Unitless] natural logarithm of the Reynolds numbers
+    CL, CD                                        [Unitless] tables of the aircraft
+    cells                                         <boolean> one per interval of angle of attack
+
+    Outputs:
+    errors                                        [Unitless] largest error of the lift and drag
+                                                  over the Reynolds numbers, one row per cell
+
+    Properties Used:
+    N/A
+    """
+
+    i      = np.nonzero(cells)[0]
+    mid_a  = (alphas[i]+alphas[i+1])/2.
+    mid_re = (log_re[1:]+log_re[:-1])/2.
+
+    _, CL_mid, CD_mid = sample_wings(settings,geometry,mid_a,mid_re)
+
+    CL_int = (CL[i,:-1] + CL[i,1:] + CL[i+1,:-1] + CL[i+1,1:])/4.
+    CD_int = (CD[i,:-1] + CD[i,1:] + CD[i+1,:-1] + CD[i+1,1:])/4.
+
+    errors = np.zeros((len(i),2))
+    errors[:,0] = np.max(np.abs(CL_int-CL_mid),axis=1)
+    errors[:,1] = np.max(np.abs(CD_int-CD_mid),axis=1)
+
+    return errors
+
+# ----------------------------------------------------------------------
+#  Wing Coefficients
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-AERODAS
+def wing_coefficients(settings,wing,alpha,re):
+    """Evaluates the AERODAS model of one wing directly at a list of points.
+
+    Assumptions:
+    None
+
+    Source:
+    NASA TR: "Models of Lift and Drag Coefficients of Stalled and Unstalled Airfoils in
+      Wind Turbines and Wind Tunnels" by D. A. Spera
+
+    Inputs:
+    settings                                      see the AERODAS steps
+    wing                                          see the AERODAS steps
+    alpha                                         [radians]
+    re                                            [1/m]
+
+    Outputs:
+    CL (coefficient of lift)                      [Unitless] on the area of the wing
+    CD (coefficient of drag)                      [Unitless] on the area of the wing
+
+    Properties Used:
+    N/A
+    """
+
+    alpha = np.reshape(alpha,(-1,1))
+
+    state = Data()
+    state.conditions = Data()
+    state.conditions.freestream   = Data()
+    state.conditions.aerodynamics = Data()
+    state.conditions.freestream.reynolds_number          = np.reshape(re,(-1,1))
+    state.conditions.freestream.altitude                 = np.zeros_like(alpha)
+    state.conditions.aerodynamics.angle_of_attack        = alpha
+    state.conditions.aerodynamics.pre_stall_coefficients  = Data()
+    state.conditions.aerodynamics.post_stall_coefficients = Data()
+
+    section_properties(state,settings,wing)
+    finite_aspect_ratio(state,settings,wing)
+    CL1, CD1 = pre_stall_coefficients(state,settings,wing)
+    CL2, CD2 = post_stall_coefficients(state,settings,wing)
+
+    CL, CD = wing_lift_drag(alpha,settings.section_zero_lift_angle_of_attack,CL1,CD1,CL2,CD2)
+
+    return CL[:,0], CD[:,0]
+
+# ----------------------------------------------------------------------
+#  Interpolate Tables
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-AERODAS
+def interpolate_tables(tables,alpha,re):
+    """Interpolates the tables of the aircraft coefficients bilinearly, in the angle of attack and
+    the logarithm of the Reynolds number.
+
+    Assumptions:
+    Points outside of the tables take the values at their edges
+
+    Source:
+    N/A
+
+    Inputs:
+    tables                                        see tabulate_wings
+    alpha                                         [radians]
+    re                                            [1/m]
+
+    Outputs:
+    CL (coefficient of lift)                      [Unitless] same shape as alpha and re
+    CD (coefficient of drag)                      [Unitless] same shape as alpha and re
+
+    Properties Used:
+    N/A
+    """
+
+    alpha, re = np.broadcast_arrays(alpha,re)
+
+    i, wa = interval(tables.angle_of_attack,alpha)
+    j, wr = interval(tables.log_reynolds_number,np.log(re))
+
+    # the corners of the cells, in the flattened tables
+    n_re = len(tables.log_reynolds_number)
+    k00  = i*n_re + j
+    k01  = k00 + 1
+    k10  = k00 + n_re
+    k11  = k10 + 1
+
+    w00 = (1.-wa)*(1.-wr)
+    w01 = (1.-wa)*wr
+    w10 = wa*(1.-wr)
+    w11 = wa*wr
+
+    CL_table = tables.lift_coefficient.ravel()
+    CD_table = tables.drag_coefficient.ravel()
+
+    CL = CL_table[k00]*w00 + CL_table[k01]*w01 + CL_table[k10]*w10 + CL_table[k11]*w11
+    CD = CD_table[k00]*w00 + CD_table[k01]*w01 + CD_table[k10]*w10 + CD_table[k11]*w11
+
+    return CL, CD
+
+## @ingroup Methods-Aerodynamics-AERODAS
+def interval(grid,x):
+    """Finds the interval of a grid that holds each point, and the position of the point in it.
+
+    Assumptions:
+    Points outside of the grid are moved to its edges
+
+    Source:
+    N/A
+
+    Inputs:
+    grid                                          increasing, at least two points
+    x                                             points
+
+    Outputs:
+    i                                             [int] index of the start of the interval
+    w                                             [Unitless] position in the interval, from 0 to 1
+
+    Properties Used:
+    N/A
+    """
+
+    x = np.clip(x,grid[0],grid[-1])
+    i = np.clip(np.searchsorted(grid,x,side='right')-1,0,len(grid)-2)
+    w = (x-grid[i])/(grid[i+1]-grid[i])
+
+    return i, w
+
+# ----------------------------------------------------------------------
+#  Tabulated Lift and Drag Total
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-AERODAS
+def tabulated_lift_drag_total(state,settings,geometry):
+    """Finds the lift and drag of the aircraft from the tables of the AERODAS model, in place of
+    evaluating the model of each wing. See tabulate_wings.
+
+    Assumptions:
+    The tables have been built when the analysis was initialized, otherwise they are built here
+
+    Source:
+    N/A
+
+    Inputs:
+    geometry._aerodas_tables                      see tabulate_wings
+    state.conditions.
+      aerodynamics.angle_of_attack                [radians]
+      freestream.reynolds_number                  [1/m]
+    settings.drag_coefficient_increment           [Unitless]
+
+    Outputs:
+    state.conditions.aerodynamics.
+      lift_coefficient                            [Unitless]
+      drag_coefficient                            [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    tables = geometry.get('_aerodas_tables',None)
+    if tables is None:
+        tables = tabulate_wings(settings,geometry)
+
+    alpha = state.conditions.aerodynamics.angle_of_attack
+    re    = state.conditions.freestream.reynolds_number
+
+    CL_total, CD_total = interpolate_tables(tables,alpha,re)
+
+    CD_total = CD_total + settings.drag_coefficient_increment
+
+    # Pack outputs
+    state.conditions.aerodynamics.lift_coefficient = CL_total
+    state.conditions.aerodynamics.drag_coefficient = CD_total
+
+    return CL_total, CD_total
@@ -3,7 +3,7 @@
 # 
 # Created:  Dec 2013, SUAVE Team
 # Modified: Nov 2016, T. MacDonald
-#        
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +12,7 @@
 # SUAVE imports
 from SUAVE.Core import Data
 from SUAVE.Components import Wings
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.drag_geometry import wing_drag_geometry
 
 # package imports
 import numpy as np
@@ -29,6 +30,7 @@ def compressibility_drag_wing(state,settings,geometry):
     Assumptions:
     Subsonic to low transonic
     Supercritical airfoil
+    The geometry is found once when the analysis is initialized, and here if it was not, see drag_geometry
 
     Source:
     adg.stanford.edu (Stanford AA241 A/B Course Notes)
@@ -39,6 +41,7 @@ def compressibility_drag_wing(state,settings,geometry):
       aerodynamics.lift_breakdown.compressible_wings [Unitless]
     geometry.thickness_to_chord                      [Unitless]
     geometry.sweeps.quarter_chord                    [radians]
+    geometry._drag_geometry                          [Data] (optional, see wing_drag_geometry)
 
     Outputs:
     total_compressibility_drag                       [Unitless]
@@ -51,13 +54,10 @@ def compressibility_drag_wing(state,settings,geometry):
     conditions    = state.conditions
     configuration = settings    # unused
     
-    wing = geometry
-    if wing.tag == 'main_wing':
-        wing_lifts = conditions.aerodynamics.lift_breakdown.compressible_wings # currently the total aircraft lift
-    elif wing.vertical:
-        wing_lifts = 0
-    else:
-        wing_lifts = 0.15 * conditions.aerodynamics.lift_breakdown.compressible_wings
+    wing   = geometry
+    record = wing.get('_drag_geometry',None)
+    if record is None:
+        record = wing_drag_geometry(wing)
         
     mach           = conditions.freestream.mach_number
     drag_breakdown = conditions.aerodynamics.drag_breakdown
@@ -66,19 +66,17 @@ def compressibility_drag_wing(state,settings,geometry):
     total_compressibility_drag = 0.0
         
     # unpack wing
-    t_c_w   = wing.thickness_to_chord
-    sweep_w = wing.sweeps.quarter_chord
+    sweep_w   = record.quarter_chord_sweep
+    cos_sweep = record.cos_sweep
     
-    # Currently uses vortex lattice model on all wings
-    if wing.tag=='main_wing':
-        cl_w = wing_lifts
+    # Currently uses vortex lattice model on all wings, the lift is only carried by the main wing
+    if record.main_wing:
+        cl_w = conditions.aerodynamics.lift_breakdown.compressible_wings # currently the total aircraft lift
     else:
         cl_w = 0
-        
-    cos_sweep = np.cos(sweep_w)
 
     # get effective Cl and sweep
-    tc = t_c_w /(cos_sweep)
+    tc = record.effective_thickness_to_chord
     cl = cl_w / (cos_sweep*cos_sweep)
 
     # compressibility drag based on regressed fits from AA241
@@ -3,12 +3,14 @@
 # 
 # Created:  Jan 2014, T. Orra
 # Modified: Jan 2016, E. Botero    
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 # SUAVE imports
 from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.drag_geometry import aircraft_drag_geometry
 
 # ----------------------------------------------------------------------
 #  Computes the miscellaneous drag
@@ -20,6 +22,8 @@ def miscellaneous_drag_aircraft_ESDU(state,settings,geometry):
 
     Assumptions:
     Basic fit
+    The drag only depends on the geometry, it is found once when the analysis is initialized, and here if
+    it was not, see drag_geometry
 
     Source:
     ESDU 94044, figure 1
@@ -31,6 +35,7 @@ def miscellaneous_drag_aircraft_ESDU(state,settings,geometry):
     geometry.fuselages.areas.wetted            [m^2]
     geometry.propulsor.areas.wetted            [m^2]
     geometry.propulsor.number_of_engines       [Unitless]
+    geometry._drag_geometry                    [Data] (optional, see aircraft_drag_geometry)
 
     Outputs:
     cd_excrescence (drag)                      [Unitless]
@@ -44,25 +49,15 @@ def miscellaneous_drag_aircraft_ESDU(state,settings,geometry):
     conditions    = state.conditions
     configuration = settings
     
-    Sref      = geometry.reference_area
     ones_1col = conditions.freestream.mach_number *0.+1
-
-    # Estimating total wetted area
-    swet_tot        = 0.
-    for wing in geometry.wings:
-        swet_tot += wing.areas.wetted
-
-    for fuselage in geometry.fuselages:
-        swet_tot += fuselage.areas.wetted
-
-    for propulsor in geometry.propulsors:
-        swet_tot += propulsor.areas.wetted * propulsor.number_of_engines
-
-    swet_tot *= 1.10
     
     # Estimating excrescence drag, based in ESDU 94044, figure 1
-    D_q = 0.40* (0.0184 + 0.000469 * swet_tot - 1.13*10**-7 * swet_tot ** 2)
-    cd_excrescence = D_q / Sref
+    record = geometry.get('_drag_geometry',None)
+    if record is None:
+        record = aircraft_drag_geometry(geometry)
+    Sref           = record.reference_area
+    swet_tot       = record.total_wetted_area
+    cd_excrescence = record.excrescence_drag
 
     # ------------------------------------------------------------------
     #   The final result
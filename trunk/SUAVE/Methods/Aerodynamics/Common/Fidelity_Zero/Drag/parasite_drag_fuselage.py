@@ -3,12 +3,14 @@
 # 
 # Created:  Aug 2014, T. MacDonald
 # Modified: Nov 2016, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions import compressible_turbulent_flat_plate
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.drag_geometry import fuselage_drag_geometry
 from SUAVE.Core import Data
 
 import numpy as np
@@ -23,6 +25,7 @@ def parasite_drag_fuselage(state,settings,geometry):
 
     Assumptions:
     Basic fit
+    The geometry is found once when the analysis is initialized, and here if it was not, see drag_geometry
 
     Source:
     adg.stanford.edu (Stanford AA241 A/B Course Notes)
@@ -38,6 +41,7 @@ def parasite_drag_fuselage(state,settings,geometry):
       areas.wetted                               [m^2]
       lengths.total                              [m]
       effective_diameter                         [m]
+      _drag_geometry                             [Data] (optional, see fuselage_drag_geometry)
 
     Outputs:
     fuselage_parasite_drag                       [Unitless]
@@ -52,11 +56,14 @@ def parasite_drag_fuselage(state,settings,geometry):
     fuselage      = geometry
     
     freestream  = state.conditions.freestream
-    Sref        = fuselage.areas.front_projected
-    Swet        = fuselage.areas.wetted
     
-    l_fus  = fuselage.lengths.total
-    d_fus  = fuselage.effective_diameter
+    record = fuselage.get('_drag_geometry',None)
+    if record is None:
+        record = fuselage_drag_geometry(fuselage)
+    Sref   = record.reference_area
+    Swet   = record.wetted_area
+    l_fus  = record.length
+    d_d    = record.diameter_ratio
     
     # conditions
     Mc  = freestream.mach_number
@@ -69,20 +76,12 @@ def parasite_drag_fuselage(state,settings,geometry):
     # skin friction coefficient
     cf_fus, k_comp, k_reyn = compressible_turbulent_flat_plate(Re_fus,Mc,Tc)
     
-    # form factor for cylindrical bodies
-    d_d = float(d_fus)/float(l_fus)
-    D = np.array([[0.0]] * len(Mc))
-    a = np.array([[0.0]] * len(Mc))
-    du_max_u = np.array([[0.0]] * len(Mc))
-    k_fus = np.array([[0.0]] * len(Mc))
+    # form factor for cylindrical bodies, above Mach 0.95 it is held at its incompressible value
+    M_sub    = np.where(Mc < 0.95,Mc,0.)
     
-    D[Mc < 0.95] = np.sqrt(1 - (1-Mc[Mc < 0.95]**2) * d_d**2)
-    a[Mc < 0.95] = 2 * (1-Mc[Mc < 0.95]**2) * (d_d**2) *(np.arctanh(D[Mc < 0.95])-D[Mc < 0.95]) / (D[Mc < 0.95]**3)
-    du_max_u[Mc < 0.95] = a[Mc < 0.95] / ( (2-a[Mc < 0.95]) * (1-Mc[Mc < 0.95]**2)**0.5 )
-    
-    D[Mc >= 0.95] = np.sqrt(1 - d_d**2)
-    a[Mc >= 0.95] = 2  * (d_d**2) *(np.arctanh(D[Mc >= 0.95])-D[Mc >= 0.95]) / (D[Mc >= 0.95]**3)
-    du_max_u[Mc >= 0.95] = a[Mc >= 0.95] / ( (2-a[Mc >= 0.95]) )
+    D        = np.sqrt(1 - (1-M_sub**2) * d_d**2)
+    a        = 2 * (1-M_sub**2) * (d_d**2) *(np.arctanh(D)-D) / (D**3)
+    du_max_u = a / ( (2-a) * (1-M_sub**2)**0.5 )
     
     k_fus = (1 + form_factor*du_max_u)**2
 
@@ -3,6 +3,7 @@
 # 
 # Created:  Dec 2013, SUAVE Team
 # Modified: Jan 2016, E. Botero          
+#           Oct 2026, SUAVE Team
 
 #Sources: Stanford AA241 Course Notes
 #         Raymer: Aircraft Design: A Conceptual Approach
@@ -14,6 +15,7 @@
 # suave imports
 from SUAVE.Core import Data
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions import compressible_turbulent_flat_plate
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.drag_geometry import propulsor_drag_geometry
 
 # package imports
 import numpy as np
@@ -28,6 +30,7 @@ def parasite_drag_propulsor(state,settings,geometry):
 
     Assumptions:
     Basic fit
+    The geometry is found once when the analysis is initialized, and here if it was not, see drag_geometry
 
     Source:
     adg.stanford.edu (Stanford AA241 A/B Course Notes)
@@ -41,6 +44,7 @@ def parasite_drag_propulsor(state,settings,geometry):
       nacelle_diameter                           [m^2]
       areas.wetted                               [m^2]
       engine_length                              [m]
+      _drag_geometry                             [Data] (optional, see propulsor_drag_geometry)
 
     Outputs:
     propulsor_parasite_drag                      [Unitless]
@@ -54,11 +58,13 @@ def parasite_drag_propulsor(state,settings,geometry):
     configuration = settings
     
     propulsor = geometry
-    Sref      = propulsor.nacelle_diameter**2. / 4. * np.pi
-    Swet      = propulsor.areas.wetted
+    record    = propulsor.get('_drag_geometry',None)
+    if record is None:
+        record = propulsor_drag_geometry(propulsor)
+    Sref      = record.reference_area
+    Swet      = record.wetted_area
     
-    l_prop = propulsor.engine_length
-    d_prop = propulsor.nacelle_diameter
+    l_prop = record.length
     
     # conditions
     freestream = conditions.freestream
@@ -73,7 +79,7 @@ def parasite_drag_propulsor(state,settings,geometry):
     cf_prop, k_comp, k_reyn = compressible_turbulent_flat_plate(Re_prop,Mc,Tc)
     
     ## form factor according to Raymer equation (pg 283 of Aircraft Design: A Conceptual Approach)
-    k_prop = 1 + 0.35 / (float(l_prop)/float(d_prop))  
+    k_prop = record.form_factor
     
    
     # find the final result    
@@ -3,6 +3,7 @@
 # 
 # Created:  Jan 2014, T. Orra
 # Modified: Jan 2016, E. Botero   
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,6 +12,7 @@ import numpy as np
 
 # Suave imports
 from SUAVE.Core import Data
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.drag_geometry import propulsor_drag_geometry
 
 # ----------------------------------------------------------------------
 #  Computes the pyloan parasite drag
@@ -22,6 +24,7 @@ def parasite_drag_pylon(state,settings,geometry):
 
     Assumptions:
     Basic fit
+    The nacelle areas are found once when the analysis is initialized, and here if they were not, see drag_geometry
 
     Source:
     adg.stanford.edu (Stanford AA241 A/B Course Notes)
@@ -38,6 +41,7 @@ def parasite_drag_pylon(state,settings,geometry):
     geometry.propulsors. 
       nacelle_diameter                                              [m]
       number_of_engines                                             [Unitless]
+      _drag_geometry                                                [Data] (optional, see propulsor_drag_geometry)
 
     Outputs:
     propulsor_parasite_drag                                         [Unitless]
@@ -61,13 +65,17 @@ def parasite_drag_pylon(state,settings,geometry):
 
     # Estimating pylon drag
     for propulsor in geometry.propulsors:
-        ref_area = propulsor.nacelle_diameter**2 / 4 * np.pi
-        pylon_parasite_drag += pylon_factor *  conditions.aerodynamics.drag_breakdown.parasite[propulsor.tag].parasite_drag_coefficient* (ref_area/geometry.reference_area * propulsor.number_of_engines)
-        pylon_wetted_area   += pylon_factor *  conditions.aerodynamics.drag_breakdown.parasite[propulsor.tag].wetted_area * propulsor.number_of_engines
-        pylon_cf            += conditions.aerodynamics.drag_breakdown.parasite[propulsor.tag].skin_friction_coefficient
-        pylon_compr_fact    += conditions.aerodynamics.drag_breakdown.parasite[propulsor.tag].compressibility_factor
-        pylon_rey_fact      += conditions.aerodynamics.drag_breakdown.parasite[propulsor.tag].reynolds_factor
-        pylon_FF            += conditions.aerodynamics.drag_breakdown.parasite[propulsor.tag].form_factor
+        record = propulsor.get('_drag_geometry',None)
+        if record is None:
+            record = propulsor_drag_geometry(propulsor)
+        ref_area = record.reference_area
+        propulsor_result = conditions.aerodynamics.drag_breakdown.parasite[propulsor.tag]
+        pylon_parasite_drag += pylon_factor *  propulsor_result.parasite_drag_coefficient* (ref_area/geometry.reference_area * propulsor.number_of_engines)
+        pylon_wetted_area   += pylon_factor *  propulsor_result.wetted_area * propulsor.number_of_engines
+        pylon_cf            += propulsor_result.skin_friction_coefficient
+        pylon_compr_fact    += propulsor_result.compressibility_factor
+        pylon_rey_fact      += propulsor_result.reynolds_factor
+        pylon_FF            += propulsor_result.form_factor
         
     pylon_cf            /= n_propulsors           
     pylon_compr_fact    /= n_propulsors   
@@ -4,6 +4,7 @@
 # Created:  Dec 2013, SUAVE Team
 # Modified: Jan 2016, E. Botero      
 #           Apr 2019, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,6 +12,8 @@
 
 # local imports
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions import compressible_mixed_flat_plate
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Helper_Functions.drag_geometry import wing_drag_geometry
+from SUAVE.Methods.Geometry.Two_Dimensional.Planform.segment_properties import segment_arrays
 
 # suave imports
 from SUAVE.Core import Data
@@ -30,6 +33,9 @@ def parasite_drag_wing(state,settings,geometry):
 
     Assumptions:
     Basic fit
+    The segments of a wing are evaluated together. Their properties are gathered by segment_properties
+    when the analysis is initialized, and are gathered here if they were not. The same holds for the 
+    geometry of a wing without segments, see drag_geometry.
 
     Source:
     http://aerodesign.stanford.edu/aircraftdesign/aircraftdesign.html (Stanford AA241 A/B Course Notes)
@@ -52,6 +58,8 @@ def parasite_drag_wing(state,settings,geometry):
       areas.wetted                               [m^2]
       transition_x_upper                         [Unitless]
       transition_x_lower                         [Unitless]
+      _segment_arrays                            [Data] (optional, see segment_arrays)
+      _drag_geometry                             [Data] (optional, see wing_drag_geometry)
       
       
     Outputs:
@@ -74,9 +82,6 @@ def parasite_drag_wing(state,settings,geometry):
     wing_parasite_drag = 0.0
     
     # Unpack wing
-    exposed_root_chord_offset = wing.exposed_root_chord_offset
-    symm                      = wing.symmetric
-    semispan                  = wing.spans.projected*0.5 * (2 - symm)
     t_c_w                     = wing.thickness_to_chord
     Sref                      = wing.areas.reference
     num_segments              = len(wing.Segments.keys())     
@@ -87,77 +92,43 @@ def parasite_drag_wing(state,settings,geometry):
     xtl       = wing.transition_x_lower     
     
     if num_segments>0:        
-        total_wetted_area            = 0
-        total_segment_parasite_drag  = 0 
-        total_segment_k_w            = 0 
-        total_segment_cf_w_u         = 0
-        total_segment_cf_w_l         = 0 
-        total_segment_k_comp_u       = 0
-        total_segment_k_comp_l       = 0
-        total_k_reyn_u               = 0          
-        total_k_reyn_l               = 0    
-        root_chord                   = wing.chords.root  
-        
-        for i_segs in range(num_segments):
-            segment = wing.Segments[i_segs]
-            
-            if i_segs == num_segments-1:
-                continue 
-            
-            taper         = segment.taper 
-            mac_seg       = segment.chords.mean_aerodynamic
-            Sref_seg      = segment.areas.reference
-            S_exposed_seg = segment.areas.exposed
-            Swet_seg      = segment.areas.wetted
-            sweep_seg     = segment.sweeps.quarter_chord
-    
-            # compute parasite drag coef., form factor, skin friction coef., compressibility factor and reynolds number for segments
-            segment_parasite_drag , segment_k_w, segment_cf_w_u, segment_cf_w_l, segment_k_comp_u, segment_k_comp_l, k_reyn_u ,k_reyn_l = compute_parasite_drag(re,mac_seg,Mc,Tc,xtu,xtl,sweep_seg,t_c_w,Sref_seg,Swet_seg,C)    
+        arrays = wing.get('_segment_arrays',None)
+        if arrays is None or len(arrays.reference_areas) != num_segments-1:
+            arrays = segment_arrays(wing)
             
-            total_wetted_area            += Swet_seg
-            total_segment_parasite_drag  += segment_parasite_drag*Sref_seg   
-            total_segment_k_w            += segment_k_w*Sref_seg 
-            total_segment_cf_w_u         += segment_cf_w_u*Sref_seg 
-            total_segment_cf_w_l         += segment_cf_w_l*Sref_seg 
-            total_segment_k_comp_u       += segment_k_comp_u*Sref_seg 
-            total_segment_k_comp_l       += segment_k_comp_l*Sref_seg 
-            total_k_reyn_u               += k_reyn_u*Sref_seg                 
-            total_k_reyn_l               += k_reyn_l*Sref_seg  
-                
-        Swet              = total_wetted_area     
-        wing.areas.wetted = total_wetted_area 
-        wing_parasite_drag= total_segment_parasite_drag  / Sref
-        k_w               = total_segment_k_w / Sref
-        cf_w_u            = total_segment_cf_w_u  / Sref
-        cf_w_l            = total_segment_cf_w_l / Sref
-        k_comp_u          = total_segment_k_comp_u  / Sref
-        k_comp_l          = total_segment_k_comp_l  / Sref
-        k_reyn_u          = total_k_reyn_u  / Sref
-        k_reyn_l          = total_k_reyn_l  / Sref
+        mac_seg   = arrays.mean_aerodynamic_chords
+        Sref_seg  = arrays.reference_areas
+        Swet_seg  = arrays.wetted_areas
+        sweep_seg = arrays.quarter_chord_sweeps
+    
+        # compute parasite drag coef., form factor, skin friction coef., compressibility factor and reynolds number 
+        # for all segments at once, with one column per segment
+        segment_parasite_drag , segment_k_w, segment_cf_w_u, segment_cf_w_l, segment_k_comp_u, segment_k_comp_l, k_reyn_u ,k_reyn_l = compute_parasite_drag(re,mac_seg,Mc,Tc,xtu,xtl,sweep_seg,t_c_w,Sref_seg,Swet_seg,C)    
+        
+        # area weighted sums over the segments
+        shape             = np.shape(segment_k_w)
+        total             = lambda x: np.sum(np.broadcast_to(x,shape)*Sref_seg,axis=-1,keepdims=True)
+        Swet              = np.sum(Swet_seg)
+        wing.areas.wetted = Swet 
+        wing_parasite_drag= total(segment_parasite_drag) / Sref
+        k_w               = total(segment_k_w) / Sref
+        cf_w_u            = total(segment_cf_w_u) / Sref
+        cf_w_l            = total(segment_cf_w_l) / Sref
+        k_comp_u          = total(segment_k_comp_u) / Sref
+        k_comp_l          = total(segment_k_comp_l) / Sref
+        k_reyn_u          = total(k_reyn_u) / Sref
+        k_reyn_l          = total(k_reyn_l) / Sref
 
     # if wing has no segments      
     else:              
-        # wing
-        mac_w        = wing.chords.mean_aerodynamic
-        sweep_w      = wing.sweeps.quarter_chord
-        arw_w        = wing.aspect_ratio
-        span_w       = wing.spans.projected
-        Sref         = wing.areas.reference
-        
-        chord_root = wing.chords.root
-        chord_tip  = wing.chords.tip
-        wing_root     = chord_root + exposed_root_chord_offset*((chord_tip - chord_root)/span_w)
-    
-        # calculate exposed area
-        if wing.symmetric:
-            S_exposed_w = wing.areas.reference - (chord_root + wing_root)*exposed_root_chord_offset         
-        else: 
-            S_exposed_w = wing.areas.reference - 0.5*(chord_root + wing_root)*exposed_root_chord_offset
-              
-        if t_c_w < 0.05:
-            Swet = 2.003* S_exposed_w
-        else:
-            Swet = (1.977 + 0.52*t_c_w) * S_exposed_w
+        # wing, the geometry is found once
+        record = wing.get('_drag_geometry',None)
+        if record is None:
+            record = wing_drag_geometry(wing)
+        mac_w        = record.mean_aerodynamic_chord
+        sweep_w      = record.quarter_chord_sweep
+        Sref         = record.reference_area
+        Swet         = record.wetted_area
         
         # compute wetted area of segment
         wing.areas.wetted = Swet                           
@@ -187,6 +158,7 @@ def compute_parasite_drag(re,mac_w,Mc,Tc,xtu,xtl,sweep_w,t_c_w,Sref,Swet,C):
 
     Assumptions:
     Basic fit
+    The geometry may be given as arrays with one entry per segment, the results then have one column per segment
 
     Source:
     adg.stanford.edu (Stanford AA241 A/B Course Notes)
@@ -232,12 +204,14 @@ def compute_parasite_drag(re,mac_w,Mc,Tc,xtu,xtl,sweep_w,t_c_w,Sref,Swet,C):
     cos_sweep = np.cos(sweep_w)
     cos2      = cos_sweep*cos_sweep
     
-    ind = Mc <= 1.
+    # the fit only holds below Mach 1, the form factor is 1 above
+    ind   = Mc <= 1.
+    M_sub = np.where(ind,Mc,0.)
     
-    k_w = np.ones_like(Mc)
-    k_w[ind] = 1. + ( 2.* C * (t_c_w * cos2) ) / ( np.sqrt(1.- Mc[ind]*Mc[ind] * cos2) )  \
+    k_w = 1. + ( 2.* C * (t_c_w * cos2) ) / ( np.sqrt(1.- M_sub*M_sub * cos2) )  \
             + ( C*C * cos2 * t_c_w*t_c_w * (1. + 5.*(cos2)) ) \
-            / (2.*(1.-(Mc[ind]*cos_sweep)**2.))             
+            / (2.*(1.-(M_sub*cos_sweep)**2.))             
+    k_w = np.where(ind,k_w,1.)
     
     spline = Cubic_Spline_Blender(.95,1.0)
     h00 = lambda M:spline.compute(M)
@@ -8,4 +8,5 @@ from .asymmetry_drag import asymmetry_drag
 from .estimate_2ndseg_lift_drag_ratio import estimate_2ndseg_lift_drag_ratio
 from .compressible_turbulent_flat_plate import compressible_turbulent_flat_plate
 from .compressible_mixed_flat_plate import compressible_mixed_flat_plate
-from .wave_drag_lift import wave_drag_lift
\ No newline at end of file
+from .wave_drag_lift import wave_drag_lift
+from .drag_geometry import drag_geometry
\ No newline at end of file
@@ -0,0 +1,277 @@
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Helper_Functions
+# drag_geometry.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Geometry.Two_Dimensional.Planform.segment_properties import segment_arrays
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Drag Geometry
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Helper_Functions
+def drag_geometry(geometry):
+    """Computes the geometric quantities of the drag buildup once, so that the drag functions only
+    do the work that depends on the flight conditions. The results are stored with each component
+    as _drag_geometry.
+
+    Assumptions:
+    The geometry is not changed afterwards, otherwise this is run again
+    Segment properties have been computed for wings with segments
+    Propulsors without a nacelle are skipped
+
+    Source:
+    N/A
+
+    Inputs:
+    geometry.
+      reference_area                  [m^2]
+      wings                           see wing_drag_geometry
+      fuselages                       see fuselage_drag_geometry
+      propulsors                      see propulsor_drag_geometry
+
+    Outputs:
+    geometry._drag_geometry           see aircraft_drag_geometry
+    geometry.wings.*._drag_geometry
+    geometry.fuselages.*._drag_geometry
+    geometry.propulsors.*._drag_geometry
+
+    Properties Used:
+    N/A
+    """
+
+    for wing in geometry.wings:
+        wing._drag_geometry = wing_drag_geometry(wing)
+
+    for fuselage in geometry.fuselages:
+        fuselage._drag_geometry = fuselage_drag_geometry(fuselage)
+
+    for propulsor in geometry.propulsors:
+        if propulsor.get('nacelle_diameter',None) is None or propulsor.get('engine_length',None) is None:
+            continue
+        propulsor._drag_geometry = propulsor_drag_geometry(propulsor)
+
+    geometry._drag_geometry = aircraft_drag_geometry(geometry)
+
+    return
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Helper_Functions
+def wing_drag_geometry(wing):
+    """Computes the geometric quantities of the parasite and compressibility drag of a wing.
+
+    Assumptions:
+    The wetted area is found from the exposed area, or from the segments if there are any
+
+    Source:
+    adg.stanford.edu (Stanford AA241 A/B Course Notes)
+
+    Inputs:
+    wing.
+      tag                             <string>
+      exposed_root_chord_offset       [m]
+      symmetric                       <boolean>
+      thickness_to_chord              [Unitless]
+      sweeps.quarter_chord            [radians]
+      spans.projected                 [m]
+      areas.reference                 [m^2]
+      chords.
+        root                          [m]
+        tip                           [m]
+        mean_aerodynamic              [m]
+      Segments                        see segment_arrays
+
+    Outputs:
+    record.
+      reference_area                  [m^2]
+      wetted_area                     [m^2]
+      mean_aerodynamic_chord          [m]
+      quarter_chord_sweep             [radians]
+      thickness_to_chord              [Unitless]
+      cos_sweep                       [Unitless]
+      effective_thickness_to_chord    [Unitless] thickness to chord normal to the quarter chord
+      main_wing                       <boolean>
+
+    Properties Used:
+    N/A
+    """
+
+    t_c_w   = wing.thickness_to_chord
+    sweep_w = wing.sweeps.quarter_chord
+    Sref    = wing.areas.reference
+
+    if len(wing.Segments.keys()) > 0:
+        arrays = wing.get('_segment_arrays',None)
+        if arrays is None or len(arrays.wetted_areas) != len(wing.Segments.keys())-1:
+            arrays = segment_arrays(wing)
+        Swet = np.sum(arrays.wetted_areas)
+
+    else:
+        exposed_root_chord_offset = wing.exposed_root_chord_offset
+        chord_root = wing.chords.root
+        chord_tip  = wing.chords.tip
+        wing_root  = chord_root + exposed_root_chord_offset*((chord_tip - chord_root)/wing.spans.projected)
+
+        # calculate exposed area
+        if wing.symmetric:
+            S_exposed_w = Sref - (chord_root + wing_root)*exposed_root_chord_offset
+        else:
+            S_exposed_w = Sref - 0.5*(chord_root + wing_root)*exposed_root_chord_offset
+
+        if t_c_w < 0.05:
+            Swet = 2.003* S_exposed_w
+        else:
+            Swet = (1.977 + 0.52*t_c_w) * S_exposed_w
+
+    cos_sweep = np.cos(sweep_w)
+
+    record = Data()
+    record.reference_area               = Sref
+    record.wetted_area                  = Swet
+    record.mean_aerodynamic_chord       = wing.chords.mean_aerodynamic
+    record.quarter_chord_sweep          = sweep_w
+    record.thickness_to_chord           = t_c_w
+    record.cos_sweep                    = cos_sweep
+    record.effective_thickness_to_chord = t_c_w /(cos_sweep)
+    record.main_wing                    = (wing.tag == 'main_wing')
+
+    return record
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Helper_Functions
+def fuselage_drag_geometry(fuselage):
+    """Computes the geometric quantities of the parasite drag of a fuselage.
+
+    Assumptions:
+    None
+
+    Source:
+    adg.stanford.edu (Stanford AA241 A/B Course Notes)
+
+    Inputs:
+    fuselage.
+      areas.front_projected           [m^2]
+      areas.wetted                    [m^2]
+      lengths.total                   [m]
+      effective_diameter              [m]
+
+    Outputs:
+    record.
+      reference_area                  [m^2]
+      wetted_area                     [m^2]
+      length                          [m]
+      diameter_ratio                  [Unitless] diameter over length
+
+    Properties Used:
+    N/A
+    """
+
+    record = Data()
+    record.reference_area = fuselage.areas.front_projected
+    record.wetted_area    = fuselage.areas.wetted
+    record.length         = fuselage.lengths.total
+    record.diameter_ratio = float(fuselage.effective_diameter)/float(fuselage.lengths.total)
+
+    return record
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Helper_Functions
+def propulsor_drag_geometry(propulsor):
+    """Computes the geometric quantities of the parasite drag of a propulsor.
+
+    Assumptions:
+    None
+
+    Source:
+    adg.stanford.edu (Stanford AA241 A/B Course Notes)
+    Raymer: Aircraft Design: A Conceptual Approach, pg 283
+
+    Inputs:
+    propulsor.
+      nacelle_diameter                [m]
+      areas.wetted                    [m^2]
+      engine_length                   [m]
+
+    Outputs:
+    record.
+      reference_area                  [m^2]
+      wetted_area                     [m^2]
+      length                          [m]
+      form_factor                     [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    l_prop = propulsor.engine_length
+    d_prop = propulsor.nacelle_diameter
+
+    record = Data()
+    record.reference_area = propulsor.nacelle_diameter**2. / 4. * np.pi
+    record.wetted_area    = propulsor.areas.wetted
+    record.length         = l_prop
+    record.form_factor    = 1 + 0.35 / (float(l_prop)/float(d_prop))
+
+    return record
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Helper_Functions
+def aircraft_drag_geometry(geometry):
+    """Computes the geometric quantities of the miscellaneous drag of an aircraft.
+
+    Assumptions:
+    The wetted areas of the wings are the ones found for their parasite drag
+
+    Source:
+    ESDU 94044, figure 1
+
+    Inputs:
+    geometry.
+      reference_area                  [m^2]
+      wings.*                         see wing_drag_geometry
+      fuselages.areas.wetted          [m^2]
+      propulsors.
+        areas.wetted                  [m^2]
+        number_of_engines             [Unitless]
+
+    Outputs:
+    record.
+      reference_area                  [m^2]
+      total_wetted_area               [m^2]
+      excrescence_drag                [Unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    Sref = geometry.reference_area
+
+    # Estimating total wetted area
+    swet_tot        = 0.
+    for wing in geometry.wings:
+        record = wing.get('_drag_geometry',None)
+        if record is None:
+            record = wing_drag_geometry(wing)
+        swet_tot += record.wetted_area
+
+    for fuselage in geometry.fuselages:
+        swet_tot += fuselage.areas.wetted
+
+    for propulsor in geometry.propulsors:
+        swet_tot += propulsor.areas.wetted * propulsor.number_of_engines
+
+    swet_tot *= 1.10
+
+    # Estimating excrescence drag, based in ESDU 94044, figure 1
+    D_q = 0.40* (0.0184 + 0.000469 * swet_tot - 1.13*10**-7 * swet_tot ** 2)
+
+    record = Data()
+    record.reference_area    = Sref
+    record.total_wetted_area = swet_tot
+    record.excrescence_drag  = D_q / Sref
+
+    return record
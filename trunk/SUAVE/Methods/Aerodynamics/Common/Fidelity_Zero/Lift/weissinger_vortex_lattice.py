@@ -5,6 +5,7 @@
 # Modified: Apr 2017, T. MacDonald
 #           Oct 2017, E. Botero
 #           Jun 2018, M. Clarke
+#           Oct 2026, SUAVE Team
 
 
 # ----------------------------------------------------------------------
@@ -13,6 +14,12 @@
 
 # package imports
 import numpy as np 
+import scipy.linalg
+
+from SUAVE.Methods.Utilities.bounded_cache import Bounded_Cache
+
+# influence matrices of the wings that have been analyzed, keyed on the geometry
+_geometry_cache = Bounded_Cache()
 
 # ----------------------------------------------------------------------
 #  Weissinger Vortex Lattice
@@ -23,7 +30,10 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
     """Uses the vortex lattice method to compute the lift coefficient and induced drag component
 
     Assumptions:
-    None
+    The angle of attack can be a scalar or an array, all angles are solved together with one
+    factorization of the influence matrix, see vortex_lattice_geometry
+    If a freestream Mach number is given it is a single subsonic value, compressibility is
+    included with the Prandtl-Glauert transformation
 
     Source:
     An Introduction to Theoretical and Computational Aerodynamics by Jack Moran
@@ -44,10 +54,99 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
     configuration.number_panels_spanwise    [Unitless]
     configuration.number_panels_chordwise   [Unitless]
     conditions.aerodynamics.angle_of_attack [radians]
+    conditions.freestream.mach_number       [Unitless] (optional)
+
+    Outputs:
+    Cl                                      [Unitless] same shape as the angle of attack
+    Cd                                      [Unitless] same shape as the angle of attack
+
+    Properties Used:
+    N/A
+    """ 
+
+    # conditions
+    aoa  = conditions.aerodynamics.angle_of_attack
+    mach = 0.
+    if 'freestream' in conditions and 'mach_number' in conditions.freestream:
+        mach = conditions.freestream.mach_number
+    
+    if wing.vertical != False :
+        CL = np.zeros(np.shape(aoa))[()]
+        CD = np.zeros(np.shape(aoa))[()]
+        return CL, CD
+    
+    # one column of the right hand side per angle of attack
+    alpha   = np.reshape(np.asarray(aoa,dtype=float),-1)
+    sin_aoa = np.sin(alpha)[:,None]
+    cos_aoa = np.cos(alpha)[:,None]
+    
+    # the influence matrix only depends on the geometry
+    twist_distri, deltax, A, lu = vortex_lattice_geometry(configuration,wing,mach)
+    Sref = wing.areas.reference
+    
+    RHS = np.sin(twist_distri[None,:] + alpha[:,None])
+    
+    # Vortex strength computation by back substitution, one row per angle of attack
+    T = scipy.linalg.lu_solve(lu,RHS.T).T
+    
+    # Calculating the effective velocty         
+    v   = np.dot(T,A.T)*0.25/np.pi
+    
+    Lfi = -T * (sin_aoa-v)
+    Lfk =  T * cos_aoa 
+    Lft = -Lfi * sin_aoa + Lfk * cos_aoa
+    Dg  =  Lfi * cos_aoa + Lfk * sin_aoa
+        
+    L  = deltax * Lft
+    D  = deltax * Dg
+    
+    # Total lift
+    LT = np.sum(L,axis=1)
+    DT = np.sum(D,axis=1)
+
+    CL = 2*LT/(0.5*Sref)
+    CD = 2*DT/(0.5*Sref)     
+    
+    # same shape as the angle of attack
+    CL = np.reshape(CL,np.shape(aoa))[()]
+    CD = np.reshape(CD,np.shape(aoa))[()]
+        
+    return CL, CD 
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def vortex_lattice_geometry(configuration,wing,mach=0.):
+    """Builds the horseshoe vortex layout and LU factored influence matrix of a wing. The results are
+    cached on the wing geometry, number of panels and Mach number, so unchanged wings are only
+    factored once.
+
+    Assumptions:
+    The wing is not vertical
+    Subsonic flow, the streamwise coordinates are stretched by 1/sqrt(1-M^2) (Prandtl-Glauert).
+    The lift from the circulation of the stretched wing, on the reference area of the real wing,
+    is then the compressible lift.
+
+    Source:
+    An Introduction to Theoretical and Computational Aerodynamics by Jack Moran
+    Katz, J. and Plotkin, A., "Low-Speed Aerodynamics", Cambridge University Press, 2001, Sec. 4.8
+
+    Inputs:
+    wing.
+      spans.projected                       [m]
+      chords.root                           [m]
+      chords.tip                            [m]
+      sweeps.quarter_chord                  [radians]
+      twists.root                           [radians]
+      twists.tip                            [radians]
+      symmetric                             [Boolean]
+      Segments                              [Data]
+    configuration.number_panels_spanwise    [Unitless]
+    mach                                    [Unitless]
 
     Outputs:
-    Cl                                      [Unitless]
-    Cd                                      [Unitless]
+    twist_distri                            [radians]
+    deltax                                  [m]
+    A                                       [Unitless] influence matrix
+    lu                                      LU factorization of A.T, see scipy.linalg.lu_factor
 
     Properties Used:
     N/A
@@ -58,17 +157,55 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
     root_chord  = wing.chords.root
     tip_chord   = wing.chords.tip
     sweep       = wing.sweeps.quarter_chord
-    taper       = wing.taper
     twist_rc    = wing.twists.root
     twist_tc    = wing.twists.tip
     sym_para    = wing.symmetric
-    Sref        = wing.areas.reference
-    orientation = wing.vertical
     
     n  = configuration.number_panels_spanwise
     
-    # conditions
-    aoa = conditions.aerodynamics.angle_of_attack
+    # compressibility factor
+    beta = np.sqrt(1. - float(mach)**2)
+    
+    segments = tuple([(float(seg.root_chord_percent),float(seg.twist),float(seg.sweeps.quarter_chord),\
+                       float(seg.percent_span_location)) for seg in wing.Segments.values()])
+    
+    key = (int(n),float(span),float(root_chord),float(tip_chord),float(sweep),float(twist_rc),float(twist_tc),\
+           sym_para is True,segments,beta)
+    
+    return _geometry_cache.fetch(key,build_vortex_lattice_geometry,configuration,wing,beta)
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def build_vortex_lattice_geometry(configuration,wing,beta):
+    """Builds the horseshoe vortex layout and LU factored influence matrix of a wing, without the
+    cache of vortex_lattice_geometry.
+
+    Assumptions:
+    See vortex_lattice_geometry
+
+    Source:
+    An Introduction to Theoretical and Computational Aerodynamics by Jack Moran
+
+    Inputs:
+    See vortex_lattice_geometry
+    beta                                    [Unitless] sqrt(1-M^2)
+
+    Outputs:
+    See vortex_lattice_geometry
+
+    Properties Used:
+    N/A
+    """ 
+
+    #unpack
+    span        = wing.spans.projected
+    root_chord  = wing.chords.root
+    tip_chord   = wing.chords.tip
+    sweep       = wing.sweeps.quarter_chord
+    twist_rc    = wing.twists.root
+    twist_tc    = wing.twists.tip
+    sym_para    = wing.symmetric
+    
+    n  = configuration.number_panels_spanwise
     
     # chord difference
     dchord = (root_chord-tip_chord)
@@ -76,125 +213,100 @@ def weissinger_vortex_lattice(conditions,configuration,wing):
         span = span/2
         
     deltax  = span/n    
-    sin_aoa = np.sin(aoa)
-    cos_aoa = np.cos(aoa)
-
-    if orientation == False :
-
-        # Determine if wing segments are defined  
-        n_segments           = len(wing.Segments.keys())
-        segment_vortex_index = np.zeros(n_segments)
-        # If spanwise stations are setup
-        if n_segments>0:
-            # discretizing the wing sections into panels
-            i             = np.arange(0,n)
-            j             = np.arange(0,n+1)
-            y_coordinates = (j)*deltax             
-            segment_chord = np.zeros(n_segments)
-            segment_twist = np.zeros(n_segments)
-            segment_sweep = np.zeros(n_segments)
-            segment_span  = np.zeros(n_segments)
-            segment_chord_x_offset = np.zeros(n_segments)
-            section_stations       = np.zeros(n_segments)
-            
-            # obtain chord and twist at the beginning/end of each segment
-            for i_seg in range(n_segments):                
-                segment_chord[i_seg]    = wing.Segments[i_seg].root_chord_percent*root_chord
-                segment_twist[i_seg]    = wing.Segments[i_seg].twist
-                segment_sweep[i_seg]    = wing.Segments[i_seg].sweeps.quarter_chord
-                section_stations[i_seg] = wing.Segments[i_seg].percent_span_location*span
-                
-                if i_seg == 0:
-                    segment_span[i_seg]           = 0.0
-                    segment_chord_x_offset[i_seg] = 0.25*root_chord # weissinger uses quarter chord as reference
-                else:
-                    segment_span[i_seg]           = wing.Segments[i_seg].percent_span_location*span - wing.Segments[i_seg-1].percent_span_location*span
-                    segment_chord_x_offset[i_seg] = segment_chord_x_offset[i_seg-1] + segment_span[i_seg]*np.tan(segment_sweep[i_seg-1])
-            
-            # shift spanwise vortices onto section breaks 
-            for i_seg in range(n_segments):
-                idx =  (np.abs(y_coordinates-section_stations[i_seg])).argmin()
-                y_coordinates[idx] = section_stations[i_seg]
-            
-            # define y coordinates of horseshoe vortices      
-            ya     = np.atleast_2d(y_coordinates[i])           
-            yb     = np.atleast_2d(y_coordinates[i+1])          
-            deltax = y_coordinates[i+1] - y_coordinates[i]
-            xa     = np.zeros(n)
-            x      = np.zeros(n)
-            y      = np.zeros(n)
-            twist_distri   = np.zeros(n)
-            section_length = np.zeros(n)
-            
-            # define coordinates of horseshoe vortices and control points
-            i_seg = 0
-            for idx in range(n):
-                twist_distri[idx]   =  segment_twist[i_seg] + ((yb[0][idx] - deltax[idx]/2 - section_stations[i_seg]) * (segment_twist[i_seg+1] - segment_twist[i_seg])/segment_span[i_seg+1])     
-                section_length[idx] =  segment_chord[i_seg] + ((yb[0][idx] - deltax[idx]/2 - section_stations[i_seg]) * (segment_chord[i_seg+1] - segment_chord[i_seg])/segment_span[i_seg+1])
-                xa[idx]             = segment_chord_x_offset[i_seg] + (yb[0][idx] - deltax[idx]/2 - section_stations[i_seg])*np.tan(segment_sweep[i_seg])                                                    # computer quarter chord points for each horseshoe vortex
-                x[idx]              = segment_chord_x_offset[i_seg] + (yb[0][idx] - deltax[idx]/2 - section_stations[i_seg])*np.tan(segment_sweep[i_seg])  + 0.5*section_length[idx]                         # computer three-quarter chord control points for each horseshoe vortex
-                y[idx]              = (yb[0][idx] -  deltax[idx]/2)                
-                
-                if y_coordinates[idx] == wing.Segments[i_seg+1].percent_span_location*span: 
-                    i_seg += 1                    
-                if y_coordinates[idx+1] == span:
-                    continue
-                                  
-            ya = np.atleast_2d(ya)  # y coordinate of start of horseshoe vortex on panel
-            yb = np.atleast_2d(yb)  # y coordinate of end horseshoe vortex on panel
-            xa = np.atleast_2d(xa)  # x coordinate of horseshoe vortex on panel
-            x  = np.atleast_2d(x)   # x coordinate of control points on panel
-            y  = np.atleast_2d(y)   # y coordinate of control points on panel
-            
-            RHS  = np.atleast_2d(np.sin(twist_distri+aoa))  
-   
-        else:   # no segments defined on wing 
-            # discretizing the wing sections into panels 
-            i              = np.arange(0,n)
-            section_length = dchord/span*(span-(i+1)*deltax+deltax/2) + tip_chord
-            twist_distri   = twist_rc + i/float(n)*(twist_tc-twist_rc)
+
+    # Determine if wing segments are defined  
+    n_segments           = len(wing.Segments.keys())
+    segment_vortex_index = np.zeros(n_segments)
+    # If spanwise stations are setup
+    if n_segments>0:
+        # discretizing the wing sections into panels
+        i             = np.arange(0,n)
+        j             = np.arange(0,n+1)
+        y_coordinates = (j)*deltax             
+        segment_chord = np.zeros(n_segments)
+        segment_twist = np.zeros(n_segments)
+        segment_sweep = np.zeros(n_segments)
+        segment_span  = np.zeros(n_segments)
+        segment_chord_x_offset = np.zeros(n_segments)
+        section_stations       = np.zeros(n_segments)
+        
+        # obtain chord and twist at the beginning/end of each segment
+        for i_seg in range(n_segments):                
+            segment_chord[i_seg]    = wing.Segments[i_seg].root_chord_percent*root_chord
+            segment_twist[i_seg]    = wing.Segments[i_seg].twist
+            segment_sweep[i_seg]    = wing.Segments[i_seg].sweeps.quarter_chord
+            section_stations[i_seg] = wing.Segments[i_seg].percent_span_location*span
             
-            ya   = np.atleast_2d((i)*deltax)                                                  # y coordinate of start of horseshoe vortex on panel
-            yb   = np.atleast_2d((i+1)*deltax)                                                # y coordinate of end horseshoe vortex on panel
-            xa   = np.atleast_2d(((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.25*section_length) # x coordinate of horseshoe vortex on panel
-            x    = np.atleast_2d(((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.75*section_length) # x coordinate of control points on panel
-            y    = np.atleast_2d(((i+1)*deltax-deltax/2))                                     # y coordinate of control points on panel 
-                    
-            RHS  = np.atleast_2d(np.sin(twist_distri+aoa))                                  
-                
+            if i_seg == 0:
+                segment_span[i_seg]           = 0.0
+                segment_chord_x_offset[i_seg] = 0.25*root_chord # weissinger uses quarter chord as reference
+            else:
+                segment_span[i_seg]           = wing.Segments[i_seg].percent_span_location*span - wing.Segments[i_seg-1].percent_span_location*span
+                segment_chord_x_offset[i_seg] = segment_chord_x_offset[i_seg-1] + segment_span[i_seg]*np.tan(segment_sweep[i_seg-1])
         
-        A = (whav(x,y,xa.T,ya.T)-whav(x,y,xa.T,yb.T)\
-            -whav(x,y,xa.T,-ya.T)+whav(x,y,xa.T,-yb.T))*0.25/np.pi
-    
-        # Vortex strength computation by matrix inversion
-        T = np.linalg.solve(A.T,RHS.T).T
+        # shift spanwise vortices onto section breaks 
+        for i_seg in range(n_segments):
+            idx =  (np.abs(y_coordinates-section_stations[i_seg])).argmin()
+            y_coordinates[idx] = section_stations[i_seg]
         
-        # Calculating the effective velocty         
-        A_v = A*0.25/np.pi*T
-        v   = np.sum(A_v,axis=1)
+        # define y coordinates of horseshoe vortices      
+        ya     = np.atleast_2d(y_coordinates[i])           
+        yb     = np.atleast_2d(y_coordinates[i+1])          
+        deltax = y_coordinates[i+1] - y_coordinates[i]
+        xa     = np.zeros(n)
+        x      = np.zeros(n)
+        y      = np.zeros(n)
+        twist_distri   = np.zeros(n)
+        section_length = np.zeros(n)
         
-        Lfi = -T * (sin_aoa-v)
-        Lfk =  T * cos_aoa 
-        Lft = -Lfi * sin_aoa + Lfk * cos_aoa
-        Dg  =  Lfi * cos_aoa + Lfk * sin_aoa
+        # define coordinates of horseshoe vortices and control points
+        i_seg = 0
+        for idx in range(n):
+            twist_distri[idx]   =  segment_twist[i_seg] + ((yb[0][idx] - deltax[idx]/2 - section_stations[i_seg]) * (segment_twist[i_seg+1] - segment_twist[i_seg])/segment_span[i_seg+1])     
+            section_length[idx] =  segment_chord[i_seg] + ((yb[0][idx] - deltax[idx]/2 - section_stations[i_seg]) * (segment_chord[i_seg+1] - segment_chord[i_seg])/segment_span[i_seg+1])
+            xa[idx]             = segment_chord_x_offset[i_seg] + (yb[0][idx] - deltax[idx]/2 - section_stations[i_seg])*np.tan(segment_sweep[i_seg])                                                    # computer quarter chord points for each horseshoe vortex
+            x[idx]              = segment_chord_x_offset[i_seg] + (yb[0][idx] - deltax[idx]/2 - section_stations[i_seg])*np.tan(segment_sweep[i_seg])  + 0.5*section_length[idx]                         # computer three-quarter chord control points for each horseshoe vortex
+            y[idx]              = (yb[0][idx] -  deltax[idx]/2)                
             
-        L  = deltax * Lft
-        D  = deltax * Dg
+            if y_coordinates[idx] == wing.Segments[i_seg+1].percent_span_location*span: 
+                i_seg += 1                    
+            if y_coordinates[idx+1] == span:
+                continue
+                              
+        ya = np.atleast_2d(ya)  # y coordinate of start of horseshoe vortex on panel
+        yb = np.atleast_2d(yb)  # y coordinate of end horseshoe vortex on panel
+        xa = np.atleast_2d(xa)  # x coordinate of horseshoe vortex on panel
+        x  = np.atleast_2d(x)   # x coordinate of control points on panel
+        y  = np.atleast_2d(y)   # y coordinate of control points on panel
         
-        # Total lift
-        LT = np.sum(L)
-        DT = np.sum(D)
-    
-        CL = 2*LT/(0.5*Sref)
-        CD = 2*DT/(0.5*Sref)     
+       
+    else:   # no segments defined on wing 
+        # discretizing the wing sections into panels 
+        i              = np.arange(0,n)
+        section_length = dchord/span*(span-(i+1)*deltax+deltax/2) + tip_chord
+        twist_distri   = twist_rc + i/float(n)*(twist_tc-twist_rc)
         
-    else:
-        
-        CL = 0.0
-        CD = 0.0    
+        ya   = np.atleast_2d((i)*deltax)                                                  # y coordinate of start of horseshoe vortex on panel
+        yb   = np.atleast_2d((i+1)*deltax)                                                # y coordinate of end horseshoe vortex on panel
+        xa   = np.atleast_2d(((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.25*section_length) # x coordinate of horseshoe vortex on panel
+        x    = np.atleast_2d(((i+1)*deltax-deltax/2)*np.tan(sweep) + 0.75*section_length) # x coordinate of control points on panel
+        y    = np.atleast_2d(((i+1)*deltax-deltax/2))                                     # y coordinate of control points on panel
 
-        
-    return CL, CD 
+    # Prandtl-Glauert stretching of the streamwise coordinates
+    x  = x/beta
+    xa = xa/beta
+    
+    A = (whav(x,y,xa.T,ya.T)-whav(x,y,xa.T,yb.T)\
+        -whav(x,y,xa.T,-ya.T)+whav(x,y,xa.T,-yb.T))*0.25/np.pi
+    
+    # factor once for all right hand sides
+    lu = scipy.linalg.lu_factor(A.T)
+    
+    # the arrays are shared by every call with this geometry, the cache makes them read only
+    twist_distri = np.array(twist_distri,dtype=float)
+    deltax       = np.array(deltax,dtype=float)
+    
+    return twist_distri, deltax, A, lu
 
 # ----------------------------------------------------------------------
 #   Helper Functions
@@ -2,7 +2,7 @@
 # Lifting_Line.py
 # 
 # Created:  Aug 2017, E. Botero
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 #           
 
 # ----------------------------------------------------------------------
@@ -10,6 +10,12 @@
 # ----------------------------------------------------------------------
 
 import numpy as np
+import scipy.linalg
+
+from SUAVE.Methods.Utilities.bounded_cache import Bounded_Cache
+
+# factored systems of the wings that have been analyzed, keyed on the stations and chords
+_factorization_cache = Bounded_Cache()
 
 # ----------------------------------------------------------------------
 #  The Function
@@ -21,6 +27,8 @@ def lifting_line(conditions,settings,geometry):
 
     Assumptions:
     subsonic and unswept
+    The angle of attack can be a scalar or an array, all angles are solved together with one
+    factorization of the system, see lifting_line_factorization
 
     Source:
     Traub, L. W., Botero, E., Waghela, R., Callahan, R., & Watson, A. (2015). Effect of Taper Ratio at Low Reynolds Number. Journal of Aircraft.
@@ -41,8 +49,8 @@ def lifting_line(conditions,settings,geometry):
     conditions.aerodynamics.angle_of_attack [radians]
 
     Outputs:
-    CL                                      [Unitless]
-    CD                                      [Unitless]
+    CL                                      [Unitless] one per angle of attack
+    CD                                      [Unitless] one per angle of attack
 
     Properties Used:
     N/A
@@ -73,10 +81,8 @@ def lifting_line(conditions,settings,geometry):
     r           = settings.number_of_stations # Number of divisions
     alpha       = conditions.aerodynamics.angle_of_attack
     
-    # Make sure alpha is 2D
-    alpha = np.atleast_2d(alpha)
-    
-    repeats = np.size(alpha)
+    # one row per angle of attack
+    alpha = np.reshape(np.asarray(alpha,dtype=float),(-1,1))
     
     # Need to set to something
     cla   = 2 * np.pi # 2-D lift curve slope
@@ -130,21 +136,15 @@ def lifting_line(conditions,settings,geometry):
         ageo = (tip_twist-root_twist)*etan+root_twist
 
     k = c*cla/(4.*b) # Grouped term 
-
-    
-    n_trans = np.atleast_2d(n).T
-        
-    # Right hand side matrix
-    RHS = (np.sin(n_trans*thetan)*(np.sin(thetan)+n_trans*k))
     
-    # Expand out for all the angles of attack
-    RHS2 = np.tile(RHS.T, (repeats,1,1))
+    # The system does not depend on the angle of attack, it is factored once
+    lu = lifting_line_factorization(r,b,n,thetan,c,k)
 
     # Left hand side vector    
     LHS = k*np.sin(thetan)*(alpha+ageo-azl)
         
-    # The Fourier Coefficients
-    A = np.linalg.solve(RHS2,LHS)
+    # The Fourier Coefficients, by back substitution with one column per angle of attack
+    A = scipy.linalg.lu_solve(lu,LHS.T).T
     
     # The 3-D Coefficient of lift
     CL = A[:,0]*np.pi*AR
@@ -172,4 +172,67 @@ def lifting_line(conditions,settings,geometry):
     
     CD  = CDv + CDp
    
-    return CL, CD
\ No newline at end of file
+    return CL, CD
+
+## @ingroup Methods-Aerodynamics-Lifting_line
+def lifting_line_factorization(r,b,n,thetan,c,k):
+    """Builds and LU factors the system of the lifting line. The result is cached on the number of
+    stations, the span and the chords, so an unchanged wing is only factored once.
+
+    Assumptions:
+    None
+
+    Source:
+    Traub, L. W., Botero, E., Waghela, R., Callahan, R., & Watson, A. (2015). Effect of Taper Ratio at Low Reynolds Number. Journal of Aircraft.
+
+    Inputs:
+    r                                       [int] number of stations
+    b                                       [m] span
+    n                                       [Unitless] station numbers
+    thetan                                  [radians] angular stations
+    c                                       [m] chords at the stations
+    k                                       [Unitless] grouped term of the chords
+
+    Outputs:
+    lu                                      LU factorization of the system, see scipy.linalg.lu_factor
+
+    Properties Used:
+    N/A
+    """  
+    
+    key = (int(r),float(b),np.asarray(c,dtype=float).tobytes())
+    
+    # the arrays are shared by every call with this geometry, the cache makes them read only
+    return _factorization_cache.fetch(key,build_lifting_line_factorization,n,thetan,k)
+
+## @ingroup Methods-Aerodynamics-Lifting_line
+def build_lifting_line_factorization(n,thetan,k):
+    """Builds and LU factors the system of the lifting line, without the cache of
+    lifting_line_factorization.
+
+    Assumptions:
+    None
+
+    Source:
+    Traub, L. W., Botero, E., Waghela, R., Callahan, R., & Watson, A. (2015). Effect of Taper Ratio at Low Reynolds Number. Journal of Aircraft.
+
+    Inputs:
+    n                                       [Unitless] station numbers
+    thetan                                  [radians] angular stations
+    k                                       [Unitless] grouped term of the chords
+
+    Outputs:
+    lu                                      LU factorization of the system, see scipy.linalg.lu_factor
+
+    Properties Used:
+    N/A
+    """  
+    
+    n_trans = np.atleast_2d(n).T
+        
+    # Right hand side matrix
+    RHS = (np.sin(n_trans*thetan)*(np.sin(thetan)+n_trans*k))
+    
+    lu = scipy.linalg.lu_factor(RHS.T)
+    
+    return lu
@@ -3,6 +3,7 @@
 # 
 # Created:  Aug 2014, T. MacDonald
 # Modified: Jun 2017, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -36,6 +37,7 @@ def compressibility_drag_total(state,settings,geometry):
     Inputs:
     settings.number_slices
     settings.number_rotations
+    settings.volume_drag_data_file  <string> (optional - defaults to volume_drag_data_<tag>.npy)
     state.conditions.aerodynamics.
       lift_breakdown.compressible_wings      [-]
     state.conditions.freestream.mach_number  [-]
@@ -58,6 +60,9 @@ def compressibility_drag_total(state,settings,geometry):
     configuration    = settings
     number_slices    = settings.number_slices
     number_rotations = settings.number_rotations
+    data_file        = settings.get('volume_drag_data_file',None)
+    if data_file is None:
+        data_file    = 'volume_drag_data_' + geometry.tag + '.npy'
     
     wings          = geometry.wings
     fuselages      = geometry.fuselages
@@ -111,7 +116,7 @@ def compressibility_drag_total(state,settings,geometry):
         drag105_total = drag105_total + cdc_l
         
     try:
-        old_array = np.load('volume_drag_data_' + geometry.tag + '.npy')
+        old_array = np.load(data_file)
         file_exists = True
     except:
         file_exists = False
@@ -120,13 +125,13 @@ def compressibility_drag_total(state,settings,geometry):
     if np.any(old_array[:,0]==1.05):
         cd_c_v = np.array([[float(old_array[old_array[:,0]==1.05,1])]])
     else:    
-        cd_c_v = wave_drag_volume(conditions,geometry, True)
+        cd_c_v = wave_drag_volume(conditions,geometry, True,data_file=data_file)
     
     if file_exists:
         pass
     else:
         new_save_row = np.array([[1.05,cd_c_v]])
-        np.save('volume_drag_data_' + geometry.tag + '.npy', new_save_row)    
+        np.save(data_file, new_save_row)    
     
 
     drag105 = drag105_total + cd_c_v*np.ones(np.shape(Mc))
@@ -154,7 +159,7 @@ def compressibility_drag_total(state,settings,geometry):
     # Only the supsonic results are returned with nonzero values
 
         
-    cd_c_v = wave_drag_volume(conditions, geometry, False,num_slices=number_slices,num_rots=number_rotations)
+    cd_c_v = wave_drag_volume(conditions, geometry, False,num_slices=number_slices,num_rots=number_rotations,data_file=data_file)
         
     cd_c[Mc >= 1.05] = cd_c_l[Mc >= 1.05] + cd_c_v[Mc >= 1.05]
 
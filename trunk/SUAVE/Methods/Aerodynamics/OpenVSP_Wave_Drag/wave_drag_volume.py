@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2014, T. Macdonald
 # Modified: Apr 2017, T. Macdonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,7 +17,7 @@ import numpy as np
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Aerodynamics-OpenVSP_Wave_Drag
-def wave_drag_volume(conditions,geometry,flag105,num_slices=20,num_rots=10):
+def wave_drag_volume(conditions,geometry,flag105,num_slices=20,num_rots=10,data_file=None):
     """Determine volume wave drag for supersonic speeds using OpenVSP
 
     Assumptions:
@@ -34,6 +35,7 @@ def wave_drag_volume(conditions,geometry,flag105,num_slices=20,num_rots=10):
     flag105                  <boolean> determines is Mach = 1.05 is used
     num_slices               [-] Slices used by OpenVSP (optional - defaults to 20)
     num_rots                 [-] Rotations used by OpenVSP (optional - defaults to 10)
+    data_file                <string> Stored volume drag data (optional - defaults to volume_drag_data_<tag>.npy)
 
     Outputs:
     cd_w_all
@@ -48,6 +50,8 @@ def wave_drag_volume(conditions,geometry,flag105,num_slices=20,num_rots=10):
     freestream   = conditions.freestream
     ref_area     = geometry.reference_area
     tag          = geometry.tag
+    if data_file is None:
+        data_file = 'volume_drag_data_' + tag + '.npy'
     
     # conditions
     Mc  = copy.copy(freestream.mach_number)
@@ -67,7 +71,7 @@ def wave_drag_volume(conditions,geometry,flag105,num_slices=20,num_rots=10):
     # Read data from file if possible, otherwise calculate new value
     for ii,mach in enumerate(Mc):
         if mach[0] >= 1.05:
-            old_array = np.load('volume_drag_data_' + geometry.tag + '.npy')
+            old_array = np.load(data_file)
             if np.any(old_array[:,0]==mach[0]):
                 cd_w = np.array([[float(old_array[old_array[:,0]==mach[0],1])]])
             else:
@@ -77,7 +81,7 @@ def wave_drag_volume(conditions,geometry,flag105,num_slices=20,num_rots=10):
                 cd_w         = cd_w[0]*100./ref_area
                 new_save_row = np.array([[mach[0],cd_w]])
                 comb_array   = np.append(old_array,new_save_row,axis=0)
-                np.save('volume_drag_data_' + geometry.tag + '.npy', comb_array)
+                np.save(data_file, comb_array)
             cd_w_all[ii] = cd_w
     
     return cd_w_all
@@ -1,6 +1,7 @@
 # segment_properties.py
 #
 # Created:  Apr 2019, T. MacDonald
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -43,6 +44,7 @@ def segment_properties(settings,wing):
         reference               [m^2]
         exposed                 [m^2]
         wetted                  [m^2]
+    wing._segment_arrays        [Data] see segment_arrays
         
 
     Properties Used:
@@ -106,5 +108,47 @@ def segment_properties(settings,wing):
             total_wetted_area += Swet_seg
             
     wing.areas.wetted = total_wetted_area 
+    
+    # the same properties as arrays, so that the segments can be evaluated together
+    wing._segment_arrays = segment_arrays(wing)
         
-    return
\ No newline at end of file
+    return
+
+def segment_arrays(wing):
+    """Gathers the segment properties used for parasite drag into arrays, one entry per segment.
+    The last segment is the tip and has no entry.
+
+    Assumptions:
+    segment_properties has been run
+
+    Source:
+    N/A
+
+    Inputs:
+    wing.Segments.
+      chords.mean_aerodynamic   [m]
+      areas.
+        reference               [m^2]
+        wetted                  [m^2]
+      sweeps.quarter_chord      [radians]
+
+    Outputs:
+    arrays.
+      mean_aerodynamic_chords   [m]
+      reference_areas           [m^2]
+      wetted_areas              [m^2]
+      quarter_chord_sweeps      [radians]
+
+    Properties Used:
+    N/A
+    """  
+    
+    segments = list(wing.Segments.values())[:-1]
+    
+    arrays = Data()
+    arrays.mean_aerodynamic_chords = np.array([segment.chords.mean_aerodynamic for segment in segments],dtype=float)
+    arrays.reference_areas         = np.array([segment.areas.reference for segment in segments],dtype=float)
+    arrays.wetted_areas            = np.array([segment.areas.wetted for segment in segments],dtype=float)
+    arrays.quarter_chord_sweeps    = np.array([segment.sweeps.quarter_chord for segment in segments],dtype=float)
+    
+    return arrays
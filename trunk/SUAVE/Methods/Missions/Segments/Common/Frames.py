@@ -5,6 +5,7 @@
 # Modified: Jul 2016, E. Botero
 #           Jul 2017, E. Botero
 #           May 2019, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,6 +16,7 @@ from SUAVE.Core import Units
 
 from SUAVE.Methods.Geometry.Three_Dimensional \
      import angles_to_dcms, orientation_product, orientation_transpose
+from SUAVE.Methods.Utilities import complex_step
 
 # ----------------------------------------------------------------------
 #  Initialize Inertial Position
@@ -274,10 +276,10 @@ def update_orientations(segment):
     V_stability_magnitude = np.sqrt( np.sum(V_stability**2,axis=1) )[:,None]
 
     # calculate angle of attack
-    alpha = np.arctan2(V_stability[:,2],V_stability[:,0])[:,None]
+    alpha = complex_step.arctan2(V_stability[:,2],V_stability[:,0])[:,None]
 
     # calculate side slip
-    beta = np.arctan2(V_body[:,1],V_stability_magnitude[:,0])[:,None]
+    beta = complex_step.arctan2(V_body[:,1],V_stability_magnitude[:,0])[:,None]
 
     # pack aerodynamics angles
     conditions.aerodynamics.angle_of_attack[:,0] = alpha[:,0]
@@ -0,0 +1,427 @@
+## @ingroup Methods-Missions-Segments-Common
+# Jacobian.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core.Arrays import atleast_2d_col, array_type, matrix_type
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+
+# ----------------------------------------------------------------------
+#  Jacobian Sparsity
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def jacobian_sparsity(segment,pattern=None):
+    """ Builds the sparsity pattern of the residuals with respect to the unknowns
+
+        Assumptions:
+        Unknowns and residuals that have one row per control point are row aligned, i.e. row i of
+        every such array belongs to control point i. Any other value (scalars, single row arrays) is
+        assumed to couple to everything.
+
+        The pattern is set by state.numerics.jacobian_sparsity:
+            'blocks'    - pointwise, plus full coupling of the pairs of unknown and residual values
+                          that are coupled across control points, such as through the Chebyshev
+                          differentiate and integrate operators. The pairs are found by block_sparsity,
+                          here every pair of the same (sub) segment is taken as coupled.
+            'pointwise' - a residual only depends on the unknowns at the same control point. This
+                          drops the differentiate and integrate operators, the Jacobian is approximate.
+            'segment'   - pointwise, plus full coupling between all control points of the same
+                          (sub) segment through the Chebyshev differentiate and integrate operators.
+                          Couplings between sub segments through the initials are dropped.
+            'detect'    - a full finite difference of the residuals at the current unknowns
+            array       - a user declared boolean array of shape [residuals, unknowns]
+
+        Inputs:
+            segment.state:
+                unknowns                         [Data]
+                residuals                        [Data]
+                numerics.jacobian_sparsity       [string or array]
+                numerics.number_control_points   [int]
+            segment.segments                     [Data] (optional)
+            pattern                              [string or array] (optional, replaces numerics.jacobian_sparsity)
+
+        Outputs:
+            sparsity                             [boolean array]
+
+        Properties Used:
+        N/A
+
+    """
+
+    # unpack
+    state    = segment.state
+    if pattern is None:
+        pattern = state.numerics.jacobian_sparsity
+
+    # the number of control points of each sub segment
+    sub_segments = segment.get('segments',None)
+    if sub_segments:
+        points = [sub.state.numerics.number_control_points for sub in sub_segments.values()]
+    else:
+        points = [state.numerics.number_control_points]
+
+    # user declared pattern
+    if isinstance(pattern,array_type):
+        return np.array(pattern,dtype=bool)
+
+    # the control point of every packed value
+    rows       = np.sum(points)
+    u_rows, _  = pack_control_point_indices(state.unknowns,rows)
+    r_rows, _  = pack_control_point_indices(state.residuals,rows)
+
+    if pattern == 'pointwise':
+        u_group = u_rows
+        r_group = r_rows
+    elif pattern in ('segment','blocks'):
+        groups  = np.repeat(np.arange(len(points)),points)
+        u_group = np.where(u_rows<0,-1,groups[u_rows])
+        r_group = np.where(r_rows<0,-1,groups[r_rows])
+    elif pattern == 'detect':
+        return np.ones([len(r_rows),len(u_rows)],dtype=bool)
+    else:
+        raise ValueError('unknown jacobian sparsity pattern: %s' % pattern)
+
+    # unaligned values couple to everything
+    sparsity = r_group[:,None] == u_group[None,:]
+    sparsity[r_group<0,:] = True
+    sparsity[:,u_group<0] = True
+
+    return sparsity
+
+# ----------------------------------------------------------------------
+#  Block Sparsity
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def block_sparsity(function,x,f0,segment,args=()):
+    """ Finds the 'blocks' sparsity pattern, the pointwise pattern plus the pairs of unknown and
+        residual values that are coupled across control points
+
+        Assumptions:
+        Each row aligned unknown value of each (sub) segment is perturbed at its middle control point,
+        the first point is often only an initial condition.
+        A residual value that changes at any other control point is coupled to that unknown value at
+        every control point of the sub segments where it changed, as through the differentiate and
+        integrate operators. Otherwise the pair is pointwise. Values that are not row aligned couple
+        to everything. This takes one evaluation of the residuals per unknown value and sub segment.
+
+        Inputs:
+            function   [callable] f(x,*args)
+            x          [array]
+            f0         [array]    f(x)
+            segment.state:
+                unknowns                         [Data]
+                residuals                        [Data]
+                numerics.number_control_points   [int]
+            segment.segments                     [Data] (optional)
+            args       [tuple]
+
+        Outputs:
+            sparsity   [boolean array]
+
+        Properties Used:
+        N/A
+
+    """
+
+    if not isinstance(args,tuple):
+        args = (args,)
+
+    # unpack
+    state    = segment.state
+    sparsity = jacobian_sparsity(segment,'pointwise')
+
+    # the sub segment of every control point
+    sub_segments = segment.get('segments',None)
+    if sub_segments:
+        points = [sub.state.numerics.number_control_points for sub in sub_segments.values()]
+    else:
+        points = [state.numerics.number_control_points]
+    groups = np.repeat(np.arange(len(points)),points)
+
+    rows             = np.sum(points)
+    u_rows, u_values = pack_control_point_indices(state.unknowns,rows)
+    r_rows, r_values = pack_control_point_indices(state.residuals,rows)
+    u_group          = np.where(u_rows<0,-1,groups[u_rows])
+    r_group          = np.where(r_rows<0,-1,groups[r_rows])
+
+    # step sizes, as in colored_finite_difference
+    h = np.sqrt(np.finfo(float).eps) * np.abs(x)
+    h[h==0.] = np.sqrt(np.finfo(float).eps)
+
+    for value in np.unique(u_values[u_values>=0]):
+        for group in np.unique(u_group[u_values==value]):
+            columns = np.where((u_values==value) & (u_group==group))[0]
+            j       = columns[len(columns)//2]
+
+            x_step     = np.array(x,dtype=float)
+            x_step[j] += h[j]
+            changed    = (function(x_step,*args) - f0) != 0.
+
+            # residual values that changed away from the perturbed control point
+            coupled = changed & (r_rows >= 0) & (r_rows != u_rows[j])
+            for r_value, r_sub in set(zip(r_values[coupled],r_group[coupled])):
+                block = (r_values == r_value) & (r_group == r_sub)
+                sparsity[np.ix_(block,columns)] = True
+
+    return sparsity
+
+# ----------------------------------------------------------------------
+#  Pack Control Point Indices
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def pack_control_point_indices(data,rows):
+    """ Finds the control point of every value that data.pack_array() returns
+
+        Assumptions:
+        Follows the packing order of Data.pack_array()
+
+        Inputs:
+            data       [Data]
+            rows       [int]
+
+        Outputs:
+            indices    [array] control point index, -1 if not row aligned
+            values     [array] index of the row aligned array column, -1 if not row aligned
+
+        Properties Used:
+        N/A
+
+    """
+
+    valid_types = ( int, float,
+                    array_type,
+                    matrix_type )
+
+    M = []
+    V = []
+
+    def do_pack(D):
+        for v in D.values():
+            if isinstance(v,dict):
+                do_pack(v)
+                continue
+            elif not isinstance(v,valid_types): continue
+            elif np.ndim(v) > 2: continue
+            n,m = atleast_2d_col(v).shape
+            if n == rows:
+                first = np.max(np.hstack(V+[[-1]])) + 1
+                M.append(np.tile(np.arange(n),m))
+                V.append(np.repeat(np.arange(m),n) + first)
+            else:
+                M.append(-np.ones(n*m,dtype=int))
+                V.append(-np.ones(n*m,dtype=int))
+
+    do_pack(data)
+
+    if M:
+        return np.hstack(M), np.hstack(V)
+    else:
+        return np.array([],dtype=int), np.array([],dtype=int)
+
+# ----------------------------------------------------------------------
+#  Color Columns
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def color_columns(sparsity):
+    """ Groups the columns of a Jacobian that can be finite differenced together
+
+        Assumptions:
+        Greedy coloring, two columns share a color if they have no nonzero row in common
+
+        Source:
+        Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian
+        Matrices", IMA Journal of Applied Mathematics, Vol. 13, 1974
+
+        Inputs:
+            sparsity   [boolean array]
+
+        Outputs:
+            colors     [array] the color of each column
+
+        Properties Used:
+        N/A
+
+    """
+
+    n_rows, n_cols = sparsity.shape
+    colors   = np.zeros(n_cols,dtype=int)
+    occupied = []
+
+    for j in range(n_cols):
+        column = sparsity[:,j]
+        for c, rows in enumerate(occupied):
+            if not np.any(rows & column):
+                rows |= column
+                colors[j] = c
+                break
+        else:
+            colors[j] = len(occupied)
+            occupied.append(column.copy())
+
+    return colors
+
+# ----------------------------------------------------------------------
+#  Colored Finite Difference
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def colored_finite_difference(function,x,f0,sparsity,colors,args=()):
+    """ Forward difference Jacobian, perturbing one group of columns at a time
+
+        Assumptions:
+        Columns of the same color do not share a nonzero row
+
+        Source:
+        N/A
+
+        Inputs:
+            function   [callable] f(x,*args)
+            x          [array]
+            f0         [array]    f(x)
+            sparsity   [boolean array]
+            colors     [array]
+            args       [tuple]
+
+        Outputs:
+            jacobian   [array]
+
+        Properties Used:
+        N/A
+
+    """
+
+    if not isinstance(args,tuple):
+        args = (args,)
+
+    # step sizes, as in MINPACK
+    h = np.sqrt(np.finfo(float).eps) * np.abs(x)
+    h[h==0.] = np.sqrt(np.finfo(float).eps)
+
+    jacobian = np.zeros(sparsity.shape)
+
+    for c in range(np.max(colors)+1):
+        columns = np.where(colors==c)[0]
+        x_step  = np.array(x,dtype=float)
+        x_step[columns] += h[columns]
+        df = (function(x_step,*args) - f0)
+
+        for j in columns:
+            rows = sparsity[:,j]
+            jacobian[rows,j] = df[rows] / h[j]
+
+    return jacobian
+
+# ----------------------------------------------------------------------
+#  Colored Complex Step
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def colored_complex_step(function,x,sparsity,colors,args=(),step=1e-30):
+    """ Complex step Jacobian, perturbing one group of columns at a time
+
+        Assumptions:
+        Columns of the same color do not share a nonzero row
+        The function is analytic in x and returns complex values for complex x
+
+        Source:
+        Martins, J. R. R. A., Sturdza, P., and Alonso, J. J., "The Complex-Step Derivative
+        Approximation", ACM Transactions on Mathematical Software, Vol. 29, No. 3, 2003
+
+        Inputs:
+            function   [callable] f(x,*args)
+            x          [array]
+            sparsity   [boolean array]
+            colors     [array]
+            args       [tuple]
+            step       [float]
+
+        Outputs:
+            jacobian   [array]
+
+        Properties Used:
+        N/A
+
+    """
+
+    if not isinstance(args,tuple):
+        args = (args,)
+
+    jacobian = np.zeros(sparsity.shape)
+
+    for c in range(np.max(colors)+1):
+        columns = np.where(colors==c)[0]
+        x_step  = np.array(x,dtype=complex)
+        x_step[columns] += 1j*step
+        df = np.imag(function(x_step,*args))
+
+        for j in columns:
+            rows = sparsity[:,j]
+            jacobian[rows,j] = df[rows] / step
+
+    return jacobian
+
+# ----------------------------------------------------------------------
+#  Cast State
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def cast_state(segment,dtype):
+    """ Changes the arrays of a segment state between real and complex
+
+        Assumptions:
+        Casting to a real type drops the imaginary part
+        Sub segment states are cast too, initials and numerics are not
+        New arrays made by ones_row follow the cast type
+
+        Inputs:
+            segment.state:
+                unknowns     [Data]
+                conditions   [Data]
+                residuals    [Data]
+            segment.segments [Data] (optional)
+            dtype            [numpy dtype]
+
+        Outputs:
+            segment.state    [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    to_complex = np.issubdtype(dtype,np.complexfloating)
+
+    def do_cast(D):
+        if isinstance(D,Conditions):
+            D._dtype = dtype
+        for k,v in D.items():
+            if isinstance(v,dict):
+                do_cast(v)
+            elif isinstance(v,array_type) and np.issubdtype(v.dtype,np.inexact):
+                if to_complex:
+                    D[k] = v.astype(dtype)
+                else:
+                    D[k] = np.real(v).astype(dtype)
+
+    segment.state._dtype = dtype
+    for key in ['unknowns','conditions','residuals']:
+        do_cast(segment.state[key])
+
+    sub_segments = segment.get('segments',None)
+    if sub_segments:
+        for sub_segment in sub_segments.values():
+            cast_state(sub_segment,dtype)
+
+    return
+
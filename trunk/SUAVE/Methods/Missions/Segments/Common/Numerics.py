@@ -3,12 +3,20 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 from SUAVE.Core.Arrays import atleast_2d_col 
+from SUAVE.Surrogate.surrogate_cache import fingerprint_objects
+
+# the dimensionless operators of each discretization method, number of control points and set of options
+_operators = {}
+
+# the numerics that are found by the initialize and solve, these are not options of the discretization
+_outputs = ['tag','dimensionless','time','converged','solver_statistics']
 
 # ----------------------------------------------------------------------
 #  Initialize Differentials
@@ -19,12 +27,14 @@ def initialize_differentials_dimensionless(segment):
     """ Discretizes the differential operators
     
         Assumptions:
-        N/A
+        The operators are shared between all segments with the same discretization method,
+        number of control points and options, see dimensionless_operators
         
         Inputs:
             state.numerics:
                 number_control_points [int]
                 discretization_method [function]
+                integration           [boolean] (optional)
             
         Outputs:
             numerics.dimensionless:           
@@ -40,12 +50,9 @@ def initialize_differentials_dimensionless(segment):
     
     # unpack
     numerics = segment.state.numerics
-    N                     = numerics.number_control_points
-    discretization_method = numerics.discretization_method
     
     # get operators
-    x,D,I = discretization_method(N,**numerics)
-    x = atleast_2d_col(x)
+    x,D,I = dimensionless_operators(numerics)
     
     # pack
     numerics.dimensionless.control_points = x
@@ -94,7 +101,7 @@ def update_differentials_time(segment):
     T    = time[-1] - time[0]
     t    = x * T
     
-    # rescale operators
+    # rescale operators, the dimensionless operators are shared so this is not done in place
     D = D / T
     I = I * T
     
@@ -104,4 +111,53 @@ def update_differentials_time(segment):
     numerics.time.integrate      = I
 
     return
-    
\ No newline at end of file
+
+# ----------------------------------------------------------------------
+#  Dimensionless Operators
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def dimensionless_operators(numerics):
+    """ Gets the dimensionless control points and operators, building them only once
+    
+        Assumptions:
+        The operators only depend on the discretization method, the number of control points and
+        the options, which are all the other numerics except the ones found by the initialize and
+        solve. Every option is passed on to the discretization method and is part of the key, so
+        segments with other solver settings get their own copy of the operators.
+        The returned arrays are read only since they are shared.
+        
+        Inputs:
+            numerics:
+                number_control_points [int]
+                discretization_method [function]
+                integration           [boolean] (optional)
+                other options         (optional)
+            
+        Outputs:
+            x                         [array]
+            D                         [array]
+            I                         [array]
+
+        Properties Used:
+        N/A
+                                
+    """
+    
+    # unpack
+    N                     = int(numerics.number_control_points)
+    discretization_method = numerics.discretization_method
+    options               = dict([(k,v) for k,v in numerics.items() if not (k in _outputs or k.startswith('_'))])
+    key                   = (discretization_method,N,fingerprint_objects(options))
+    
+    if not key in _operators:
+        x,D,I = discretization_method(N,**options)
+        x = atleast_2d_col(x)
+        
+        for A in (x,D,I):
+            if A is not None:
+                A.flags.writeable = False
+        
+        _operators[key] = (x,D,I)
+    
+    return _operators[key]
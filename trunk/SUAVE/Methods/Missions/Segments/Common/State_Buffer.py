@@ -0,0 +1,447 @@
+## @ingroup Methods-Missions-Segments-Common
+# State_Buffer.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type
+
+dictget  = dict.get
+dictkeys = dict.keys
+
+# ----------------------------------------------------------------------
+#  Merge Flat States
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def merge_flat_states(segment):
+    """ Merges the sub segment states into one contiguous buffer per state key
+
+        Assumptions:
+        Every array of the sub segment states becomes a view of a row block of the buffer, and the
+        merged state of the segment holds views of whole columns, so merging only copies the arrays
+        that the sub segments replaced since the last merge.
+        If the sub segment states do not have the same keys, or an array does not have one row per
+        control point, the states are merged by copying with segment.merged().
+
+        Inputs:
+            segment.segments                         [Data]
+            sub_segment.state:
+                unknowns                             [Data]
+                conditions                           [Data]
+                residuals                            [Data]
+                numerics.number_control_points       [int]
+
+        Outputs:
+            segment.state:
+                unknowns                             [Data]
+                conditions                           [Data]
+                residuals                            [Data]
+                numerics._state_buffers              [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    numerics = segment.state.numerics
+    buffers  = numerics.get('_state_buffers',None)
+    if buffers is None:
+        buffers = Data()
+        numerics._state_buffers = buffers
+
+    merged = None
+
+    for key in ['unknowns','conditions','residuals']:
+        buffer = buffers.get(key,None)
+        if buffer is None:
+            buffer = State_Buffer()
+            buffers[key] = buffer
+
+        states = [sub_segment.state[key] for sub_segment in segment.segments.values()]
+        rows   = [sub_segment.state.numerics.number_control_points for sub_segment in segment.segments.values()]
+
+        if buffer.merge(states,rows):
+            segment.state[key].update(buffer.merged)
+        else:
+            # fall back to stacking copies
+            if merged is None:
+                merged = segment.merged()
+            segment.state[key].update(merged[key])
+
+    return
+
+# ----------------------------------------------------------------------
+#  State Buffer
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+class State_Buffer(object):
+    """ One contiguous 2D array that holds the arrays of a list of sub segment states
+
+        The rows of the buffer are the control points of all sub segments in order, the columns are
+        the flattened columns of every array. columns[path] gives the columns of the array at the
+        dotted path, so the whole mission can be handed to post processing as buffer.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+    """
+
+    def __init__(self):
+        """ Makes an empty buffer
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.buffer  = None
+        self.columns = Data()
+        self.merged  = None
+        self.nodes   = []
+        self.entries = []
+
+    def build(self,states,rows):
+        """ Allocates the buffer and makes the views of the sub segment states and merged state
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            states     [list of Data]
+            rows       [list of int]
+
+            Outputs:
+            supported  [boolean]
+
+            Properties Used:
+            N/A
+        """
+
+        self.buffer  = None
+        self.columns = Data()
+        self.merged  = None
+        self.nodes   = []
+        self.entries = []
+
+        if len(states) < 2:
+            return False
+
+        # the arrays of the first state set the columns
+        layout = []
+        dtypes = []
+        if not find_arrays(states[0],rows[0],[],layout):
+            return False
+        for state,n in zip(states[1:],rows[1:]):
+            other = []
+            if not find_arrays(state,n,[],other):
+                return False
+            if sorted(other) != sorted(layout):
+                return False
+        for state in states:
+            for path,trailing in layout:
+                dtypes.append(deep_value(state,path).dtype)
+
+        widths = [int(np.prod(trailing)) for path,trailing in layout]
+        starts = np.cumsum([0] + widths)
+        total  = int(np.sum(rows))
+
+        buffer = np.zeros([total,starts[-1]],dtype=np.result_type(*dtypes) if dtypes else float)
+
+        # views of the merged state
+        merged = states[0].__class__()
+        for (path,trailing),c0,c1 in zip(layout,starts[:-1],starts[1:]):
+            self.columns[path] = (c0,c1)
+            set_value(merged,path,buffer[:,c0:c1].reshape((total,) + trailing))
+
+        # views of each sub segment, copying in the current values
+        r0 = 0
+        for state,n in zip(states,rows):
+            nodes, index = containers(state)
+            entries = []
+            for (path,trailing),c0,c1 in zip(layout,starts[:-1],starts[1:]):
+                parent, k = deep_parent(state,path)
+                view      = buffer[r0:r0+n,c0:c1].reshape((n,) + trailing)
+                view[...] = dictget(parent,k)
+                parent[k] = view
+                entries.append((index[path.rpartition('.')[0]],k,view))
+            self.nodes.append(nodes)
+            self.entries.append(entries)
+            r0 += n
+
+        self.buffer = buffer
+        self.merged = merged
+
+        return True
+
+    def merge(self,states,rows):
+        """ Copies the arrays that the sub segments replaced into the buffer
+
+            Assumptions:
+            The buffer is rebuilt if the sub segment states changed their structure, their number of
+            control points, or their dtype
+
+            Source:
+            N/A
+
+            Inputs:
+            states     [list of Data]
+            rows       [list of int]
+
+            Outputs:
+            supported  [boolean]
+
+            Properties Used:
+            N/A
+        """
+
+        if not self.valid(states,rows):
+            return self.build(states,rows)
+
+        dtype = self.buffer.dtype
+
+        for nodes,entries in zip(self.nodes,self.entries):
+            for i,k,view in entries:
+                parent = nodes[i][2]
+                v      = dictget(parent,k)
+                if v is view:
+                    continue
+                if type(v) is not array_type or v.shape != view.shape or v.dtype is not dtype:
+                    return self.build(states,rows)
+                view[...]  = v
+                parent[k]  = view
+
+        return True
+
+    def valid(self,states,rows):
+        """ Checks that the sub segment states still have the structure of the buffer
+
+            Assumptions:
+            A Data that was replaced by a new Data with the same keys is followed, its arrays are
+            copied in by the next merge
+
+            Source:
+            N/A
+
+            Inputs:
+            states     [list of Data]
+            rows       [list of int]
+
+            Outputs:
+            valid      [boolean]
+
+            Properties Used:
+            N/A
+        """
+
+        if self.buffer is None or len(states) != len(self.nodes):
+            return False
+
+        if np.sum(rows) != self.buffer.shape[0]:
+            return False
+
+        # parents come before their children
+        for state,nodes in zip(states,self.nodes):
+            for node in nodes:
+                i,k,D,keys = node
+                if i is None:
+                    new = state
+                else:
+                    new = dictget(nodes[i][2],k)
+                if new is not D:
+                    if not isinstance(new,dict):
+                        return False
+                    node[2] = new
+                if list(dictkeys(new)) != keys:
+                    return False
+
+        for n,entries in zip(rows,self.entries):
+            if entries and entries[0][2].shape[0] != n:
+                return False
+
+        return True
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def find_arrays(state,rows,path,layout):
+    """ Finds the dotted path and trailing shape of every array in a state
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+            state      [Data]
+            rows       [int]
+            path       [list of strings]
+            layout     [list]
+
+        Outputs:
+            supported  [boolean] False if an array does not have one row per control point
+
+        Properties Used:
+        N/A
+    """
+
+    for k in dictkeys(state):
+        v = dictget(state,k)
+        if isinstance(v,dict):
+            if not find_arrays(v,rows,path + [k],layout):
+                return False
+        elif isinstance(v,array_type):
+            if type(v) is not array_type or np.ndim(v) < 2 or v.shape[0] != rows:
+                return False
+            layout.append(('.'.join(path + [k]),v.shape[1:]))
+
+    return True
+
+## @ingroup Methods-Missions-Segments-Common
+def containers(state):
+    """ Lists every Data in a state with the index of its parent, its key and its keys
+
+        Assumptions:
+        Parents are listed before their children
+
+        Source:
+        N/A
+
+        Inputs:
+            state      [Data]
+
+        Outputs:
+            nodes      [list]
+            index      [dict] the node of each dotted path, '' is the state
+
+        Properties Used:
+        N/A
+    """
+
+    nodes = []
+    index = {}
+
+    def do_find(parent,key,path,D):
+        index[path] = len(nodes)
+        nodes.append([parent,key,D,list(dictkeys(D))])
+        parent = index[path]
+        for k in dictkeys(D):
+            v = dictget(D,k)
+            if isinstance(v,dict):
+                do_find(parent,k,path + '.' + k if path else k,v)
+
+    do_find(None,None,'',state)
+
+    return nodes, index
+
+## @ingroup Methods-Missions-Segments-Common
+def deep_parent(state,path):
+    """ Finds the Data that holds the value at a dotted path, and the last key
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+            state      [Data]
+            path       [string]
+
+        Outputs:
+            parent     [Data]
+            key        [string]
+
+        Properties Used:
+        N/A
+    """
+
+    keys   = path.split('.')
+    parent = state
+    for k in keys[:-1]:
+        parent = dictget(parent,k)
+
+    return parent, keys[-1]
+
+## @ingroup Methods-Missions-Segments-Common
+def deep_value(state,path):
+    """ Finds the value at a dotted path
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+            state      [Data]
+            path       [string]
+
+        Outputs:
+            value
+
+        Properties Used:
+        N/A
+    """
+
+    parent, k = deep_parent(state,path)
+
+    return dictget(parent,k)
+
+## @ingroup Methods-Missions-Segments-Common
+def set_value(state,path,value):
+    """ Sets the value at a dotted path, making the Data along the path as needed
+
+        Assumptions:
+        New Data along the path are of the same class as state
+
+        Source:
+        N/A
+
+        Inputs:
+            state      [Data]
+            path       [string]
+            value
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+    """
+
+    keys   = path.split('.')
+    parent = state
+    for k in keys[:-1]:
+        if not k in parent:
+            parent[k] = state.__class__()
+        parent = parent[k]
+    parent[keys[-1]] = value
+
+    return
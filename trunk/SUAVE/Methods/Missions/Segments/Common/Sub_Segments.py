@@ -5,6 +5,7 @@
 # Modified: Jan 2016, E. Botero
 #           Mar 2016, E. Botero
 #           Jul 2017, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,25 @@
 
 from SUAVE.Analyses import Process
 from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type
+from .State_Buffer import merge_flat_states
+
+import numpy as np
+import multiprocessing
+from copy import deepcopy
+
+# the mission being solved by parallel_sub_segments, inherited by the worker processes
+_parallel_segment = None
+
+# the conditions that segments take from their initials
+initials_keys = ['frames.inertial.time',
+                 'frames.inertial.position_vector',
+                 'frames.body.inertial_rotations',
+                 'frames.planet.start_time',
+                 'frames.planet.latitude',
+                 'frames.planet.longitude',
+                 'weights.total_mass',
+                 'propulsion.battery_energy']
 
 # ----------------------------------------------------------------------
 #  Expand Sub Segments
@@ -114,7 +134,7 @@ def sequential_sub_segments(segment):
     """ Evaluates all the segments in a mission one by one
     
         Assumptions:
-        N/A
+        If segment.settings.parallel_segments is True the segments are solved by parallel_sub_segments
         
         Inputs:
         N/A
@@ -127,9 +147,173 @@ def sequential_sub_segments(segment):
                                 
     """       
 
+    if segment.settings.get('parallel_segments',False):
+        parallel_sub_segments(segment)
+        return
+
     for tag,sub_segment in segment.segments.items():
         sub_segment.evaluate()
 
+# ----------------------------------------------------------------------
+#  Parallel Sub Segments
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def parallel_sub_segments(segment):
+    """ Evaluates all the segments in a mission at once in a process pool, then re-solves
+        in order the segments whose initials were not predicted well
+    
+        Assumptions:
+        Each segment is first solved from the initials its predecessor converged to in the
+        last evaluation. Then, in order, the initials of each segment are updated from its
+        solved predecessor. A segment is solved again, starting from its parallel solution, if
+        the final value of any of the initials_keys conditions of its predecessor moved by more
+        than parallel_tolerance, relative to the value or to 1 if the value is smaller.
+        If any segment did not converge in the last evaluation, or fork is not available,
+        the segments are evaluated one by one.
+        
+        Inputs:
+            segment.settings:
+                parallel_processes          [int] (None uses all cpus)
+                parallel_tolerance          [Unitless]
+            sub_segment.state.numerics.converged
+            
+        Outputs:
+            sub_segment.state:
+                unknowns                    [Data]
+                conditions                  [Data]
+                residuals                   [Data]
+                numerics                    [Data]
+
+        Properties Used:
+        N/A
+                                
+    """       
+    
+    global _parallel_segment
+    
+    sub_segments = list(segment.segments.values())
+    
+    # the initials can only be predicted from a converged evaluation
+    predicted = all([sub.state.numerics.converged for sub in sub_segments])
+    if not predicted or not 'fork' in multiprocessing.get_all_start_methods():
+        for sub_segment in sub_segments:
+            sub_segment.evaluate()
+        return
+    
+    # solve all the segments at once
+    processes = segment.settings.get('parallel_processes',None) or multiprocessing.cpu_count()
+    processes = min(processes,len(sub_segments))
+    
+    _parallel_segment = segment
+    try:
+        with multiprocessing.get_context('fork').Pool(processes) as pool:
+            states = pool.map(evaluate_sub_segment,range(len(sub_segments)))
+    finally:
+        _parallel_segment = None
+    
+    # reconcile the initials in order
+    tolerance = segment.settings.get('parallel_tolerance',1e-6)
+    for i, sub_segment in enumerate(sub_segments):
+        
+        # segments that failed in the pool are solved here
+        if states[i] is None:
+            sub_segment.evaluate()
+            continue
+        
+        # the initials steps can change the final conditions of the predecessor, run them
+        # on a copy of the parallel solution to get the initials this segment would see
+        for key in ['unknowns','conditions','residuals','numerics']:
+            sub_segment.state[key].update(deepcopy(states[i][key]))
+        
+        if i == 0:
+            continue
+        
+        sub_segment.process.iterate.initials(sub_segment)
+        sub_segment.state.conditions.update(states[i].conditions)
+        
+        predicted = states[i].initials
+        actual    = final_conditions(sub_segment.state.initials)
+        moved     = len(actual) != len(predicted) or \
+            np.any(np.abs(actual - predicted) > tolerance*np.maximum(np.abs(actual),1.))
+        
+        if moved:
+            if Process.verbose:
+                print('segment re-solved :' , sub_segment.tag)
+            sub_segment.evaluate()
+    
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def evaluate_sub_segment(index):
+    """ Evaluates one sub segment of the mission set by parallel_sub_segments, in a worker process
+    
+        Assumptions:
+        Segments that raise an error return None
+        
+        Inputs:
+            index                           [int]
+            
+        Outputs:
+            state                           [Data] unknowns, conditions, residuals and numerics
+            state.initials                  [array]  the final_conditions of the initials used
+
+        Properties Used:
+        N/A
+                                
+    """       
+    
+    sub_segment = list(_parallel_segment.segments.values())[index]
+    
+    try:
+        sub_segment.evaluate()
+    except Exception:
+        return None
+    
+    state = Data()
+    for key in ['unknowns','conditions','residuals','numerics']:
+        state[key] = sub_segment.state[key]
+    
+    if index > 0:
+        state.initials = final_conditions(sub_segment.state.initials)
+    else:
+        state.initials = np.array([])
+    
+    return state
+
+## @ingroup Methods-Missions-Segments-Common
+def final_conditions(state):
+    """ Packs the last row of the conditions that the next segment uses as initials
+    
+        Assumptions:
+        Conditions in initials_keys that the segment does not have are skipped
+        
+        Inputs:
+            state.conditions                [Data]
+            
+        Outputs:
+            values                          [array]
+
+        Properties Used:
+        N/A
+                                
+    """       
+    
+    values = []
+    
+    for key in initials_keys:
+        try:
+            v = state.conditions.deep_get(key)
+        except (KeyError,AttributeError):
+            continue
+        if isinstance(v,array_type) and np.ndim(v) == 2 and v.shape[0] > 0:
+            values.append(np.real(v[-1]))
+    
+    if values:
+        return np.hstack(values)
+    else:
+        return np.array([])
+
 
 # ----------------------------------------------------------------------
 #  Sequential Sub Segments
@@ -141,10 +325,11 @@ def merge_sub_segment_states(segment):
     """ Merges all of the sub segment states back into the main state
     
         Assumptions:
-        N/A
+        If segment.settings.flat_state is True the states are merged into contiguous buffers,
+        see State_Buffer.merge_flat_states
         
         Inputs:
-        N/A
+        segment.settings.flat_state   [boolean]
             
         Outputs:
         N/A
@@ -154,7 +339,15 @@ def merge_sub_segment_states(segment):
                                 
     """       
 
-    segment.state.update(segment.merged())
+    if segment.settings.get('flat_state',False):
+        merge_flat_states(segment)
+        return
+    
+    merged = segment.merged()
+    
+    # only the stacked values, keep the numerics of the main state
+    for key in ['unknowns','conditions','residuals']:
+        segment.state[key].update(merged[key])
 
 # ----------------------------------------------------------------------
 #  Sequential Sub Segments
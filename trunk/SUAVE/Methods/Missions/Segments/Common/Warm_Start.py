@@ -0,0 +1,161 @@
+## @ingroup Methods-Missions-Segments-Common
+# Warm_Start.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from copy import deepcopy
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type
+from .Numerics import dimensionless_operators
+
+# ----------------------------------------------------------------------
+#  Store Unknowns
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def store_unknowns(segment):
+    """ Saves the converged unknowns of each sub segment, keyed by the sub segment tag
+
+        Assumptions:
+        Unknowns of sub segments that did not converge are not saved
+
+        Inputs:
+            segment.segments                                 [Data]
+            segment.state.numerics.converged                 [boolean]
+            sub_segment.state:
+                unknowns                                     [Data]
+                numerics.converged                           [boolean]
+                numerics.dimensionless.control_points        [array]
+
+        Outputs:
+            segment.warm_start_cache[tag]:
+                unknowns                                     [array]
+                control_points                               [array]
+
+        Properties Used:
+        N/A
+
+    """
+
+    # an all at once solve only tracks convergence of the whole mission
+    if segment.state.numerics.converged is False:
+        return
+
+    for tag,sub_segment in segment.segments.items():
+        numerics = sub_segment.state.numerics
+        if numerics.converged is False:
+            continue
+
+        stored = Data()
+        stored.unknowns       = sub_segment.state.unknowns.pack_array()
+        stored.control_points = np.array(numerics.dimensionless.control_points).flatten()
+
+        segment.warm_start_cache[tag] = stored
+
+    return
+
+# ----------------------------------------------------------------------
+#  Initialize Unknowns
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def initialize_unknowns(segment):
+    """ Sets the unknowns of each sub segment to the ones saved by the last converged evaluation
+
+        Assumptions:
+        Only used if segment.settings.warm_start is True
+        The sub segment states have already been expanded to their number of control points.
+        If the number of control points changed the saved unknowns are linearly interpolated
+        in dimensionless time onto the new control points.
+        Saved unknowns that do not match the structure of the sub segment unknowns are ignored.
+
+        Inputs:
+            segment.settings.warm_start                      [boolean]
+            segment.warm_start_cache                         [Data]
+            sub_segment.state:
+                unknowns                                     [Data]
+                numerics.number_control_points               [int]
+                numerics.discretization_method               [function]
+
+        Outputs:
+            sub_segment.state.unknowns                       [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    if not segment.settings.warm_start:
+        return
+
+    for tag,sub_segment in segment.segments.items():
+        if not tag in segment.warm_start_cache:
+            continue
+
+        stored   = segment.warm_start_cache[tag]
+        unknowns = sub_segment.state.unknowns
+        numerics = sub_segment.state.numerics
+        N        = numerics.number_control_points
+
+        # same discretization, use the saved unknowns as they are
+        if len(stored.control_points) == N:
+            if len(stored.unknowns) == len(unknowns.pack_array()):
+                unknowns.unpack_array(stored.unknowns)
+            continue
+
+        # rebuild the saved unknowns on the old control points
+        old_unknowns = deepcopy(unknowns)
+        old_unknowns.expand_rows(len(stored.control_points))
+        if len(stored.unknowns) != len(old_unknowns.pack_array()):
+            continue
+        old_unknowns.unpack_array(stored.unknowns)
+
+        # and interpolate them onto the new ones
+        x_old = stored.control_points
+        x_new = dimensionless_operators(numerics)[0].flatten()
+
+        interpolate_rows(unknowns,old_unknowns,x_old,x_new)
+
+    return
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def interpolate_rows(new,old,x_old,x_new):
+    """ Interpolates every column of the arrays in old onto new control points, in place
+
+        Assumptions:
+        Both data structures have the same keys
+        x_old is increasing
+
+        Inputs:
+            new        [Data]
+            old        [Data]
+            x_old      [array]
+            x_new      [array]
+
+        Outputs:
+            new        [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    for k,v in new.items():
+        if isinstance(v,dict):
+            interpolate_rows(v,old[k],x_old,x_new)
+        elif isinstance(v,array_type) and np.ndim(v) == 2:
+            old_v  = old[k]
+            new[k] = np.array([np.interp(x_new,x_old,old_v[:,j]) for j in range(old_v.shape[1])]).T
+
+    return
@@ -2,9 +2,12 @@
 # Climb mission methods containing the functions for setting up and solving a mission.
 # @ingroup Methods-Missions-Segments
 
+from . import State_Buffer
 from . import Sub_Segments
 from . import Aerodynamics
 from . import Energy
 from . import Frames
+from . import Jacobian
 from . import Numerics
+from . import Warm_Start
 from . import Weights
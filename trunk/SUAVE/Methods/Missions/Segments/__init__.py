@@ -6,6 +6,8 @@ from .converge_root import converge_root
 from .expand_state  import expand_state
 from .optimize      import converge_opt
 
+from . import root_finders
+
 from . import Common
 from . import Cruise
 from . import Climb
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -12,6 +13,9 @@ import scipy.optimize
 import numpy as np
 
 from SUAVE.Core.Arrays import array_type
+from SUAVE.Core.Data_Layout import Data_Layout
+from SUAVE.Methods.Missions.Segments.Common.Jacobian import jacobian_sparsity, block_sparsity, color_columns, \
+     colored_finite_difference, colored_complex_step, cast_state
 
 # ----------------------------------------------------------------------
 #  Converge Root
@@ -22,7 +26,12 @@ def converge_root(segment):
     """Interfaces the mission to a numerical solver. The solver may be changed by using root_finder.
 
     Assumptions:
-    N/A
+    If state.numerics.solver_jacobian is 'sparse' or 'complex_step' the Jacobian is passed to the root
+    finder as fprime. It is found by perturbing one color group of unknowns at a time, see jacobian.
+    If the solve fails with a 'blocks' or 'detect' pattern, the pattern is found again where the solve
+    stopped and the solve is restarted once from there.
+    The function evaluations are every call of iterate during the solve, including the ones made for
+    the Jacobian, so they compare between root finders and Jacobian options.
 
     Source:
     N/A
@@ -31,27 +40,77 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [string]
 
     Outputs:
     state.unknowns                     [Any]
     segment.state.numerics.converged   [Unitless]
+    segment.state.numerics.solver_statistics:
+        function_evaluations           [int]
+        jacobian_evaluations           [int]
+        residual_norm_history          [array]
 
     Properties Used:
     N/A
     """       
     
-    unknowns = segment.state.unknowns.pack_array()
+    unknowns_layout, residuals_layout = pack_layouts(segment)
+    unknowns = unknowns_layout.pack(segment.state.unknowns)
+    
+    # iterate counts the function evaluations, evaluations of an earlier solve are not reused
+    statistics = segment.state.numerics.solver_statistics
+    statistics.function_evaluations = 0
+    segment.state.numerics._last_evaluation = None
+    segment.state.numerics._last_jacobian   = None
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
     
-    unknowns,infodict,ier,msg = root_finder( iterate,
-                                         unknowns,
-                                         args = segment,
-                                         xtol = segment.state.numerics.tolerance_solution,
-                                         full_output=1)
+    if segment.state.numerics.solver_jacobian in ('sparse','complex_step'):
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = segment,
+                                             fprime = jacobian,
+                                             xtol = segment.state.numerics.tolerance_solution,
+                                             full_output=1)
+        
+        # the last evaluation may have been a perturbation of the unknowns
+        iterate(unknowns,segment)
+        
+        # a found pattern only holds the couplings at the point it was found, find it again
+        # where the solve stopped and start over from there
+        if ier!=1 and detect_sparsity(segment.state.numerics):
+            njev = infodict.get('njev',0)
+            segment.state.numerics._jacobian_coloring = None
+            unknowns,infodict,ier,msg = root_finder( iterate,
+                                                 unknowns,
+                                                 args = segment,
+                                                 fprime = jacobian,
+                                                 xtol = segment.state.numerics.tolerance_solution,
+                                                 full_output=1)
+            iterate(unknowns,segment)
+            infodict['njev'] = infodict.get('njev',0) + njev
+        
+    else:
+        unknowns,infodict,ier,msg = root_finder( iterate,
+                                             unknowns,
+                                             args = segment,
+                                             xtol = segment.state.numerics.tolerance_solution,
+                                             full_output=1)
+
+    # record the solver statistics
+    statistics.jacobian_evaluations  = infodict.get('njev',0)
+    
+    # a root finder that reports neither history nor residuals is evaluated once more
+    history = infodict.get('residual_norm_history',None)
+    if history is None:
+        fvec = infodict.get('fvec',None)
+        if fvec is None:
+            fvec = iterate(unknowns,segment)
+        history = np.atleast_1d(np.linalg.norm(fvec))
+    statistics.residual_norm_history = history
 
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -73,7 +132,9 @@ def iterate(unknowns, segment):
     """Runs one iteration of of all analyses for the mission.
 
     Assumptions:
-    N/A
+    The unknowns and residuals are packed and unpacked through the layouts of pack_layouts.
+    Every call is counted in the solver statistics, and the last packed unknowns and residuals are
+    kept for the Jacobian.
 
     Source:
     N/A
@@ -84,17 +145,192 @@ def iterate(unknowns, segment):
 
     Outputs:
     residuals                     [Unitless]
+    state.numerics.solver_statistics.function_evaluations [int]
 
     Properties Used:
     N/A
     """       
+    unknowns_layout, residuals_layout = pack_layouts(segment)
+    numerics = segment.state.numerics
+    
     if isinstance(unknowns,array_type):
-        segment.state.unknowns.unpack_array(unknowns)
+        unknowns_layout.unpack(segment.state.unknowns,unknowns)
     else:
         segment.state.unknowns = unknowns
         
     segment.process.iterate(segment)
     
-    residuals = segment.state.residuals.pack_array()
+    residuals = residuals_layout.pack(segment.state.residuals)
+    
+    numerics.solver_statistics.function_evaluations += 1
+    if isinstance(unknowns,array_type):
+        numerics._last_evaluation = (np.array(unknowns),residuals)
         
-    return residuals 
\ No newline at end of file
+    return residuals
+
+## @ingroup Methods-Missions-Segments
+def pack_layouts(segment):
+    
+    """Finds the layouts used to pack and unpack the unknowns and residuals of a segment.
+
+    Assumptions:
+    The layouts are kept in the segment numerics and rebuild themselves when the structure of the
+    unknowns or residuals changes.
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics                [Data]
+
+    Outputs:
+    unknowns_layout               [Data_Layout]
+    residuals_layout              [Data_Layout]
+
+    Properties Used:
+    N/A
+    """   
+    
+    numerics = segment.state.numerics
+    layouts  = numerics.get('_pack_layouts',None)
+    
+    if layouts is None:
+        layouts = (Data_Layout(),Data_Layout())
+        numerics._pack_layouts = layouts
+    
+    return layouts
+
+## @ingroup Methods-Missions-Segments
+def jacobian(unknowns, segment):
+    
+    """Finds the Jacobian of the residuals with respect to the unknowns by colored finite differences,
+    or by colored complex steps if state.numerics.solver_jacobian is 'complex_step'.
+
+    Assumptions:
+    For complex steps the segment state is cast to complex for the perturbed evaluations and cast
+    back to real afterwards, the whole iterate process has to carry complex numbers.
+    The sparsity pattern and column coloring are found on the first call and kept until the
+    number of unknowns, the sparsity setting or the solver_jacobian changes. A 'blocks' pattern
+    is found by block_sparsity at the first call. A 'detect' pattern is replaced by the nonzeros
+    of the first, full, Jacobian together with the pointwise pattern.
+    The residuals of the last iterate and the last Jacobian are reused at the same unknowns, as when
+    the root finder checks fprime before it starts.
+
+    Source:
+    N/A
+
+    Inputs:
+    state.unknowns                     [Data]
+    state.numerics.solver_jacobian     [string]
+    state.numerics.jacobian_sparsity   [string or array]
+
+    Outputs:
+    jacobian                           [array]
+
+    Properties Used:
+    N/A
+    """   
+    
+    numerics = segment.state.numerics
+    coloring = numerics.get('_jacobian_coloring',None)
+    key      = coloring_key(numerics,len(unknowns))
+    pattern  = numerics.jacobian_sparsity
+    
+    last = numerics.get('_last_jacobian',None)
+    if last is not None and coloring is not None and coloring[0] == key and np.array_equal(last[0],unknowns):
+        return np.array(last[1])
+    
+    last = numerics.get('_last_evaluation',None)
+    if last is not None and np.array_equal(last[0],unknowns):
+        residuals = last[1]
+    else:
+        residuals = None
+    
+    if coloring is None or coloring[0] != key:
+        detect = detect_sparsity(numerics)
+        if detect and pattern == 'blocks':
+            if residuals is None:
+                residuals = iterate(unknowns, segment)
+            sparsity = block_sparsity(iterate,unknowns,residuals,segment,segment)
+            detect   = False
+        else:
+            sparsity = jacobian_sparsity(segment)
+        coloring = (key,sparsity,color_columns(sparsity))
+    else:
+        detect   = False
+        
+    key, sparsity, colors = coloring
+    
+    if numerics.solver_jacobian == 'complex_step':
+        cast_state(segment,np.complex128)
+        J = colored_complex_step(iterate,unknowns,sparsity,colors,segment)
+        cast_state(segment,np.float64)
+    else:
+        if residuals is None:
+            residuals = iterate(unknowns, segment)
+        J = colored_finite_difference(iterate,unknowns,residuals,sparsity,colors,segment)
+    
+    # an entry may be zero at this point only, keep every pointwise coupling
+    if detect:
+        sparsity = (J != 0.) | jacobian_sparsity(segment,'pointwise')
+        coloring = (key,sparsity,color_columns(sparsity))
+        
+    numerics._jacobian_coloring = coloring
+    numerics._last_jacobian     = (np.array(unknowns),J)
+    
+    return np.array(J)
+
+## @ingroup Methods-Missions-Segments
+def coloring_key(numerics,number_unknowns):
+    
+    """Finds what the sparsity pattern and column coloring of the Jacobian depend on.
+
+    Assumptions:
+    A user declared pattern is compared by its values.
+
+    Source:
+    N/A
+
+    Inputs:
+    number_unknowns                    [int]
+    state.numerics.jacobian_sparsity   [string or array]
+    state.numerics.solver_jacobian     [string]
+
+    Outputs:
+    key                                [tuple]
+
+    Properties Used:
+    N/A
+    """   
+    
+    pattern = numerics.jacobian_sparsity
+    if isinstance(pattern,array_type):
+        pattern = (np.shape(pattern),np.array(pattern,dtype=bool).tobytes())
+    
+    return (number_unknowns,pattern,numerics.solver_jacobian)
+
+## @ingroup Methods-Missions-Segments
+def detect_sparsity(numerics):
+    
+    """Checks if the sparsity pattern of the Jacobian is found from evaluations of the residuals, by
+    block_sparsity for 'blocks' or from the nonzeros of a full Jacobian for 'detect'.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    state.numerics.jacobian_sparsity   [string or array]
+
+    Outputs:
+    detect                             [bool]
+
+    Properties Used:
+    N/A
+    """   
+    
+    pattern = numerics.jacobian_sparsity
+    
+    return isinstance(pattern,str) and pattern in ('blocks','detect')
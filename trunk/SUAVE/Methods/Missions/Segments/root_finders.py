@@ -0,0 +1,368 @@
+## @ingroup Methods-Missions-Segments
+# root_finders.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import scipy.optimize
+import numpy as np
+
+from SUAVE.Methods.Missions.Segments.Common.Jacobian import colored_finite_difference
+
+# ----------------------------------------------------------------------
+#  Root Finders
+# ----------------------------------------------------------------------
+
+# These are drop in replacements for scipy.optimize.fsolve that can be set
+# as segment.settings.root_finder. They share the fsolve call signature and
+# return the same unknowns, infodict, ier, msg tuple. The infodict also holds
+#    nfev                   [int]   number of calls of func, finite differences included
+#    njev                   [int]   number of jacobian evaluations
+#    fvec                   [array] the final residuals
+#    residual_norm_history  [array] residual norm of each accepted iterate
+# The last function evaluation is always made at the returned unknowns, so
+# the segment state matches the solution. Every call of func goes through an
+# Evaluation_Counter. Calls made inside fprime can not be seen here,
+# converge_root counts those in iterate.
+
+## @ingroup Methods-Missions-Segments
+def newton_line_search(func,x0,args=(),fprime=None,xtol=1.49012e-08,full_output=1,maxiter=100):
+    """Dense Newton's method with a backtracking line search
+
+    Assumptions:
+    The Jacobian is found by forward differences of all unknowns if fprime is not given, or if the
+    line search fails with the Jacobian from fprime.
+    Converged when the step is smaller than xtol relative to the unknowns.
+
+    Source:
+    Dennis, J. E. and Schnabel, R. B., "Numerical Methods for Unconstrained Optimization
+    and Nonlinear Equations", SIAM, 1996, Algorithm A6.3.1
+
+    Inputs:
+    func         [callable] residuals = func(unknowns,*args)
+    x0           [array]
+    args         [tuple]
+    fprime       [callable] jacobian = fprime(unknowns,*args) (optional)
+    xtol         [Unitless]
+    full_output  [int]
+    maxiter      [int]
+
+    Outputs:
+    x            [array]
+    infodict     [dict]
+    ier          [int]      1 if converged
+    msg          [string]
+
+    Properties Used:
+    N/A
+    """
+
+    if not isinstance(args,tuple):
+        args = (args,)
+
+    counter = Evaluation_Counter(func,args)
+    x       = np.array(x0,dtype=float)
+    f       = counter(x)
+    history = [np.linalg.norm(f)]
+    njev    = 0
+    dense   = fprime is None
+    ier     = 0
+    msg     = 'The maximum number of iterations has been reached.'
+
+    for i in range(maxiter):
+
+        # newton step
+        if dense:
+            J = dense_finite_difference(counter,x,f)
+        else:
+            J = fprime(x,*args)
+        njev += 1
+        counter.x = None
+
+        try:
+            p = -np.linalg.solve(J,f)
+        except np.linalg.LinAlgError:
+            msg = 'The Jacobian is singular.'
+            break
+
+        # backtrack on the merit function 0.5*|f|^2, its slope along p is -|f|^2
+        merit = 0.5*np.dot(f,f)
+        step  = 1.
+        while True:
+            x_new     = x + step*p
+            f_new     = counter(x_new)
+            merit_new = 0.5*np.dot(f_new,f_new)
+            if merit_new <= (1. - 2.e-4*step)*merit:
+                break
+            step = step * 0.5
+            if step < 1e-4:
+                break
+
+        # an approximate jacobian may not give a descent direction
+        if step < 1e-4:
+            if dense:
+                msg = 'The line search did not make progress.'
+                break
+            dense = True
+            continue
+
+        dx = step*np.linalg.norm(p)
+        x  = x_new
+        f  = f_new
+        history.append(np.linalg.norm(f))
+
+        if dx <= xtol*(xtol + np.linalg.norm(x)) or history[-1] == 0.:
+            ier = 1
+            msg = 'The solution converged.'
+            break
+
+    counter.finish(x)
+
+    infodict = dict(nfev = counter.nfev, njev = njev, fvec = counter.f, residual_norm_history = np.array(history))
+
+    return x, infodict, ier, msg
+
+## @ingroup Methods-Missions-Segments
+def newton_krylov(func,x0,args=(),fprime=None,xtol=1.49012e-08,full_output=1,maxiter=100):
+    """Matrix free Newton-Krylov solve, the Jacobian is never formed
+
+    Assumptions:
+    fprime is ignored, Jacobian vector products are found by finite differences.
+    Converged when the largest residual is below xtol.
+
+    Source:
+    Knoll, D. A. and Keyes, D. E., "Jacobian-free Newton-Krylov methods: a survey of
+    approaches and applications", Journal of Computational Physics, Vol. 193, 2004
+
+    Inputs:
+    func         [callable] residuals = func(unknowns,*args)
+    x0           [array]
+    args         [tuple]
+    fprime       [callable] (unused)
+    xtol         [Unitless]
+    full_output  [int]
+    maxiter      [int]
+
+    Outputs:
+    x            [array]
+    infodict     [dict]
+    ier          [int]      1 if converged
+    msg          [string]
+
+    Properties Used:
+    N/A
+    """
+
+    if not isinstance(args,tuple):
+        args = (args,)
+
+    counter = Evaluation_Counter(func,args)
+    x       = np.array(x0,dtype=float)
+    history = [np.linalg.norm(counter(x))]
+
+    def callback(x,f):
+        history.append(np.linalg.norm(f))
+
+    try:
+        x   = scipy.optimize.newton_krylov(counter,x,f_tol=xtol,maxiter=maxiter,method='lgmres',callback=callback)
+        ier = 1
+        msg = 'The solution converged.'
+    except scipy.optimize.NoConvergence as exc:
+        x   = np.array(exc.args[0],dtype=float)
+        ier = 0
+        msg = 'The maximum number of iterations has been reached.'
+    except (ValueError,np.linalg.LinAlgError) as exc:
+        ier = 0
+        msg = str(exc)
+
+    counter.finish(x)
+
+    infodict = dict(nfev = counter.nfev, njev = 0, fvec = counter.f, residual_norm_history = np.array(history))
+
+    return x, infodict, ier, msg
+
+## @ingroup Methods-Missions-Segments
+def trust_region_least_squares(func,x0,args=(),fprime=None,xtol=1.49012e-08,full_output=1,maxiter=None):
+    """Trust region reflective least squares solve of the residuals
+
+    Assumptions:
+    The Jacobian is found by forward differences of all unknowns if fprime is not given.
+    Converged when scipy reports success and the residuals are near zero.
+
+    Source:
+    Branch, M. A., Coleman, T. F., and Li, Y., "A Subspace, Interior, and Conjugate Gradient
+    Method for Large-Scale Bound-Constrained Minimization Problems", SIAM Journal on
+    Scientific Computing, Vol. 21, No. 1, 1999
+
+    Inputs:
+    func         [callable] residuals = func(unknowns,*args)
+    x0           [array]
+    args         [tuple]
+    fprime       [callable] jacobian = fprime(unknowns,*args) (optional)
+    xtol         [Unitless]
+    full_output  [int]
+    maxiter      [int]      maximum number of function evaluations
+
+    Outputs:
+    x            [array]
+    infodict     [dict]
+    ier          [int]      1 if converged
+    msg          [string]
+
+    Properties Used:
+    N/A
+    """
+
+    if not isinstance(args,tuple):
+        args = (args,)
+
+    counter = Evaluation_Counter(func,args)
+
+    # keep the finite difference evaluations out of the trial point history
+    trials  = []
+    def fun(x):
+        f = counter(x)
+        trials.append(np.linalg.norm(f))
+        return f
+
+    def jac(x):
+        if fprime is None:
+            f = counter.f if counter.x is not None and np.array_equal(counter.x,x) else counter(x)
+            J = dense_finite_difference(counter,x,f)
+        else:
+            J = fprime(x,*args)
+        counter.x = None
+        return J
+
+    result = scipy.optimize.least_squares(fun,np.array(x0,dtype=float),jac=jac,method='trf',xtol=xtol,max_nfev=maxiter)
+    x      = result.x
+
+    counter.finish(x)
+
+    # the trust region only accepts steps that reduce the residuals
+    history = np.minimum.accumulate(trials)
+    history = history[np.r_[True,np.diff(history) < 0.]]
+
+    if result.status > 0 and np.linalg.norm(counter.f) <= np.sqrt(xtol)*max(1.,history[0]):
+        ier = 1
+    else:
+        ier = 0
+
+    infodict = dict(nfev = counter.nfev, njev = result.njev, fvec = counter.f, residual_norm_history = history)
+
+    return x, infodict, ier, result.message
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments
+def dense_finite_difference(func,x,f,args=()):
+    """Forward difference Jacobian of all unknowns, one evaluation per unknown
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    func         [callable]
+    x            [array]
+    f            [array]    func(x)
+    args         [tuple]
+
+    Outputs:
+    jacobian     [array]
+
+    Properties Used:
+    N/A
+    """
+    sparsity = np.ones([len(f),len(x)],dtype=bool)
+    colors   = np.arange(len(x))
+
+    return colored_finite_difference(func,x,f,sparsity,colors,args)
+
+## @ingroup Methods-Missions-Segments
+class Evaluation_Counter(object):
+    """Wraps the residual function to count evaluations and track the last point
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+    """
+
+    def __init__(self,func,args):
+        """Stores the function and its extra arguments
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        func         [callable]
+        args         [tuple]
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+        """
+        self.func = func
+        self.args = args
+        self.nfev = 0
+        self.x    = None
+        self.f    = None
+
+    def __call__(self,x):
+        """Evaluates the residuals
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        x            [array]
+
+        Outputs:
+        f            [array]
+
+        Properties Used:
+        N/A
+        """
+        self.nfev += 1
+        self.x = np.array(x)
+        self.f = self.func(x,*self.args)
+        return self.f
+
+    def finish(self,x):
+        """Makes sure the last evaluation was at x
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        x            [array]
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+        """
+        if self.x is None or not np.array_equal(self.x,x):
+            self(x)
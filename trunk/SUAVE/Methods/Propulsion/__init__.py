@@ -7,6 +7,7 @@ from .propeller_design import propeller_design
 from .turbofan_emission_index import turbofan_emission_index
 from .electric_motor_sizing import size_from_kv, size_from_mass
 from .turbofan_sizing import turbofan_sizing
+from .turbofan_cycle import turbofan_cycle, turbofan_cycle_parameters
 from .turbojet_sizing import turbojet_sizing
 from .ramjet_sizing import ramjet_sizing
 from .scramjet_sizing import scramjet_sizing
@@ -3,13 +3,20 @@
 #
 # Created:  Sep 2017, P Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
-from scipy.optimize import fsolve
+from warnings import warn
+from SUAVE.Methods.Utilities.scalar_root import safeguarded_newton
+
+# default range of the Mach number solvers, the sonic point splits the subsonic and supersonic branches
+minimum_mach_number = 1e-6
+sonic_mach_number   = 1.0
+maximum_mach_number = 100.
 
 # ----------------------------------------------------------------------
 #  fm_solver
@@ -18,14 +25,20 @@ from scipy.optimize import fsolve
 ## @ingroup Methods-Propulsion
 
 
-def fm_solver(area_ratio, M0, gamma):
+def fm_solver(area_ratio, M0, gamma, minimum_mach=minimum_mach_number, maximum_mach=maximum_mach_number):
     """Function that takes in an area ratio and a Mach number associated to
     one of the areas and outputs the missing Mach number.
 
+    Assumptions:
+    The missing Mach number is on the same side of Mach 1 as M0
+    Each point is solved on its own, see safeguarded_newton
+
     Inputs:
     M           [-]
     gamma       [-]
     area_ratio  [-]
+    minimum_mach [-] (optional) lower end of the subsonic branch
+    maximum_mach [-] (optional) upper end of the supersonic branch
 
     Outputs:
     M1          [-]
@@ -33,23 +46,50 @@ def fm_solver(area_ratio, M0, gamma):
     Source:
     https://web.stanford.edu/~cantwell/AA210A_Course_Material/AA210A_Course_Notes/
     """
-    # Area-Mach Function
-    func = lambda M1: ((M0/M1*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**((gamma+1.)/(2.*(gamma-1.))))-area_ratio)
 
-    # Initializing the array
-    M1_guess = np.ones_like(M0)
+    M0 = np.asarray(M0,dtype=float)
 
     # Separating supersonic and subsonic solutions
-    i_low = M0 < 1.0
-    i_high = M0 >= 1.0
-
-    # Subsonic solution initialization
-    M1_guess[i_low]= 0.1
+    i_low  = M0 < sonic_mach_number
 
-    # Supersonic solution initialization
-    M1_guess[i_high]= 1.1
+    # Subsonic solutions are bracketed below Mach 1, supersonic ones above
+    lower    = np.where(i_low, minimum_mach, sonic_mach_number)
+    upper    = np.where(i_low, sonic_mach_number, maximum_mach)
+    M1_guess = np.where(i_low, 0.1, 1.1)
 
     # Solving
-    M1 = fsolve(func,M1_guess, factor=0.1)
+    M1, converged = safeguarded_newton(area_mach_function,lower,upper,M1_guess,args=(M0,gamma,area_ratio))
+
+    # in case there is no solution on the branch
+    if not np.all(converged):
+        warn('fm_solver did not converge',RuntimeWarning)
 
     return M1
+
+## @ingroup Methods-Propulsion
+def area_mach_function(M1, M0, gamma, area_ratio):
+    """The area-Mach relation between two Mach numbers, less the area ratio, and
+    its derivative with the missing Mach number.
+
+    Inputs:
+    M1          [-]
+    M0          [-]
+    gamma       [-]
+    area_ratio  [-]
+
+    Outputs:
+    residual    [-]
+    derivative  [-]
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA210A_Course_Material/AA210A_Course_Notes/
+    """
+
+    exponent = (gamma+1.)/(2.*(gamma-1.))
+    T1       = 1.+(gamma-1.)/2.*M1*M1
+    ratio    = M0/M1*(T1/(1.+(gamma-1.)/2.*M0*M0))**exponent
+
+    residual   = ratio - area_ratio
+    derivative = ratio*(exponent*(gamma-1.)*M1/T1 - 1./M1)
+
+    return residual, derivative
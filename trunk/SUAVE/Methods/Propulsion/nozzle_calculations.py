@@ -2,10 +2,13 @@
 # nozzle_calculations.py
 # 
 # Created:  Sep 2017, P. Goncalves
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 import numpy as np
-from scipy.optimize import fsolve
+from warnings import warn
+from SUAVE.Methods.Utilities.scalar_root import safeguarded_newton
+from SUAVE.Methods.Propulsion.fm_solver import area_mach_function, minimum_mach_number, sonic_mach_number, \
+     maximum_mach_number
 
 # ----------------------------------------------------------------------
 #  nozzle calculations
@@ -33,20 +36,14 @@ def exit_Mach_shock(area_ratio, gamma, Pt_out, P0):
     Me            [dimensionless]      
     
     """
-    func = lambda Me : (Pt_out/P0)*(1./area_ratio)-(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))*Me*((1.+(gamma-1.)/2.*Me**2.)**0.5)
-
-    #Initializing the array
-    Me_initial_guess = np.ones_like(Pt_out) 
-    i_sol = Me_initial_guess < 10.0
-    Me_initial_guess[i_sol] = 0.1
-
-    # Solving for Me
-    Me = fsolve(func,Me_initial_guess)
+    # the relation is a quadratic in Me**2, solved in a form without cancellation
+    R  = (Pt_out/P0)/area_ratio/(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))
+    Me = np.sqrt(2.*R*R/(1.+np.sqrt(1.+2.*(gamma-1.)*R*R)))
         
     return Me
         
 ## @ingroup Methods-Propulsion
-def mach_area(area_ratio, gamma, subsonic):
+def mach_area(area_ratio, gamma, subsonic, minimum_mach=minimum_mach_number, maximum_mach=maximum_mach_number):
     """ Returns the Mach number given an area ratio and isentropic conditions
     
     Assumptions:
@@ -59,18 +56,26 @@ def mach_area(area_ratio, gamma, subsonic):
     area_ratio    [dimensionless]
     gamma         [dimensionless]
     subsonic      [Boolean]
+    minimum_mach  [dimensionless] (optional) lower end of the subsonic branch
+    maximum_mach  [dimensionless] (optional) upper end of the supersonic branch
     
     Outputs:
     Me            [dimensionless]  
     
     """
-    func = lambda Me : (area_ratio**2. - ((1./Me)**2.)*(((2./(gamma+1.))*(1.+((gamma-1.)/2.)*Me**2.))**((gamma+1.)/((gamma-1.)))))[:,0]
+    # the area ratio is to the throat, where the Mach number is 1
     if subsonic:
         Me_initial_guess = 0.01
+        lower, upper     = minimum_mach, sonic_mach_number
     else:
-        Me_initial_guess = 2.0         
-        
-    Me = fsolve(func,Me_initial_guess, factor = 0.1)
+        Me_initial_guess = 2.0
+        lower, upper     = sonic_mach_number, maximum_mach
+
+    Me, converged = safeguarded_newton(area_mach_function,lower,upper,Me_initial_guess,args=(sonic_mach_number,gamma,area_ratio))
+
+    # in case the area is below the throat area
+    if not np.all(converged):
+        warn('mach_area did not converge',RuntimeWarning)
 
     return Me
 
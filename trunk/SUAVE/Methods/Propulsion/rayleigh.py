@@ -3,27 +3,36 @@
 # 
 # Created:  Aug 2017, P. Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 import numpy as np
+from warnings import warn
 
-from scipy.optimize import fsolve
+from SUAVE.Methods.Utilities.scalar_root import safeguarded_newton
+from SUAVE.Methods.Propulsion.fm_solver import minimum_mach_number, sonic_mach_number, maximum_mach_number
 
 # ----------------------------------------------------------------------
 #  rayleigh
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Propulsion
-def rayleigh(gamma, M0, TtR):
+def rayleigh(gamma, M0, TtR, minimum_mach=minimum_mach_number, maximum_mach=maximum_mach_number):
     """
     Function that takes in a input (output) Mach number and a stagnation 
     temperature ratio and yields an output (input) Mach number, according
     to the Rayleigh flow equation. The function also outputs the stagnation
     pressure ratio
     
+    Assumptions:
+    The output Mach number is on the same side of Mach 1 as M0
+    Each point is solved on its own, see safeguarded_newton
+    
     Inputs:
     M       [dimensionless]
     gamma   [dimensionless]
     Ttr     [dimensionless]
+    minimum_mach [dimensionless] (optional) lower end of the subsonic branch
+    maximum_mach [dimensionless] (optional) upper end of the supersonic branch
     
     Outputs:
     M1      [dimensionless]
@@ -31,25 +40,51 @@ def rayleigh(gamma, M0, TtR):
     
     """
 
-    func = lambda M1: (((1.+gamma*M0*M0)**2.*M1*M1*(1.+(gamma-1.)/2.*M1*M1))/((1.+gamma*M1*M1)**2.*M0*M0*(1.+(gamma-1.)/2.*M0*M0))-TtR)
-
-    #Initializing the array
-    M1_guess = np.ones_like(M0)
+    M0 = np.asarray(M0,dtype=float)
     
     # Separating supersonic and subsonic solutions
-    i_low = M0 <= 1.0
-    i_high = M0 > 1.0
+    i_low = M0 <= sonic_mach_number
 
-    #--Subsonic solution Guess
-    M1_guess[i_low]= .01
-    
-    #--Supersonic solution Guess
-    M1_guess[i_high]= 1.1
+    # Subsonic solutions are bracketed below Mach 1, supersonic ones above
+    lower    = np.where(i_low, minimum_mach, sonic_mach_number)
+    upper    = np.where(i_low, sonic_mach_number, maximum_mach)
+    M1_guess = np.where(i_low, .01, 1.1)
 
     # Find Mach number
-    M1 = fsolve(func,M1_guess, factor=0.1)
+    M1, converged = safeguarded_newton(rayleigh_function,lower,upper,M1_guess,args=(M0,gamma,TtR))
+
+    # in case the heat addition chokes the flow
+    if not np.all(converged):
+        warn('rayleigh did not converge',RuntimeWarning)
     
     #Calculate stagnation pressure ratio
     Ptr = ((1.+gamma*M0*M0)/(1.+gamma*M1*M1)*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**(gamma/(gamma-1.)))
 
-    return M1, Ptr
\ No newline at end of file
+    return M1, Ptr
+
+## @ingroup Methods-Propulsion
+def rayleigh_function(M1, M0, gamma, TtR):
+    """
+    The stagnation temperature ratio of Rayleigh flow between two Mach numbers,
+    less the target ratio, and its derivative with the missing Mach number.
+    
+    Inputs:
+    M1      [dimensionless]
+    M0      [dimensionless]
+    gamma   [dimensionless]
+    TtR     [dimensionless]
+    
+    Outputs:
+    residual    [dimensionless]
+    derivative  [dimensionless]
+    
+    """
+
+    T1    = 1.+(gamma-1.)/2.*M1*M1
+    G1    = 1.+gamma*M1*M1
+    ratio = ((1.+gamma*M0*M0)**2.*M1*M1*T1)/(G1**2.*M0*M0*(1.+(gamma-1.)/2.*M0*M0))
+
+    residual   = ratio - TtR
+    derivative = ratio*(2./M1 + (gamma-1.)*M1/T1 - 4.*gamma*M1/G1)
+
+    return residual, derivative
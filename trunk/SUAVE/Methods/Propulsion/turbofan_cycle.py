@@ -0,0 +1,375 @@
+## @ingroup Methods-Propulsion
+# turbofan_cycle.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from warnings import warn
+
+from SUAVE.Core import Data, Units
+from .fm_id import fm_id
+
+# the conversions of Units.hour, which is slower to look up than the whole cycle. Converting
+# out of hours multiplies by the inverse, as the units do.
+hour     = 1. * Units.hour
+per_hour = 1. / Units.hour
+
+# ----------------------------------------------------------------------
+#   Stations
+# ----------------------------------------------------------------------
+
+# the rows of the stacked stagnation temperatures and pressures
+stations = ['freestream',
+            'inlet_nozzle',
+            'low_pressure_compressor',
+            'high_pressure_compressor',
+            'fan',
+            'combustor',
+            'high_pressure_turbine',
+            'low_pressure_turbine',
+            'core_nozzle',
+            'fan_nozzle']
+
+# ----------------------------------------------------------------------
+#   Cycle Parameters
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def turbofan_cycle_parameters(turbofan):
+    """Gathers the parameters of the components of a turbofan network that the cycle needs, so
+    that the cycle can be evaluated without the inputs and outputs of the components.
+
+    Assumptions:
+    The inlet nozzle does not model compressibility effects
+
+    Source:
+    N/A
+
+    Inputs:
+    turbofan.
+      working_fluid
+      bypass_ratio                                      [-]
+      number_of_engines                                 [-]
+      inlet_nozzle, low_pressure_compressor, high_pressure_compressor, fan, combustor,
+      high_pressure_turbine, low_pressure_turbine, core_nozzle, fan_nozzle, thrust
+      Shaft_Power_Off_Take (optional)
+
+    Outputs:
+    parameters                                          [Data] floats only
+
+    Properties Used:
+    N/A
+    """
+
+    inlet_nozzle             = turbofan.inlet_nozzle
+    low_pressure_compressor  = turbofan.low_pressure_compressor
+    high_pressure_compressor = turbofan.high_pressure_compressor
+    fan                      = turbofan.fan
+    combustor                = turbofan.combustor
+    high_pressure_turbine    = turbofan.high_pressure_turbine
+    low_pressure_turbine     = turbofan.low_pressure_turbine
+    core_nozzle              = turbofan.core_nozzle
+    fan_nozzle               = turbofan.fan_nozzle
+    thrust                   = turbofan.thrust
+    shaft_power              = turbofan.get('Shaft_Power_Off_Take',None)
+
+    p = Data()
+    p.working_fluid       = turbofan.working_fluid
+    p.bypass_ratio        = turbofan.bypass_ratio
+    p.number_of_engines   = turbofan.number_of_engines
+
+    p.inlet_pressure_ratio          = inlet_nozzle.pressure_ratio
+    p.inlet_polytropic_efficiency   = inlet_nozzle.polytropic_efficiency
+    p.inlet_pressure_recovery       = inlet_nozzle.pressure_recovery
+
+    p.lpc_pressure_ratio            = low_pressure_compressor.pressure_ratio
+    p.lpc_polytropic_efficiency     = low_pressure_compressor.polytropic_efficiency
+    p.hpc_pressure_ratio            = high_pressure_compressor.pressure_ratio
+    p.hpc_polytropic_efficiency     = high_pressure_compressor.polytropic_efficiency
+    p.fan_pressure_ratio            = fan.pressure_ratio
+    p.fan_polytropic_efficiency     = fan.polytropic_efficiency
+
+    p.turbine_inlet_temperature     = combustor.turbine_inlet_temperature
+    p.combustor_pressure_ratio      = combustor.pressure_ratio
+    p.combustor_efficiency          = combustor.efficiency
+    p.nondim_mass_ratio             = combustor.inputs.nondim_mass_ratio
+    p.fuel_specific_energy          = combustor.fuel_data.specific_energy
+
+    p.hpt_mechanical_efficiency     = high_pressure_turbine.mechanical_efficiency
+    p.hpt_polytropic_efficiency     = high_pressure_turbine.polytropic_efficiency
+    p.lpt_mechanical_efficiency     = low_pressure_turbine.mechanical_efficiency
+    p.lpt_polytropic_efficiency     = low_pressure_turbine.polytropic_efficiency
+
+    p.core_nozzle_pressure_ratio        = core_nozzle.pressure_ratio
+    p.core_nozzle_polytropic_efficiency = core_nozzle.polytropic_efficiency
+    p.fan_nozzle_pressure_ratio         = fan_nozzle.pressure_ratio
+    p.fan_nozzle_polytropic_efficiency  = fan_nozzle.polytropic_efficiency
+
+    p.reference_temperature              = thrust.reference_temperature
+    p.reference_pressure                 = thrust.reference_pressure
+    p.compressor_nondimensional_massflow = thrust.compressor_nondimensional_massflow
+    p.SFC_adjustment                     = thrust.SFC_adjustment
+
+    # the shaft power is only taken off the low pressure turbine
+    if shaft_power is None:
+        p.shaft_power_draw = None
+    else:
+        p.shaft_power_draw            = shaft_power.power_draw
+        p.shaft_reference_temperature = shaft_power.reference_temperature
+        p.shaft_reference_pressure    = shaft_power.reference_pressure
+
+    return p
+
+# ----------------------------------------------------------------------
+#   Cycle
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def turbofan_cycle(conditions,p):
+    """Evaluates the whole cycle of a turbofan in one pass over arrays, with the same equations as
+    the components of the Turbofan network, and gives the same results.
+
+    Assumptions:
+    Perfect gas, see the components of SUAVE.Components.Energy.Converters
+    The inlet nozzle does not model compressibility effects
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA283_Course_Material/AA283_Course_Notes/
+
+    Inputs:
+    conditions.freestream.
+      pressure                                          [Pa]
+      temperature                                       [K]
+      mach_number                                       [-]
+      velocity                                          [m/s]
+      speed_of_sound                                    [m/s]
+      gravity                                           [m/s^2]
+    conditions.propulsion.throttle                      [-]
+    p                                                   see turbofan_cycle_parameters
+
+    Outputs:
+    cycle.
+      stagnation_temperature                            [K]  one row per station, see stations
+      stagnation_pressure                               [Pa] one row per station, see stations
+      fuel_to_air_ratio                                 [-]
+      core_nozzle. and fan_nozzle.
+        static_temperature                              [K]
+        static_pressure                                 [Pa]
+        velocity                                        [m/s]
+        area_ratio                                      [-]
+      thrust                                            [N]
+      fuel_flow_rate                                    [kg/s]
+      power                                             [W]
+    conditions.freestream.
+      stagnation_temperature                            [K]
+      stagnation_pressure                               [Pa]
+      isentropic_expansion_factor                       [-]
+      specific_heat_at_constant_pressure                [J/(kg K)]
+      gas_specific_constant                             [J/(kg K)]
+
+    Properties Used:
+    N/A
+    """
+
+    # Unpack
+    Po       = conditions.freestream.pressure
+    To       = conditions.freestream.temperature
+    M0       = conditions.freestream.mach_number
+    u0       = conditions.freestream.velocity
+    a0       = conditions.freestream.speed_of_sound
+    g        = conditions.freestream.gravity
+    throttle = conditions.propulsion.throttle
+
+    # ram
+    gamma  = p.working_fluid.compute_gamma(To,Po)
+    Cp     = p.working_fluid.compute_cp(To,Po)
+    R      = p.working_fluid.gas_specific_constant
+    Tt0    = To*(1.+((gamma-1.)/2.*M0*M0))
+    Pt0    = Po*((1.+(gamma-1.)/2.*M0*M0 )**(gamma/(gamma-1.)))
+
+    conditions.freestream.stagnation_temperature             = Tt0
+    conditions.freestream.stagnation_pressure                = Pt0
+    conditions.freestream.isentropic_expansion_factor        = gamma
+    conditions.freestream.specific_heat_at_constant_pressure = Cp
+    conditions.freestream.gas_specific_constant              = R
+
+    # inlet nozzle
+    pid    = p.inlet_pressure_ratio*p.inlet_pressure_recovery
+    Tt2    = Tt0*(pid)**((gamma-1)/(gamma*p.inlet_polytropic_efficiency))
+    Pt2    = Pt0*p.inlet_pressure_ratio*p.inlet_pressure_recovery
+    if np.any(Pt2<Po):
+        warn('Pt_out goes too low',RuntimeWarning)
+        Pt2 = np.where(Pt2<Po,Po,Pt2)
+
+    # compressors and fan
+    Tt25, Pt25, lpc_work = compression(Tt2, Pt2, gamma,Cp,p.lpc_pressure_ratio,p.lpc_polytropic_efficiency)
+    Tt3,  Pt3,  hpc_work = compression(Tt25,Pt25,gamma,Cp,p.hpc_pressure_ratio,p.hpc_polytropic_efficiency)
+    Tt21, Pt21, fan_work = compression(Tt2, Pt2, gamma,Cp,p.fan_pressure_ratio,p.fan_polytropic_efficiency)
+
+    # combustor
+    Tt4    = p.turbine_inlet_temperature
+    Pt4    = Pt3*p.combustor_pressure_ratio
+    ht4    = Cp*Tt4*p.nondim_mass_ratio
+    ht_in  = Cp*Tt3*p.nondim_mass_ratio
+    f      = (ht4 - ht_in)/(p.combustor_efficiency*p.fuel_specific_energy-ht4)
+
+    # shaft power off take
+    if p.shaft_power_draw is None:
+        shaft_takeoff = 0.
+    elif p.shaft_power_draw == 0.0:
+        shaft_takeoff = np.array([0.0])
+    else:
+        mdot_core     = p.compressor_nondimensional_massflow * np.sqrt(p.shaft_reference_temperature / Tt25) * (Pt25 / p.shaft_reference_pressure)
+        shaft_takeoff = p.shaft_power_draw / mdot_core
+        shaft_takeoff[mdot_core == 0] = 0
+
+    # turbines, the high pressure turbine drives only the high pressure compressor
+    Tt45, Pt45 = expansion(Tt4, Pt4, gamma,Cp,f,hpc_work,0.,0.0,fan_work,p.hpt_mechanical_efficiency,p.hpt_polytropic_efficiency)
+    Tt5,  Pt5  = expansion(Tt45,Pt45,gamma,Cp,f,lpc_work,shaft_takeoff,p.bypass_ratio,fan_work,p.lpt_mechanical_efficiency,p.lpt_polytropic_efficiency)
+
+    # nozzles
+    Tt8,  Pt8,  core = nozzle(Tt5, Pt5, gamma,Cp,Po,Pt0,Tt0,M0,p.core_nozzle_pressure_ratio,p.core_nozzle_polytropic_efficiency)
+    Tt18, Pt18, fan  = nozzle(Tt21,Pt21,gamma,Cp,Po,Pt0,Tt0,M0,p.fan_nozzle_pressure_ratio,p.fan_nozzle_polytropic_efficiency)
+
+    # thrust
+    bypass_ratio      = p.bypass_ratio
+    flow_through_core = 1./(1.+bypass_ratio)
+    flow_through_fan  = bypass_ratio/(1.+bypass_ratio)
+
+    core_thrust_nondimensional  = flow_through_core*(gamma*M0*M0*(core.velocity/u0-1.) + core.area_ratio*(core.static_pressure/Po-1.))
+    fan_thrust_nondimensional   = flow_through_fan*(gamma*M0*M0*(fan.velocity/u0-1.) + fan.area_ratio*(fan.static_pressure/Po-1.))
+    Thrust_nd                   = core_thrust_nondimensional + fan_thrust_nondimensional
+
+    Fsp       = 1./(gamma*M0)*Thrust_nd
+    TSFC      = f*g/(Fsp*a0*(1.+bypass_ratio))*(1.-p.SFC_adjustment) * hour
+    mdot_core = p.compressor_nondimensional_massflow*np.sqrt(p.reference_temperature/Tt25)*(Pt25/p.reference_pressure)
+    FD2       = Fsp*a0*(1.+bypass_ratio)*mdot_core*p.number_of_engines*throttle
+
+    # Pack outputs
+    cycle = Data()
+    cycle.stagnation_temperature = np.stack(np.broadcast_arrays(Tt0,Tt2,Tt25,Tt3,Tt21,Tt4,Tt45,Tt5,Tt8,Tt18))
+    cycle.stagnation_pressure    = np.stack(np.broadcast_arrays(Pt0,Pt2,Pt25,Pt3,Pt21,Pt4,Pt45,Pt5,Pt8,Pt18))
+    cycle.fuel_to_air_ratio      = f
+    cycle.core_nozzle            = core
+    cycle.fan_nozzle             = fan
+    cycle.thrust                 = FD2
+    cycle.fuel_flow_rate         = np.fmax(FD2*TSFC/g,np.array([0.]))*1.*per_hour
+    cycle.power                  = FD2*u0
+
+    return cycle
+
+## @ingroup Methods-Propulsion
+def compression(Tt_in,Pt_in,gamma,Cp,pid,etapold):
+    """The stagnation properties and work of a compressor or a fan, see
+    SUAVE.Components.Energy.Converters.Compressor.
+
+    Assumptions:
+    Constant polytropic efficiency and pressure ratio
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA283_Course_Material/AA283_Course_Notes/
+
+    Inputs:
+    Tt_in, Pt_in                                        [K], [Pa]
+    gamma, Cp                                           [-], [J/(kg K)]
+    pid, etapold                                        [-]
+
+    Outputs:
+    Tt_out, Pt_out                                      [K], [Pa]
+    work_done                                           [J/kg]
+
+    Properties Used:
+    N/A
+    """
+
+    Pt_out    = Pt_in*pid
+    Tt_out    = Tt_in*pid**((gamma-1)/(gamma*etapold))
+    work_done = Cp*Tt_out - Cp*Tt_in
+
+    return Tt_out, Pt_out, work_done
+
+## @ingroup Methods-Propulsion
+def expansion(Tt_in,Pt_in,gamma,Cp,f,compressor_work,shaft_takeoff,alpha,fan_work,eta_mech,etapolt):
+    """The stagnation properties after a turbine, see SUAVE.Components.Energy.Converters.Turbine.
+
+    Assumptions:
+    Constant polytropic and mechanical efficiencies
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA283_Course_Material/AA283_Course_Notes/
+
+    Inputs:
+    Tt_in, Pt_in                                        [K], [Pa]
+    gamma, Cp                                           [-], [J/(kg K)]
+    f                                                   [-]
+    compressor_work, shaft_takeoff, fan_work            [J/kg]
+    alpha (bypass ratio)                                [-]
+    eta_mech, etapolt                                   [-]
+
+    Outputs:
+    Tt_out, Pt_out                                      [K], [Pa]
+
+    Properties Used:
+    N/A
+    """
+
+    deltah_ht = -1 / (1 + f) * 1 / eta_mech * (compressor_work + shaft_takeoff + alpha * fan_work)
+    Tt_out    =  Tt_in+deltah_ht/Cp
+    Pt_out    =  Pt_in*(Tt_out/Tt_in)**(gamma/((gamma-1)*etapolt))
+
+    return Tt_out, Pt_out
+
+## @ingroup Methods-Propulsion
+def nozzle(Tt_in,Pt_in,gamma,Cp,Po,Pto,Tto,Mo,pid,etapold):
+    """The exit of an expansion nozzle, see SUAVE.Components.Energy.Converters.Expansion_Nozzle.
+
+    Assumptions:
+    The nozzle is choked when the exit Mach number would be above one
+
+    Source:
+    https://web.stanford.edu/~cantwell/AA283_Course_Material/AA283_Course_Notes/
+
+    Inputs:
+    Tt_in, Pt_in                                        [K], [Pa]
+    gamma, Cp                                           [-], [J/(kg K)]
+    Po, Pto, Tto, Mo (freestream)                       [Pa], [Pa], [K], [-]
+    pid, etapold                                        [-]
+
+    Outputs:
+    Tt_out, Pt_out                                      [K], [Pa]
+    exit.
+      static_temperature                                [K]
+      static_pressure                                   [Pa]
+      velocity                                          [m/s]
+      area_ratio                                        [-]
+
+    Properties Used:
+    N/A
+    """
+
+    Pt_out   = Pt_in*pid
+    Tt_out   = Tt_in*pid**((gamma-1)/(gamma)*etapold)
+    ht_out   = Cp*Tt_out
+
+    Mach     = np.sqrt((((Pt_out/Po)**((gamma-1)/gamma))-1)*2/(gamma-1))
+    choked   = Mach >= 1.0
+
+    Mach     = np.where(choked,1.0,Mach)
+    P_choked = Pt_out/(1.+(gamma-1.)/2.*Mach*Mach)**(gamma/(gamma-1.))
+    P_out    = np.where(choked,P_choked,np.where(Mach < 1.0,Po,np.nan))
+
+    T_out    = Tt_out/(1+(gamma-1)/2*Mach*Mach)
+    h_out    = Cp*T_out
+
+    exit = Data()
+    exit.static_temperature = T_out
+    exit.static_pressure    = P_out
+    exit.velocity           = np.sqrt(2*(ht_out-h_out))
+    exit.area_ratio         = (fm_id(Mo,gamma)/fm_id(Mach,gamma)*(1/(Pt_out/Pto))*(np.sqrt(Tt_out/Tto)))
+
+    return Tt_out, Pt_out, exit
@@ -4,5 +4,9 @@
 # @ingroup Methods
 from . import Chebyshev
 from . import soft_max
+from . import complex_step
 #import Utilities
-from . import latin_hypercube_sampling
\ No newline at end of file
+from . import latin_hypercube_sampling
+from . import job_scheduler
+from . import scalar_root
+from . import bounded_cache
\ No newline at end of file
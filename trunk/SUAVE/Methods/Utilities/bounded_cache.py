@@ -0,0 +1,142 @@
+## @ingroup Methods-Utilities
+# bounded_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from collections import OrderedDict
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Bounded Cache
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+class Bounded_Cache(object):
+    """ Keeps the results of an expensive build, such as a factored matrix, for the inputs it was
+        built from. Only the most recently used entries are kept, so the cache stays bounded when
+        the inputs are being varied, as in an optimization.
+
+        Assumptions:
+        The keys are hashable and hold everything the result depends on.
+        The results are shared by every caller, their arrays are made read only.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,maximum_size=64):
+        """ Makes an empty cache
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            maximum_size  [int] number of entries that are kept
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.maximum_size = maximum_size
+        self.entries      = OrderedDict()
+        self.hits         = 0
+        self.misses       = 0
+
+    def fetch(self,key,build,*args):
+        """ Gets the entry of a key, building it with build(*args) if it is not kept
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            key           hashable
+            build         function that returns the entry
+            args          arguments of build
+
+            Outputs:
+            entry         with read only arrays
+
+            Properties Used:
+            N/A
+        """
+
+        entries = self.entries
+
+        if key in entries:
+            self.hits += 1
+            entries.move_to_end(key)
+            return entries[key]
+
+        self.misses += 1
+        entry = build(*args)
+        freeze(entry)
+
+        entries[key] = entry
+        while len(entries) > self.maximum_size:
+            entries.popitem(last=False)
+
+        return entry
+
+    def clear(self):
+        """ Removes every entry and resets the counters
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.entries.clear()
+        self.hits   = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+## @ingroup Methods-Utilities
+def freeze(entry):
+    """ Makes the arrays of an entry, and of any tuples and lists in it, read only
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        entry
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+    """
+    if isinstance(entry,np.ndarray):
+        entry.flags.writeable = False
+    elif isinstance(entry,(tuple,list)):
+        for item in entry:
+            freeze(item)
@@ -0,0 +1,50 @@
+## @ingroup Methods-Utilities
+# complex_step.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Complex Step Safe Functions
+# ----------------------------------------------------------------------
+
+# These replace numpy functions that are either not defined for complex
+# numbers or that drop the imaginary part, where the iterate process
+# needs them. Real inputs are passed straight to numpy. For complex
+# inputs the real part is the numpy result and the imaginary part
+# carries the first derivative, so that complex step derivatives stay
+# exact.
+
+## @ingroup Methods-Utilities
+def arctan2(y,x):
+    """Four quadrant arctangent that carries complex step derivatives
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    y      [array]
+    x      [array]
+
+    Outputs:
+    angle  [radians]
+
+    Properties Used:
+    N/A
+    """
+    if not (np.iscomplexobj(y) or np.iscomplexobj(x)):
+        return np.arctan2(y,x)
+
+    yr, yi = np.real(y), np.imag(y)
+    xr, xi = np.real(x), np.imag(x)
+
+    return np.arctan2(yr,xr) + 1j*(xr*yi - yr*xi)/(xr**2 + yr**2)
@@ -0,0 +1,343 @@
+## @ingroup Methods-Utilities
+# job_scheduler.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import sys
+import time
+import shutil
+import pickle
+import signal
+import traceback
+import multiprocessing
+from collections import deque
+from multiprocessing.connection import wait
+
+from SUAVE.Core import redirect
+from SUAVE.Surrogate.surrogate_cache import hash_objects
+
+# ----------------------------------------------------------------------
+#  Run Jobs
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def run_jobs(function,arguments,folder,processes=None,timeout=None,retries=0,links=None,key=None):
+    """Runs a function for every argument, several at a time, each in its own scratch folder.
+    This is meant for tables of external solver runs, such as the training of the AVL and SU2
+    surrogates.
+
+    Assumptions:
+    Jobs run in forked processes, so the function does not need to be picklable, but its results do.
+    A job fails if it raises an error, exits, or runs for longer than the timeout. A failed job is run
+    again, in a clean folder, up to retries times.
+    Every result is saved in its job folder as soon as the job finishes. Saved results of the same key
+    and argument are reused, so a table that was interrupted continues where it stopped.
+    Where fork is not available the jobs are run one at a time in this process, without a timeout.
+
+    Source:
+    N/A
+
+    Inputs:
+    function      [callable] result = function(argument), called with the job folder as the working directory
+    arguments     [list]
+    folder        <string>  scratch folder, holds one folder per job
+    processes     [-]       number of jobs run at once (optional - defaults to the number of processors)
+    timeout       [s]       (optional)
+    retries       [-]       (optional)
+    links         [list]    files linked into every job folder, such as meshes (optional)
+    key           anything else the results depend on, see SUAVE.Surrogate.surrogate_cache.hash_objects
+
+    Outputs:
+    results       [list]    in the order of the arguments
+
+    Properties Used:
+    N/A
+    """
+
+    folder    = os.path.abspath(folder)
+    links     = [os.path.abspath(link) for link in (links or [])]
+    processes = processes or multiprocessing.cpu_count()
+    count     = len(arguments)
+
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+
+    jobs     = [Job(os.path.join(folder,'job_{0:04d}'.format(i)),hash_objects(key,arguments[i])) for i in range(count)]
+    results  = [None] * count
+    attempts = [0] * count
+    failed   = []
+
+    # reuse the results of an earlier run
+    pending = deque()
+    for i,job in enumerate(jobs):
+        found, result = job.load()
+        if found:
+            results[i] = result
+        else:
+            pending.append(i)
+
+    fork = 'fork' in multiprocessing.get_all_start_methods()
+    if fork:
+        context = multiprocessing.get_context('fork')
+
+    active = {}
+    try:
+        while pending or active:
+
+            # start as many jobs as there are free processes
+            while pending and len(active) < processes:
+                i   = pending.popleft()
+                job = jobs[i]
+                job.prepare(links)
+                if fork:
+                    process = context.Process(target=job.run,args=(function,arguments[i]))
+                    process.start()
+                    active[i] = (process,time.time())
+                else:
+                    with redirect.folder(job.folder,force=False):
+                        job.run(function,arguments[i],forked=False)
+                    active[i] = (None,time.time())
+
+            # wait for a job to finish or to run out of time
+            running = [process for process,_ in active.values() if process is not None]
+            if running:
+                wait_time = None
+                if timeout is not None:
+                    start     = min([start for process,start in active.values() if process is not None])
+                    wait_time = max(start + timeout - time.time(),0.)
+                wait([process.sentinel for process in running],wait_time)
+
+            now = time.time()
+            for i,(process,start) in list(active.items()):
+                if process is not None:
+                    if process.is_alive():
+                        if timeout is None or now - start < timeout:
+                            continue
+                        kill(process)
+                    process.join()
+                del active[i]
+
+                found, result = jobs[i].load()
+                if found:
+                    results[i] = result
+                elif attempts[i] < retries:
+                    attempts[i] += 1
+                    pending.append(i)
+                else:
+                    failed.append(i)
+    finally:
+        for process,_ in active.values():
+            if process is not None:
+                kill(process)
+                process.join()
+
+    if failed:
+        raise RuntimeError('Jobs ' + str(sorted(failed)) + ' failed, see the output.log files in ' + folder)
+
+    return results
+
+## @ingroup Methods-Utilities
+def kill(process):
+    """Stops a job and the programs it started.
+
+    Assumptions:
+    Jobs start their own process group where possible
+
+    Source:
+    N/A
+
+    Inputs:
+    process       <multiprocessing.Process>
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+
+    try:
+        os.killpg(process.pid,signal.SIGKILL)
+    except (AttributeError,OSError):
+        process.terminate()
+
+    return
+
+# ----------------------------------------------------------------------
+#  Job
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+class Job(object):
+    """The scratch folder and saved result of one job, see run_jobs.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+    """
+
+    def __init__(self,folder,key):
+        """Sets the folder and key of the job.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        folder        <string>
+        key           <string> the hash of everything the result depends on
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+        """
+        self.folder      = folder
+        self.key         = key
+        self.result_file = os.path.join(folder,'result.pkl')
+
+    def prepare(self,links):
+        """Makes a clean folder for the job.
+
+        Assumptions:
+        Files are copied where they can not be linked, see SUAVE.Core.redirect.make_link
+
+        Source:
+        N/A
+
+        Inputs:
+        links         [list] absolute paths of the files needed by the job
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+        """
+
+        if os.path.isdir(self.folder):
+            shutil.rmtree(self.folder)
+        os.makedirs(self.folder)
+
+        for link in links:
+            redirect.make_link(link,os.path.join(self.folder,os.path.basename(link)))
+
+        return
+
+    def run(self,function,argument,forked=True):
+        """Runs the job in its folder and saves the result, the output of the job and of the programs it
+        calls is written to output.log.
+
+        Assumptions:
+        A forked job runs in its own process. Otherwise the job runs in this process from its folder, and
+        its errors are only logged.
+
+        Source:
+        N/A
+
+        Inputs:
+        function      [callable]
+        argument
+        forked        <boolean>
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+        """
+
+        if not forked:
+            try:
+                with redirect.output('output.log','output.log'):
+                    self.save(function(argument))
+            except Exception:
+                with open('output.log','a') as log:
+                    traceback.print_exc(file=log)
+            return
+
+        # a group of its own, so the job can be stopped along with the programs it started
+        if hasattr(os,'setpgrp'):
+            os.setpgrp()
+
+        os.chdir(self.folder)
+        log = os.open('output.log',os.O_WRONLY|os.O_CREAT|os.O_TRUNC,0o644)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(log,1)
+        os.dup2(log,2)
+
+        self.save(function(argument))
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        return
+
+    def save(self,result):
+        """Saves the result of the job, a result is never read while it is partly written.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        result        a picklable object
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+        """
+
+        temp = self.result_file + '.tmp'
+        with open(temp,'wb') as f:
+            pickle.dump(dict(key=self.key,result=result),f,protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp,self.result_file)
+
+        return
+
+    def load(self):
+        """Loads the saved result of the job.
+
+        Assumptions:
+        A result saved for a different key is ignored
+
+        Source:
+        N/A
+
+        Inputs:
+        N/A
+
+        Outputs:
+        found         <boolean>
+        result
+
+        Properties Used:
+        N/A
+        """
+
+        try:
+            with open(self.result_file,'rb') as f:
+                content = pickle.load(f)
+        except Exception:
+            return False, None
+
+        if content.get('key',None) != self.key:
+            return False, None
+
+        return True, content['result']
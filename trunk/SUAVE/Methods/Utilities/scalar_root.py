@@ -0,0 +1,109 @@
+## @ingroup Methods-Utilities
+# scalar_root.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Safeguarded Newton
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Utilities
+def safeguarded_newton(function,lower,upper,guess=None,args=(),tolerance=1e-12,max_iterations=100):
+    """Solves many independent scalar equations f(x) = 0 at once. Each element takes its own Newton
+    steps inside its own bracket, and only the elements that have not converged are evaluated
+    again. This replaces a dense solve of the whole vector when the Jacobian is diagonal.
+
+    Assumptions:
+    Where f(lower) and f(upper) differ in sign, the root is kept inside the bracket. A Newton
+    step that leaves the bracket is replaced by a bisection, and the bracket shrinks around
+    every new point. Picking the bracket picks the branch, such as the subsonic or the
+    supersonic root of an area ratio.
+    Where there is no sign change, the Newton steps are only clipped to [lower, upper], and an
+    element that is held at an end of its range is stopped as not converged.
+
+    Source:
+    Press, W. H., et al., "Numerical Recipes", safeguarded Newton-Raphson (rtsafe)
+
+    Inputs:
+    function(x,*args)  returns f and df/dx, element-wise, for any subset of the elements
+    lower              [array] lower ends of the brackets
+    upper              [array] upper ends of the brackets
+    guess              [array] starting points, the middle of the brackets if None
+    args               [tuple of arrays] parameters of the equations
+    tolerance          [-] relative size of the last step
+    max_iterations     [int]
+
+    Outputs:
+    x                  [array] roots, with the broadcast shape of the inputs
+    converged          [array of bools]
+
+    Properties Used:
+    N/A
+    """
+
+    if guess is None:
+        guess = 0.5*(np.asarray(lower,dtype=float) + np.asarray(upper,dtype=float))
+
+    # every element gets its own copy of the bracket and parameters
+    arrays = np.broadcast_arrays(lower,upper,guess,*args)
+    shape  = arrays[0].shape
+    lower  = np.array(arrays[0],dtype=float).ravel()
+    upper  = np.array(arrays[1],dtype=float).ravel()
+    x      = np.clip(np.array(arrays[2],dtype=float).ravel(),lower,upper)
+    args   = [np.ravel(arg) for arg in arrays[3:]]
+
+    converged = np.zeros(x.shape,dtype=bool)
+
+    with np.errstate(divide='ignore',invalid='ignore',over='ignore'):
+
+        # sides of the brackets
+        f_lower   = function(lower,*args)[0]
+        f_upper   = function(upper,*args)[0]
+        bracketed = np.sign(f_lower) != np.sign(f_upper)
+
+        active = np.arange(x.size)
+
+        for iteration in range(max_iterations):
+
+            x_a  = x[active]
+            lo   = lower[active]
+            hi   = upper[active]
+            br   = bracketed[active]
+            f, dfdx = function(x_a,*[arg[active] for arg in args])
+
+            # shrink the brackets around the new point
+            below = np.sign(f) == np.sign(f_lower[active])
+            lo    = np.where(br & below, x_a, lo)
+            hi    = np.where(br & ~below, x_a, hi)
+
+            # Newton, falling back to bisection when the step leaves the bracket
+            x_new   = x_a - f/dfdx
+            outside = np.logical_not((x_new >= lo) & (x_new <= hi))
+            x_new   = np.where(br & outside, 0.5*(lo+hi), x_new)
+            x_new   = np.where(~br & outside, np.clip(x_new,lo,hi), x_new)
+            x_new   = np.where(np.isfinite(x_new), x_new, x_a)
+
+            # without a bracket, a step held at the end of the range is not a root
+            stuck = ~br & outside & (x_new == x_a)
+
+            scale = np.fmax(np.abs(x_new),np.finfo(float).tiny)
+            done  = (f == 0.) | (np.abs(x_new - x_a) <= tolerance*scale) | (br & (hi - lo <= tolerance*scale))
+            x_new = np.where(f == 0., x_a, x_new)
+
+            x[active]     = x_new
+            lower[active] = lo
+            upper[active] = hi
+            converged[active[done & ~stuck]] = True
+
+            active = active[~done]
+            if active.size == 0:
+                break
+
+    return x.reshape(shape), converged.reshape(shape)
@@ -2,6 +2,7 @@
 #Sizing_Loop.py
 #Created:  Jun 2016, M. Vegh
 #Modified: May 2018, M. Vegh
+#          Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -60,6 +61,7 @@ class Sizing_Loop(Data):
         self.iteration_options.newton_raphson_tolerance          = 5E-2             #threshhold of convergence when you start using newton raphson
         self.iteration_options.max_newton_raphson_tolerance      = 2E-3             #threshhold at which newton raphson is no longer used (to prevent overshoot and extra iterations)
         self.iteration_options.h                                 = 1E-6             #finite difference step for Newton iteration
+        self.iteration_options.jacobian_method                   = 'finite_difference' #'finite_difference' or 'complex_step'; complex step needs a sizing_evaluation that carries complex numbers
         self.iteration_options.initialize_jacobian               = 'newton-raphson' #how Jacobian is initialized for broyden; newton-raphson by default
         self.iteration_options.jacobian                          = np.array([np.nan])
         self.iteration_options.write_jacobian                    = True             #set to True if you want to write the Jacobian at each iteration (to keep track of every iteration
@@ -326,9 +328,13 @@ class Sizing_Loop(Data):
         tries to use that to zero the residual
         """
         
-        h = iteration_options.h
-        print('###begin Finite Differencing###')
-        J, iter = Finite_Difference_Gradient(y,err, sizing_evaluation, nexus, scaling, iter, h)
+        if iteration_options.jacobian_method == 'complex_step':
+            print('###begin Complex Step###')
+            J, iter = Complex_Step_Gradient(y, sizing_evaluation, nexus, scaling, iter)
+        else:
+            h = iteration_options.h
+            print('###begin Finite Differencing###')
+            J, iter = Finite_Difference_Gradient(y,err, sizing_evaluation, nexus, scaling, iter, h)
         try:
             
             Jinv     = np.linalg.inv(J)  
@@ -471,6 +477,37 @@ def Finite_Difference_Gradient(x,f , my_function, inputs, scaling, iter, h):
         
     return J, iter
 
+## @ingroup Sizing    
+def Complex_Step_Gradient(x, my_function, inputs, scaling, iter, h=1E-30):
+    """
+    Uses a complex step to calculate the Jacobian, exact to machine precision
+    without tuning the step size
+    
+    Inputs:
+    x               [array]
+    my_function     function that returns the residual f and sizing variable y-y_save,
+                    must carry complex numbers through the sizing evaluation
+    inputs          ordered dict that is unpacked within my_function
+    scaling         [array]
+    iter            [int]
+    h               [float]
+    
+    Outputs:
+    J               [array,array]
+    iter            [int]
+    
+    """
+
+    J = np.nan*np.ones([len(x), len(x)])
+    for i in range(len(x)):
+        xu        = np.array(x,dtype=complex)
+        xu[i]     = x[i]+1j*h
+        fu, y_out = my_function(xu, inputs,scaling)
+        J[:,i]    = np.imag(fu)/h
+        iter=iter+1
+        
+    return J, iter
+
 def find_min_norm(scaled_inputs, data_inputs):
     """
     Finds the minimum and location of the L2 norm of two sets of data
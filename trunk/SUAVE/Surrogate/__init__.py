@@ -5,4 +5,6 @@ from . import kriging_surrogate_functions
 from . import scikit_surrogate_functions
 from . import svr_surrogate_functions
 from . import Surrogate_Problem
+from . import surrogate_evaluation
+from . import surrogate_cache
 
@@ -0,0 +1,473 @@
+## @ingroup Surrogate
+# surrogate_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os
+import time
+import pickle
+import hashlib
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  Surrogate Cache
+# ----------------------------------------------------------------------
+
+## @ingroup Surrogate
+class Surrogate_Cache(object):
+    """ A directory of training data and fitted surrogates, keyed on a hash of everything they depend on
+
+        Entries are pickled. Loading an entry marks it as used, and every save evicts the least recently
+        used entries until the directory is below maximum_size, as well as every entry older than
+        maximum_age.
+
+        Assumptions:
+        Only trusted directories are used, loading an entry unpickles it
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,directory,maximum_size=1.e9,maximum_age=None):
+        """ Makes the cache directory if needed
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            directory     <string>
+            maximum_size  [bytes]   (None for no limit)
+            maximum_age   [seconds] since an entry was last used (None for no limit)
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.directory    = os.path.abspath(directory)
+        self.maximum_size = maximum_size
+        self.maximum_age  = maximum_age
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+    def key(self,*objects):
+        """ Hashes the objects that an entry depends on
+
+            Assumptions:
+            See hash_objects
+
+            Source:
+            N/A
+
+            Inputs:
+            objects
+
+            Outputs:
+            key           <string>
+
+            Properties Used:
+            N/A
+        """
+        return hash_objects(*objects)
+
+    def path(self,key,extension='.pkl'):
+        """ The file of an entry
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            key           <string>
+            extension     <string>
+
+            Outputs:
+            path          <string>
+
+            Properties Used:
+            N/A
+        """
+        return os.path.join(self.directory,key + extension)
+
+    def load(self,key):
+        """ Loads an entry
+
+            Assumptions:
+            An entry that can not be read is treated as missing
+
+            Source:
+            N/A
+
+            Inputs:
+            key           <string>
+
+            Outputs:
+            content       the saved object, None if there is no entry
+
+            Properties Used:
+            N/A
+        """
+
+        path = self.path(key)
+        try:
+            with open(path,'rb') as f:
+                content = pickle.load(f)
+        except Exception:
+            return None
+
+        # mark as recently used
+        try:
+            os.utime(path,None)
+        except OSError:
+            pass
+
+        return content
+
+    def save(self,key,content):
+        """ Saves an entry, then evicts old entries
+
+            Assumptions:
+            The entry is written to a temporary file and moved into place, so an entry is never read
+            while it is partly written
+
+            Source:
+            N/A
+
+            Inputs:
+            key           <string>
+            content       a picklable object
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        path = self.path(key)
+        temp = path + '.' + str(os.getpid()) + '.tmp'
+        with open(temp,'wb') as f:
+            pickle.dump(content,f,protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp,path)
+
+        self.evict()
+
+        return
+
+    def evict(self):
+        """ Removes entries older than maximum_age, then the least recently used entries until the
+            directory is smaller than maximum_size
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.tmp'):
+                continue
+            path = os.path.join(self.directory,name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime,stat.st_size,path))
+
+        # newest first
+        entries.sort(reverse=True)
+
+        now   = time.time()
+        total = 0.
+        for mtime,size,path in entries:
+            too_old   = self.maximum_age  is not None and now - mtime > self.maximum_age
+            too_large = self.maximum_size is not None and total + size > self.maximum_size
+            if too_old or too_large:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            else:
+                total += size
+
+        return
+
+# ----------------------------------------------------------------------
+#  Analysis Helpers
+# ----------------------------------------------------------------------
+
+## @ingroup Surrogate
+def load_surrogates(cache,key,analysis):
+    """ Restores the training data and surrogates of an analysis from the cache
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        cache         <Surrogate_Cache> (None for no cache)
+        key           <string>
+        analysis.
+          training    [Data]
+          surrogates  [Data]
+
+        Outputs:
+        found         <boolean>
+
+        Properties Used:
+        N/A
+    """
+
+    if cache is None:
+        return False
+
+    content = cache.load(key)
+    if content is None:
+        return False
+
+    analysis.training   = content['training']
+    analysis.surrogates = content['surrogates']
+
+    return True
+
+## @ingroup Surrogate
+def save_surrogates(cache,key,analysis):
+    """ Saves the training data and surrogates of an analysis in the cache
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        cache         <Surrogate_Cache> (None for no cache)
+        key           <string>
+        analysis.
+          training    [Data]
+          surrogates  [Data]
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+    """
+
+    if cache is None:
+        return
+
+    cache.save(key,dict(training=analysis.training,surrogates=analysis.surrogates))
+
+    return
+
+## @ingroup Surrogate
+def file_contents(file_name):
+    """ Reads a file so it can be part of a cache key
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        file_name     <string> (None for no file)
+
+        Outputs:
+        contents      <bytes> None if there is no file
+
+        Properties Used:
+        N/A
+    """
+
+    if not file_name:
+        return None
+
+    with open(file_name,'rb') as f:
+        return f.read()
+
+# ----------------------------------------------------------------------
+#  Hashing
+# ----------------------------------------------------------------------
+
+## @ingroup Surrogate
+def hash_objects(*objects):
+    """ A hash of the contents of nested data, for cache keys
+
+        Assumptions:
+        Dictionaries are hashed by their items in sorted key order, keys that start with an underscore
+        are skipped. Arrays are hashed by their shape, dtype and values, numbers by their exact value,
+        functions and classes by their name, and any other object by its class and attributes.
+        Surrogate caches, files and other objects without attributes are hashed by their class only.
+        Objects that are already being hashed higher up the tree are skipped.
+
+        Source:
+        N/A
+
+        Inputs:
+        objects
+
+        Outputs:
+        key           <string> hexadecimal digest
+
+        Properties Used:
+        N/A
+    """
+
+    h = hashlib.sha1()
+    for obj in objects:
+        update_hash(h,obj,set())
+
+    return h.hexdigest()
+
+## @ingroup Surrogate
+def update_hash(h,obj,active):
+    """ Adds an object to a running hash, see hash_objects
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        h             <hashlib hash>
+        obj
+        active        <set> ids of the containers being hashed
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+    """
+
+    kind = type(obj)
+    h.update(b'<' + (kind.__module__ + '.' + kind.__name__).encode() + b'>')
+
+    if obj is None or isinstance(obj,(bool,int,float,complex,str,bytes,np.generic)):
+        h.update(repr(obj).encode() if not isinstance(obj,bytes) else obj)
+        return
+
+    if isinstance(obj,np.ndarray):
+        h.update(repr((obj.shape,obj.dtype.str)).encode())
+        if obj.dtype.hasobject:
+            for v in obj.flat:
+                update_hash(h,v,active)
+        else:
+            h.update(np.ascontiguousarray(obj).tobytes())
+        return
+
+    if callable(obj) and hasattr(obj,'__qualname__'):
+        h.update((getattr(obj,'__module__','') + '.' + obj.__qualname__).encode())
+        return
+
+    if isinstance(obj,Surrogate_Cache):
+        return
+
+    if id(obj) in active:
+        return
+    active.add(id(obj))
+
+    if isinstance(obj,dict):
+        keys = [k for k in obj.keys() if not (isinstance(k,str) and k.startswith('_'))]
+        for k in sorted(keys,key=repr):
+            update_hash(h,k,active)
+            update_hash(h,dict.__getitem__(obj,k),active)
+    elif isinstance(obj,(list,tuple,set,frozenset)):
+        items = sorted(obj,key=repr) if isinstance(obj,(set,frozenset)) else obj
+        h.update(str(len(items)).encode())
+        for v in items:
+            update_hash(h,v,active)
+    elif hasattr(obj,'__dict__') and not hasattr(obj,'fileno'):
+        update_hash(h,vars(obj),active)
+
+    active.discard(id(obj))
+
+    return
+
+## @ingroup Surrogate
+def fingerprint_objects(*objects):
+    """ An exact copy of the contents of nested data that is cheap to make and compare, for checking
+        on every call that the inputs of a cached result have not changed
+
+        Assumptions:
+        Dictionaries are taken in their own key order, keys that start with an underscore are
+        skipped. Arrays are taken by their shape, dtype and values, numbers and strings by value, and
+        any other object, such as a function or a surrogate cache, by its identity only.
+
+        Source:
+        N/A
+
+        Inputs:
+        objects
+
+        Outputs:
+        fingerprint   <tuple> equal for equal contents
+
+        Properties Used:
+        N/A
+    """
+
+    return tuple([fingerprint(obj) for obj in objects])
+
+## @ingroup Surrogate
+def fingerprint(obj):
+    """ The fingerprint of one object, see fingerprint_objects
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        obj
+
+        Outputs:
+        fingerprint   <tuple> or the object itself for numbers and strings
+
+        Properties Used:
+        N/A
+    """
+
+    if obj is None or isinstance(obj,(bool,int,float,complex,str,bytes,np.generic)):
+        return obj
+
+    if isinstance(obj,np.ndarray):
+        return (obj.shape,obj.dtype.str,obj.tobytes())
+
+    if isinstance(obj,dict):
+        return tuple([(k,fingerprint(v)) for k, v in obj.items() if not (isinstance(k,str) and k.startswith('_'))])
+
+    if isinstance(obj,(list,tuple)):
+        return (type(obj),) + tuple([fingerprint(v) for v in obj])
+
+    return (type(obj),id(obj))
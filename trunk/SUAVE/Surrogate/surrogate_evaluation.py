@@ -0,0 +1,392 @@
+## @ingroup Surrogate
+# surrogate_evaluation.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from sklearn import gaussian_process
+from sklearn import neighbors
+from sklearn import svm
+from sklearn.gaussian_process import kernels
+
+# ----------------------------------------------------------------------
+#  Predict
+# ----------------------------------------------------------------------
+
+## @ingroup Surrogate
+def predict(model,X):
+    """ Evaluates a surrogate at every row of X with one call to its predict
+
+        Assumptions:
+        The model has a scikit-learn style predict(X) that takes a 2D array, one sample per row.
+
+        Source:
+        N/A
+
+        Inputs:
+        model        <scikit-learn regressor> or <Compiled_Surrogate>
+        X            [array] one sample per row
+
+        Outputs:
+        y            [array] one row per sample, one column per output
+
+        Properties Used:
+        N/A
+    """
+
+    X = np.atleast_2d(X)
+    y = model.predict(X)
+
+    return np.reshape(y,[len(X),-1])
+
+# ----------------------------------------------------------------------
+#  Compile Surrogate
+# ----------------------------------------------------------------------
+
+## @ingroup Surrogate
+def compile_surrogate(model):
+    """ Makes a copy of the prediction of a fitted scikit-learn model that is evaluated with numpy only,
+        without the input validation of scikit-learn
+
+        Assumptions:
+        Gaussian processes with constant, white, dot product, RBF, rational quadratic and exp sine
+        squared kernels and their sums and products, k nearest neighbors with the euclidean metric, and
+        support vector regression with linear, polynomial, RBF and sigmoid kernels are compiled.
+        Other models are returned as they are.
+
+        Source:
+        N/A
+
+        Inputs:
+        model        <scikit-learn regressor>
+
+        Outputs:
+        model        <Compiled_Surrogate> or the model if it is not supported
+
+        Properties Used:
+        N/A
+    """
+
+    if isinstance(model,Compiled_Surrogate):
+        return model
+
+    try:
+        if isinstance(model,gaussian_process.GaussianProcessRegressor):
+            evaluate = compile_gaussian_process(model)
+        elif isinstance(model,neighbors.KNeighborsRegressor):
+            evaluate = compile_nearest_neighbors(model)
+        elif isinstance(model,svm.SVR):
+            evaluate = compile_support_vector(model)
+        else:
+            evaluate = None
+    except AttributeError:
+        # not fitted
+        evaluate = None
+
+    if evaluate is None:
+        return model
+
+    return Compiled_Surrogate(model,evaluate)
+
+## @ingroup Surrogate
+class Compiled_Surrogate(object):
+    """ A fitted scikit-learn model with a numpy only predict
+
+        Assumptions:
+        The model is not refit after it is compiled
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,model,evaluate):
+        """ Stores the model and the compiled prediction
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            model        <scikit-learn regressor>
+            evaluate     [callable] y = evaluate(X)
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.model    = model
+        self.evaluate = evaluate
+
+    def predict(self,X):
+        """ Evaluates the surrogate, the same as model.predict(X)
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            X            [array] one sample per row
+
+            Outputs:
+            y            [array]
+
+            Properties Used:
+            N/A
+        """
+
+        return self.evaluate(np.atleast_2d(np.asarray(X,dtype=float)))
+
+    def __reduce__(self):
+        """ Pickles the model only, the prediction is compiled again when it is unpickled
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        return (compile_surrogate,(self.model,))
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Surrogate
+def compile_gaussian_process(model):
+    """ Compiles the posterior mean of a Gaussian process, K(X,X_train).alpha
+
+        Assumptions:
+        N/A
+
+        Source:
+        Rasmussen, C. E. and Williams, C. K. I., "Gaussian Processes for Machine Learning",
+        MIT Press, 2006, Algorithm 2.1
+
+        Inputs:
+        model        <GaussianProcessRegressor>
+
+        Outputs:
+        evaluate     [callable] or None if the kernel is not supported
+
+        Properties Used:
+        N/A
+    """
+
+    kernel = compile_kernel(model.kernel_)
+    if kernel is None:
+        return None
+
+    X_train = np.array(model.X_train_,dtype=float)
+    alpha   = np.array(model.alpha_)
+    std     = model._y_train_std
+    mean    = model._y_train_mean
+
+    def evaluate(X):
+        y = np.dot(kernel(X,X_train),alpha)
+        y = std * y + mean
+        if y.ndim > 1 and y.shape[1] == 1:
+            y = y[:,0]
+        return y
+
+    return evaluate
+
+## @ingroup Surrogate
+def compile_kernel(kernel):
+    """ Compiles a Gaussian process kernel between two sets of points
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        kernel       <sklearn.gaussian_process.kernels.Kernel>
+
+        Outputs:
+        k            [callable] K = k(X,Y), or None if the kernel is not supported
+
+        Properties Used:
+        N/A
+    """
+
+    if isinstance(kernel,(kernels.Sum,kernels.Product)):
+        k1 = compile_kernel(kernel.k1)
+        k2 = compile_kernel(kernel.k2)
+        if k1 is None or k2 is None:
+            return None
+        if isinstance(kernel,kernels.Sum):
+            return lambda X,Y: k1(X,Y) + k2(X,Y)
+        else:
+            return lambda X,Y: k1(X,Y) * k2(X,Y)
+
+    elif isinstance(kernel,kernels.ConstantKernel):
+        c = kernel.constant_value
+        return lambda X,Y: np.full([len(X),len(Y)],c,dtype=float)
+
+    elif isinstance(kernel,kernels.WhiteKernel):
+        # the noise does not correlate new points with the training points
+        return lambda X,Y: np.zeros([len(X),len(Y)])
+
+    elif isinstance(kernel,kernels.DotProduct):
+        s = kernel.sigma_0**2
+        return lambda X,Y: np.dot(X,Y.T) + s
+
+    elif isinstance(kernel,kernels.RationalQuadratic):
+        l = kernel.length_scale
+        a = kernel.alpha
+        return lambda X,Y: (1. + squared_distances(X,Y)/(2.*a*l**2))**-a
+
+    elif isinstance(kernel,kernels.ExpSineSquared):
+        l = kernel.length_scale
+        p = kernel.periodicity
+        return lambda X,Y: np.exp(-2.*(np.sin(np.pi/p*np.sqrt(squared_distances(X,Y)))/l)**2)
+
+    elif isinstance(kernel,kernels.RBF) and not isinstance(kernel,kernels.Matern):
+        l = np.asarray(kernel.length_scale,dtype=float)
+        return lambda X,Y: np.exp(-0.5*squared_distances(X/l,Y/l))
+
+    return None
+
+## @ingroup Surrogate
+def compile_nearest_neighbors(model):
+    """ Compiles a k nearest neighbors regression
+
+        Assumptions:
+        Ties between neighbors at the same distance may be broken differently than scikit-learn
+
+        Source:
+        N/A
+
+        Inputs:
+        model        <KNeighborsRegressor>
+
+        Outputs:
+        evaluate     [callable] or None if the metric or weights are not supported
+
+        Properties Used:
+        N/A
+    """
+
+    if model.effective_metric_ != 'euclidean' or model.weights not in ['uniform','distance']:
+        return None
+
+    X_train  = np.array(model._fit_X,dtype=float)
+    y_train  = np.array(model._y,dtype=float)
+    k        = model.n_neighbors
+    distance = model.weights == 'distance'
+
+    def evaluate(X):
+        d2  = squared_distances(X,X_train)
+        if k < len(X_train):
+            ind = np.argpartition(d2,k-1,axis=1)[:,:k]
+        else:
+            ind = np.tile(np.arange(len(X_train)),[len(X),1])
+        y   = y_train[ind]
+
+        if distance:
+            d = np.sqrt(np.take_along_axis(d2,ind,axis=1))
+            with np.errstate(divide='ignore'):
+                w = 1./d
+            # exact matches take all of the weight
+            exact = np.isinf(w)
+            rows  = np.any(exact,axis=1)
+            w[rows] = exact[rows]
+        else:
+            w = np.ones(np.shape(ind))
+
+        if y.ndim == 3:
+            w = w[:,:,None]
+
+        return np.sum(y*w,axis=1)/np.sum(w,axis=1)
+
+    return evaluate
+
+## @ingroup Surrogate
+def compile_support_vector(model):
+    """ Compiles a support vector regression, K(X,support_vectors).dual_coef + intercept
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        model        <SVR>
+
+        Outputs:
+        evaluate     [callable] or None if the kernel is not supported
+
+        Properties Used:
+        N/A
+    """
+
+    if not model.kernel in ['linear','poly','rbf','sigmoid']:
+        return None
+
+    V      = np.array(model.support_vectors_,dtype=float)
+    coef   = np.array(model.dual_coef_,dtype=float)[0]
+    b      = float(model.intercept_[0])
+    kernel = model.kernel
+    gamma  = model._gamma
+    coef0  = model.coef0
+    degree = model.degree
+
+    def evaluate(X):
+        if kernel == 'rbf':
+            K = np.exp(-gamma*squared_distances(X,V))
+        elif kernel == 'linear':
+            K = np.dot(X,V.T)
+        elif kernel == 'poly':
+            K = (gamma*np.dot(X,V.T) + coef0)**degree
+        else:
+            K = np.tanh(gamma*np.dot(X,V.T) + coef0)
+        return np.dot(K,coef) + b
+
+    return evaluate
+
+## @ingroup Surrogate
+def squared_distances(X,Y):
+    """ Squared euclidean distances between every row of X and every row of Y
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        X            [array]
+        Y            [array]
+
+        Outputs:
+        D            [array] shape (len(X),len(Y))
+
+        Properties Used:
+        N/A
+    """
+
+    return np.sum((X[:,None,:] - Y[None,:,:])**2,axis=2)